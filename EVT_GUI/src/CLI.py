@@ -0,0 +1,152 @@
+import os
+import sys
+import argparse
+import traceback
+from pathlib import Path
+from typing import Optional
+
+from Tools import Tools, GetDirs
+from Worker import Progress_Reporter, ExecuteTask, ToJSONLine
+
+##############################################################################################################################
+
+# Subcommands and the tools they run ('tts' picks its tool by --model)
+Commands = {
+    'process': 'process',
+    'vpr': 'vpr',
+    'whisper': 'whisper',
+    'dat-gptsovits': 'dat-gptsovits',
+    'dat-vits': 'dat-vits',
+    'train-gptsovits': 'train-gptsovits',
+    'train-vits': 'train-vits',
+    'tts': {'gptsovits': 'tts-gptsovits', 'vits': 'tts-vits'}
+}
+
+##############################################################################################################################
+
+def IsPathParam(Name: str):
+    return any(Word in Name for Word in ('Dir', 'Path', 'Root')) and not Name.endswith('Name')
+
+
+def ResolvePaths(Values: dict):
+    '''
+    Make the given paths absolute (tasks run with the core dir as working dir)
+    '''
+    Resolved = {}
+    for Name, Value in Values.items():
+        if IsPathParam(Name) and isinstance(Value, str) and Value.strip() not in ('', str(None)):
+            Value = Path(Value).absolute().as_posix()
+        if Name == 'StdAudioSpeaker' and isinstance(Value, dict):
+            Value = {Speaker: Path(Audio).absolute().as_posix() if str(Audio).strip() != '' else Audio for Speaker, Audio in Value.items()}
+        Resolved[Name] = Value
+    return Resolved
+
+
+def FormatEvent(Event: dict):
+    '''
+    Turn a progress event into a line of text
+    '''
+    if Event['Event'] == 'Stage':
+        return f"[{Event['Stage']}]"
+    if Event['Event'] == 'Progress':
+        Text = f"[{Event.get('Stage')}] {Event.get('Done')}/{Event.get('Total') or '?'} {Event.get('Unit') or ''}".rstrip()
+        Text += f" ({Event['Bytes'] / 1024**2:.1f} MB)" if Event.get('Bytes') else ''
+        Text += f", ETA {int(Event['ETA'])}s" if Event.get('ETA') else ''
+        return Text
+    if Event['Event'] == 'Error':
+        return f"{Event['Type']}: {Event['Message']}"
+    return None
+
+
+def GetProgressSink(Mode: str):
+    def Sink(Event: dict):
+        if Mode == 'json':
+            sys.stderr.write(ToJSONLine(Event))
+        if Mode == 'text':
+            Text = FormatEvent(Event)
+            sys.stderr.write(f"{Text}\n") if Text is not None else None
+        sys.stderr.flush()
+    return Sink
+
+
+def GetParser(
+    CoreDir: Optional[str] = None,
+    ModelDir: Optional[str] = None,
+    OutputDir: Optional[str] = None
+):
+    parser = argparse.ArgumentParser(prog = "evt", description = "Run Easy Voice Toolkit tools without the GUI")
+    parser.add_argument("--core",     help = "dir of core files", default = CoreDir, required = CoreDir is None)
+    parser.add_argument("--models",   help = "dir of models",     default = ModelDir, required = ModelDir is None)
+    parser.add_argument("--output",   help = "dir of output",     default = OutputDir, required = OutputDir is None)
+    parser.add_argument("--progress", help = "how to report progress (on stderr)", choices = ['text', 'json', 'none'], default = 'text')
+    Subparsers = parser.add_subparsers(dest = "command", required = True)
+    for Command, ToolName in Commands.items():
+        ToolNames = list(ToolName.values()) if isinstance(ToolName, dict) else [ToolName]
+        Subparser = Subparsers.add_parser(Command, help = f"run {'/'.join(ToolNames)}")
+        Subparser.add_argument("--model",   help = "model type", choices = list(ToolName.keys()), required = True) if isinstance(ToolName, dict) else None
+        Subparser.add_argument("--config",  help = "path to Config_*.ini (as exported from the GUI)", default = None)
+        Subparser.add_argument("--dry-run", help = "print the params and exit", action = 'store_true')
+        Added = set()
+        for Name in ToolNames:
+            for Param in Tools[Name].Params:
+                if Param.Name in Added:
+                    continue
+                Added.add(Param.Name)
+                Subparser.add_argument(f"--{Param.Name}",
+                    help = f"[{Param.Section}] {Param.Option} (default: {Param.Default})" if Param.Section is not None else f"(default: {Param.Default})",
+                    default = None
+                )
+    return parser
+
+
+def Run(
+    Args: Optional[list] = None,
+    CoreDir: Optional[str] = None,
+    ModelDir: Optional[str] = None,
+    OutputDir: Optional[str] = None,
+    CurrentDir: Optional[str] = None
+):
+    '''
+    Run a tool in this process, return the exit code
+    '''
+    args = GetParser(CoreDir, ModelDir, OutputDir).parse_args(Args)
+    Command = Commands[args.command]
+    Tool = Tools[Command[args.model] if isinstance(Command, dict) else Command]
+    Dirs = GetDirs(args.models, args.output, CurrentDir or os.getcwd())
+
+    if args.config is not None and not Path(args.config).is_file():
+        sys.stderr.write(f"Config not found: {args.config}\n")
+        return 2
+    Values = Tool.ReadConfig(args.config, Dirs) if args.config is not None else Tool.GetDefaults(Dirs)
+    try:
+        Values.update({Param.Name: Param.Convert(getattr(args, Param.Name)) for Param in Tool.Params if getattr(args, Param.Name, None) is not None})
+        Params = Tool.ToParams(ResolvePaths(Values), Dirs)
+    except (ValueError, SyntaxError) as e:
+        sys.stderr.write(f"{e}\n")
+        return 2
+    Task = Tool.Task(Params)
+    if args.dry_run:
+        for Param, Value in zip(Tool.Params, Task['Params']):
+            print(f"{Param.Name} = {Value!r}")
+        return 0
+
+    # Same as the workers: run from the core dir with core modules importable
+    CoreDir = Path(args.core).absolute().as_posix()
+    os.chdir(CoreDir)
+    sys.path.insert(0, CoreDir) if CoreDir not in sys.path else None
+    Reporter = Progress_Reporter(GetProgressSink(args.progress)) if args.progress != 'none' else None
+    try:
+        ExecuteTask(Task['Module'], Task['Name'], Task['Params'], Task['Calls'], Reporter)
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+##############################################################################################################################
+
+if __name__ == "__main__":
+    sys.exit(Run())
+
+##############################################################################################################################
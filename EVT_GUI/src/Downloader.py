@@ -0,0 +1,424 @@
+import io
+import os
+import re
+import json
+import time
+import hashlib
+import tarfile
+import zipfile
+import threading
+import http.client
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+##############################################################################################################################
+
+# Size of the chunks read from the connection
+DownloadChunkSize = 1024 ** 2
+
+# Files are split into at most this many segments (of at least MinSegmentSize each)
+MaxSegments = 4
+MinSegmentSize = 16 * 1024 ** 2
+
+# Number of files downloaded at the same time (further downloads wait for a slot)
+MaxDownloads = 2
+DownloadSlots = threading.BoundedSemaphore(MaxDownloads)
+
+# Size of the segment fetched for the end of zip archives (where their member list is)
+ZipTailSize = 1024 ** 2
+
+# Number of archive members decompressed at the same time
+MaxExtractWorkers = min(8, os.cpu_count() or 1)
+
+# Times a segment is retried (resuming from where it stopped) before giving up
+MaxRetries = 5
+
+Timeout = 30
+
+##############################################################################################################################
+
+def GetHasher(SHA_Expected: Optional[str] = None):
+    return hashlib.sha1() if SHA_Expected is not None and len(SHA_Expected) == 40 else hashlib.sha256()
+
+
+def GetRemoteInfo(DownloadURL: str):
+    '''
+    Return the size of a remote file and whether it can be fetched by range
+    '''
+    Request = urllib.request.Request(DownloadURL, headers = {'Range': 'bytes=0-0'})
+    with urllib.request.urlopen(Request, timeout = Timeout) as Response:
+        ContentRange = Response.headers.get('Content-Range')
+        if Response.status == 206 and ContentRange is not None:
+            Match = re.match(r'bytes\s+\d+-\d+/(\d+)', ContentRange)
+            if Match is not None:
+                return int(Match.group(1)), True
+        ContentLength = Response.headers.get('Content-Length')
+        return (int(ContentLength) if ContentLength is not None else None), False
+
+
+def SplitSegments(Size: int, Segments: int = MaxSegments, TailSize: int = 0):
+    '''
+    Split [0, Size) into [Start, End, Done] segments (the last TailSize bytes get a segment of their own)
+    '''
+    TailSize = TailSize if Size > 2 * TailSize else 0
+    Count = max(1, min(Segments, (Size - TailSize) // MinSegmentSize))
+    Step = -(-(Size - TailSize) // Count)
+    Split = [[Start, min(Start + Step, Size - TailSize), 0] for Start in range(0, Size - TailSize, Step)] if Size > 0 else [[0, 0, 0]]
+    return Split + [[Size - TailSize, Size, 0]] if TailSize > 0 else Split
+
+
+def GetArchiveFormat(FilePath: str):
+    '''
+    Return 'zip' or 'tar' for archives that can be unpacked, None for anything else
+    '''
+    Suffixes = [Suffix.lower() for Suffix in Path(FilePath).suffixes]
+    if Suffixes[-1:] == ['.zip']:
+        return 'zip'
+    if '.tar' in Suffixes[-2:] or Suffixes[-1:] in (['.tgz'], ['.tbz2'], ['.txz']):
+        return 'tar'
+    return None
+
+
+class Download_State:
+    '''
+    Track the segments of a partial download (saved next to it so that it can be resumed)
+    and hash the bytes in order as they arrive
+    '''
+    def __init__(self, PartPath: str, DownloadURL: str, Size: Optional[int], Ranged: bool, SHA_Expected: Optional[str] = None, Segments: int = MaxSegments, TailSize: int = 0):
+        self.PartPath = PartPath
+        self.StatePath = f"{PartPath}.json"
+        self.Lock = threading.Lock()
+        self.SaveLock = threading.Lock()
+        self.Arrived = threading.Condition(self.Lock)
+        self.Completed = False
+        self.Stopped = False
+
+        self.Hasher = GetHasher(SHA_Expected)
+        self.Hashed = 0
+
+        State = self.Load()
+        if State is not None and State['URL'] == DownloadURL and State['Size'] == Size and Ranged and Path(PartPath).exists():
+            self.Segments = State['Segments']
+        else:
+            self.Segments = SplitSegments(Size, Segments, TailSize) if Ranged else [[0, None, 0]]
+            with open(PartPath, mode = 'wb') as f:
+                f.truncate(Size) if Ranged else None
+        self.URL = DownloadURL
+        self.Size = Size
+        self.Ranged = Ranged
+        self.Save()
+
+    def Load(self):
+        try:
+            with open(self.StatePath, mode = 'r', encoding = 'utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def Save(self):
+        with self.Lock:
+            State = {'URL': self.URL, 'Size': self.Size, 'Segments': [list(Segment) for Segment in self.Segments]}
+        with self.SaveLock:
+            TempPath = f"{self.StatePath}.tmp"
+            with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+                json.dump(State, f)
+            os.replace(TempPath, self.StatePath)
+
+    def Downloaded(self):
+        with self.Lock:
+            return sum(Segment[2] for Segment in self.Segments)
+
+    def Frontier(self):
+        '''
+        End of the bytes that have arrived without gaps from the start of the file
+        '''
+        Frontier = 0
+        for Start, End, Done in self.Segments:
+            Frontier = Start + Done
+            if End is None or Start + Done < End:
+                break
+        return Frontier
+
+    def Feed(self, Index: int, Data: bytes):
+        '''
+        Record the bytes written to a segment, hash them right away if they continue the hashed part
+        (otherwise they get hashed from the file as soon as the gap before them is filled)
+        '''
+        with self.Lock:
+            Offset = self.Segments[Index][0] + self.Segments[Index][2]
+            self.Segments[Index][2] += len(Data)
+            if Offset == self.Hashed:
+                self.Hasher.update(Data)
+                self.Hashed += len(Data)
+            Frontier = self.Frontier()
+            if self.Hashed < Frontier:
+                with open(self.PartPath, mode = 'rb') as f:
+                    f.seek(self.Hashed)
+                    while self.Hashed < Frontier:
+                        Chunk = f.read(min(DownloadChunkSize, Frontier - self.Hashed))
+                        if not Chunk:
+                            break
+                        self.Hasher.update(Chunk)
+                        self.Hashed += len(Chunk)
+            self.Arrived.notify_all()
+
+    def IsAvailable(self, Start: int, End: int):
+        '''
+        Whether all bytes of [Start, End) have arrived
+        '''
+        for Segment_Start, Segment_End, Done in sorted(self.Segments):
+            if Start >= End:
+                break
+            if Segment_Start <= Start < Segment_Start + Done:
+                Start = Segment_Start + Done
+        return Start >= End
+
+    def WaitFor(self, Start: int, End: int):
+        '''
+        Wait until [Start, End) has arrived, return False if the download stopped before that
+        '''
+        with self.Arrived:
+            while not self.IsAvailable(Start, End):
+                if self.Stopped:
+                    return False
+                self.Arrived.wait(1)
+            return True
+
+    def Stop(self, Completed: bool = False):
+        with self.Arrived:
+            self.Completed = Completed
+            self.Stopped = True
+            self.Arrived.notify_all()
+
+    def CatchUp(self):
+        '''
+        Hash what was downloaded before resuming
+        '''
+        self.Feed(0, b'')
+
+    def Remove(self):
+        for FilePath in (self.PartPath, self.StatePath):
+            os.remove(FilePath) if Path(FilePath).exists() else None
+
+
+class Stream_Reader(io.RawIOBase):
+    '''
+    Read a download from the start while it is still arriving (blocking until the next bytes are in)
+    '''
+    def __init__(self, State: Download_State):
+        super().__init__()
+        self.State = State
+        self.File = open(State.PartPath, mode = 'rb')
+        self.Offset = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, Buffer):
+        with self.State.Arrived:
+            while self.State.Frontier() <= self.Offset and not self.State.Stopped:
+                self.State.Arrived.wait(1)
+            Frontier = self.State.Frontier()
+        if Frontier <= self.Offset:
+            if self.State.Completed:
+                return 0
+            raise OSError(f"Download of {self.State.URL} stopped")
+        self.File.seek(self.Offset)
+        Size = self.File.readinto(memoryview(Buffer)[:min(len(Buffer), Frontier - self.Offset)])
+        self.Offset += Size
+        return Size
+
+    def close(self):
+        self.File.close()
+        super().close()
+
+
+def ExtractZip(FilePath: str, ExtractDir: str, Size: Optional[int] = None, WaitFor: Optional[Callable[[int, int], bool]] = None, Paths: Optional[list] = None):
+    '''
+    Unpack a zip archive with its members decompressed in parallel,
+    each member as soon as its bytes are in when the archive is still arriving, return the extracted paths
+    '''
+    Paths = Paths if Paths is not None else []
+    WaitFor = WaitFor or (lambda Start, End: True)
+    Size = Size if Size is not None else os.path.getsize(FilePath)
+    if not WaitFor(max(0, Size - ZipTailSize), Size):
+        raise OSError(f"Download of {FilePath} stopped")
+    try:
+        Zip = zipfile.ZipFile(FilePath)
+    except zipfile.BadZipFile:
+        # Member list is bigger than the tail segment, wait for everything
+        if not WaitFor(0, Size):
+            raise OSError(f"Download of {FilePath} stopped")
+        Zip = zipfile.ZipFile(FilePath)
+    with Zip, ThreadPoolExecutor(max_workers = MaxExtractWorkers) as Executor:
+        Members = sorted(Zip.infolist(), key = lambda Member: Member.header_offset)
+        Ends = [Member.header_offset for Member in Members[1:]] + [Zip.start_dir]
+        Futures = []
+        for Member, End in zip(Members, Ends):
+            if not WaitFor(Member.header_offset, End):
+                raise OSError(f"Download of {FilePath} stopped")
+            Futures.append(Executor.submit(Zip.extract, Member, ExtractDir))
+            Futures[-1].add_done_callback(lambda Future: Paths.append(Future.result()) if Future.exception() is None else None)
+        for Future in Futures:
+            Future.result()
+    return Paths
+
+
+def ExtractTar(FileObj: io.IOBase, ExtractDir: str, Paths: Optional[list] = None):
+    '''
+    Unpack a (compressed) tar archive member by member as it is read, return the extracted paths
+    '''
+    Filter = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+    Paths = Paths if Paths is not None else []
+    with tarfile.open(fileobj = FileObj, mode = 'r|*') as Tar:
+        for Member in Tar:
+            Paths.append(os.path.join(ExtractDir, Member.name))
+            Tar.extract(Member, ExtractDir, **Filter)
+    return Paths
+
+
+def ExtractArchive(FilePath: str, ExtractDir: str):
+    '''
+    Unpack a downloaded archive, return the extracted paths
+    '''
+    if GetArchiveFormat(FilePath) == 'zip':
+        return ExtractZip(FilePath, ExtractDir)
+    if GetArchiveFormat(FilePath) == 'tar':
+        with open(FilePath, mode = 'rb') as f:
+            return ExtractTar(f, ExtractDir)
+    return []
+
+
+def RemovePaths(Paths: list):
+    for FilePath in Paths:
+        os.remove(FilePath) if Path(FilePath).is_file() else None
+
+
+def DownloadSegment(State: Download_State, Index: int, OnChunk: Optional[Callable[[], None]] = None):
+    '''
+    Fetch the rest of a segment, retrying (from where it stopped) when the connection drops
+    '''
+    Retries = 0
+    while True:
+        Start, End, Done = State.Segments[Index]
+        if End is not None and Start + Done >= End:
+            return
+        Headers = {'Range': f"bytes={Start + Done}-{End - 1}"} if State.Ranged else {}
+        try:
+            with urllib.request.urlopen(urllib.request.Request(State.URL, headers = Headers), timeout = Timeout) as Response:
+                if State.Ranged and Response.status != 206:
+                    raise OSError(f"Server ignored range request for {State.URL}")
+                with open(State.PartPath, mode = 'r+b' if State.Ranged else 'ab') as f:
+                    f.seek(Start + Done) if State.Ranged else None
+                    while True:
+                        Chunk = Response.read(DownloadChunkSize if End is None else min(DownloadChunkSize, End - Start - State.Segments[Index][2]))
+                        if not Chunk:
+                            break
+                        f.write(Chunk)
+                        f.flush()
+                        State.Feed(Index, Chunk)
+                        OnChunk() if OnChunk is not None else None
+            if End is None or Start + State.Segments[Index][2] >= End:
+                return
+            raise OSError(f"Connection closed early while downloading {State.URL}")
+        except (OSError, http.client.HTTPException) as e:
+            State.Save()
+            Retries += 1
+            if Retries > MaxRetries or not State.Ranged or (isinstance(e, urllib.error.HTTPError) and e.code < 500):
+                raise
+            time.sleep(min(2 ** Retries, 30))
+
+
+def DownloadFile(
+    DownloadURL: str,
+    DownloadDir: str,
+    FileName: str,
+    FileFormat: str,
+    SHA_Expected: Optional[str] = None,
+    Segments: int = MaxSegments,
+    OnProgress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ExtractDir: Optional[str] = None
+):
+    '''
+    Download a file in parallel segments (resuming a previous partial download if there is one),
+    hash it while it arrives and check the hash against the expected one, return the path of the file
+    (zip and tar archives are unpacked into ExtractDir while they arrive if it's given)
+    '''
+    os.makedirs(DownloadDir, exist_ok = True)
+    DownloadName = FileName + (FileFormat if '.' in FileFormat else f'.{FileFormat}')
+    DownloadPath = Path(DownloadDir).joinpath(DownloadName).absolute().as_posix()
+    PartPath = f"{DownloadPath}.part"
+    ArchiveFormat = GetArchiveFormat(DownloadPath) if ExtractDir is not None else None
+
+    if Path(DownloadPath).is_file() and SHA_Expected is not None:
+        Hasher = GetHasher(SHA_Expected)
+        with open(DownloadPath, mode = 'rb') as f:
+            for Chunk in iter(lambda: f.read(DownloadChunkSize), b''):
+                Hasher.update(Chunk)
+        if Hasher.hexdigest() == SHA_Expected.lower():
+            ExtractArchive(DownloadPath, ExtractDir) if ArchiveFormat is not None else None
+            return DownloadPath
+
+    with DownloadSlots:
+        Size, Ranged = GetRemoteInfo(DownloadURL)
+        Ranged = Ranged and Size is not None
+        State = Download_State(PartPath, DownloadURL, Size, Ranged, SHA_Expected, Segments, ZipTailSize if ArchiveFormat == 'zip' else 0)
+        State.CatchUp()
+
+        Paths = []
+        Extractor = ThreadPoolExecutor(max_workers = 1)
+        if ArchiveFormat == 'zip' and Ranged:
+            Extracted = Extractor.submit(ExtractZip, PartPath, ExtractDir, Size, State.WaitFor, Paths)
+        elif ArchiveFormat == 'tar':
+            def StreamTar():
+                with io.BufferedReader(Stream_Reader(State), DownloadChunkSize) as f:
+                    return ExtractTar(f, ExtractDir, Paths)
+            Extracted = Extractor.submit(StreamTar)
+        else:
+            Extracted = None
+
+        LastSaved = [time.monotonic()]
+        def OnChunk():
+            OnProgress(State.Downloaded(), Size) if OnProgress is not None else None
+            if time.monotonic() - LastSaved[0] > 5:
+                LastSaved[0] = time.monotonic()
+                State.Save()
+
+        try:
+            with ThreadPoolExecutor(max_workers = len(State.Segments)) as Executor:
+                Futures = [Executor.submit(DownloadSegment, State, Index, OnChunk) for Index in range(len(State.Segments))]
+                for Future in Futures:
+                    Future.result()
+        except BaseException:
+            State.Stop()
+            State.Save()
+            Extractor.shutdown(wait = True)
+            raise
+
+        State.CatchUp()
+        SHA_Current = State.Hasher.hexdigest()
+        Verified = SHA_Expected is None or SHA_Current == SHA_Expected.lower()
+        State.Stop(Completed = True)
+        try:
+            Streamed = Extracted.result() is not None if Extracted is not None else False
+        except Exception:
+            Streamed = False
+        finally:
+            Extractor.shutdown(wait = True)
+        if not Verified:
+            # Drop whatever was unpacked from the bad download too
+            RemovePaths(Paths)
+            State.Remove()
+            raise Exception(f"SHA mismatch for {DownloadName} (expected {SHA_Expected}, got {SHA_Current})")
+        os.replace(PartPath, DownloadPath)
+        os.remove(State.StatePath)
+
+    # Unpack what couldn't be unpacked while downloading
+    ExtractArchive(DownloadPath, ExtractDir) if ArchiveFormat is not None and not Streamed else None
+
+    return DownloadPath
+
+##############################################################################################################################
@@ -1,14 +1,25 @@
 import os
 import re
 import sys
+import json
+import math
+import time
 import platform
 import shutil
+import tempfile
+import threading
+import subprocess
+import urllib.error
+import urllib.request
 import pynvml
-#import subprocess
 #import pkg_resources
+from importlib.metadata import PathDistribution
 from packaging import version
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.utils import canonicalize_name
 from pathlib import Path
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from PySide6.QtCore import QObject, Signal
 from QEasyWidgets import QFunctions as QFunc
 
@@ -61,9 +72,348 @@ class CustomSignals_EnvConfigurator(QObject):
     Signal_PytorchInstalled = Signal()
     Signal_PytorchInstallFailed = Signal(Exception)
 
+    Signal_EnvReport = Signal(object, bool)
+
 
 EnvConfiguratorSignals = CustomSignals_EnvConfigurator()
 
+##############################################################################################################################
+
+# Run by the interpreter to check, reports where it looks for packages and the values of its environment markers
+ProbeScript = '''
+import os, sys, json, platform
+def FormatVersion(Info):
+    return '%d.%d.%d' % Info[:3] + ('' if Info.releaselevel == 'final' else Info.releaselevel[0] + str(Info.serial))
+print(json.dumps({
+    'Executable': sys.executable,
+    'Paths': [Path for Path in sys.path if Path != ''],
+    'Environment': {
+        'implementation_name': sys.implementation.name,
+        'implementation_version': FormatVersion(sys.implementation.version),
+        'os_name': os.name,
+        'platform_machine': platform.machine(),
+        'platform_release': platform.release(),
+        'platform_system': platform.system(),
+        'platform_version': platform.version(),
+        'python_full_version': platform.python_version(),
+        'platform_python_implementation': platform.python_implementation(),
+        'python_version': '.'.join(platform.python_version_tuple()[:2]),
+        'sys_platform': sys.platform
+    }
+}))
+'''
+
+
+class Installed_Distributions:
+    '''
+    Versions of the distributions installed for an interpreter, read from the metadata in its search paths in one scan
+    (the interpreter is only run once to find those paths, the scan is kept until one of them changes its mtime)
+    '''
+    def __init__(self, Interpreter: str = 'python'):
+        self.Interpreter = Interpreter
+
+        self.Lock = threading.Lock()
+        self.ProbeKey = None
+        self.Paths = []
+        self.Environment = {}
+        self.ScanKey = None
+        self.Versions = {}
+
+    def Probe(self):
+        ExecutablePath = shutil.which(self.Interpreter)
+        if ExecutablePath is None:
+            raise OSError(f"{self.Interpreter} not found")
+        ProbeKey = (ExecutablePath, os.stat(ExecutablePath).st_mtime_ns)
+        if ProbeKey != self.ProbeKey:
+            Result = subprocess.run([ExecutablePath, '-c', ProbeScript], capture_output = True, text = True, timeout = 60)
+            if Result.returncode != 0:
+                raise OSError(f"Failed to probe {ExecutablePath}: {Result.stderr.strip()}")
+            ProbeResult = json.loads(Result.stdout)
+            self.Paths = [Path for Path in ProbeResult['Paths'] if os.path.isdir(Path)]
+            self.Environment = ProbeResult['Environment']
+            self.ProbeKey = ProbeKey
+            self.ScanKey = None
+
+    def ScanPath(self, SearchPath: str, Versions: dict):
+        for Entry in os.scandir(SearchPath):
+            Stem, Suffix = os.path.splitext(Entry.name)
+            if Suffix not in ('.dist-info', '.egg-info'):
+                continue
+            NameVersion = Stem.split('-')
+            if Suffix == '.dist-info' and len(NameVersion) == 2: # The name and version are in the folder's name
+                Name, DistVersion = NameVersion
+            else:
+                Metadata = PathDistribution(Path(Entry.path)).metadata
+                Name, DistVersion = Metadata['Name'], Metadata['Version']
+                if Name is None or DistVersion is None:
+                    continue
+            Versions.setdefault(canonicalize_name(Name), DistVersion) # The first one found is the one imported
+
+    def GetVersions(self):
+        '''
+        Return the installed distributions (by their normalized names) and their versions
+        '''
+        with self.Lock:
+            self.Probe()
+            ScanKey = tuple(os.stat(SearchPath).st_mtime_ns for SearchPath in self.Paths)
+            if ScanKey != self.ScanKey:
+                Versions = {}
+                for SearchPath in self.Paths:
+                    self.ScanPath(SearchPath, Versions)
+                self.Versions = Versions
+                self.ScanKey = ScanKey
+            return self.Versions
+
+    def Check(self, Req: Requirement):
+        '''
+        Return the installed version that satisfies the requirement, True if its marker doesn't apply to the interpreter,
+        or False if it isn't satisfied
+        '''
+        Versions = self.GetVersions()
+        if Req.marker is not None and not Req.marker.evaluate(self.Environment):
+            return True
+        CurrentVersion = Versions.get(canonicalize_name(Req.name))
+        if CurrentVersion is None:
+            return False
+        return CurrentVersion if Req.specifier.contains(CurrentVersion, prereleases = True) else False
+
+
+InstalledDistributions = Installed_Distributions()
+
+##############################################################################################################################
+
+# Indexes to install Python requirements from (tried from the fastest to answer)
+MirrorList = ['https://pypi.org/simple', 'https://pypi.tuna.tsinghua.edu.cn/simple']
+
+
+def MeasureLatency(URL: str, Timeout: float = 3):
+    '''
+    Time a request to the URL (infinite if it can't be reached)
+    '''
+    Start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(URL, method = 'HEAD'), timeout = Timeout):
+            pass
+    except urllib.error.HTTPError:
+        pass
+    except (OSError, ValueError):
+        return math.inf
+    return time.perf_counter() - Start
+
+
+def SortMirrors(Mirrors: list):
+    with ThreadPoolExecutor(max_workers = max(len(Mirrors), 1)) as Executor:
+        Latencies = list(Executor.map(MeasureLatency, Mirrors))
+    return [Mirror for _, Mirror in sorted(zip(Latencies, Mirrors), key = lambda Item: Item[0])]
+
+
+def InstallRequirements(
+    Requirements: list,
+    Interpreter: str = InstalledDistributions.Interpreter,
+    Mirrors: list = MirrorList,
+    CacheDir: Optional[str] = None,
+    WheelhouseDir: Optional[str] = None
+):
+    '''
+    Install the requirements with one pip run so that they are resolved together, reusing the wheels in the cache dir,
+    the wheelhouse is tried alone (offline) before the mirrors
+    '''
+    ExecutablePath = shutil.which(Interpreter)
+    if ExecutablePath is None:
+        raise OSError(f"{Interpreter} not found")
+    with tempfile.NamedTemporaryFile(mode = 'w', suffix = '.txt', delete = False, encoding = 'utf-8') as f:
+        f.write('\n'.join(Requirements) + '\n')
+        RequirementsPath = f.name
+    try:
+        Args = [ExecutablePath, '-m', 'pip', 'install', '-r', RequirementsPath, '--disable-pip-version-check']
+        Args += ['--cache-dir', CacheDir] if CacheDir is not None else []
+        HasWheelhouse = WheelhouseDir is not None and Path(WheelhouseDir).is_dir()
+        Args += ['--find-links', WheelhouseDir] if HasWheelhouse else []
+        Attempts = ([['--no-index']] if HasWheelhouse else []) + [['--index-url', Mirror] for Mirror in SortMirrors(Mirrors)]
+        Error = None
+        for Attempt in Attempts:
+            Result = subprocess.run(Args + Attempt, capture_output = True, text = True)
+            if Result.returncode == 0:
+                return
+            Error = (Result.stderr.strip() or Result.stdout.strip()).splitlines()[-1:]
+        raise Exception(Error[0] if Error else "No index to install from")
+    finally:
+        os.remove(RequirementsPath)
+
+##############################################################################################################################
+
+# How long (in seconds) a check may take before it is given up on
+CheckTimeout = 30
+
+# Packages that make up Pytorch
+PytorchPackageList = ['torch', 'torchvision', 'torchaudio', 'pytorch-lightning']
+
+
+def GetCommandVersion(Args: list, Timeout: float = CheckTimeout):
+    '''
+    Return the first line a command prints about its version (False if it can't be run)
+    '''
+    try:
+        Result = subprocess.run(Args, capture_output = True, text = True, timeout = Timeout)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    Output = Result.stdout.strip() or Result.stderr.strip()
+    return Output.splitlines()[0] if Result.returncode == 0 and Output != '' else False
+
+
+def ReadRequirements(FilePath: str):
+    '''
+    Read the requirement lines of a requirements file, return them with their parsed forms (None for those that can't be parsed)
+    '''
+    Requirements = []
+    with open(FilePath, 'r') as f:
+        for Line in f.read().splitlines():
+            Line = re.split(r'(^|\s)#', Line, 1)[0].strip()
+            if Line == '' or Line.startswith('-'):
+                continue
+            try:
+                Requirements.append((Line, Requirement(Line)))
+            except InvalidRequirement:
+                Requirements.append((Line, None))
+    return Requirements
+
+
+def Check_Aria2():
+    Result = GetCommandVersion(['aria2c', '-v'])
+    return {'Detected': Result != False, 'Version': Result, 'Status': f"Aria2 detected. Version: {Result}"}
+
+
+def Check_FFmpeg():
+    Result = GetCommandVersion(['ffmpeg', '-version'])
+    return {'Detected': Result != False, 'Version': Result, 'Status': f"FFmpeg detected. Version: {Result}"}
+
+
+def Check_Python():
+    Result = GetCommandVersion([InstalledDistributions.Interpreter, '--version'])
+    Matched = re.match(r'Python (\d+)\.(\d+)', Result) if Result != False else None
+    Detected = Matched is not None and (int(Matched[1]), int(Matched[2])) >= (3, 8)
+    return {'Detected': Detected, 'Version': Result, 'Status': f"Python detected. Version: {Result}"}
+
+
+def Check_PyReqs(FilePath: str):
+    Missing = []
+    for Line, Req in ReadRequirements(FilePath):
+        try:
+            Result = InstalledDistributions.Check(Req) if Req is not None else False
+        except (OSError, ValueError):
+            Result = False
+        Missing.append(Line) if Result == False else None
+    return {'Detected': Missing == [], 'Status': "All requirements detected.", 'Missing': Missing}
+
+
+def Check_Pytorch():
+    Missing = []
+    Versions = {}
+    for Package in PytorchPackageList:
+        try:
+            Result = InstalledDistributions.Check(Requirement(Package))
+        except (OSError, ValueError):
+            Result = False
+        Missing.append(Package) if Result == False else Versions.update({Package: Result})
+    return {'Detected': Missing == [], 'Version': Versions.get('torch'), 'Status': f"torch detected. Version: {Versions.get('torch')}", 'Missing': Missing}
+
+
+def GetEnvKey():
+    '''
+    What the checks depend on: PATH and the interpreter (by its path and mtime)
+    '''
+    ExecutablePath = shutil.which(InstalledDistributions.Interpreter)
+    return [os.environ.get('PATH', ''), ExecutablePath, os.stat(ExecutablePath).st_mtime_ns if ExecutablePath is not None else None]
+
+
+class Env_Report:
+    '''
+    Results of all environment checks by their names, kept on disk under the key they were made with
+    so that the next launch can show them before checking again
+    '''
+    def __init__(self, Key: list, Results: dict = {}, Time: Optional[float] = None):
+        self.Key = Key
+        self.Results = dict(Results)
+        self.Time = Time if Time is not None else time.time()
+
+    def IsDetected(self, Name: str):
+        return self.Results.get(Name, {}).get('Detected', False)
+
+    def GetStatus(self, Name: str):
+        return self.Results.get(Name, {}).get('Status')
+
+    @classmethod
+    def Load(cls, ReportPath: str):
+        '''
+        Read the report saved before, None if there's none or PATH or the interpreter changed since
+        '''
+        try:
+            with open(ReportPath, mode = 'r', encoding = 'utf-8') as f:
+                Report = json.load(f)
+            Key = GetEnvKey()
+        except (OSError, ValueError):
+            return None
+        return cls(Key, Report['Results'], Report['Time']) if Report.get('Key') == Key else None
+
+    def Save(self, ReportPath: str):
+        os.makedirs(Path(ReportPath).parent, exist_ok = True)
+        TempPath = f"{ReportPath}.tmp"
+        with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+            json.dump({'Key': self.Key, 'Time': self.Time, 'Results': self.Results}, f, ensure_ascii = False)
+        os.replace(TempPath, ReportPath)
+
+
+class Env_Prober:
+    '''
+    Run all environment checks at the same time (each one given up on after the timeout) and gather them into one report
+    '''
+    def __init__(self, RequirementsPath: Optional[str] = None, ReportPath: Optional[str] = None, Timeout: float = CheckTimeout):
+        self.RequirementsPath = RequirementsPath
+        self.ReportPath = ReportPath
+        self.Timeout = Timeout
+
+    def GetChecks(self):
+        Checks = {
+            'Aria2': Check_Aria2,
+            'FFmpeg': Check_FFmpeg,
+            'Python': Check_Python,
+            'Pytorch': Check_Pytorch
+        }
+        Checks.update(PyReqs = lambda: Check_PyReqs(self.RequirementsPath)) if self.RequirementsPath is not None and Path(self.RequirementsPath).exists() else None
+        return Checks
+
+    def Probe(self):
+        Key = GetEnvKey()
+        Checks = self.GetChecks()
+        Executor = ThreadPoolExecutor(max_workers = len(Checks))
+        Futures = {Name: Executor.submit(Check) for Name, Check in Checks.items()}
+        Executor.shutdown(wait = False)
+        Deadline = time.monotonic() + self.Timeout
+        Results = {}
+        for Name, Future in Futures.items():
+            try:
+                Results[Name] = Future.result(timeout = max(Deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                Results[Name] = {'Detected': False, 'Status': f"Checking {Name} timed out", 'Error': 'Timeout'}
+            except Exception as e:
+                Results[Name] = {'Detected': False, 'Status': f"Checking {Name} failed", 'Error': str(e)}
+        Report = Env_Report(Key, Results)
+        Report.Save(self.ReportPath) if self.ReportPath is not None else None
+        return Report
+
+    def LoadCached(self):
+        return Env_Report.Load(self.ReportPath) if self.ReportPath is not None else None
+
+    def Revalidate(self):
+        '''
+        Send the saved report right away (if it still applies) and a fresh one once the checks are done (in the background)
+        '''
+        CachedReport = self.LoadCached()
+        EnvConfiguratorSignals.Signal_EnvReport.emit(CachedReport, True) if CachedReport is not None else None
+        threading.Thread(target = lambda: EnvConfiguratorSignals.Signal_EnvReport.emit(self.Probe(), False), daemon = True).start()
+
+##############################################################################################################################
+
 
 class Aria2_Installer(QObject):
     '''
@@ -74,11 +424,8 @@ class Aria2_Installer(QObject):
         super().__init__()
 
     def Check_Aria2(self):
-        try:
-            Aria2Version = str(QFunc.RunCMD([['aria2c', '-v']], DecodeResult = True)[0])
-            return Aria2Version
-        except OSError:
-            return False
+        Result = Check_Aria2()
+        return Result['Version'] if Result['Detected'] else False
 
     def Install_Aria2(self):
         if platform.system() == 'Windows':
@@ -133,11 +480,8 @@ class FFmpeg_Installer(QObject):
         super().__init__()
 
     def Check_FFmpeg(self):
-        try:
-            FFmpegVersion = str(QFunc.RunCMD([['ffmpeg', '-version']], DecodeResult = True)[0])
-            return FFmpegVersion
-        except OSError:
-            return False
+        Result = Check_FFmpeg()
+        return Result['Version'] if Result['Detected'] else False
 
     def Install_FFmpeg(self):
         if platform.system() == 'Windows':
@@ -336,14 +680,8 @@ class Python_Installer(QObject):
         except ImportError:
             return False
         '''
-        try:
-            PythonVersion = str(QFunc.RunCMD([['python', '--version']], DecodeResult = True)[0])
-            if PythonVersion.split('.')[0] == 'Python 3' and int(PythonVersion.split('.')[1]) >= 8:
-                return PythonVersion
-            else:
-                return False
-        except OSError:
-            return False
+        Result = Check_Python()
+        return Result['Version'] if Result['Detected'] else False
 
     def Install_Python(self, Version_Download: str):
         if platform.system() == 'Windows':
@@ -396,7 +734,7 @@ class PyReqs_Installer(QObject):
 
         self.EmitFlag = True
 
-    def Check_PyReq(self, PackageName: str, PackageVersionReqs: str, SystemReqs: str):
+    def Check_PyReq(self, Req: Requirement):
         '''
         try:
             Version_Current = pkg_resources.get_distribution(Package).version #exec("import {0}".format(Package))
@@ -406,66 +744,34 @@ class PyReqs_Installer(QObject):
             return False
         '''
         try:
-            PackageInfos = str(QFunc.RunCMD([['pip', 'show', PackageName]], DecodeResult = True)[0])
-            if PackageInfos != 'None':
-                CurrentVersion = None
-                for PackageInfo in PackageInfos.splitlines():
-                    if PackageInfo.startswith('Version:'):
-                        CurrentVersion = PackageInfo[len('Version:'):].strip()
-                        continue
-                CurrentVersion = PackageInfos if CurrentVersion is None else CurrentVersion
-                return CurrentVersion if QFunc.IsVersionSatisfied(CurrentVersion, PackageVersionReqs) or not QFunc.IsSystemSatisfied(SystemReqs) else False
-            else:
-                return False
-        except OSError:
+            return InstalledDistributions.Check(Req)
+        except (OSError, ValueError):
             return False
 
-    def Install_PyReq(self, Package: str):
-        MirrorList = ['https://pypi.org/simple', 'https://pypi.tuna.tsinghua.edu.cn/simple']
-        for Mirror in MirrorList:
-            '''
-            Ask = "This script requires {0}. Do you want to install {0}? [y/n]".format(Package)
-            Inquiry = input(Ask)
-            while Inquiry not in ("y", "n"):
-                Inquiry = input(Ask)
-            if Inquiry == "y":
-                os.system("pip3 install {0} --index-url {1}".format(Package, Mirror))
-            else:
-                exit(-1)
-            '''
-            _, _, ReturnCode = QFunc.RunCMD([f'pip3 install {Package} --index-url {Mirror}'])
-            if ReturnCode == 0:
-                break
+    def Install_PyReqs(self, Packages: list, CacheDir: Optional[str] = None, WheelhouseDir: Optional[str] = None):
+        '''
+        Install the packages in one resolver run
+        '''
+        InstallRequirements(Packages, CacheDir = CacheDir, WheelhouseDir = WheelhouseDir)
 
-    def Execute_PyReqs_Installation(self, FilePath: str):
+    def Execute_PyReqs_Installation(self, FilePath: str, CacheDir: Optional[str] = None, WheelhouseDir: Optional[str] = None):
         MissingRequirementList = []
-        with open(FilePath, 'r') as f:
-            Requirements = f.read().splitlines() #Requirements = f.readlines()
-        for Index, Requirement in enumerate(Requirements):
-            if not (Requirement.startswith('#') or Requirement.strip() == ''):
-                SplitRequirement = re.split(';', Requirement, 1)
-                Package = SplitRequirement[0]
-                SystemReqs = SplitRequirement[1] if len(SplitRequirement) == 2 else None
-                SplitPackage = re.split('=|>|<', Package, 1)
-                PackageName = SplitPackage[0]
-                PackageVersionReqs = Package[len(PackageName):] if len(SplitPackage) == 2 else None
-                Result = self.Check_PyReq(PackageName, PackageVersionReqs, SystemReqs)
-                if Result == False:
-                    if self.EmitFlag == True:
-                        EnvConfiguratorSignals.Signal_PyReqsUndetected.emit()
-                        self.EmitFlag = False
-                    MissingRequirementList.append(Package)
-                else:
-                    EnvConfiguratorSignals.Signal_PyReqsDetected.emit() if Index + 1 == len(Requirements) and MissingRequirementList == [] else None
-                    EnvConfiguratorSignals.Signal_PyReqsStatus.emit(f"{PackageName} detected. Version: {Result}")
-            else:
-                continue
-        for Index, MissingRequirement in enumerate(MissingRequirementList):
-            EnvConfiguratorSignals.Signal_PyReqsStatus.emit(f"Installing {MissingRequirement}. Please wait...")
+        for Line, Req in ReadRequirements(FilePath):
+            Result = self.Check_PyReq(Req) if Req is not None else False # Lines that can't be parsed are left for pip to make sense of
+            if Result == False:
+                if self.EmitFlag == True:
+                    EnvConfiguratorSignals.Signal_PyReqsUndetected.emit()
+                    self.EmitFlag = False
+                MissingRequirementList.append(str(Req).split(';', 1)[0].strip() if Req is not None else Line)
+            elif Result != True:
+                EnvConfiguratorSignals.Signal_PyReqsStatus.emit(f"{Req.name} detected. Version: {Result}")
+        EnvConfiguratorSignals.Signal_PyReqsDetected.emit() if MissingRequirementList == [] else None
+        if MissingRequirementList != []:
+            EnvConfiguratorSignals.Signal_PyReqsStatus.emit(f"Installing {', '.join(MissingRequirementList)}. Please wait...")
             try:
-                self.Install_PyReq(MissingRequirement)
-                EnvConfiguratorSignals.Signal_PyReqsInstalled.emit() if Index + 1 == len(MissingRequirementList) else None
-                EnvConfiguratorSignals.Signal_PyReqsStatus.emit("Successfully installed!") if Index + 1 == len(MissingRequirementList) else None
+                self.Install_PyReqs(MissingRequirementList, CacheDir, WheelhouseDir)
+                EnvConfiguratorSignals.Signal_PyReqsInstalled.emit()
+                EnvConfiguratorSignals.Signal_PyReqsStatus.emit("Successfully installed!")
             except Exception as e:
                 EnvConfiguratorSignals.Signal_PyReqsInstallFailed.emit(e)
                 EnvConfiguratorSignals.Signal_PyReqsStatus.emit("Installation failed:(")
@@ -503,12 +809,8 @@ class Pytorch_Installer(QObject):
             return False
         '''
         try:
-            PackageInfos = str(QFunc.RunCMD([['pip', 'show', Package]], DecodeResult = True)[0])
-            if PackageInfos != 'None':
-                return PackageInfos
-            else:
-                return False
-        except OSError:
+            return InstalledDistributions.Check(Requirement(Package))
+        except (OSError, ValueError, InvalidRequirement):
             return False
 
     def Install_Pytorch(self, Package: str, Reinstall: bool):
@@ -534,7 +836,7 @@ class Pytorch_Installer(QObject):
             )
 
     def Execute_Pytorch_Installation(self, Version: Optional[str] = None, Reinstall: bool = False):
-        PackageList = ['torch', 'torchvision', 'torchaudio', 'pytorch-lightning']
+        PackageList = PytorchPackageList
         VersionDict = {
             '2.0.1': {'torch': '2.0.1', 'torchvision': '0.15.2', 'torchaudio': '2.0.2', 'pytorch-lightning': '2.1'},
             '2.2.2': {'torch': '2.2.2', 'torchvision': '0.17.2', 'torchaudio': '2.2.2', 'pytorch-lightning': '2.2'}
@@ -0,0 +1,220 @@
+import os
+import sys
+import mmap
+import math
+import wave
+import struct
+from array import array
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+##############################################################################################################################
+
+# Head of a binary filelist: magic, version, row count, column count, whether the text ends with a newline,
+# and the size and mtime of the text filelist it was made from
+Header = struct.Struct('<6sHIIB3xQq')
+Magic = b'EVTFL\0'
+Version = 1
+
+# Suffix of the binary filelist kept next to a text one
+Suffix = '.evtfl'
+
+# Number of audio files whose header is read at once for their duration
+MaxDurationWorkers = 8
+
+##############################################################################################################################
+
+def Align(Size: int):
+    return (Size + 7) // 8 * 8
+
+
+def ToLittleEndian(Array: array):
+    Array.byteswap() if sys.byteorder == 'big' else None
+    return Array
+
+
+def ReadDuration(AudioPath: str):
+    '''
+    Read the duration of a wav file from its header (NaN if it can't be read)
+    '''
+    try:
+        with wave.open(AudioPath, mode = 'rb') as Audio:
+            return Audio.getnframes() / Audio.getframerate()
+    except (OSError, EOFError, wave.Error, ZeroDivisionError):
+        return math.nan
+
+
+def ReadTextFileList(TextPath: str):
+    '''
+    Read the lines of a text filelist as they are (line endings other than the newline are kept), return them and whether the text ends with a newline
+    '''
+    with open(TextPath, mode = 'r', encoding = 'utf-8', newline = '') as f:
+        Text = f.read()
+    Lines = Text.split('\n')
+    TrailingNewline = len(Text) > 0 and Lines[-1] == ''
+    Lines.pop() if TrailingNewline or len(Text) == 0 else None
+    return Lines, TrailingNewline
+
+
+def WriteTextFileList(TextPath: str, Lines: list, TrailingNewline: bool):
+    TempPath = f"{TextPath}.tmp"
+    with open(TempPath, mode = 'w', encoding = 'utf-8', newline = '') as f:
+        f.write('\n'.join(Lines) + ('\n' if TrailingNewline and len(Lines) > 0 else ''))
+    os.replace(TempPath, TextPath)
+
+
+def WriteFileList(BinPath: str, Lines: list, TrailingNewline: bool, Source: tuple = (0, 0), Durations: Optional[list] = None):
+    '''
+    Write the lines as a binary filelist, where each field ('|'-separated) is a column of UTF-8 values with their offsets
+    '''
+    Rows = [Line.split('|') for Line in Lines]
+    NumColumns = max((len(Row) for Row in Rows), default = 0)
+    Parts = [Header.pack(Magic, Version, len(Rows), NumColumns, TrailingNewline, *Source)]
+    def AddPart(Part: bytes):
+        Parts.append(Part)
+        Parts.append(bytes(Align(len(Part)) - len(Part)))
+    AddPart(ToLittleEndian(array('H', [len(Row) for Row in Rows])).tobytes())
+    AddPart(ToLittleEndian(array('f', Durations if Durations is not None else [math.nan] * len(Rows))).tobytes())
+    for Column in range(NumColumns):
+        Values = [Row[Column].encode('utf-8') if Column < len(Row) else b'' for Row in Rows]
+        Offsets = array('Q', [0])
+        for Value in Values:
+            Offsets.append(Offsets[-1] + len(Value))
+        Parts.append(ToLittleEndian(Offsets).tobytes())
+        AddPart(b''.join(Values))
+    TempPath = f"{BinPath}.tmp"
+    with open(TempPath, mode = 'wb') as f:
+        f.writelines(Parts)
+    os.replace(TempPath, BinPath)
+
+
+class File_List:
+    '''
+    Filelist memory-mapped from its binary form, fields are only decoded when asked for
+    (pickling it only carries the path, so dataloader workers map the same pages instead of copying them)
+    '''
+    def __init__(self, BinPath: str):
+        self.BinPath = BinPath
+        self.Open()
+
+    def Open(self):
+        with open(self.BinPath, mode = 'rb') as f:
+            self.Map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        MagicRead, VersionRead, self.NumRows, self.NumColumns, TrailingNewline, Size, MTimeNs = Header.unpack_from(self.Map, 0)
+        if MagicRead != Magic or VersionRead != Version:
+            self.Map.close()
+            raise ValueError(f"Not a binary filelist of version {Version}: {self.BinPath}")
+        self.TrailingNewline = bool(TrailingNewline)
+        self.Source = (Size, MTimeNs)
+
+        View = memoryview(self.Map)
+        Position = Header.size
+        def GetArray(TypeCode: str, Length: int):
+            nonlocal Position
+            Size = array(TypeCode).itemsize * Length
+            Part = View[Position : Position + Size]
+            Position += Align(Size)
+            return Part.cast(TypeCode) if sys.byteorder == 'little' else ToLittleEndian(array(TypeCode, Part.tobytes()))
+        self.FieldCounts = GetArray('H', self.NumRows)
+        self.Durations = GetArray('f', self.NumRows)
+        self.Columns = []
+        for Column in range(self.NumColumns):
+            Offsets = GetArray('Q', self.NumRows + 1)
+            Blob = View[Position : Position + Offsets[-1]]
+            Position += Align(Offsets[-1])
+            self.Columns.append((Offsets, Blob))
+
+    def Close(self):
+        self.FieldCounts = self.Durations = None
+        self.Columns = []
+        self.Map.close()
+
+    def __getstate__(self):
+        return {'BinPath': self.BinPath}
+
+    def __setstate__(self, State: dict):
+        self.BinPath = State['BinPath']
+        self.Open()
+
+    def __len__(self):
+        return self.NumRows
+
+    def GetField(self, Row: int, Column: int):
+        '''
+        Return a field of a row (None if the row has fewer fields)
+        '''
+        if Column >= self.FieldCounts[Row]:
+            return None
+        Offsets, Blob = self.Columns[Column]
+        return bytes(Blob[Offsets[Row] : Offsets[Row + 1]]).decode('utf-8')
+
+    def GetLine(self, Row: int):
+        return '|'.join(self.GetField(Row, Column) for Column in range(self.FieldCounts[Row]))
+
+    def GetDuration(self, Row: int):
+        Duration = self.Durations[Row]
+        return None if math.isnan(Duration) else Duration
+
+    def GetLines(self):
+        return [self.GetLine(Row) for Row in range(self.NumRows)]
+
+    def ToText(self, TextPath: str):
+        '''
+        Export the filelist to the text format (exactly as the text it was made from)
+        '''
+        WriteTextFileList(TextPath, self.GetLines(), self.TrailingNewline)
+
+##############################################################################################################################
+
+def GetSource(TextPath: str):
+    FileStat = os.stat(TextPath)
+    return (FileStat.st_size, FileStat.st_mtime_ns)
+
+
+def ExportFileList(TextPath: str, BinPath: Optional[str] = None, WithDurations: bool = False):
+    '''
+    Convert a text filelist to the binary form (reading the durations of its wav files if asked), return the path of the latter
+    '''
+    BinPath = BinPath or f"{TextPath}{Suffix}"
+    Source = GetSource(TextPath)
+    Lines, TrailingNewline = ReadTextFileList(TextPath)
+    Durations = None
+    if WithDurations:
+        AudioPaths = [Path(TextPath).parent.joinpath(Line.split('|')[0]).as_posix() for Line in Lines]
+        with ThreadPoolExecutor(max_workers = MaxDurationWorkers) as Executor:
+            Durations = list(Executor.map(ReadDuration, AudioPaths))
+    WriteFileList(BinPath, Lines, TrailingNewline, Source, Durations)
+    return BinPath
+
+
+def LoadFileList(TextPath: str):
+    '''
+    Map a text filelist through its binary form, which is made again when the text has changed since
+    '''
+    BinPath = f"{TextPath}{Suffix}"
+    try:
+        FileList = File_List(BinPath)
+        if FileList.Source == GetSource(TextPath):
+            return FileList
+        FileList.Close()
+    except (OSError, ValueError, struct.error):
+        pass
+    return File_List(ExportFileList(TextPath, BinPath))
+
+##############################################################################################################################
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description = "Convert filelists between the text and the binary form")
+    parser.add_argument("mode",   help = "'binary' to convert text to binary, 'text' to convert binary to text", choices = ['binary', 'text'])
+    parser.add_argument("input",  help = "path of the filelist to convert")
+    parser.add_argument("output", help = "path of the converted filelist", nargs = '?', default = None)
+    parser.add_argument("--durations", help = "read the durations of the wav files (binary only)", action = 'store_true')
+    args = parser.parse_args()
+    if args.mode == 'binary':
+        print(ExportFileList(args.input, args.output, args.durations))
+    if args.mode == 'text':
+        File_List(args.input).ToText(args.output or str(Path(args.input).with_suffix('')))
+
+##############################################################################################################################
@@ -1,7 +1,14 @@
+import io
 import os
+import ast
+import time
 import platform
-from typing import Union, Optional
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QPoint
+import weakref
+import threading
+import configparser
+from typing import Union, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QPoint, QTimer
 from PySide6.QtCore import QCoreApplication as QCA
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
@@ -11,6 +18,7 @@ from QEasyWidgets.Components import *
 
 from components.Components import *
 from windows.Windows import *
+from Profiler import StartupProfiler
 
 ##############################################################################################################################
 
@@ -35,6 +43,9 @@ class CustomSignals_Functions(QObject):
 
     Signal_ReadyToUpdate = Signal(str)
 
+    # Show job queue
+    Signal_ShowJobQueue = Signal()
+
 
 FunctionSignals = CustomSignals_Functions()
 
@@ -348,6 +359,63 @@ def Function_AnimateStackedWidget(
     WidgetAnimation.start() if StackedWidget.currentIndex() != TargetIndex else None
 
 
+class Lazy_Pages(QObject):
+    '''
+    Set up the pages of a stackedwidget the first time they are shown (or needed by another page),
+    the rest can be set up while the window is idle, one page per turn of the event loop
+    '''
+    # Milliseconds to wait between two pages set up in the background
+    PrewarmInterval = 30
+
+    def __init__(self, StackedWidget: QStackedWidget):
+        super().__init__(StackedWidget)
+
+        self.StackedWidget = StackedWidget
+        self.Setups = {}
+        self.Requirements = {}
+        self.Done = set()
+
+        self.PrewarmTimer = QTimer(self)
+        self.PrewarmTimer.setSingleShot(True)
+        self.PrewarmTimer.timeout.connect(self.PrewarmNext)
+        StackedWidget.currentChanged.connect(lambda Index: self.Setup(StackedWidget.widget(Index)))
+
+    def Register(self, Page: QWidget, Setup: Optional[Callable] = None, Requires: list = []):
+        '''
+        Add a setup to the page (run right away if the page is already set up), the required pages get set up before it
+        '''
+        if Page not in self.Done:
+            self.Requirements.setdefault(Page, []).extend(Requires)
+            self.Setups.setdefault(Page, []).append(Setup) if Setup is not None else None
+            return
+        for Required in Requires:
+            self.Setup(Required)
+        Setup() if Setup is not None else None
+
+    def Setup(self, Page: QWidget):
+        if Page in self.Done:
+            return
+        self.Done.add(Page)
+        for Required in self.Requirements.pop(Page, []):
+            self.Setup(Required)
+        with StartupProfiler.Span(f"Set up {Page.objectName()}"):
+            for Setup in self.Setups.pop(Page, []):
+                Setup()
+
+    def Prewarm(self, Delay: int = 0):
+        '''
+        Set up the remaining pages in the background
+        '''
+        self.PrewarmTimer.start(Delay)
+
+    def PrewarmNext(self):
+        Pages = [Page for Page in self.Setups if Page not in self.Done]
+        if len(Pages) == 0:
+            return
+        self.Setup(Pages[0])
+        self.PrewarmTimer.start(self.PrewarmInterval)
+
+
 def Function_AnimateFrame(
     Frame: QWidget,
     MinWidth: Optional[int] = None,
@@ -387,6 +455,8 @@ def Function_AnimateProgressBar(
     '''
     Function to animate progressbar
     '''
+    ProgressBar.resetFormat()
+    ProgressBar.setToolTip('')
     ProgressBar.setTextVisible(DisplayValue)
     ProgressBar.setRange(MinValue, MaxValue)
     ProgressBar.setValue(MinValue)
@@ -398,11 +468,193 @@ def Function_AnimateProgressBar(
         ProgressBar.setRange(MinValue, MaxValue)
         ProgressBar.setValue(MaxValue)
 
+
+def Function_FormatDuration(Seconds: float):
+    Minutes, Seconds = divmod(int(Seconds), 60)
+    Hours, Minutes = divmod(Minutes, 60)
+    return f"{Hours}:{Minutes:02d}:{Seconds:02d}" if Hours > 0 else f"{Minutes:02d}:{Seconds:02d}"
+
+
+def Function_FormatProgress(Info: dict):
+    '''
+    Function to turn a progress event (see Worker.Progress_Reporter) into text
+    '''
+    Event = Info.get('Event')
+    if Event == 'Stage':
+        return f"{Info.get('Stage')}"
+    if Event == 'Progress':
+        Done, Total, Unit = Info.get('Done'), Info.get('Total'), Info.get('Unit') or ''
+        Texts = [f"{Info.get('Stage')}"] if Info.get('Stage') else []
+        Texts.append(f"{Done}/{Total} {Unit}".strip() if Total else f"{Done} {Unit}".strip())
+        Texts.append(f"{Info['Bytes'] / 1024**2:.1f} MB") if Info.get('Bytes') is not None else None
+        Texts.append(f"{Info['Rate']:.2f} {Unit or 'it'}/s") if Info.get('Rate') else None
+        Texts.append(f"剩余 {Function_FormatDuration(Info['ETA'])}") if Info.get('ETA') is not None else None
+        return ' | '.join(Texts)
+    if Event == 'Error':
+        return f"{Info.get('Type')}: {Info.get('Message')}"
+    return ''
+
+
+def Function_UpdateProgressBar(
+    ProgressBar: QProgressBar,
+    Info: dict
+):
+    '''
+    Function to show progress events on progressbar
+    '''
+    ProgressBar.setProperty('LastProgressTime', time.monotonic())
+    Event = Info.get('Event')
+    if Event == 'Stage':
+        ProgressBar.setRange(0, 0)
+    if Event == 'Progress' and Info.get('Total'):
+        Scale = max(1, -(-int(Info['Total']) // 0x7FFFFFFF)) # Keep byte counters within QProgressBar's int range
+        ProgressBar.setRange(0, int(Info['Total']) // Scale)
+        ProgressBar.setValue(min(int(Info['Done']), int(Info['Total'])) // Scale)
+    Text = Function_FormatProgress(Info)
+    if len(Text) == 0:
+        return
+    ProgressBar.setProperty('ProgressText', Text)
+    ProgressBar.setFormat(Text.replace('%', '%%'))
+    ProgressBar.setToolTip(Text)
+    ProgressBar.setTextVisible(True)
+
+
+def Function_CheckProgressStall(
+    ProgressBar: QProgressBar,
+    StallTime: int = 300
+):
+    '''
+    Function to mark progressbar as stalled if no progress has been reported for a while
+    '''
+    LastProgressTime = ProgressBar.property('LastProgressTime')
+    if LastProgressTime is None or not ProgressBar.isTextVisible():
+        return
+    Idle = time.monotonic() - LastProgressTime
+    if Idle > StallTime:
+        Text = f"{ProgressBar.property('ProgressText')} | 已 {Function_FormatDuration(Idle)} 无进展"
+        ProgressBar.setFormat(Text.replace('%', '%%'))
+        ProgressBar.setToolTip(Text)
+
 ##############################################################################################################################
 
+class Config_Buffer(QObject):
+    '''
+    Config kept in memory (with the methods of QFunc.ManageConfig), edits are coalesced and written
+    (by replacing the file) on a background thread once they stop coming in for a while
+    '''
+    Signal_Edited = Signal()
+
+    # Milliseconds to wait after the last edit (and at most after the first one that isn't written yet)
+    Debounce = 500
+    MaxDelay = 3000
+
+    # Writes of all configs go through one thread so that they land in order
+    Writer = ThreadPoolExecutor(max_workers = 1)
+
+    Instances = weakref.WeakSet()
+
+    def __init__(self, ConfigPath: str, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.ConfigPath = ConfigPath
+        self.ConfigParser = configparser.ConfigParser(interpolation = None) # Values are free text (paths, prompts...) where '%' is literal
+        self.Lock = threading.Lock()
+        self.Pending = False
+        self.FirstPending = None
+        self.Load()
+
+        self.FlushTimer = QTimer(self)
+        self.FlushTimer.setSingleShot(True)
+        self.FlushTimer.timeout.connect(self.Flush)
+        self.Signal_Edited.connect(self.Schedule)
+        QApplication.instance().aboutToQuit.connect(lambda: self.Flush(Wait = True)) if QApplication.instance() is not None else None
+        self.Instances.add(self)
+
+    def Load(self, ReadPath: Optional[str] = None):
+        '''
+        Read the config from the file (or from another file, whose content then gets written to this one)
+        '''
+        os.makedirs(os.path.dirname(self.ConfigPath), exist_ok = True)
+        with self.Lock, StartupProfiler.Span(f"Load {os.path.basename(ReadPath or self.ConfigPath)}"):
+            self.ConfigParser.clear()
+            try:
+                self.ConfigParser.read(ReadPath or self.ConfigPath, encoding = 'utf-8')
+            except configparser.Error:
+                self.ConfigParser.clear()
+        self.Edited() if ReadPath is not None else None
+
+    def Clear(self):
+        with self.Lock:
+            self.ConfigParser.clear()
+        self.Edited()
+
+    def Parser(self):
+        return self.ConfigParser
+
+    def EditConfig(self, Section: str = ..., Option: str = ..., Value: str = ...):
+        with self.Lock:
+            if self.ConfigParser.has_option(Section, Option) and self.ConfigParser.get(Section, Option) == Value:
+                return
+            self.ConfigParser.add_section(Section) if not self.ConfigParser.has_section(Section) else None
+            self.ConfigParser.set(Section, Option, Value)
+        self.Edited()
+
+    def GetValue(self, Section: str = ..., Option: str = ..., InitValue: Optional[str] = None):
+        with self.Lock:
+            if self.ConfigParser.has_option(Section, Option):
+                return self.ConfigParser.get(Section, Option)
+        if InitValue is None:
+            raise configparser.NoOptionError(Option, Section)
+        self.EditConfig(Section, Option, InitValue)
+        return InitValue
+
+    def Edited(self):
+        self.Schedule() if QThread.currentThread() == self.thread() else self.Signal_Edited.emit()
+
+    def Schedule(self):
+        Now = time.monotonic()
+        self.FirstPending = Now if not self.Pending else self.FirstPending
+        self.Pending = True
+        Remaining = self.MaxDelay - (Now - self.FirstPending) * 1000
+        self.Flush() if Remaining <= 0 else self.FlushTimer.start(int(min(self.Debounce, Remaining)))
+
+    def Write(self, Content: str):
+        TempPath = f"{self.ConfigPath}.tmp"
+        with open(TempPath, mode = 'w', encoding = 'utf-8') as Config:
+            Config.write(Content)
+        for Retry in range(5):
+            try:
+                return os.replace(TempPath, self.ConfigPath)
+            except PermissionError: # The file may be held open for a moment by a reader (e.g. on Windows)
+                time.sleep(0.1 * (Retry + 1))
+        os.replace(TempPath, self.ConfigPath)
+
+    def Flush(self, Wait: bool = False):
+        '''
+        Write the config if it was edited since the last write
+        '''
+        self.FlushTimer.stop()
+        if not self.Pending:
+            return
+        self.Pending = False
+        with self.Lock:
+            Content = io.StringIO()
+            self.ConfigParser.write(Content)
+        Future = self.Writer.submit(self.Write, Content.getvalue())
+        Future.result() if Wait else None
+
+    @classmethod
+    def FlushAll(cls):
+        '''
+        Write all the edited configs before their files get read elsewhere
+        '''
+        for Instance in list(cls.Instances):
+            Instance.Flush(Wait = True)
+
+
 def Function_SetWidgetValue(
     Widget: QWidget,
-    Config: QFunc.ManageConfig,
+    Config: Union[QFunc.ManageConfig, Config_Buffer],
     Section: str = ...,
     Option: str = ...,
     Value = ...,
@@ -430,23 +682,23 @@ def Function_SetWidgetValue(
             EditConfig(Value) if str(Value) in itemTexts else None
 
     if isinstance(Widget, (QSlider, QSpinBox, SpinBoxBase)):
-        Widget.setValue(int(eval(str(Value)) * Times))
+        Widget.setValue(int(ast.literal_eval(str(Value)) * Times))
         def EditConfig(Value):
-            Config.EditConfig(Section, Option, str(eval(str(Value)) / Times))
+            Config.EditConfig(Section, Option, str(ast.literal_eval(str(Value)) / Times))
         if Config is not None:
             Widget.valueChanged.connect(EditConfig)
             EditConfig(Value)
 
     if isinstance(Widget, (QDoubleSpinBox, DoubleSpinBoxBase)):
-        Widget.setValue(float(eval(str(Value)) * Times))
+        Widget.setValue(float(ast.literal_eval(str(Value)) * Times))
         def EditConfig(Value):
-            Config.EditConfig(Section, Option, str(eval(str(Value)) / Times))
+            Config.EditConfig(Section, Option, str(ast.literal_eval(str(Value)) / Times))
         if Config is not None:
             Widget.valueChanged.connect(EditConfig)
             EditConfig(Value)
 
     if isinstance(Widget, (QCheckBox, QRadioButton)):
-        Widget.setChecked(eval(str(Value)))
+        Widget.setChecked(ast.literal_eval(str(Value)))
         def EditConfig(Value):
             Config.EditConfig(Section, Option, str(Value))
         if Config is not None:
@@ -454,7 +706,7 @@ def Function_SetWidgetValue(
             EditConfig(Value)
 
     if isinstance(Widget, Table_EditAudioSpeaker):
-        Widget.SetValue(eval(str(Value)))
+        Widget.SetValue(ast.literal_eval(str(Value)))
         def EditConfig(Value):
             Config.EditConfig(Section, Option, str(Value))
         if Config is not None:
@@ -467,7 +719,7 @@ class ParamsManager:
         ConfigPath: str,
     ):
         self.ConfigPath = ConfigPath
-        self.Config = QFunc.ManageConfig(ConfigPath)
+        self.Config = Config_Buffer(ConfigPath)
 
         self.RegistratedWidgets = {}
 
@@ -493,9 +745,7 @@ class ParamsManager:
         Function_SetWidgetValue(Widget, self.Config, *value)
 
     def ClearSettings(self):
-        with open(self.ConfigPath, 'w'):
-            pass
-        self.Config = QFunc.ManageConfig(self.ConfigPath)
+        self.Config.Clear()
 
     def ResetSettings(self):
         self.ClearSettings()
@@ -503,9 +753,7 @@ class ParamsManager:
             self.ResetParam(Widget)
 
     def ImportSettings(self, ReadPath: str):
-        ConfigParser = QFunc.ManageConfig(ReadPath).Parser()
-        with open(self.ConfigPath, 'w', encoding = 'utf-8') as Config:
-            ConfigParser.write(Config)
+        self.Config.Load(ReadPath)
         for Widget, value in list(self.RegistratedWidgets.items()):
             self.SetParam(Widget, *value)
 
@@ -525,7 +773,8 @@ def Function_SetMethodExecutor(
     Params: Optional[tuple] = None,
     ParamsFrom: Optional[list[QObject]] = None,
     EmptyAllowed: Optional[list[QObject]] = None,
-    SuccessEvents: Optional[list] = None
+    SuccessEvents: Optional[list] = None,
+    JobScheduler: Optional[object] = None
 ):
     '''
     Function to execute outer class methods
@@ -551,6 +800,15 @@ def Function_SetMethodExecutor(
     else:
         WorkerThread = ClassInstance
 
+    if hasattr(ClassInstance, 'progress') and ProgressBar is not None:
+        ClassInstance.progress.connect(lambda Info: Function_UpdateProgressBar(ProgressBar, Info), type = Qt.QueuedConnection)
+        StallTimer = QTimer(ProgressBar)
+        StallTimer.setInterval(30000)
+        StallTimer.timeout.connect(lambda: Function_CheckProgressStall(ProgressBar))
+        WorkerThread.started.connect(lambda: ProgressBar.setProperty('LastProgressTime', None), type = Qt.QueuedConnection)
+        WorkerThread.started.connect(StallTimer.start)
+        WorkerThread.finished.connect(StallTimer.stop)
+
     @Slot()
     def ExecuteMethod():
         '''
@@ -621,6 +879,48 @@ def Function_SetMethodExecutor(
     else:
         pass
 
+    if JobScheduler is not None and ExecuteButton is not None and hasattr(ClassInstance, 'Task'):
+        Function_SetTaskSubmitter(ParentWindow, ExecuteButton, ClassInstance.Task, ParamsFrom, EmptyAllowed, JobScheduler)
+
+
+def Function_SetTaskSubmitter(
+    ParentWindow: Optional[QWidget] = None,
+    ExecuteButton: QAbstractButton = ...,
+    Task: object = ...,
+    ParamsFrom: Optional[list[QObject]] = None,
+    EmptyAllowed: Optional[list[QObject]] = None,
+    JobScheduler: object = ...
+):
+    '''
+    Function to add the task of an execute button to the job queue (through the button's context menu)
+    '''
+    Title = ExecuteButton.toolTip().strip().removeprefix("执行")
+
+    def SubmitTask(AfterLast: bool = False):
+        Args = Function_ParamsChecker(ParamsFrom, EmptyAllowed)
+        if Args == "Abort":
+            return print("Aborted.")
+        LastJobID = JobScheduler.LastSubmitted
+        JobScheduler.Submit(
+            Task = Task(tuple(Args)),
+            Title = Title,
+            Depends = [LastJobID] if AfterLast and LastJobID is not None else []
+        )
+        MessageBoxBase.pop(ParentWindow, QMessageBox.Information, "Tip", "已加入任务队列")
+
+    def ShowMenu(Position: QPoint):
+        Menu = QMenu(ExecuteButton)
+        Menu.addAction(QCA.translate("Action", "加入任务队列")).triggered.connect(lambda: SubmitTask(False))
+        Action_AfterLast = Menu.addAction(QCA.translate("Action", "加入任务队列（等待上一个加入的任务完成）"))
+        Action_AfterLast.triggered.connect(lambda: SubmitTask(True))
+        Action_AfterLast.setEnabled(JobScheduler.LastSubmitted is not None)
+        Menu.addSeparator()
+        Menu.addAction(QCA.translate("Action", "查看任务队列")).triggered.connect(FunctionSignals.Signal_ShowJobQueue.emit)
+        Menu.exec(ExecuteButton.mapToGlobal(Position))
+
+    ExecuteButton.setContextMenuPolicy(Qt.CustomContextMenu)
+    ExecuteButton.customContextMenuRequested.connect(ShowMenu)
+
 ##############################################################################################################################
 
 def Function_UpdateChecker(
@@ -1,16 +1,14 @@
 import os
 import sys
-import time
 import json
-import hashlib
 import argparse
 import subprocess
 from pathlib import Path
-from glob import glob
-from datetime import date, datetime
-from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Union, Optional, Callable
+from Profiler import StartupProfiler, DefaultTracePath # Imported first so that the imports below can be timed
 from PySide6 import __file__ as PySide6_File
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QTimer, QEventLoop, QFileSystemWatcher, QSize
 from PySide6.QtCore import QCoreApplication as QCA
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
@@ -22,6 +20,14 @@ from QEasyWidgets.Windows import MessageBoxBase
 from windows.Windows import *
 from Functions import *
 from EnvConfigurator import *
+from Worker import Worker_Pool, Progress_Reporter
+from Tools import Tools, GetDirs
+from Pipeline import LoadPipeline, SubmitPipeline, ExportTemplate
+from ModelManager import Hash_Index, Manifest_Index, Model_Catalogue
+from Downloader import DownloadFile, GetArchiveFormat
+from Results import Stem_Index, STT_Result, ASR_Result, DAT_Result, LinkModes
+from Scheduler import Job_Scheduler, GetDefaultLimits
+from Tensorboard import Tensorboard_Manager, FindEventFile
 from Config import *
 
 ##############################################################################################################################
@@ -37,8 +43,10 @@ parser.add_argument("--core",         help = "dir of core files",        default
 parser.add_argument("--manifest",     help = "path to manifest.json",    default = Path(ResourceDir).joinpath('manifest.json'))
 parser.add_argument("--requirements", help = "path to requirements.txt", default = Path(ResourceDir).joinpath('requirements.txt'))
 parser.add_argument("--dependencies", help = "dir of dependencies",      default = Path(CurrentDir).joinpath(''))
+parser.add_argument("--wheelhouse",   help = "dir of wheels to install python requirements from offline", default = Path(CurrentDir).joinpath('Wheelhouse'))
 parser.add_argument("--models",       help = "dir of models",            default = Path(CurrentDir).joinpath('Models'))
 parser.add_argument("--output",       help = "dir of output",            default = Path(CurrentDir).joinpath(''))
+parser.add_argument("--profile-startup", help = "record the startup and write it as a trace (Chrome trace format) to the given path", nargs = '?', const = DefaultTracePath, default = None)
 args = parser.parse_args()
 
 UpdaterPath = args.updater
@@ -46,14 +54,17 @@ CoreDir = args.core
 ManifestPath = args.manifest
 RequirementsPath = args.requirements
 DependencyDir = args.dependencies
+WheelhouseDir = args.wheelhouse
 ModelDir = args.models
 OutputDir = args.output
+TracePath = args.profile_startup
 
 
 # Set up client config
-Config = QFunc.ManageConfig(ConfigPath)
-Config.EditConfig('Info', 'CurrentVersion', str(CurrentVersion))
-Config.EditConfig('Info', 'ExecuterName', str(QFunc.GetFileInfo()[0]))
+with StartupProfiler.Span("Load client config"):
+    Config = QFunc.ManageConfig(ConfigPath)
+    Config.EditConfig('Info', 'CurrentVersion', str(CurrentVersion))
+    Config.EditConfig('Info', 'ExecuterName', str(QFunc.GetFileInfo()[0]))
 
 
 # Set up environment variables while python file is not compiled
@@ -83,6 +94,60 @@ if Path(DependencyDir).joinpath('Python').exists():
         Value = QFunc.NormPath(Path(DependencyDir).joinpath('Python', 'Scripts'), TrailingSlash = True)
     )
 
+
+# Set up warm workers for core tasks
+with StartupProfiler.Span("Set up core workers"):
+    CoreWorkers = Worker_Pool(
+        CoreDir = CoreDir,
+        LogPath = LogPath,
+        CacheMB = int(Config.GetValue('Tools', 'WorkerCacheMB', '1024'))
+    )
+
+# Set up scheduler for queued core tasks
+JobScheduler = Job_Scheduler(
+    Pool = CoreWorkers,
+    QueuePath = QFunc.NormPath(Path(ConfigDir).joinpath('JobQueue.json')),
+    Limits = {
+        Resource: float(Config.GetValue('Scheduler', f'Max{Resource}', str(Limit)))
+        for Resource, Limit in GetDefaultLimits().items()
+    }
+)
+
+# Set up index of model hashes (so that unchanged models don't get hashed again)
+ModelHashes = Hash_Index(QFunc.NormPath(Path(ConfigDir).joinpath('ModelHashes.json')))
+
+# Set up index of model manifest (parsed again only when it changes)
+ModelManifest = Manifest_Index(QFunc.NormPath(ManifestPath))
+
+# Set up index of result files (so that audio and subtitles are matched by stem without a walk per file)
+ResultFiles = Stem_Index()
+
+# Set up manager of tensorboards (one per log dir, reused until the client quits)
+TensorboardManager = Tensorboard_Manager(Interpreter = InstalledDistributions.Interpreter)
+
+def FormatCoreError(Error: Optional[dict]):
+    '''
+    Turn the error returned by a worker into the message shown to users
+    '''
+    return f"{Error['Type']}: {Error['Message']}\n（详情请见终端输出信息）" if Error is not None else None
+
+
+def RunCoreTask(Executor: QObject, Task: dict):
+    '''
+    Run a core task on a warm worker and forward its progress to the executor
+    '''
+    Executor.Worker = CoreWorkers.Acquire(Task['Key'])
+    Error = Executor.Worker.Run(
+        Module = Task['Module'],
+        Name = Task['Name'],
+        Params = Task['Params'],
+        Calls = Task['Calls'],
+        OnProgress = Executor.progress.emit,
+        Paths = Task.get('Paths', [])
+    )
+    CoreWorkers.Release(Executor.Worker, Task['KeepAlive'])
+    return Error
+
 ##############################################################################################################################
 
 class Execute_Update_Checking(QObject):
@@ -93,6 +158,7 @@ class Execute_Update_Checking(QObject):
     def __init__(self):
         super().__init__()
 
+    @StartupProfiler.Trace("Check for updates")
     def Execute(self):
         Function_UpdateChecker(
             RepoOwner = RepoOwner,
@@ -116,40 +182,26 @@ class Execute_Audio_Processing(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['process'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from AudioProcessor.Process import Audio_Processing; '
-                f"AudioConvertandSlice = Audio_Processing{str(Params)}; "
-                'AudioConvertandSlice.Process_Audio()"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # Tools: VoiceIdentifier
@@ -162,41 +214,26 @@ class Execute_Voice_Identifying_VPR(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['vpr'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from VPR.Identify import Voice_Identifying; '
-                f"AudioContrastInference = Voice_Identifying{str(Params)}; "
-                'AudioContrastInference.GetModel(); '
-                'AudioContrastInference.Inference()"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # Tools: VoiceTranscriber
@@ -209,48 +246,26 @@ class Execute_Voice_Transcribing_Whisper(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['whisper'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        LANGUAGES = {
-            "中":       "zh",
-            "Chinese":  "zh",
-            "英":       "en",
-            "English":  "en",
-            "日":       "ja",
-            "japanese": "ja"
-        }
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from Whisper.Transcribe import Voice_Transcribing; '
-                f"WAVtoSRT = Voice_Transcribing{str(QFunc.ItemReplacer(LANGUAGES, Params))}; "
-                'WAVtoSRT.Transcriber()"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # Tools: DatasetCreator
@@ -263,40 +278,26 @@ class Execute_Dataset_Creating_GPTSoVITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['dat-gptsovits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from GPT_SoVITS.Create import Dataset_Creating; '
-                f"SRTtoCSVandSplitAudio = Dataset_Creating{str(Params)}; "
-                'SRTtoCSVandSplitAudio.CallingFunctions()"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 class Execute_Dataset_Creating_VITS(QObject):
@@ -308,40 +309,26 @@ class Execute_Dataset_Creating_VITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['dat-vits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from VITS.Create import Dataset_Creating; '
-                f"SRTtoCSVandSplitAudio = Dataset_Creating{str(Params)}; "
-                'SRTtoCSVandSplitAudio.CallingFunctions()"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # Tools: VoiceTrainer
@@ -354,39 +341,26 @@ class Execute_Voice_Training_GPTSoVITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['train-gptsovits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from GPT_SoVITS.Train import Train; '
-                f'Train{str(Params)}"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 class Execute_Voice_Training_VITS(QObject):
@@ -398,39 +372,26 @@ class Execute_Voice_Training_VITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['train-vits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from VITS.Train import Train; '
-                f'Train{str(Params)}"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # Tools: VoiceConverter
@@ -443,39 +404,26 @@ class Execute_Voice_Converting_GPTSoVITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['tts-gptsovits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from GPT_SoVITS.Convert import Convert; '
-                f'Convert{str(Params)}"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 def Get_Speakers(Config_Path_Load):
@@ -496,47 +444,26 @@ class Execute_Voice_Converting_VITS(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def Task(Params: tuple):
+        return Tools['tts-vits'].Task(Params)
+
     @Slot(tuple)
     def Execute(self, Params: tuple):
         self.started.emit()
 
-        LANGUAGES = {
-            "中":       "ZH",
-            "Chinese":  "ZH",
-            "英":       "EN",
-            "English":  "EN",
-            "日":       "JA",
-            "Japanese": "JA"
-        }
-        CMD = QFunc.SubprocessManager(CommunicateThroughConsole = True)
-        self.Process = CMD.create(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from VITS.Convert import Convert; '
-                f'Convert{str(QFunc.ItemReplacer(LANGUAGES, Params))}"'
-            ]
-        )
-        Output, Error = CMD.monitor(
-            ShowProgress = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[:2]
-        if 'error' in str(Error).lower():
-            Error += "（详情请见终端输出信息）"
-        elif 'traceback' in str(Output).lower():
-            Error = "执行完成，但疑似中途出错\n（详情请见终端输出信息）"
-        else:
-            Error = None
-        self.errChk.emit(str(Error))
+        Error = RunCoreTask(self, self.Task(Params))
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
     def Terminate(self):
-        QFunc.ProcessTerminator(self.Process.pid) if hasattr(self, 'Process') else None
+        CoreWorkers.Terminate(self.Worker) if hasattr(self, 'Worker') else None
 
 
 # ClientFunc: GetModelsInfo
@@ -544,18 +471,28 @@ class CustomSignals_ModelView(QObject):
     '''
     Set up signals for model view
     '''
-    Signal_Process_UVR = Signal(list)
+    Signal_Process_UVR = Signal(dict)
 
-    Signal_ASR_VPR = Signal(list)
+    Signal_ASR_VPR = Signal(dict)
 
-    Signal_STT_Whisper = Signal(list)
+    Signal_STT_Whisper = Signal(dict)
 
-    Signal_TTS_GPTSoVITS = Signal(list)
+    Signal_TTS_GPTSoVITS = Signal(dict)
 
-    Signal_TTS_VITS = Signal(list)
+    Signal_TTS_VITS = Signal(dict)
+
+    Signal_Scanned = Signal(list)
 
 ModelViewSignals = CustomSignals_ModelView()
 
+ModelCatalogues = {
+    'Process_UVR': Model_Catalogue(QFunc.NormPath(Path(ModelDir).joinpath('Process', 'UVR')), ['pth', 'onnx'], ModelHashes),
+    'ASR_VPR': Model_Catalogue(QFunc.NormPath(Path(ModelDir).joinpath('ASR', 'VPR')), ['pth'], ModelHashes),
+    'STT_Whisper': Model_Catalogue(QFunc.NormPath(Path(ModelDir).joinpath('STT', 'Whisper')), ['pt'], ModelHashes),
+    'TTS_GPTSoVITS': Model_Catalogue(QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS')), ['pth', 'ckpt', 'bin', 'json'], ModelHashes),
+    'TTS_VITS': Model_Catalogue(QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS')), ['pth', 'json'], ModelHashes),
+}
+
 class Model_View(QObject):
     '''
     View model
@@ -567,105 +504,20 @@ class Model_View(QObject):
     def __init__(self):
         super().__init__()
 
-    def GetModelsInfo(self, ModelsDir: str, ModelsFormats: list):
-        ModelsInfo = {}
-        os.makedirs(ModelsDir, exist_ok = True)
-
-        ModelDicts_Cloud = []
-        Tags = [Path(ModelsDir).parts[-2], Path(ModelsDir).parts[-1]]
-        if not Path(ManifestPath).exists():
-            return []
-        with open(QFunc.NormPath(ManifestPath), 'r', encoding = 'utf-8') as File:
-            Param = json.load(File)
-        for ModelDict in Param["models"]:
-            if ModelDict["tags"] == Tags:
-                ModelDicts_Cloud.append(ModelDict)
-        def GetModelInfo_Cloud(ModelDict):
-            if isinstance(ModelDict["SHA"], dict):
-                Name = ModelDict["name"]
-                for Model, ModelSHA in ModelDict["SHA"].items():
-                    ModelName = Model
-                    ModelName, ModelType = ModelName.rsplit('.', 1)
-                    ModelSize = ModelDict["size"][Model]
-                    ModelDate = ModelDict["date"][Model]
-                    ModelSHA = ModelSHA
-                    ModelURL = ModelDict["downloadurl"][Model]
-                    ModelDir = Path(ModelsDir).joinpath("Downloaded", Name)
-                    DownloadParam = (ModelURL, ModelDir, ModelName, Path(ModelURL).suffix, ModelSHA)
-                    ModelsInfo[ModelSHA] = [str(f"[{Name}]{ModelName}"), str(ModelType), str(ModelSize), str(ModelDate), tuple(DownloadParam)]
-            else:
-                ModelName = ModelDict["name"]
-                ModelName, ModelType = ModelName.rsplit('.', 1)
-                ModelSize = ModelDict["size"]
-                ModelDate = ModelDict["date"]
-                ModelSHA = ModelDict["SHA"]
-                ModelURL = ModelDict["downloadurl"]
-                ModelDir = Path(ModelsDir).joinpath("Downloaded")
-                DownloadParam = (ModelURL, ModelDir, ModelName, Path(ModelURL).suffix, ModelSHA)
-                ModelsInfo[ModelSHA] = [str(ModelName), str(ModelType), str(ModelSize), str(ModelDate), tuple(DownloadParam)]
-        with ThreadPoolExecutor(max_workers = os.cpu_count()) as Executor:
-            Executor.map(
-                GetModelInfo_Cloud,
-                ModelDicts_Cloud
-            ) if ModelDicts_Cloud is not None else None
-
-        ModelPaths_Local = []
-        for ModelsFormat in ModelsFormats:
-            ModelPaths_Local_Sep = QFunc.ToIterable(QFunc.GetPaths(ModelsDir, ModelsFormat))
-            ModelPaths_Local_Sep = [ModelPath_Local_Sep for ModelPath_Local_Sep in ModelPaths_Local_Sep if ModelPath_Local_Sep is not None and ModelPath_Local_Sep.endswith(ModelsFormat)]
-            ModelPaths_Local.extend(ModelPaths_Local_Sep) if ModelPaths_Local_Sep is not None else None
-        ModelPaths_Local = list(set(ModelPaths_Local))
-        def GetModelInfo_Local(ModelPath):
-            Name = Path(ModelPath).parts[-2] if Path(ModelPath).parent.__str__() not in Path(ModelsDir).joinpath("Downloaded").__str__() else None
-            ModelName = Path(ModelPath).name
-            ModelName, ModelType = ModelName.rsplit('.', 1)
-            ModelSize = round(Path(ModelPath).stat().st_size / (1024 ** 2), 1)
-            ModelDate = datetime.fromtimestamp(Path(ModelPath).stat().st_mtime)
-            with open(ModelPath, "rb") as m:
-                ModelBytes = m.read()
-            ModelSHA = hashlib.sha256(ModelBytes).hexdigest()
-            ModelDir = Path(ModelPath).parent
-            ModelsInfo[ModelSHA] = [str(f"[{Name}]{ModelName}" if Name is not None else ModelName), str(ModelType), str(ModelSize)+'MB', str(ModelDate), str(ModelDir)]
-        with ThreadPoolExecutor(max_workers = os.cpu_count()) as Executor:
-            Executor.map(
-                GetModelInfo_Local,
-                ModelPaths_Local
-            ) if ModelPaths_Local is not None else None
-
-        return list(ModelsInfo.values())
+    def GetModelDicts_Cloud(self, ModelsDir: str):
+        return ModelManifest.Get([Path(ModelsDir).parts[-2], Path(ModelsDir).parts[-1]])
 
     @Slot()
+    @StartupProfiler.Trace("Scan models")
     def Execute(self):
-        ModelViewSignals.Signal_Process_UVR.emit(
-            self.GetModelsInfo(
-                QFunc.NormPath(Path(ModelDir).joinpath('Process', 'UVR')),
-                ['pth', 'onnx']
-            )
-        )
-        ModelViewSignals.Signal_ASR_VPR.emit(
-            self.GetModelsInfo(
-                QFunc.NormPath(Path(ModelDir).joinpath('ASR', 'VPR')),
-                ['pth']
-            )
-        )
-        ModelViewSignals.Signal_STT_Whisper.emit(
-            self.GetModelsInfo(
-                QFunc.NormPath(Path(ModelDir).joinpath('STT', 'Whisper')),
-                ['pt']
-            )
-        )
-        ModelViewSignals.Signal_TTS_GPTSoVITS.emit(
-            self.GetModelsInfo(
-                QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS')),
-                ['pth', 'ckpt', 'bin', 'json']
-            )
-        )
-        ModelViewSignals.Signal_TTS_VITS.emit(
-            self.GetModelsInfo(
-                QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS')),
-                ['pth', 'json']
-            )
-        )
+        '''
+        Update the catalogues and send out only the rows that changed
+        '''
+        for Name, Catalogue in ModelCatalogues.items():
+            Delta = Catalogue.Update(self.GetModelDicts_Cloud(Catalogue.ModelsDir))
+            getattr(ModelViewSignals, f'Signal_{Name}').emit(Delta) if any(len(Value) > 0 for Value in Delta.values()) else None
+        ModelHashes.Save()
+        ModelViewSignals.Signal_Scanned.emit([Dir for Catalogue in ModelCatalogues.values() for Dir in Catalogue.Dirs])
         self.finished.emit()
 
 
@@ -678,14 +530,20 @@ class Model_Downloader(QObject):
 
     errChk = Signal(str)
 
+    progress = Signal(dict)
+
     def __init__(self):
         super().__init__()
 
     def DownloadModel(self, DownloadParams: tuple):
         try:
-            FilePath = QFunc.DownloadFile(*DownloadParams, CreateNewConsole = True)[1]
-            FileSuffix = Path(FilePath).suffix
-            shutil.unpack_archive(FilePath, DownloadParams[1], FileSuffix) if FileSuffix in ('zip', 'tar', 'gztar', 'bztar') else None
+            Reporter = Progress_Reporter(self.progress.emit)
+            Reporter.SetStage('Download_Model')
+            FilePath = DownloadFile(*DownloadParams,
+                OnProgress = lambda Done, Total: Reporter.Update(Done, Total, Unit = 'B', Bytes = Done),
+                ExtractDir = QFunc.NormPath(DownloadParams[1])
+            )
+            os.remove(FilePath) if GetArchiveFormat(FilePath) is not None else None
             return None
         except Exception as e:
             return e
@@ -706,77 +564,68 @@ def AddLocalModel(ModelPath: str, Sector: list[str] = ['Tool', 'Type']):
 
 # ClientFunc: GetASRResult
 def ASRResult_Get(AudioSpeakersData_Path: str):
-    AudioSpeakerSimList = []
-    with open(AudioSpeakersData_Path, mode = 'r', encoding = 'utf-8') as AudioSpeakersData:
-        AudioSpeakerSimLines = AudioSpeakersData.readlines()
-    for AudioSpeakerSimLine in AudioSpeakerSimLines:
-        AudioSpeakerSim = AudioSpeakerSimLine.strip().split('|')
-        if len(AudioSpeakerSim) == 2:
-            AudioSpeakerSim.append('')
-        AudioSpeakerSimList.append(AudioSpeakerSim)
-    return AudioSpeakerSimList
+    return ASR_Result(QFunc.NormPath(AudioSpeakersData_Path))
 
 
 # ClientFunc: SaveASRResult
-def ASRResult_Save(AudioSpeakers: dict, AudioSpeakersData_Path: str, MoveAudio: bool, MoveToDst: Optional[str] = None):
-    with open(AudioSpeakersData_Path, mode = 'w', encoding = 'utf-8') as AudioSpeakersData:
-        Lines = []
-        for Audio, Speaker in AudioSpeakers.items():
-            Speaker = Speaker.strip()
-            if Speaker == '':
-                continue
-            if MoveAudio:
-                if MoveToDst is None:
-                    raise Exception("Destination shouldn't be 'None'")
-                MoveToDst_Sub = QFunc.NormPath(Path(MoveToDst).joinpath(Speaker))
-                os.makedirs(MoveToDst_Sub, exist_ok = True) if Path(MoveToDst_Sub).exists() == False else None
-                Audio_Dst = QFunc.NormPath(Path(MoveToDst_Sub).joinpath(Path(Audio).name).as_posix())
-                shutil.copy(Audio, MoveToDst_Sub) if not Path(Audio_Dst).exists() else None
-                Lines.append(f"{Audio_Dst}|{Speaker}\n")
-            else:
-                Lines.append(f"{Audio}|{Speaker}\n")
-        AudioSpeakersData.writelines(Lines)
+def ASRResult_Save(ASRResult: ASR_Result, MoveAudio: bool, MoveToDst: Optional[str] = None, OnProgress: Optional[Callable] = None):
+    if MoveAudio and MoveToDst is None:
+        raise Exception("Destination shouldn't be 'None'")
+    LinkMode = Config.GetValue('Tools', 'LinkMode', 'Auto')
+    return ASRResult.Save(QFunc.NormPath(MoveToDst) if MoveAudio else None, OnProgress, LinkMode = LinkMode if LinkMode in LinkModes else 'Auto')
+
+
+# ClientFunc: ASRResultSaver
+class ASRResult_Saver(QObject):
+    '''
+    Save ASR result (linking the audio in the background)
+    '''
+    finished = Signal()
+
+    errChk = Signal(str)
+
+    progress = Signal(dict)
+
+    def __init__(self):
+        super().__init__()
+
+    def SaveASRResult(self, ASRResult: ASR_Result, MoveAudio: bool, MoveToDst: Optional[str] = None):
+        try:
+            Reporter = Progress_Reporter(self.progress.emit)
+            Reporter.SetStage('Save_ASRResult')
+            ASRResult_Save(ASRResult, MoveAudio, MoveToDst,
+                OnProgress = lambda Done, Total: Reporter.Update(Done, Total, Unit = 'file')
+            )
+            return None
+        except Exception as e:
+            return e
+
+    @Slot(tuple)
+    def Execute(self, Params: tuple):
+        Error = self.SaveASRResult(*Params)
+        self.errChk.emit(str(Error))
+
+        self.finished.emit()
 
 
 # ClientFunc: GetSTTResult
 def STTResult_Get(SRTDir: str, AudioDir: str):
-    STTResult = {}
-    for SRTFile in glob(QFunc.NormPath(Path(SRTDir).joinpath('*.srt'))):
-        AudioFiles = glob(QFunc.NormPath(Path(AudioDir).joinpath('**', f'{Path(SRTFile).stem}.*')), recursive = True)
-        if len(AudioFiles) == 0:
-            continue
-        with open(SRTFile, mode = 'r', encoding = 'utf-8') as SRT:
-            SRTContent = SRT.read()
-        STTResult[AudioFiles[0]] = SRTContent
-    return STTResult
+    return STT_Result(QFunc.NormPath(SRTDir), QFunc.NormPath(AudioDir), ResultFiles)
 
 
 # ClientFunc: SaveSTTResult
-def STTResult_Save(STTResult: dict, SRTDir: str):
-    for AudioFile in STTResult.keys():
-        SRTFiles = glob(QFunc.NormPath(Path(SRTDir).joinpath(f'{Path(AudioFile).stem}.*')))
-        if len(SRTFiles) == 0:
-            continue
-        with open(SRTFiles[0], mode = 'w', encoding = 'utf-8') as SRT:
-            SRT.write(STTResult[AudioFile])
+def STTResult_Save(STTResult: STT_Result, SRTDir: str):
+    return STTResult.Save()
 
 
 # ClientFunc: GetDATResult
 def DATResult_Get(DATPath: str):
-    DATResult = {}
-    with open(DATPath, mode = 'r', encoding = 'utf-8') as DAT:
-        DATLines = DAT.readlines()
-    for DATLine in DATLines:
-        Audio = QFunc.NormPath(Path(DATPath).parent.joinpath(DATLine.split('|')[0]))
-        DATResult[Audio] = DATLine.strip()
-    return DATResult
+    return DAT_Result(QFunc.NormPath(DATPath))
 
 
 # ClientFunc: SaveDATResult
-def DATResult_Save(DATResult: list, DATPath: str):
-    with open(DATPath, mode = 'w', encoding = 'utf-8') as DAT:
-        DATLines = '\n'.join(DATResult)
-        DAT.write(DATLines)
+def DATResult_Save(DATResult: DAT_Result, DATPath: str):
+    return DATResult.Save()
 
 
 # ClientFunc: ClientRebooter
@@ -800,25 +649,22 @@ class Integrity_Checker(QObject):
 
     @Slot()
     def Execute(self):
-        Error = QFunc.RunCMD(
-            Args = [
-                f'cd "{CoreDir}"',
-                'python -c "'
-                'from AudioProcessor.Process import Audio_Processing; '
-                'from VPR.Identify import Voice_Identifying; '
-                'from Whisper.Transcribe import Voice_Transcribing; '
-                'from GPT_SoVITS.Create import Dataset_Creating; '
-                'from GPT_SoVITS.Train import Train; '
-                'from GPT_SoVITS.Convert import Convert; '
-                'from VITS.Create import Dataset_Creating; '
-                'from VITS.Train import Train; '
-                'from VITS.Convert import Convert"'
-            ],
-            CommunicateThroughConsole = True,
-            DecodeResult = True,
-            LogPath = LogPath
-        )[1]
-        self.errChk.emit(str(Error))
+        Worker = CoreWorkers.Acquire()
+        Error = Worker.Preload(
+            Modules = [
+                'AudioProcessor.Process',
+                'VPR.Identify',
+                'Whisper.Transcribe',
+                'GPT_SoVITS.Create',
+                'GPT_SoVITS.Train',
+                'GPT_SoVITS.Convert',
+                'VITS.Create',
+                'VITS.Train',
+                'VITS.Convert'
+            ]
+        )
+        CoreWorkers.Release(Worker)
+        self.errChk.emit(str(FormatCoreError(Error)))
 
         self.finished.emit()
 
@@ -826,7 +672,7 @@ class Integrity_Checker(QObject):
 # ClientFunc: TensorboardRunner
 class Tensorboard_Runner(QObject):
     '''
-    Check File integrity
+    Open tensorboard for a log dir
     '''
     finished = Signal()
 
@@ -835,19 +681,34 @@ class Tensorboard_Runner(QObject):
     def __init__(self):
         super().__init__()
 
+    def WaitForEventFile(self, LogDir: str, MaximumWaitTime: int = 30):
+        '''
+        Wait until an event file shows up under the log dir (or the time is up), woken by changes of its folders instead of polling
+        '''
+        Loop = QEventLoop()
+        Watcher = QFileSystemWatcher()
+        def Rewatch():
+            WatchDir = Path(LogDir)
+            while not WatchDir.exists() and WatchDir.parent != WatchDir:
+                WatchDir = WatchDir.parent
+            Dirs = [DirPath for DirPath, _, _ in os.walk(WatchDir)] if WatchDir == Path(LogDir) else [WatchDir.as_posix()]
+            NewDirs = [Dir for Dir in Dirs if Dir not in Watcher.directories()]
+            Watcher.addPaths(NewDirs) if len(NewDirs) > 0 else None
+            if FindEventFile(LogDir) is not None: # Checked after watching so that nothing slips in between
+                Loop.quit()
+                return True
+            return False
+        Watcher.directoryChanged.connect(Rewatch)
+        if Rewatch():
+            return
+        QTimer.singleShot(MaximumWaitTime * 1000, Loop.quit)
+        Loop.exec()
+
     def RunTensorboard(self, LogDir):
         try:
             Error = None
-            InitialWaitTime = 0
-            MaximumWaitTime = 30
-            while QFunc.GetPaths(LogDir, 'events.out.tfevents') == None:
-                time.sleep(3)
-                InitialWaitTime += 3
-                if InitialWaitTime >= MaximumWaitTime:
-                    break
-            subprocess.Popen(['python', '-m', 'tensorboard.main', '--logdir', LogDir], env = os.environ)
-            time.sleep(9)
-            QFunc.Function_OpenURL('http://localhost:6006/')
+            self.WaitForEventFile(LogDir)
+            QFunc.Function_OpenURL(TensorboardManager.Launch(LogDir))
         except Exception as e:
             Error = e
         finally:
@@ -869,6 +730,8 @@ class CustomSignals_MainWindow(QObject):
     '''
     Signal_MainWindowShown = Signal()
 
+    Signal_JobsChanged = Signal()
+
 MainWindowSignals = CustomSignals_MainWindow()
 
 
@@ -933,6 +796,16 @@ class MainWindow(Window_MainWindow):
         AddLocalModel(ModelPath, Sector)
         self.ui.Button_Models_Refresh.click()
 
+    def watchModels(self, Dirs: list):
+        Watched = self.ModelWatcher.directories()
+        Dirs_Unwatched = [Dir for Dir in Dirs if Dir not in Watched]
+        Dirs_Failed = self.ModelWatcher.addPaths(Dirs_Unwatched) if len(Dirs_Unwatched) > 0 else []
+        Dirs_Gone = [Dir for Dir in Watched if Dir not in Dirs]
+        self.ModelWatcher.removePaths(Dirs_Gone) if len(Dirs_Gone) > 0 else None
+        self.ModelPollTimer.start() if len(Dirs_Failed) > 0 and not self.ModelPollTimer.isActive() else None
+        # Check again once the files that are still being written have settled
+        self.ModelRefreshTimer.start() if any(Catalogue.Unsettled for Catalogue in ModelCatalogues.values()) else None
+
     def setAudioSpeakersDataPath(self):
         DialogBox_AudioSpeakersDataPath = MessageBox_Buttons(self)
         DialogBox_AudioSpeakersDataPath.setText(QCA.translate("MsgBox", "请选择参数类型"))
@@ -1028,6 +901,9 @@ class MainWindow(Window_MainWindow):
         self.closed.connect(
             lambda: (
                 FunctionSignals.Signal_ForceQuit.emit(),
+                JobScheduler.Shutdown(),
+                CoreWorkers.Shutdown(),
+                TensorboardManager.Shutdown(),
                 FunctionSignals.Signal_TaskStatus.connect(QApplication.exit),
                 #os._exit(0)
             )
@@ -1199,6 +1075,23 @@ class MainWindow(Window_MainWindow):
         self.ui.Button_Menu_Info.setAutoExclusive(True)
         self.ui.Button_Menu_Info.setToolTip(QCA.translate("ToolTip", "关于本软件"))
 
+        # Prewarm core workers for the tools being visited
+        self.ui.Button_Menu_Process.clicked.connect(lambda: CoreWorkers.Prewarm('AudioProcessor', ['AudioProcessor.Process']))
+        self.ui.Button_Menu_ASR.clicked.connect(lambda: CoreWorkers.Prewarm('VPR', ['VPR.Identify']))
+        self.ui.Button_Menu_STT.clicked.connect(lambda: CoreWorkers.Prewarm('Whisper', ['Whisper.Transcribe']))
+        self.ui.Button_Menu_TTS.clicked.connect(lambda: CoreWorkers.Prewarm('GPT_SoVITS', ['GPT_SoVITS.Convert']))
+        self.ui.Button_Menu_TTS.clicked.connect(lambda: CoreWorkers.Prewarm('VITS', ['VITS.Convert']))
+
+        # Set up the pages the first time they are shown (what the settings use from the tool pages is assigned by then)
+        PageSetups = Lazy_Pages(self.ui.StackedWidget_Pages)
+        ParamsManager_Process = LineEdit_Process_OutputDir = None
+        ParamsManager_ASR_VPR = LineEdit_ASR_VPR_AudioSpeakersDataPath = ChildWindow_ASR = None
+        ParamsManager_STT_Whisper = LineEdit_STT_Whisper_OutputDir = None
+        ParamsManager_DAT_GPTSoVITS = ParamsManager_DAT_VITS = None
+        LineEdit_DAT_GPTSoVITS_FileListPath = LineEdit_DAT_VITS_FileListPathTraining = LineEdit_DAT_VITS_FileListPathValidation = None
+        ParamsManager_Train_GPTSoVITS = ParamsManager_Train_VITS = None
+        ParamsManager_TTS_GPTSoVITS = ParamsManager_TTS_VITS = None
+
         #############################################################
         ####################### Content: Home #######################
         #############################################################
@@ -1283,9 +1176,6 @@ class MainWindow(Window_MainWindow):
             Method = Aria2_Installer.Execute,
             Params = ()
         )
-        MainWindowSignals.Signal_MainWindowShown.connect(
-            self.ui.Button_Install_Aria2.click
-        )
         self.ui.Button_Install_Aria2.setText('')
         self.ui.Button_Install_Aria2.setToolTip(QCA.translate("ToolTip", "重新检测安装"))
         EnvConfiguratorSignals.Signal_Aria2Undetected.connect(
@@ -1320,9 +1210,6 @@ class MainWindow(Window_MainWindow):
             Method = FFmpeg_Installer.Execute,
             Params = ()
         )
-        MainWindowSignals.Signal_MainWindowShown.connect(
-            self.ui.Button_Install_FFmpeg.click
-        )
         self.ui.Button_Install_FFmpeg.setText('')
         self.ui.Button_Install_FFmpeg.setToolTip(QCA.translate("ToolTip", "重新检测安装"))
         EnvConfiguratorSignals.Signal_FFmpegUndetected.connect(
@@ -1357,9 +1244,6 @@ class MainWindow(Window_MainWindow):
             Method = Python_Installer.Execute,
             Params = ('3.9.0', )
         )
-        MainWindowSignals.Signal_MainWindowShown.connect( #EnvConfiguratorSignals.Signal_CMakeDetected.connect(
-            self.ui.Button_Install_Python.click
-        )
         self.ui.Button_Install_Python.setText('')
         self.ui.Button_Install_Python.setToolTip(QCA.translate("ToolTip", "重新检测安装"))
         EnvConfiguratorSignals.Signal_PythonUndetected.connect(
@@ -1392,7 +1276,7 @@ class MainWindow(Window_MainWindow):
             ExecuteButton = self.ui.Button_Install_PyReqs,
             ProgressBar = self.ui.ProgressBar_Env_Install_PyReqs,
             Method = PyReqs_Installer.Execute,
-            Params = (QFunc.NormPath(RequirementsPath), )
+            Params = (QFunc.NormPath(RequirementsPath), QFunc.NormPath(Path(DependencyDir).joinpath('PipCache')), QFunc.NormPath(WheelhouseDir))
         ) if Path(RequirementsPath).exists() else None
         EnvConfiguratorSignals.Signal_PythonDetected.connect(
             self.ui.Button_Install_PyReqs.click
@@ -1461,6 +1345,40 @@ class MainWindow(Window_MainWindow):
             lambda Status: self.ui.Label_Env_Install_Pytorch_Status.setText(Status)
         )
 
+        # Check everything at once, showing what was found last time until then
+        EnvProber = Env_Prober(
+            RequirementsPath = QFunc.NormPath(RequirementsPath),
+            ReportPath = QFunc.NormPath(Path(ConfigDir).joinpath('EnvReport.json'))
+        )
+        def ApplyEnvReport(Report: Env_Report, Cached: bool):
+            Items = {
+                'Aria2': (self.ui.Button_Install_Aria2, self.ui.ProgressBar_Env_Install_Aria2, self.ui.Label_Env_Install_Aria2_Status),
+                'FFmpeg': (self.ui.Button_Install_FFmpeg, self.ui.ProgressBar_Env_Install_FFmpeg, self.ui.Label_Env_Install_FFmpeg_Status),
+                'Python': (self.ui.Button_Install_Python, self.ui.ProgressBar_Env_Install_Python, self.ui.Label_Env_Install_Python_Status),
+                'PyReqs': (self.ui.Button_Install_PyReqs, self.ui.ProgressBar_Env_Install_PyReqs, self.ui.Label_Env_Install_PyReqs_Status),
+                'Pytorch': (self.ui.Button_Install_Pytorch, self.ui.ProgressBar_Env_Install_Pytorch, self.ui.Label_Env_Install_Pytorch_Status)
+            }
+            for Name, (Button, ProgressBar, Label) in Items.items():
+                if Report.IsDetected(Name):
+                    ProgressBar.setValue(100)
+                    Label.setText(Report.GetStatus(Name))
+            if Cached:
+                return
+            # What's missing gets installed (the installers of Python, its requirements and Pytorch go on to the next one by themselves)
+            for Name in ('Aria2', 'FFmpeg'):
+                Items[Name][0].click() if not Report.IsDetected(Name) else None
+            for Name in ('Python', 'PyReqs', 'Pytorch'):
+                if Name in Report.Results and not Report.IsDetected(Name):
+                    Items[Name][0].click()
+                    break
+        EnvConfiguratorSignals.Signal_EnvReport.connect(
+            ApplyEnvReport,
+            type = Qt.QueuedConnection
+        )
+        MainWindowSignals.Signal_MainWindowShown.connect(
+            EnvProber.Revalidate
+        )
+
         # EnvManagement
         self.ui.ToolButton_Env_Manage_Title.setText(QCA.translate("ToolButton", "安装管理"))
         self.ui.ToolButton_Env_Manage_Title.setCheckable(True)
@@ -1493,127 +1411,157 @@ class MainWindow(Window_MainWindow):
         ####################### Content: Models #####################
         #############################################################
 
-        MainWindowSignals.Signal_MainWindowShown.connect(
-            lambda: Function_SetMethodExecutor(self,
-                Method = Model_View.Execute
+        # Set up the page (and scan the model dirs) the first time it is shown
+        def SetupPage_Models():
+            # Refresh the catalogues shortly after the model dirs change (or poll them if they can't be watched)
+            self.ModelRefreshTimer = QTimer(self)
+            self.ModelRefreshTimer.setSingleShot(True)
+            self.ModelRefreshTimer.setInterval(1000)
+            self.ModelRefreshTimer.timeout.connect(
+                lambda: Function_SetMethodExecutor(self,
+                    Method = Model_View.Execute
+                )
             )
-        )
-
-        self.ui.ToolButton_Models_Process_Title.setText(QCA.translate("ToolButton", '基本处理'))
-        self.ui.ToolButton_Models_Process_Title.setCheckable(True)
-        self.ui.ToolButton_Models_Process_Title.setChecked(True)
-        self.ui.ToolButton_Models_Process_Title.setAutoExclusive(True)
-        self.ui.ToolButton_Models_Process_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Models,
-                Target = 0
+            self.ModelPollTimer = QTimer(self)
+            self.ModelPollTimer.setInterval(10000)
+            self.ModelPollTimer.timeout.connect(self.ModelRefreshTimer.start)
+            self.ModelWatcher = QFileSystemWatcher(self)
+            self.ModelWatcher.directoryChanged.connect(self.ModelRefreshTimer.start)
+            ModelViewSignals.Signal_Scanned.connect(self.watchModels)
+
+            self.ui.ToolButton_Models_Process_Title.setText(QCA.translate("ToolButton", '基本处理'))
+            self.ui.ToolButton_Models_Process_Title.setCheckable(True)
+            self.ui.ToolButton_Models_Process_Title.setChecked(True)
+            self.ui.ToolButton_Models_Process_Title.setAutoExclusive(True)
+            self.ui.ToolButton_Models_Process_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Models,
+                    Target = 0
+                )
+            )
+            self.ui.ToolButton_Models_Process_Title.setToolTip(
+                "基本处理模型"
+            )
+
+            self.ui.ProgressBar_Models_Download = QProgressBar(self.ui.Frame_Models_Title_Spacer)
+            self.ui.ProgressBar_Models_Download.setStyleSheet(self.ui.ProgressBar_Process.styleSheet())
+            self.ui.ProgressBar_Models_Download.setMinimumSize(QSize(0, 30))
+            self.ui.ProgressBar_Models_Download.setValue(0)
+            self.ui.ProgressBar_Models_Download.setTextVisible(False)
+            self.ui.horizontalLayout_27.insertWidget(1, self.ui.ProgressBar_Models_Download, 1)
+
+            self.ui.TabWidget_Models_Process.setTabText(0, 'UVR（人声分离）')
+            self.ui.Table_Models_Process_UVR.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
+            ModelViewSignals.Signal_Process_UVR.connect(self.ui.Table_Models_Process_UVR.ApplyDelta)
+            self.ui.Table_Models_Process_UVR.Download.connect(
+                lambda Params: Function_SetMethodExecutor(self,
+                    ProgressBar = self.ui.ProgressBar_Models_Download,
+                    Method = Model_Downloader.Execute,
+                    Params = Params
+                )
             )
-        )
-        self.ui.ToolButton_Models_Process_Title.setToolTip(
-            "基本处理模型"
-        )
 
-        self.ui.TabWidget_Models_Process.setTabText(0, 'UVR（人声分离）')
-        self.ui.Table_Models_Process_UVR.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
-        ModelViewSignals.Signal_Process_UVR.connect(self.ui.Table_Models_Process_UVR.SetValue)
-        self.ui.Table_Models_Process_UVR.Download.connect(
-            lambda Params: Function_SetMethodExecutor(self,
-                Method = Model_Downloader.Execute,
-                Params = Params
+            self.ui.ToolButton_Models_ASR_Title.setText(QCA.translate("ToolButton", 'ASR（识别）'))
+            self.ui.ToolButton_Models_ASR_Title.setCheckable(True)
+            self.ui.ToolButton_Models_ASR_Title.setChecked(False)
+            self.ui.ToolButton_Models_ASR_Title.setAutoExclusive(True)
+            self.ui.ToolButton_Models_ASR_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Models,
+                    Target = 1
+                )
+            )
+            self.ui.ToolButton_Models_ASR_Title.setToolTip(
+                "语音识别模型"
             )
-        )
 
-        self.ui.ToolButton_Models_ASR_Title.setText(QCA.translate("ToolButton", 'ASR（识别）'))
-        self.ui.ToolButton_Models_ASR_Title.setCheckable(True)
-        self.ui.ToolButton_Models_ASR_Title.setChecked(False)
-        self.ui.ToolButton_Models_ASR_Title.setAutoExclusive(True)
-        self.ui.ToolButton_Models_ASR_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Models,
-                Target = 1
+            self.ui.TabWidget_Models_ASR.setTabText(0, 'VPR（声纹识别）')
+            self.ui.Table_Models_ASR_VPR.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
+            ModelViewSignals.Signal_ASR_VPR.connect(self.ui.Table_Models_ASR_VPR.ApplyDelta)
+            self.ui.Table_Models_ASR_VPR.Download.connect(
+                lambda Params: Function_SetMethodExecutor(self,
+                    ProgressBar = self.ui.ProgressBar_Models_Download,
+                    Method = Model_Downloader.Execute,
+                    Params = Params
+                )
             )
-        )
-        self.ui.ToolButton_Models_ASR_Title.setToolTip(
-            "语音识别模型"
-        )
 
-        self.ui.TabWidget_Models_ASR.setTabText(0, 'VPR（声纹识别）')
-        self.ui.Table_Models_ASR_VPR.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
-        ModelViewSignals.Signal_ASR_VPR.connect(self.ui.Table_Models_ASR_VPR.SetValue)
-        self.ui.Table_Models_ASR_VPR.Download.connect(
-            lambda Params: Function_SetMethodExecutor(self,
-                Method = Model_Downloader.Execute,
-                Params = Params
+            self.ui.ToolButton_Models_STT_Title.setText(QCA.translate("ToolButton", 'STT（转录）'))
+            self.ui.ToolButton_Models_STT_Title.setCheckable(True)
+            self.ui.ToolButton_Models_STT_Title.setChecked(False)
+            self.ui.ToolButton_Models_STT_Title.setAutoExclusive(True)
+            self.ui.ToolButton_Models_STT_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Models,
+                    Target = 2
+                )
+            )
+            self.ui.ToolButton_Models_STT_Title.setToolTip(
+                "语音转录模型"
             )
-        )
 
-        self.ui.ToolButton_Models_STT_Title.setText(QCA.translate("ToolButton", 'STT（转录）'))
-        self.ui.ToolButton_Models_STT_Title.setCheckable(True)
-        self.ui.ToolButton_Models_STT_Title.setChecked(False)
-        self.ui.ToolButton_Models_STT_Title.setAutoExclusive(True)
-        self.ui.ToolButton_Models_STT_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Models,
-                Target = 2
+            self.ui.TabWidget_Models_STT.setTabText(0, 'Whisper')
+            self.ui.Table_Models_STT_Whisper.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
+            ModelViewSignals.Signal_STT_Whisper.connect(self.ui.Table_Models_STT_Whisper.ApplyDelta)
+            self.ui.Table_Models_STT_Whisper.Download.connect(
+                lambda Params: Function_SetMethodExecutor(self,
+                    ProgressBar = self.ui.ProgressBar_Models_Download,
+                    Method = Model_Downloader.Execute,
+                    Params = Params
+                )
             )
-        )
-        self.ui.ToolButton_Models_STT_Title.setToolTip(
-            "语音转录模型"
-        )
 
-        self.ui.TabWidget_Models_STT.setTabText(0, 'Whisper')
-        self.ui.Table_Models_STT_Whisper.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
-        ModelViewSignals.Signal_STT_Whisper.connect(self.ui.Table_Models_STT_Whisper.SetValue)
-        self.ui.Table_Models_STT_Whisper.Download.connect(
-            lambda Params: Function_SetMethodExecutor(self,
-                Method = Model_Downloader.Execute,
-                Params = Params
+            self.ui.ToolButton_Models_TTS_Title.setText(QCA.translate("ToolButton", 'TTS（合成）'))
+            self.ui.ToolButton_Models_TTS_Title.setCheckable(True)
+            self.ui.ToolButton_Models_TTS_Title.setChecked(False)
+            self.ui.ToolButton_Models_TTS_Title.setAutoExclusive(True)
+            self.ui.ToolButton_Models_TTS_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Models,
+                    Target = 3
+                )
+            )
+            self.ui.ToolButton_Models_TTS_Title.setToolTip(
+                "语音合成模型"
             )
-        )
 
-        self.ui.ToolButton_Models_TTS_Title.setText(QCA.translate("ToolButton", 'TTS（合成）'))
-        self.ui.ToolButton_Models_TTS_Title.setCheckable(True)
-        self.ui.ToolButton_Models_TTS_Title.setChecked(False)
-        self.ui.ToolButton_Models_TTS_Title.setAutoExclusive(True)
-        self.ui.ToolButton_Models_TTS_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Models,
-                Target = 3
+            self.ui.TabWidget_Models_TTS.setTabText(0, 'GPT-SoVITS')
+            self.ui.Table_Models_TTS_GPTSoVITS.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
+            ModelViewSignals.Signal_TTS_GPTSoVITS.connect(self.ui.Table_Models_TTS_GPTSoVITS.ApplyDelta)
+            self.ui.Table_Models_TTS_GPTSoVITS.Download.connect(
+                lambda Params: Function_SetMethodExecutor(self,
+                    ProgressBar = self.ui.ProgressBar_Models_Download,
+                    Method = Model_Downloader.Execute,
+                    Params = Params
+                )
             )
-        )
-        self.ui.ToolButton_Models_TTS_Title.setToolTip(
-            "语音合成模型"
-        )
 
-        self.ui.TabWidget_Models_TTS.setTabText(0, 'GPT-SoVITS')
-        self.ui.Table_Models_TTS_GPTSoVITS.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
-        ModelViewSignals.Signal_TTS_GPTSoVITS.connect(self.ui.Table_Models_TTS_GPTSoVITS.SetValue)
-        self.ui.Table_Models_TTS_GPTSoVITS.Download.connect(
-            lambda Params: Function_SetMethodExecutor(self,
-                Method = Model_Downloader.Execute,
-                Params = Params
+            self.ui.TabWidget_Models_TTS.setTabText(1, 'VITS')
+            self.ui.Table_Models_TTS_VITS.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
+            ModelViewSignals.Signal_TTS_VITS.connect(self.ui.Table_Models_TTS_VITS.ApplyDelta)
+            self.ui.Table_Models_TTS_VITS.Download.connect(
+                lambda Params: Function_SetMethodExecutor(self,
+                    ProgressBar = self.ui.ProgressBar_Models_Download,
+                    Method = Model_Downloader.Execute,
+                    Params = Params
+                )
             )
-        )
 
-        self.ui.TabWidget_Models_TTS.setTabText(1, 'VITS')
-        self.ui.Table_Models_TTS_VITS.setHorizontalHeaderLabels(['名字', '类型', '大小', '日期', '操作'])
-        ModelViewSignals.Signal_TTS_VITS.connect(self.ui.Table_Models_TTS_VITS.SetValue)
-        self.ui.Table_Models_TTS_VITS.Download.connect(
-            lambda Params: Function_SetMethodExecutor(self,
-                Method = Model_Downloader.Execute,
-                Params = Params
+            self.ui.Button_Models_Refresh.setText(QCA.translate("ToolButton", '刷新'))
+            self.ui.Button_Models_Refresh.clicked.connect(
+                lambda: Function_SetMethodExecutor(self,
+                    Method = Model_View.Execute
+                )
             )
-        )
 
-        self.ui.Button_Models_Refresh.setText(QCA.translate("ToolButton", '刷新'))
-        self.ui.Button_Models_Refresh.clicked.connect(
-            lambda: Function_SetMethodExecutor(self,
+            self.ui.Button_Models_Append.setText(QCA.translate("ToolButton", '添加'))
+            self.ui.Button_Models_Append.clicked.connect(self.appendModels)
+
+            # Scan the model dirs
+            Function_SetMethodExecutor(self,
                 Method = Model_View.Execute
             )
-        )
-
-        self.ui.Button_Models_Append.setText(QCA.translate("ToolButton", '添加'))
-        self.ui.Button_Models_Append.clicked.connect(self.appendModels)
+        PageSetups.Register(self.ui.Page_Models, SetupPage_Models)
 
         #############################################################
         ###################### Content: Process #####################
@@ -1641,620 +1589,626 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_Process', 'False')) is False else None
         )
 
-        # ParamsManager
-        Path_Config_Process = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Process.ini'))
-        ParamsManager_Process = ParamsManager(Path_Config_Process)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_Process():
+            nonlocal ParamsManager_Process, LineEdit_Process_OutputDir
 
-        # Top
-        self.ui.ToolButton_AudioProcessor_Title.setText(QCA.translate("ToolButton", '音频基本处理'))
-        self.ui.ToolButton_AudioProcessor_Title.setCheckable(True)
-        self.ui.ToolButton_AudioProcessor_Title.setChecked(True)
-        self.ui.ToolButton_AudioProcessor_Title.setAutoExclusive(True)
-        self.ui.ToolButton_AudioProcessor_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Process,
-                Target = 0
+            # ParamsManager
+            Path_Config_Process = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Process.ini'))
+            ParamsManager_Process = ParamsManager(Path_Config_Process)
+
+            # Top
+            self.ui.ToolButton_AudioProcessor_Title.setText(QCA.translate("ToolButton", '音频基本处理'))
+            self.ui.ToolButton_AudioProcessor_Title.setCheckable(True)
+            self.ui.ToolButton_AudioProcessor_Title.setChecked(True)
+            self.ui.ToolButton_AudioProcessor_Title.setAutoExclusive(True)
+            self.ui.ToolButton_AudioProcessor_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Process,
+                    Target = 0
+                )
             )
-        )
 
-        # Left
-        self.ui.TreeWidget_Catalogue_Process.clear()
-        self.ui.TreeWidget_Catalogue_Process.setHeaderHidden(True)
+            # Left
+            self.ui.TreeWidget_Catalogue_Process.clear()
+            self.ui.TreeWidget_Catalogue_Process.setHeaderHidden(True)
 
-        # Middle
-        self.ui.GroupBox_Process_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Process_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # Middle
+            self.ui.GroupBox_Process_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Process_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_MediaDirInput,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "媒体输入目录\n需要处理的音频文件的所在目录。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_MediaDirInput,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "媒体输入目录\n需要处理的音频文件的所在目录。")
+                )
+            )
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.LineEdit_Process_MediaDirInput,
+                Section = 'Input Params',
+                Option = 'Media_Dir_Input',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_Process_MediaDirInput.SetFileDialog(
+                Mode = "SelectFolder"
+            )
+            self.ui.Button_Process_MediaDirInput_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_MediaDirInput),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_MediaDirInput.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_MediaDirInput,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "媒体输入目录")
             )
-        )
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.LineEdit_Process_MediaDirInput,
-            Section = 'Input Params',
-            Option = 'Media_Dir_Input',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_Process_MediaDirInput.SetFileDialog(
-            Mode = "SelectFolder"
-        )
-        self.ui.Button_Process_MediaDirInput_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_MediaDirInput),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_MediaDirInput.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_MediaDirInput,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "媒体输入目录")
-        )
 
-        self.ui.GroupBox_Process_DenoiserParams.setTitle(QCA.translate("GroupBox", "降噪参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Process_DenoiserParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "降噪参数")
-        )
+            self.ui.GroupBox_Process_DenoiserParams.setTitle(QCA.translate("GroupBox", "降噪参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Process_DenoiserParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "降噪参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_DenoiseAudio,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "启用杂音去除\n弱化音频中的非人声部分。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_DenoiseAudio,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "启用杂音去除\n弱化音频中的非人声部分。")
+                )
             )
-        )
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.CheckBox_Process_DenoiseAudio,
-            Section = 'Denoiser Params',
-            Option = 'Denoise_Audio',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Process_DenoiseAudio,
-            CheckedText = "已启用",
-            CheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Process_DenoiserParams_BasicSettings,
-                    [
-                        self.ui.Frame_Process_DenoiseModelPath,
-                        self.ui.Frame_Process_DenoiseTarget,
-                    ],
-                    True
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.CheckBox_Process_DenoiseAudio,
+                Section = 'Denoiser Params',
+                Option = 'Denoise_Audio',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Process_DenoiseAudio,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Process_DenoiserParams_BasicSettings,
+                        [
+                            self.ui.Frame_Process_DenoiseModelPath,
+                            self.ui.Frame_Process_DenoiseTarget,
+                        ],
+                        True
+                    )
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Process_DenoiserParams_BasicSettings,
+                        [
+                            self.ui.Frame_Process_DenoiseModelPath,
+                            self.ui.Frame_Process_DenoiseTarget,
+                        ],
+                        False
+                    )
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Process_DenoiseAudio_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_DenoiseAudio)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_DenoiseAudio,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "降噪参数"),
+                ChildItemText = QCA.translate("Tree", "启用杂音去除")
+            )
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_DenoiseModelPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "uvr5模型路径\n用于uvr5降噪的模型文件的路径。")
                 )
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Process_DenoiserParams_BasicSettings,
-                    [
-                        self.ui.Frame_Process_DenoiseModelPath,
-                        self.ui.Frame_Process_DenoiseTarget,
-                    ],
-                    False
+            )
+            Process_DenoiseModelPath_Default = Path(ModelDir).joinpath('Process', 'UVR', 'Downloaded', 'HP5_only_main_vocal.pth').as_posix()
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.LineEdit_Process_DenoiseModelPath,
+                Section = 'Denoiser Params',
+                Option = 'Denoise_Model_Path',
+                DefaultValue = Process_DenoiseModelPath_Default,
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_Process_DenoiseModelPath.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型/onnx类型 (*.pth *.onnx)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('Process', 'UVR', 'Downloaded'))
+            )
+            self.ui.Button_Process_DenoiseModelPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_DenoiseModelPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_DenoiseModelPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_DenoiseModelPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "降噪参数"),
+                ChildItemText = QCA.translate("Tree", "uvr5模型路径")
+            )
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_DenoiseTarget,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "提取目标\n选择在降噪时要保留的声音对象。")
                 )
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Process_DenoiseAudio_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_DenoiseAudio)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_DenoiseAudio,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "降噪参数"),
-            ChildItemText = QCA.translate("Tree", "启用杂音去除")
-        )
+            )
+            self.ui.ComboBox_Process_DenoiseTarget.addItems([QCA.translate("ComboBox", '人声'), QCA.translate("ComboBox", '背景声')])
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.ComboBox_Process_DenoiseTarget,
+                Section = 'Denoiser Params',
+                Option = 'Denoise_Target',
+                DefaultValue = '人声'
+            )
+            self.ui.Button_Process_DenoiseTarget_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_DenoiseTarget)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_DenoiseTarget,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "降噪参数"),
+                ChildItemText = QCA.translate("Tree", "提取目标")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_DenoiseModelPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "uvr5模型路径\n用于uvr5降噪的模型文件的路径。")
+            self.ui.GroupBox_Process_SlicerParams.setTitle(QCA.translate("GroupBox", "静音切除参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Process_SlicerParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数")
             )
-        )
-        Process_DenoiseModelPath_Default = Path(ModelDir).joinpath('Process', 'UVR', 'Downloaded', 'HP5_only_main_vocal.pth').as_posix()
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.LineEdit_Process_DenoiseModelPath,
-            Section = 'Denoiser Params',
-            Option = 'Denoise_Model_Path',
-            DefaultValue = Process_DenoiseModelPath_Default,
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_Process_DenoiseModelPath.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型/onnx类型 (*.pth *.onnx)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('Process', 'UVR', 'Downloaded'))
-        )
-        self.ui.Button_Process_DenoiseModelPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_DenoiseModelPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_DenoiseModelPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_DenoiseModelPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "降噪参数"),
-            ChildItemText = QCA.translate("Tree", "uvr5模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_DenoiseTarget,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "提取目标\n选择在降噪时要保留的声音对象。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_SliceAudio,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "启用静音切除\n切除音频中的静音部分。")
+                )
             )
-        )
-        self.ui.ComboBox_Process_DenoiseTarget.addItems([QCA.translate("ComboBox", '人声'), QCA.translate("ComboBox", '背景声')])
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.ComboBox_Process_DenoiseTarget,
-            Section = 'Denoiser Params',
-            Option = 'Denoise_Target',
-            DefaultValue = '人声'
-        )
-        self.ui.Button_Process_DenoiseTarget_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_DenoiseTarget)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_DenoiseTarget,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "降噪参数"),
-            ChildItemText = QCA.translate("Tree", "提取目标")
-        )
-
-        self.ui.GroupBox_Process_SlicerParams.setTitle(QCA.translate("GroupBox", "静音切除参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Process_SlicerParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_SliceAudio,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "启用静音切除\n切除音频中的静音部分。")
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.CheckBox_Process_SliceAudio,
+                Section = 'Slicer Params',
+                Option = 'Slice_Audio',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Process_SliceAudio,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.ToolBox_Process_SlicerParams_AdvanceSettings_Page1Content,
+                        [
+                            self.ui.Frame_Process_RMSThreshold,
+                            self.ui.Frame_Process_HopSize,
+                            self.ui.Frame_Process_SilentIntervalMin,
+                            self.ui.Frame_Process_SilenceKeptMax,
+                            self.ui.Frame_Process_AudioLengthMin
+                        ],
+                        True,
+                        True
+                    )
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.ToolBox_Process_SlicerParams_AdvanceSettings_Page1Content,
+                        [
+                            self.ui.Frame_Process_RMSThreshold,
+                            self.ui.Frame_Process_HopSize,
+                            self.ui.Frame_Process_SilentIntervalMin,
+                            self.ui.Frame_Process_SilenceKeptMax,
+                            self.ui.Frame_Process_AudioLengthMin
+                        ],
+                        False,
+                        True
+                    )
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Process_SliceAudio_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_SliceAudio)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_SliceAudio,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "启用静音切除")
             )
-        )
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.CheckBox_Process_SliceAudio,
-            Section = 'Slicer Params',
-            Option = 'Slice_Audio',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Process_SliceAudio,
-            CheckedText = "已启用",
-            CheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.ToolBox_Process_SlicerParams_AdvanceSettings_Page1Content,
-                    [
-                        self.ui.Frame_Process_RMSThreshold,
-                        self.ui.Frame_Process_HopSize,
-                        self.ui.Frame_Process_SilentIntervalMin,
-                        self.ui.Frame_Process_SilenceKeptMax,
-                        self.ui.Frame_Process_AudioLengthMin
-                    ],
-                    True,
-                    True
-                )
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.ToolBox_Process_SlicerParams_AdvanceSettings_Page1Content,
-                    [
-                        self.ui.Frame_Process_RMSThreshold,
-                        self.ui.Frame_Process_HopSize,
-                        self.ui.Frame_Process_SilentIntervalMin,
-                        self.ui.Frame_Process_SilenceKeptMax,
-                        self.ui.Frame_Process_AudioLengthMin
-                    ],
-                    False,
-                    True
-                )
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Process_SliceAudio_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_SliceAudio)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_SliceAudio,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "启用静音切除")
-        )
 
-        self.ui.ToolBox_Process_SlicerParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Process_SlicerParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_Process_SlicerParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Process_SlicerParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_RMSThreshold,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "均方根阈值 (db)\n低于该阈值的片段将被视作静音进行处理，若有降噪需求可以增加该值。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_RMSThreshold,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "均方根阈值 (db)\n低于该阈值的片段将被视作静音进行处理，若有降噪需求可以增加该值。")
+                )
             )
-        )
-        self.ui.DoubleSpinBox_Process_RMSThreshold.setRange(-100, 0)
-        #self.ui.DoubleSpinBox_Process_RMSThreshold.setSingleStep(0.01)
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.DoubleSpinBox_Process_RMSThreshold,
-            Section = 'Slicer Params',
-            Option = 'RMS_Threshold',
-            DefaultValue = -34.
-        )
-        self.ui.Button_Process_RMSThreshold_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.DoubleSpinBox_Process_RMSThreshold)
-            }
-            
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_RMSThreshold,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "均方根阈值")
-        )
+            self.ui.DoubleSpinBox_Process_RMSThreshold.setRange(-100, 0)
+            #self.ui.DoubleSpinBox_Process_RMSThreshold.setSingleStep(0.01)
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.DoubleSpinBox_Process_RMSThreshold,
+                Section = 'Slicer Params',
+                Option = 'RMS_Threshold',
+                DefaultValue = -34.
+            )
+            self.ui.Button_Process_RMSThreshold_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.DoubleSpinBox_Process_RMSThreshold)
+                }
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_HopSize,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "跃点大小 (ms)\n每个RMS帧的长度，增加该值能够提高分割精度但会减慢进程。")
             )
-        )
-        self.ui.SpinBox_Process_HopSize.setRange(0, 100)
-        self.ui.SpinBox_Process_HopSize.setSingleStep(1)
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.SpinBox_Process_HopSize,
-            Section = 'Slicer Params',
-            Option = 'Hop_Size',
-            DefaultValue = 10
-        )
-        self.ui.Button_Process_HopSize_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_HopSize)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_HopSize,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "跃点大小")
-        )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_RMSThreshold,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "均方根阈值")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_SilentIntervalMin,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "最小静音间隔 (ms)\n静音部分被分割成的最小长度，若音频只包含短暂中断可以减小该值。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_HopSize,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "跃点大小 (ms)\n每个RMS帧的长度，增加该值能够提高分割精度但会减慢进程。")
+                )
+            )
+            self.ui.SpinBox_Process_HopSize.setRange(0, 100)
+            self.ui.SpinBox_Process_HopSize.setSingleStep(1)
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.SpinBox_Process_HopSize,
+                Section = 'Slicer Params',
+                Option = 'Hop_Size',
+                DefaultValue = 10
+            )
+            self.ui.Button_Process_HopSize_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_HopSize)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_HopSize,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "跃点大小")
             )
-        )
-        self.ui.SpinBox_Process_SilentIntervalMin.setRange(0, 3000)
-        self.ui.SpinBox_Process_SilentIntervalMin.setSingleStep(1)
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.SpinBox_Process_SilentIntervalMin,
-            Section = 'Slicer Params',
-            Option = 'Silent_Interval_Min',
-            DefaultValue = 300
-        )
-        self.ui.SpinBox_Process_SilentIntervalMin.setToolTip(QCA.translate("ToolTip", "注意：这个值必须小于最小音频长度，大于跃点大小。"))
-        self.ui.Button_Process_SilentIntervalMin_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_SilentIntervalMin)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_SilentIntervalMin,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "最小静音间隔")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_SilenceKeptMax,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "最大静音长度 (ms)\n被分割的音频周围保持静音的最大长度。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_SilentIntervalMin,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "最小静音间隔 (ms)\n静音部分被分割成的最小长度，若音频只包含短暂中断可以减小该值。")
+                )
+            )
+            self.ui.SpinBox_Process_SilentIntervalMin.setRange(0, 3000)
+            self.ui.SpinBox_Process_SilentIntervalMin.setSingleStep(1)
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.SpinBox_Process_SilentIntervalMin,
+                Section = 'Slicer Params',
+                Option = 'Silent_Interval_Min',
+                DefaultValue = 300
+            )
+            self.ui.SpinBox_Process_SilentIntervalMin.setToolTip(QCA.translate("ToolTip", "注意：这个值必须小于最小音频长度，大于跃点大小。"))
+            self.ui.Button_Process_SilentIntervalMin_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_SilentIntervalMin)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_SilentIntervalMin,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "最小静音间隔")
             )
-        )
-        self.ui.SpinBox_Process_SilenceKeptMax.setRange(0, 10000)
-        self.ui.SpinBox_Process_SilenceKeptMax.setSingleStep(1)
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.SpinBox_Process_SilenceKeptMax,
-            Section = 'Slicer Params',
-            Option = 'Silence_Kept_Max',
-            DefaultValue = 500
-        )
-        self.ui.SpinBox_Process_SilenceKeptMax.setToolTip(QCA.translate("ToolTip", "注意：这个值无需完全对应被分割音频中的静音长度。算法将自行检索最佳的分割位置。"))
-        self.ui.Button_Process_SilenceKeptMax_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_SilenceKeptMax)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_SilenceKeptMax,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "最大静音长度")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_AudioLengthMin,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "最小音频长度 (ms)\n每个被分割的音频片段所需的最小长度。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_SilenceKeptMax,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "最大静音长度 (ms)\n被分割的音频周围保持静音的最大长度。")
+                )
+            )
+            self.ui.SpinBox_Process_SilenceKeptMax.setRange(0, 10000)
+            self.ui.SpinBox_Process_SilenceKeptMax.setSingleStep(1)
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.SpinBox_Process_SilenceKeptMax,
+                Section = 'Slicer Params',
+                Option = 'Silence_Kept_Max',
+                DefaultValue = 500
+            )
+            self.ui.SpinBox_Process_SilenceKeptMax.setToolTip(QCA.translate("ToolTip", "注意：这个值无需完全对应被分割音频中的静音长度。算法将自行检索最佳的分割位置。"))
+            self.ui.Button_Process_SilenceKeptMax_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_SilenceKeptMax)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_SilenceKeptMax,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "最大静音长度")
             )
-        )
-        self.ui.SpinBox_Process_AudioLengthMin.setRange(300, 30000)
-        self.ui.SpinBox_Process_AudioLengthMin.setSingleStep(1)
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.SpinBox_Process_AudioLengthMin,
-            Section = 'Slicer Params',
-            Option = 'Audio_Length_Min',
-            DefaultValue = 4000
-        )
-        self.ui.Button_Process_AudioLengthMin_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_AudioLengthMin)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_AudioLengthMin,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "静音切除参数"),
-            ChildItemText = QCA.translate("Tree", "最小音频长度")
-        )
 
-        self.ui.GroupBox_Process_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Process_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_AudioLengthMin,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "最小音频长度 (ms)\n每个被分割的音频片段所需的最小长度。")
+                )
+            )
+            self.ui.SpinBox_Process_AudioLengthMin.setRange(300, 30000)
+            self.ui.SpinBox_Process_AudioLengthMin.setSingleStep(1)
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.SpinBox_Process_AudioLengthMin,
+                Section = 'Slicer Params',
+                Option = 'Audio_Length_Min',
+                DefaultValue = 4000
+            )
+            self.ui.Button_Process_AudioLengthMin_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.SpinBox_Process_AudioLengthMin)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_AudioLengthMin,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "静音切除参数"),
+                ChildItemText = QCA.translate("Tree", "最小音频长度")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_MediaFormatOutput,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "媒体输出格式\n媒体文件输出为音频文件的格式，若维持不变则保持'None'即可。")
+            self.ui.GroupBox_Process_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Process_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数")
             )
-        )
-        self.ui.ComboBox_Process_MediaFormatOutput.addItems(['flac', 'wav', 'mp3', 'aac', 'm4a', 'wma', 'aiff', 'au', 'ogg', 'None'])
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.ComboBox_Process_MediaFormatOutput,
-            Section = 'Output Params',
-            Option = 'Media_Format_Output',
-            DefaultValue = 'wav'
-        )
-        self.ui.Button_Process_MediaFormatOutput_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_MediaFormatOutput)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_AudioLengthMin,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "媒体输出格式")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的音频文件的目录的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_MediaFormatOutput,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "媒体输出格式\n媒体文件输出为音频文件的格式，若维持不变则保持'None'即可。")
+                )
+            )
+            self.ui.ComboBox_Process_MediaFormatOutput.addItems(['flac', 'wav', 'mp3', 'aac', 'm4a', 'wma', 'aiff', 'au', 'ogg', 'None'])
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.ComboBox_Process_MediaFormatOutput,
+                Section = 'Output Params',
+                Option = 'Media_Format_Output',
+                DefaultValue = 'wav'
+            )
+            self.ui.Button_Process_MediaFormatOutput_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_MediaFormatOutput)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_AudioLengthMin,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "媒体输出格式")
             )
-        )
-        Process_OutputDirName_Default = str(date.today())
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.LineEdit_Process_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Output_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = Process_OutputDirName_Default
-        )
-        self.ui.Button_Process_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
-
-        LineEdit_Process_OutputDir = QLineEdit()
-        def SetText_LineEdit_Process_OutputDir():
-            DirName = self.ui.LineEdit_Process_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_Process_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_Process_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_Process_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_Process_OutputDirName.interacted.connect(SetText_LineEdit_Process_OutputDir)
-        self.ui.LineEdit_Process_OutputRoot.interacted.connect(SetText_LineEdit_Process_OutputDir)
-        #SetText_LineEdit_Process_OutputDir()
-
-        self.ui.ToolBox_Process_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Process_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_ToMono,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "合并声道\n将输出音频的声道合并为单声道。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的音频文件的目录的名字。")
+                )
+            )
+            Process_OutputDirName_Default = str(date.today())
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.LineEdit_Process_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Output_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = Process_OutputDirName_Default
+            )
+            self.ui.Button_Process_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.LineEdit_Process_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Process_OutputDirName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
+            )
+
+            LineEdit_Process_OutputDir = QLineEdit()
+            def SetText_LineEdit_Process_OutputDir():
+                DirName = self.ui.LineEdit_Process_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_Process_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_Process_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_Process_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_Process_OutputDirName.interacted.connect(SetText_LineEdit_Process_OutputDir)
+            self.ui.LineEdit_Process_OutputRoot.interacted.connect(SetText_LineEdit_Process_OutputDir)
+            #SetText_LineEdit_Process_OutputDir()
+
+            self.ui.ToolBox_Process_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Process_OutputParams_AdvanceSettings.widget(0).collapse()
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_ToMono,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "合并声道\n将输出音频的声道合并为单声道。")
+                )
+            )
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.CheckBox_Process_ToMono,
+                Section = 'Output Params',
+                Option = 'ToMono',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Process_ToMono,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Process_ToMono_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_ToMono)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_ToMono,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "合并声道")
             )
-        )
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.CheckBox_Process_ToMono,
-            Section = 'Output Params',
-            Option = 'ToMono',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Process_ToMono,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Process_ToMono_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.CheckBox_Process_ToMono)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_ToMono,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "合并声道")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_SampleRate,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出采样率\n输出音频所拥有的采样率，若维持不变则保持'None'即可。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_SampleRate,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出采样率\n输出音频所拥有的采样率，若维持不变则保持'None'即可。")
+                )
+            )
+            self.ui.ComboBox_Process_SampleRate.addItems(['22050', '44100', '48000', '96000', '192000', 'None'])
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.ComboBox_Process_SampleRate,
+                Section = 'Output Params',
+                Option = 'SampleRate',
+                DefaultValue = None
+            )
+            self.ui.Button_Process_SampleRate_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_SampleRate)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_SampleRate,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出采样率")
             )
-        )
-        self.ui.ComboBox_Process_SampleRate.addItems(['22050', '44100', '48000', '96000', '192000', 'None'])
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.ComboBox_Process_SampleRate,
-            Section = 'Output Params',
-            Option = 'SampleRate',
-            DefaultValue = None
-        )
-        self.ui.Button_Process_SampleRate_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_SampleRate)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_SampleRate,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出采样率")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Process_SampleWidth,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出采样位数\n输出音频所拥有的采样位数，若维持不变则保持'None'即可。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Process_SampleWidth,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出采样位数\n输出音频所拥有的采样位数，若维持不变则保持'None'即可。")
+                )
+            )
+            self.ui.ComboBox_Process_SampleWidth.addItems(['8', '16', '24', '32', '32 (Float)', 'None'])
+            ParamsManager_Process.SetParam(
+                Widget = self.ui.ComboBox_Process_SampleWidth,
+                Section = 'Output Params',
+                Option = 'SampleWidth',
+                DefaultValue = None
+            )
+            self.ui.Button_Process_SampleWidth_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_SampleWidth)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Process_SampleWidth,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Process,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出采样位数")
             )
-        )
-        self.ui.ComboBox_Process_SampleWidth.addItems(['8', '16', '24', '32', '32 (Float)', 'None'])
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.ComboBox_Process_SampleWidth,
-            Section = 'Output Params',
-            Option = 'SampleWidth',
-            DefaultValue = None
-        )
-        self.ui.Button_Process_SampleWidth_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Process.ResetParam(self.ui.ComboBox_Process_SampleWidth)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Process_SampleWidth,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Process,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出采样位数")
-        )
 
-        # Right
-        MonitorFile_Config_AudioProcessor = QTasks.MonitorFile(Path_Config_Process)
-        MonitorFile_Config_AudioProcessor.start()
-        MonitorFile_Config_AudioProcessor.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_Process.setText(
-                FileContent
+            # Right
+            MonitorFile_Config_AudioProcessor = QTasks.MonitorFile(Path_Config_Process)
+            MonitorFile_Config_AudioProcessor.start()
+            MonitorFile_Config_AudioProcessor.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_Process.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_Process.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_Process.clicked.connect(
-            lambda: ParamsManager_Process.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_Process.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_Process.clicked.connect(
+                lambda: ParamsManager_Process.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_Process.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_Process.clicked.connect(
-            lambda: ParamsManager_Process.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_Process.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_Process.clicked.connect(
+                lambda: ParamsManager_Process.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_Process.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_Process.clicked.connect(
-            lambda: ParamsManager_Process.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_Process.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_Process.clicked.connect(
+                lambda: ParamsManager_Process.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
-
-        self.ui.Button_CheckOutput_Process.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_Process,
-            URL = self.ui.LineEdit_Process_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
 
-        # Bottom
-        self.ui.Button_Process_Execute.setToolTip(QCA.translate("ToolTip", "执行音频处理"))
-        self.ui.Button_Process_Terminate.setToolTip(QCA.translate("ToolTip", "终止音频处理"))
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_Process_Execute,
-            TerminateButton = self.ui.Button_Process_Terminate,
-            ProgressBar = self.ui.ProgressBar_Process,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Audio_Processing.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_Process_MediaDirInput,
-                self.ui.ComboBox_Process_MediaFormatOutput,
-                self.ui.ComboBox_Process_SampleRate,
-                self.ui.ComboBox_Process_SampleWidth,
-                self.ui.CheckBox_Process_ToMono,
-                self.ui.CheckBox_Process_DenoiseAudio,
-                self.ui.LineEdit_Process_DenoiseModelPath,
-                self.ui.ComboBox_Process_DenoiseTarget,
-                self.ui.CheckBox_Process_SliceAudio,
-                self.ui.DoubleSpinBox_Process_RMSThreshold,
-                self.ui.SpinBox_Process_AudioLengthMin,
-                self.ui.SpinBox_Process_SilentIntervalMin,
-                self.ui.SpinBox_Process_HopSize,
-                self.ui.SpinBox_Process_SilenceKeptMax,
-                self.ui.LineEdit_Process_OutputRoot,
-                self.ui.LineEdit_Process_OutputDirName
-            ],
-            EmptyAllowed = [
-                self.ui.ComboBox_Process_MediaFormatOutput,
-                self.ui.ComboBox_Process_SampleRate,
-                self.ui.ComboBox_Process_SampleWidth
-            ],
-            SuccessEvents = [
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
+            self.ui.Button_CheckOutput_Process.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_Process,
+                URL = self.ui.LineEdit_Process_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # Bottom
+            self.ui.Button_Process_Execute.setToolTip(QCA.translate("ToolTip", "执行音频处理"))
+            self.ui.Button_Process_Terminate.setToolTip(QCA.translate("ToolTip", "终止音频处理"))
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_Process_Execute,
+                TerminateButton = self.ui.Button_Process_Terminate,
+                ProgressBar = self.ui.ProgressBar_Process,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Audio_Processing.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_Process_MediaDirInput,
+                    self.ui.ComboBox_Process_MediaFormatOutput,
+                    self.ui.ComboBox_Process_SampleRate,
+                    self.ui.ComboBox_Process_SampleWidth,
+                    self.ui.CheckBox_Process_ToMono,
+                    self.ui.CheckBox_Process_DenoiseAudio,
+                    self.ui.LineEdit_Process_DenoiseModelPath,
+                    self.ui.ComboBox_Process_DenoiseTarget,
+                    self.ui.CheckBox_Process_SliceAudio,
+                    self.ui.DoubleSpinBox_Process_RMSThreshold,
+                    self.ui.SpinBox_Process_AudioLengthMin,
+                    self.ui.SpinBox_Process_SilentIntervalMin,
+                    self.ui.SpinBox_Process_HopSize,
+                    self.ui.SpinBox_Process_SilenceKeptMax,
+                    self.ui.LineEdit_Process_OutputRoot,
+                    self.ui.LineEdit_Process_OutputDirName
+                ],
+                EmptyAllowed = [
+                    self.ui.ComboBox_Process_MediaFormatOutput,
+                    self.ui.ComboBox_Process_SampleRate,
+                    self.ui.ComboBox_Process_SampleWidth
+                ],
+                SuccessEvents = [
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_Process, SetupPage_Process)
 
         #############################################################
         ######################## Content: ASR #######################
@@ -2282,493 +2236,501 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_ASR', 'False')) is False else None
         )
 
-        # ParamsManager
-        Path_Config_ASR_VPR = QFunc.NormPath(Path(ConfigDir).joinpath('Config_ASR_VPR.ini'))
-        ParamsManager_ASR_VPR = ParamsManager(Path_Config_ASR_VPR)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_ASR():
+            nonlocal ParamsManager_ASR_VPR, LineEdit_ASR_VPR_AudioSpeakersDataPath, ChildWindow_ASR
 
-        # Top
-        self.ui.ToolButton_VoiceIdentifier_Title.setText(QCA.translate("ToolButton", "VPR（声纹识别）"))
-        self.ui.ToolButton_VoiceIdentifier_Title.setCheckable(True)
-        self.ui.ToolButton_VoiceIdentifier_Title.setChecked(True)
-        self.ui.ToolButton_VoiceIdentifier_Title.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceIdentifier_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_ASR,
-                Target = 0
+            # ParamsManager
+            Path_Config_ASR_VPR = QFunc.NormPath(Path(ConfigDir).joinpath('Config_ASR_VPR.ini'))
+            ParamsManager_ASR_VPR = ParamsManager(Path_Config_ASR_VPR)
+
+            # Top
+            self.ui.ToolButton_VoiceIdentifier_Title.setText(QCA.translate("ToolButton", "VPR（声纹识别）"))
+            self.ui.ToolButton_VoiceIdentifier_Title.setCheckable(True)
+            self.ui.ToolButton_VoiceIdentifier_Title.setChecked(True)
+            self.ui.ToolButton_VoiceIdentifier_Title.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceIdentifier_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_ASR,
+                    Target = 0
+                )
             )
-        )
 
-        # Left
-        self.ui.TreeWidget_Catalogue_ASR_VPR.clear()
-        self.ui.TreeWidget_Catalogue_ASR_VPR.setHeaderHidden(True)
+            # Left
+            self.ui.TreeWidget_Catalogue_ASR_VPR.clear()
+            self.ui.TreeWidget_Catalogue_ASR_VPR.setHeaderHidden(True)
 
-        # Middle
-        self.ui.GroupBox_ASR_VPR_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_ASR_VPR_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # Middle
+            self.ui.GroupBox_ASR_VPR_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_ASR_VPR_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_AudioDirInput,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音频输入目录\n需要进行语音识别筛选的音频文件的所在目录。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_AudioDirInput,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音频输入目录\n需要进行语音识别筛选的音频文件的所在目录。")
+                )
+            )
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.LineEdit_ASR_VPR_AudioDirInput,
+                Section = 'Input Params',
+                Option = 'Audio_Dir_Input',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_ASR_VPR_AudioDirInput.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = Path(CurrentDir).joinpath('音频处理结果').as_posix()
+            )
+            self.ui.Button_ASR_VPR_AudioDirInput_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_AudioDirInput),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_AudioDirInput.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_AudioDirInput,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "音频输入目录")
             )
-        )
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.LineEdit_ASR_VPR_AudioDirInput,
-            Section = 'Input Params',
-            Option = 'Audio_Dir_Input',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_ASR_VPR_AudioDirInput.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = Path(CurrentDir).joinpath('音频处理结果').as_posix()
-        )
-        self.ui.Button_ASR_VPR_AudioDirInput_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_AudioDirInput),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_AudioDirInput.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_AudioDirInput,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "音频输入目录")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_StdAudioSpeaker,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "目标人物与音频\n目标人物的名字及其语音文件的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_StdAudioSpeaker,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "目标人物与音频\n目标人物的名字及其语音文件的路径。")
+                )
+            )
+            self.ui.Table_ASR_VPR_StdAudioSpeaker.setHorizontalHeaderLabels(['人物姓名', '音频路径', '增删'])
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.Table_ASR_VPR_StdAudioSpeaker,
+                Section = 'Input Params',
+                Option = 'StdAudioSpeaker',
+                DefaultValue = {"": ""}
+            )
+            self.ui.Table_ASR_VPR_StdAudioSpeaker.SetFileDialog(
+                FileType = "音频类型 (*.flac *.wav *.mp3 *.aac *.m4a *.wma *.aiff *.au *.ogg)"
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_StdAudioSpeaker,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "目标人物与音频")
             )
-        )
-        self.ui.Table_ASR_VPR_StdAudioSpeaker.setHorizontalHeaderLabels(['人物姓名', '音频路径', '增删'])
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.Table_ASR_VPR_StdAudioSpeaker,
-            Section = 'Input Params',
-            Option = 'StdAudioSpeaker',
-            DefaultValue = {"": ""}
-        )
-        self.ui.Table_ASR_VPR_StdAudioSpeaker.SetFileDialog(
-            FileType = "音频类型 (*.flac *.wav *.mp3 *.aac *.m4a *.wma *.aiff *.au *.ogg)"
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_StdAudioSpeaker,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "目标人物与音频")
-        )
 
-        self.ui.GroupBox_ASR_VPR_VPRParams.setTitle(QCA.translate("GroupBox", "语音识别参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_ASR_VPR_VPRParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数")
-        )
+            self.ui.GroupBox_ASR_VPR_VPRParams.setTitle(QCA.translate("GroupBox", "语音识别参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_ASR_VPR_VPRParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_DecisionThreshold,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "判断阈值\n判断相似度的阈值，若参与比对的说话人声音相似度较高可以增加该值。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_DecisionThreshold,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "判断阈值\n判断相似度的阈值，若参与比对的说话人声音相似度较高可以增加该值。")
+                )
+            )
+            self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold.setRange(0.5, 1)
+            self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold.setSingleStep(0.01)
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold,
+                Section = 'VPR Params',
+                Option = 'DecisionThreshold',
+                DefaultValue = 0.75
+            )
+            self.ui.Button_ASR_VPR_DecisionThreshold_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_DecisionThreshold,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数"),
+                ChildItemText = QCA.translate("Tree", "判断阈值")
             )
-        )
-        self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold.setRange(0.5, 1)
-        self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold.setSingleStep(0.01)
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold,
-            Section = 'VPR Params',
-            Option = 'DecisionThreshold',
-            DefaultValue = 0.75
-        )
-        self.ui.Button_ASR_VPR_DecisionThreshold_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_DecisionThreshold,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数"),
-            ChildItemText = QCA.translate("Tree", "判断阈值")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_ModelPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "模型加载路径\n用于加载的声纹识别模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_ModelPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "模型加载路径\n用于加载的声纹识别模型的路径。")
+                )
             )
-        )
-        ASR_VPR_ModelPath_Default = Path(ModelDir).joinpath('ASR', 'VPR', 'Downloaded', 'Ecapa-Tdnn_spectrogram.pth').as_posix()
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.LineEdit_ASR_VPR_ModelPath,
-            Section = 'VPR Params',
-            Option = 'Model_Path',
-            DefaultValue = ASR_VPR_ModelPath_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = ASR_VPR_ModelPath_Default
-        )
-        self.ui.LineEdit_ASR_VPR_ModelPath.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('ASR', 'VPR', 'Downloaded'))
-        )
-        self.ui.Button_ASR_VPR_ModelPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_ModelPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_ModelPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_ModelPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数"),
-            ChildItemText = QCA.translate("Tree", "模型加载路径")
-        )
-
-        self.ui.ToolBox_ASR_VPR_VPRParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_ASR_VPR_VPRParams_AdvanceSettings.widget(0).collapse()
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_ModelType,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "模型类型\n声纹识别模型的类型。")
+            ASR_VPR_ModelPath_Default = Path(ModelDir).joinpath('ASR', 'VPR', 'Downloaded', 'Ecapa-Tdnn_spectrogram.pth').as_posix()
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.LineEdit_ASR_VPR_ModelPath,
+                Section = 'VPR Params',
+                Option = 'Model_Path',
+                DefaultValue = ASR_VPR_ModelPath_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = ASR_VPR_ModelPath_Default
             )
-        )
-        self.ui.ComboBox_ASR_VPR_ModelType.addItems(['Ecapa-Tdnn'])
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.ComboBox_ASR_VPR_ModelType,
-            Section = 'VPR Params',
-            Option = 'Model_Type',
-            DefaultValue = 'Ecapa-Tdnn'
-        )
-        self.ui.Button_ASR_VPR_ModelPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.ComboBox_ASR_VPR_ModelType)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_ModelType,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数"),
-            ChildItemText = QCA.translate("Tree", "模型类型")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_FeatureMethod,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预处理方法\n音频的预处理方法。")
+            self.ui.LineEdit_ASR_VPR_ModelPath.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('ASR', 'VPR', 'Downloaded'))
             )
-        )
-        self.ui.ComboBox_ASR_VPR_FeatureMethod.addItems(['spectrogram', 'melspectrogram'])
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.ComboBox_ASR_VPR_FeatureMethod,
-            Section = 'VPR Params',
-            Option = 'Feature_Method',
-            DefaultValue = 'spectrogram'
-        )
-        self.ui.Button_ASR_VPR_FeatureMethod_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.ComboBox_ASR_VPR_FeatureMethod)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_FeatureMethod,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数"),
-            ChildItemText = QCA.translate("Tree", "预处理方法")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_DurationOfAudio,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音频长度\n用于预测的音频长度。")
+            self.ui.Button_ASR_VPR_ModelPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_ModelPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_ModelPath.text())
+                }
             )
-        )
-        self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio.setRange(0, 30)
-        #self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio.setSingleStep(0.01)
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio,
-            Section = 'VPR Params',
-            Option = 'Duration_of_Audio',
-            DefaultValue = 3.00
-        )
-        self.ui.Button_ASR_VPR_DurationOfAudio_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_DurationOfAudio,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "语音识别参数"),
-            ChildItemText = QCA.translate("Tree", "音频长度")
-        )
-
-        self.ui.GroupBox_ASR_VPR_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_ASR_VPR_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的结果文件的目录的名字。")
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_ModelPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数"),
+                ChildItemText = QCA.translate("Tree", "模型加载路径")
             )
-        )
-        ASR_VPR_OutputDirName_Default = str(date.today())
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.LineEdit_ASR_VPR_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Audio_Dir_Output',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = ASR_VPR_OutputDirName_Default
-        )
-        self.ui.Button_ASR_VPR_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
 
-        self.ui.ToolBox_ASR_VPR_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_ASR_VPR_OutputParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_ASR_VPR_VPRParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_ASR_VPR_VPRParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_ASR_VPR_AudioSpeakersDataName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "识别结果文本名\n用于保存最后生成的记录音频文件与对应说话人的txt文件的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_ModelType,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "模型类型\n声纹识别模型的类型。")
+                )
             )
-        )
-        ASR_VPR_AudioSpeakersDataName_Default = "Recgonition_" + str(date.today())
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName,
-            Section = 'Output Params',
-            Option = 'FileList_Name',
-            DefaultValue = ASR_VPR_AudioSpeakersDataName_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = ASR_VPR_AudioSpeakersDataName_Default
-        )
-        self.ui.Button_ASR_VPR_AudioSpeakersDataName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_ASR_VPR_AudioSpeakersDataName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "识别结果文本名")
-        )
-
-        LineEdit_ASR_VPR_OutputDir = QLineEdit()
-        def SetText_LineEdit_ASR_VPR_OutputDir():
-            DirName = self.ui.LineEdit_ASR_VPR_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_ASR_VPR_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_ASR_VPR_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_ASR_VPR_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_ASR_VPR_OutputDirName.interacted.connect(SetText_LineEdit_ASR_VPR_OutputDir)
-        self.ui.LineEdit_ASR_VPR_OutputRoot.interacted.connect(SetText_LineEdit_ASR_VPR_OutputDir)
-        #SetText_LineEdit_ASR_VPR_OutputDir()
-
-        LineEdit_ASR_VPR_AudioSpeakersDataPath = QLineEdit()
-        def SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath():
-            FileName = self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.text()
-            if len(FileName.strip()) == 0:
-                Alert = False
-            else:
-                PathText = Path(LineEdit_ASR_VPR_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
-                LineEdit_ASR_VPR_AudioSpeakersDataPath.setText(PathText)
-                Alert = Path(PathText).exists()
-            self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.Alert(True if Alert else False, "注意：路径已存在")
-        self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.interacted.connect(SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath)
-        LineEdit_ASR_VPR_OutputDir.textChanged.connect(SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath)
-        #SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath()
-
-        # ChildWindow
-        ChildWindow_ASR = Window_ChildWindow_ASR(self)
-
-        ChildWindow_ASR.ui.Button_Close.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认放弃编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_ASR.close()
-                    )
+            self.ui.ComboBox_ASR_VPR_ModelType.addItems(['Ecapa-Tdnn'])
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.ComboBox_ASR_VPR_ModelType,
+                Section = 'VPR Params',
+                Option = 'Model_Type',
+                DefaultValue = 'Ecapa-Tdnn'
+            )
+            self.ui.Button_ASR_VPR_ModelPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.ComboBox_ASR_VPR_ModelType)
                 }
             )
-        )
-        ChildWindow_ASR.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_ASR.showNormal() if ChildWindow_ASR.isMaximized() else ChildWindow_ASR.showMaximized())
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_ModelType,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数"),
+                ChildItemText = QCA.translate("Tree", "模型类型")
+            )
 
-        QFunc.Function_SetText(
-            Widget = ChildWindow_ASR.ui.Label_Title,
-            Text = QFunc.SetRichText(
-                Title = QCA.translate("Label", "语音识别结果")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_FeatureMethod,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预处理方法\n音频的预处理方法。")
+                )
             )
-        )
-        QFunc.Function_SetText(
-            Widget = ChildWindow_ASR.ui.Label_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的人物名（留空表示无匹配人物且最终不会被保留）\n你可以对这些人物名进行更改并在表格下方设置音频的保存路径")
+            self.ui.ComboBox_ASR_VPR_FeatureMethod.addItems(['spectrogram', 'melspectrogram'])
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.ComboBox_ASR_VPR_FeatureMethod,
+                Section = 'VPR Params',
+                Option = 'Feature_Method',
+                DefaultValue = 'spectrogram'
+            )
+            self.ui.Button_ASR_VPR_FeatureMethod_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.ComboBox_ASR_VPR_FeatureMethod)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_FeatureMethod,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数"),
+                ChildItemText = QCA.translate("Tree", "预处理方法")
             )
-        )
 
-        ChildWindow_ASR.ui.Table.setHorizontalHeaderLabels(['音频路径', '人物姓名', '相似度', '播放', '操作'])
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_DurationOfAudio,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音频长度\n用于预测的音频长度。")
+                )
+            )
+            self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio.setRange(0, 30)
+            #self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio.setSingleStep(0.01)
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio,
+                Section = 'VPR Params',
+                Option = 'Duration_of_Audio',
+                DefaultValue = 3.00
+            )
+            self.ui.Button_ASR_VPR_DurationOfAudio_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_DurationOfAudio,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "语音识别参数"),
+                ChildItemText = QCA.translate("Tree", "音频长度")
+            )
 
-        ChildWindow_ASR.ui.CheckBox.setText(QCA.translate("CheckBox", "结束编辑时将拥有匹配人物的音频保存到:"))
-        ChildWindow_ASR.ui.CheckBox.setChecked(True)
-        ChildWindow_ASR.ui.LineEdit.ClearDefaultStyleSheet()
-        ChildWindow_ASR.ui.LineEdit.setStyleSheet(ChildWindow_ASR.ui.LineEdit.styleSheet() + 'LineEditBase {border-width: 0px 0px 1px 0px; border-radius: 0px;}')
-        LineEdit_ASR_VPR_OutputDir.textChanged.connect(ChildWindow_ASR.ui.LineEdit.setText)
-        ChildWindow_ASR.ui.LineEdit.setReadOnly(True)
+            self.ui.GroupBox_ASR_VPR_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_ASR_VPR_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        ChildWindow_ASR.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
-        ChildWindow_ASR.ui.Button_Cancel.clicked.connect(ChildWindow_ASR.ui.Button_Close.click)
-        ChildWindow_ASR.ui.Button_Save.setText(QCA.translate("Button", "保存"))
-        ChildWindow_ASR.ui.Button_Save.clicked.connect(
-            lambda: (
-                ASRResult_Save(
-                    ChildWindow_ASR.ui.Table.GetValue(),
-                    LineEdit_ASR_VPR_AudioSpeakersDataPath.text(),
-                    False
-                ),
-                MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "已保存当前结果。"
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的结果文件的目录的名字。")
                 )
             )
-        )
-        ChildWindow_ASR.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
-        ChildWindow_ASR.ui.Button_Confirm.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认结束并应用编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ASRResult_Save(
-                            ChildWindow_ASR.ui.Table.GetValue(),
-                            LineEdit_ASR_VPR_AudioSpeakersDataPath.text(),
-                            ChildWindow_ASR.ui.CheckBox.isChecked(),
-                            ChildWindow_ASR.ui.LineEdit.text()
-                        ),
-                        ChildWindow_ASR.close()
-                    )
+            ASR_VPR_OutputDirName_Default = str(date.today())
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.LineEdit_ASR_VPR_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Audio_Dir_Output',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = ASR_VPR_OutputDirName_Default
+            )
+            self.ui.Button_ASR_VPR_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_OutputDirName.text())
                 }
             )
-        )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
+            )
+
+            self.ui.ToolBox_ASR_VPR_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_ASR_VPR_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        # Right
-        MonitorFile_Config_VoiceIdentifier = QTasks.MonitorFile(Path_Config_ASR_VPR)
-        MonitorFile_Config_VoiceIdentifier.start()
-        MonitorFile_Config_VoiceIdentifier.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_ASR_VPR.setText(
-                FileContent
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_ASR_VPR_AudioSpeakersDataName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "识别结果文本名\n用于保存最后生成的记录音频文件与对应说话人的txt文件的名字。")
+                )
             )
-        )
+            ASR_VPR_AudioSpeakersDataName_Default = "Recgonition_" + str(date.today())
+            ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName,
+                Section = 'Output Params',
+                Option = 'FileList_Name',
+                DefaultValue = ASR_VPR_AudioSpeakersDataName_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = ASR_VPR_AudioSpeakersDataName_Default
+            )
+            self.ui.Button_ASR_VPR_AudioSpeakersDataName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_ASR_VPR.ResetParam(self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_ASR_VPR_AudioSpeakersDataName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_ASR_VPR,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "识别结果文本名")
+            )
+
+            LineEdit_ASR_VPR_OutputDir = QLineEdit()
+            def SetText_LineEdit_ASR_VPR_OutputDir():
+                DirName = self.ui.LineEdit_ASR_VPR_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_ASR_VPR_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_ASR_VPR_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_ASR_VPR_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_ASR_VPR_OutputDirName.interacted.connect(SetText_LineEdit_ASR_VPR_OutputDir)
+            self.ui.LineEdit_ASR_VPR_OutputRoot.interacted.connect(SetText_LineEdit_ASR_VPR_OutputDir)
+            #SetText_LineEdit_ASR_VPR_OutputDir()
+
+            LineEdit_ASR_VPR_AudioSpeakersDataPath = QLineEdit()
+            def SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath():
+                FileName = self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.text()
+                if len(FileName.strip()) == 0:
+                    Alert = False
+                else:
+                    PathText = Path(LineEdit_ASR_VPR_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
+                    LineEdit_ASR_VPR_AudioSpeakersDataPath.setText(PathText)
+                    Alert = Path(PathText).exists()
+                self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.Alert(True if Alert else False, "注意：路径已存在")
+            self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName.interacted.connect(SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath)
+            LineEdit_ASR_VPR_OutputDir.textChanged.connect(SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath)
+            #SetText_LineEdit_ASR_VPR_AudioSpeakersDataPath()
+
+            # ChildWindow
+            ChildWindow_ASR = Window_ChildWindow_ASR(self)
+
+            ChildWindow_ASR.ui.Button_Close.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认放弃编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_ASR.close()
+                        )
+                    }
+                )
+            )
+            ChildWindow_ASR.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_ASR.showNormal() if ChildWindow_ASR.isMaximized() else ChildWindow_ASR.showMaximized())
 
-        self.ui.Button_ResetSettings_ASR_VPR.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_ASR_VPR.clicked.connect(
-            lambda: ParamsManager_ASR_VPR.ResetSettings()
-        )
+            QFunc.Function_SetText(
+                Widget = ChildWindow_ASR.ui.Label_Title,
+                Text = QFunc.SetRichText(
+                    Title = QCA.translate("Label", "语音识别结果")
+                )
+            )
+            QFunc.Function_SetText(
+                Widget = ChildWindow_ASR.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的人物名（留空表示无匹配人物且最终不会被保留）\n你可以对这些人物名进行更改并在表格下方设置音频的保存路径")
+                )
+            )
 
-        self.ui.Button_ImportSettings_ASR_VPR.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_ASR_VPR.clicked.connect(
-            lambda: ParamsManager_ASR_VPR.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            ChildWindow_ASR.ui.Table.setHorizontalHeaderLabels(['音频路径', '人物姓名', '相似度', '播放', '操作'])
+
+            ChildWindow_ASR.ui.CheckBox.setText(QCA.translate("CheckBox", "结束编辑时将拥有匹配人物的音频保存到:"))
+            ChildWindow_ASR.ui.CheckBox.setChecked(True)
+            ChildWindow_ASR.ui.LineEdit.ClearDefaultStyleSheet()
+            ChildWindow_ASR.ui.LineEdit.setStyleSheet(ChildWindow_ASR.ui.LineEdit.styleSheet() + 'LineEditBase {border-width: 0px 0px 1px 0px; border-radius: 0px;}')
+            LineEdit_ASR_VPR_OutputDir.textChanged.connect(ChildWindow_ASR.ui.LineEdit.setText)
+            ChildWindow_ASR.ui.LineEdit.setReadOnly(True)
+
+            ChildWindow_ASR.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
+            ChildWindow_ASR.ui.Button_Cancel.clicked.connect(ChildWindow_ASR.ui.Button_Close.click)
+            ChildWindow_ASR.ui.Button_Save.setText(QCA.translate("Button", "保存"))
+            ChildWindow_ASR.ui.Button_Save.clicked.connect(
+                lambda: (
+                    ASRResult_Save(
+                        ChildWindow_ASR.ui.Table.GetValue(),
+                        False
+                    ),
+                    MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "已保存当前结果。"
+                    )
+                )
+            )
+            ChildWindow_ASR.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
+            ChildWindow_ASR.ui.Button_Confirm.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认结束并应用编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            Function_SetMethodExecutor(self,
+                                ProgressBar = self.ui.ProgressBar_ASR_VPR,
+                                Method = ASRResult_Saver.Execute,
+                                Params = (
+                                    ChildWindow_ASR.ui.Table.GetValue(),
+                                    ChildWindow_ASR.ui.CheckBox.isChecked(),
+                                    ChildWindow_ASR.ui.LineEdit.text()
+                                )
+                            ),
+                            ChildWindow_ASR.close()
+                        )
+                    }
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_ASR_VPR.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_ASR_VPR.clicked.connect(
-            lambda: ParamsManager_ASR_VPR.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            # Right
+            MonitorFile_Config_VoiceIdentifier = QTasks.MonitorFile(Path_Config_ASR_VPR)
+            MonitorFile_Config_VoiceIdentifier.start()
+            MonitorFile_Config_VoiceIdentifier.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_ASR_VPR.setText(
+                    FileContent
                 )
             )
-        )
 
-        self.ui.Button_EditResult_ASR_VPR.setText(QCA.translate("Button", "编辑识别结果"))
-        def EditASRResult():
-            ASRResultPath = QFunc.Function_GetFileDialog(
-                Mode = "SelectFile",
-                FileType = "txt类型 (*.txt)",
-                Directory = Path(CurrentDir).joinpath('语音识别结果', 'VPR').as_posix()
+            self.ui.Button_ResetSettings_ASR_VPR.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_ASR_VPR.clicked.connect(
+                lambda: ParamsManager_ASR_VPR.ResetSettings()
             )
-            if QFunc.NormPath(ASRResultPath) is not None:
-                self.ShowMask(True, "正在加载表单")
-                ChildWindow_ASR.ui.Table.SetValue(
-                    ASRResult_Get(ASRResultPath),
-                    None
+
+            self.ui.Button_ImportSettings_ASR_VPR.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_ASR_VPR.clicked.connect(
+                lambda: ParamsManager_ASR_VPR.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
-                ChildWindow_ASR.exec()
-        self.ui.Button_EditResult_ASR_VPR.clicked.connect(EditASRResult)
+            )
 
-        self.ui.Button_CheckOutput_ASR_VPR.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_ASR_VPR,
-            URL = self.ui.LineEdit_ASR_VPR_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
+            self.ui.Button_ExportSettings_ASR_VPR.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_ASR_VPR.clicked.connect(
+                lambda: ParamsManager_ASR_VPR.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
+                )
+            )
 
-        # Bottom
-        self.ui.Button_ASR_VPR_Execute.setToolTip("执行语音识别")
-        self.ui.Button_ASR_VPR_Terminate.setToolTip("终止语音识别")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_ASR_VPR_Execute,
-            TerminateButton = self.ui.Button_ASR_VPR_Terminate,
-            ProgressBar = self.ui.ProgressBar_ASR_VPR,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Identifying_VPR.Execute,
-            ParamsFrom = [
-                self.ui.Table_ASR_VPR_StdAudioSpeaker,
-                self.ui.LineEdit_ASR_VPR_AudioDirInput,
-                self.ui.LineEdit_ASR_VPR_ModelPath,
-                self.ui.ComboBox_ASR_VPR_ModelType,
-                self.ui.ComboBox_ASR_VPR_FeatureMethod,
-                self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold,
-                self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio,
-                self.ui.LineEdit_ASR_VPR_OutputRoot,
-                self.ui.LineEdit_ASR_VPR_OutputDirName,
-                self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName
-            ],
-            SuccessEvents = [
-                lambda: self.ShowMask(True, "正在加载表单"),
-                lambda: ChildWindow_ASR.ui.Table.SetValue(
-                    ASRResult_Get(LineEdit_ASR_VPR_AudioSpeakersDataPath.text()),
-                    list(self.ui.Table_ASR_VPR_StdAudioSpeaker.GetValue().keys()) + ['']
-                ),
-                ChildWindow_ASR.exec,
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
+            self.ui.Button_EditResult_ASR_VPR.setText(QCA.translate("Button", "编辑识别结果"))
+            def EditASRResult():
+                ASRResultPath = QFunc.Function_GetFileDialog(
+                    Mode = "SelectFile",
+                    FileType = "txt类型 (*.txt)",
+                    Directory = Path(CurrentDir).joinpath('语音识别结果', 'VPR').as_posix()
                 )
-            ]
-        )
+                if QFunc.NormPath(ASRResultPath) is not None:
+                    self.ShowMask(True, "正在加载表单")
+                    ChildWindow_ASR.ui.Table.SetValue(
+                        ASRResult_Get(ASRResultPath),
+                        None
+                    )
+                    ChildWindow_ASR.exec()
+            self.ui.Button_EditResult_ASR_VPR.clicked.connect(EditASRResult)
+
+            self.ui.Button_CheckOutput_ASR_VPR.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_ASR_VPR,
+                URL = self.ui.LineEdit_ASR_VPR_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # Bottom
+            self.ui.Button_ASR_VPR_Execute.setToolTip("执行语音识别")
+            self.ui.Button_ASR_VPR_Terminate.setToolTip("终止语音识别")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_ASR_VPR_Execute,
+                TerminateButton = self.ui.Button_ASR_VPR_Terminate,
+                ProgressBar = self.ui.ProgressBar_ASR_VPR,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Identifying_VPR.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.Table_ASR_VPR_StdAudioSpeaker,
+                    self.ui.LineEdit_ASR_VPR_AudioDirInput,
+                    self.ui.LineEdit_ASR_VPR_ModelPath,
+                    self.ui.ComboBox_ASR_VPR_ModelType,
+                    self.ui.ComboBox_ASR_VPR_FeatureMethod,
+                    self.ui.DoubleSpinBox_ASR_VPR_DecisionThreshold,
+                    self.ui.DoubleSpinBox_ASR_VPR_DurationOfAudio,
+                    self.ui.LineEdit_ASR_VPR_OutputRoot,
+                    self.ui.LineEdit_ASR_VPR_OutputDirName,
+                    self.ui.LineEdit_ASR_VPR_AudioSpeakersDataName
+                ],
+                SuccessEvents = [
+                    lambda: self.ShowMask(True, "正在加载表单"),
+                    lambda: ChildWindow_ASR.ui.Table.SetValue(
+                        ASRResult_Get(LineEdit_ASR_VPR_AudioSpeakersDataPath.text()),
+                        list(self.ui.Table_ASR_VPR_StdAudioSpeaker.GetValue().keys()) + ['']
+                    ),
+                    ChildWindow_ASR.exec,
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_ASR, SetupPage_ASR)
 
         #############################################################
         ######################## Content: STT #######################
@@ -2796,416 +2758,422 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_STT', 'False')) is False else None
         )
 
-        # ParamsManager
-        Path_Config_STT_Whisper = QFunc.NormPath(Path(ConfigDir).joinpath('Config_STT_Whisper.ini'))
-        ParamsManager_STT_Whisper = ParamsManager(Path_Config_STT_Whisper)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_STT():
+            nonlocal ParamsManager_STT_Whisper, LineEdit_STT_Whisper_OutputDir
 
-        # Top
-        self.ui.ToolButton_VoiceTranscriber_Title.setText(QCA.translate("ToolButton", "Whisper"))
-        self.ui.ToolButton_VoiceTranscriber_Title.setCheckable(True)
-        self.ui.ToolButton_VoiceTranscriber_Title.setChecked(True)
-        self.ui.ToolButton_VoiceTranscriber_Title.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceTranscriber_Title.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_STT,
-                Target = 0
+            # ParamsManager
+            Path_Config_STT_Whisper = QFunc.NormPath(Path(ConfigDir).joinpath('Config_STT_Whisper.ini'))
+            ParamsManager_STT_Whisper = ParamsManager(Path_Config_STT_Whisper)
+
+            # Top
+            self.ui.ToolButton_VoiceTranscriber_Title.setText(QCA.translate("ToolButton", "Whisper"))
+            self.ui.ToolButton_VoiceTranscriber_Title.setCheckable(True)
+            self.ui.ToolButton_VoiceTranscriber_Title.setChecked(True)
+            self.ui.ToolButton_VoiceTranscriber_Title.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceTranscriber_Title.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_STT,
+                    Target = 0
+                )
             )
-        )
 
-        # Left
-        self.ui.TreeWidget_Catalogue_STT_Whisper.clear()
-        self.ui.TreeWidget_Catalogue_STT_Whisper.setHeaderHidden(True)
+            # Left
+            self.ui.TreeWidget_Catalogue_STT_Whisper.clear()
+            self.ui.TreeWidget_Catalogue_STT_Whisper.setHeaderHidden(True)
 
-        # Middle
-        self.ui.GroupBox_STT_Whisper_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_STT_Whisper_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # Middle
+            self.ui.GroupBox_STT_Whisper_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_STT_Whisper_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_AudioDir,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音频输入目录\n需要将语音内容转为文字的音频文件的所在目录。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_AudioDir,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音频输入目录\n需要将语音内容转为文字的音频文件的所在目录。")
+                )
+            )
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.LineEdit_STT_Whisper_AudioDir,
+                Section = 'Input Params',
+                Option = 'Audio_Dir',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_STT_Whisper_AudioDir.SetFileDialog(
+                Mode = "SelectFolder"
+            )
+            self.ui.Button_STT_Whisper_AudioDir_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_AudioDir),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_AudioDir.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_AudioDir,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "音频输入目录")
             )
-        )
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.LineEdit_STT_Whisper_AudioDir,
-            Section = 'Input Params',
-            Option = 'Audio_Dir',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_STT_Whisper_AudioDir.SetFileDialog(
-            Mode = "SelectFolder"
-        )
-        self.ui.Button_STT_Whisper_AudioDir_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_AudioDir),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_AudioDir.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_AudioDir,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "音频输入目录")
-        )
 
-        self.ui.GroupBox_STT_Whisper_WhisperParams.setTitle(QCA.translate("GroupBox", "语音转录参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_STT_Whisper_WhisperParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数")
-        )
+            self.ui.GroupBox_STT_Whisper_WhisperParams.setTitle(QCA.translate("GroupBox", "语音转录参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_STT_Whisper_WhisperParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_AddLanguageInfo,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "语种标注\n标注音频中说话人所使用的语言，若用于数据集制作则建议启用。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_AddLanguageInfo,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "语种标注\n标注音频中说话人所使用的语言，若用于数据集制作则建议启用。")
+                )
+            )
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
+                Section = 'Whisper Params',
+                Option = 'Add_LanguageInfo',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_STT_Whisper_AddLanguageInfo_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_AddLanguageInfo)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_AddLanguageInfo,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数"),
+                ChildItemText = QCA.translate("Tree", "语种标注")
             )
-        )
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
-            Section = 'Whisper Params',
-            Option = 'Add_LanguageInfo',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_STT_Whisper_AddLanguageInfo_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_AddLanguageInfo)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_AddLanguageInfo,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数"),
-            ChildItemText = QCA.translate("Tree", "语种标注")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_ModelPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "模型加载路径\n用于加载的Whisper模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_ModelPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "模型加载路径\n用于加载的Whisper模型的路径。")
+                )
+            )
+            STT_Whisper_ModelPath_Default = Path(ModelDir).joinpath('STT', 'Whisper', 'Downloaded', 'small.pt').as_posix()
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.LineEdit_STT_Whisper_ModelPath,
+                Section = 'Whisper Params',
+                Option = 'Model_Path',
+                DefaultValue = STT_Whisper_ModelPath_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = STT_Whisper_ModelPath_Default
+            )
+            self.ui.LineEdit_STT_Whisper_ModelPath.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pt类型 (*.pt)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('STT', 'Whisper', 'Downloaded'))
+            )
+            self.ui.Button_STT_Whisper_ModelPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_ModelPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_ModelPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_ModelPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数"),
+                ChildItemText = QCA.translate("Tree", "模型加载路径")
             )
-        )
-        STT_Whisper_ModelPath_Default = Path(ModelDir).joinpath('STT', 'Whisper', 'Downloaded', 'small.pt').as_posix()
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.LineEdit_STT_Whisper_ModelPath,
-            Section = 'Whisper Params',
-            Option = 'Model_Path',
-            DefaultValue = STT_Whisper_ModelPath_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = STT_Whisper_ModelPath_Default
-        )
-        self.ui.LineEdit_STT_Whisper_ModelPath.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pt类型 (*.pt)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('STT', 'Whisper', 'Downloaded'))
-        )
-        self.ui.Button_STT_Whisper_ModelPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_ModelPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_ModelPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_ModelPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数"),
-            ChildItemText = QCA.translate("Tree", "模型加载路径")
-        )
 
-        self.ui.ToolBox_STT_Whisper_WhisperParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_STT_Whisper_WhisperParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_STT_Whisper_WhisperParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_STT_Whisper_WhisperParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_Verbose,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "显示转录内容\n启用该项后会在运行过程中显示转录的内容，否则只显示进度。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_Verbose,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "显示转录内容\n启用该项后会在运行过程中显示转录的内容，否则只显示进度。")
+                )
+            )
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.CheckBox_STT_Whisper_Verbose,
+                Section = 'Whisper Params',
+                Option = 'Verbose',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_STT_Whisper_Verbose,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_STT_Whisper_Verbose_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_Verbose)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_Verbose,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数"),
+                ChildItemText = QCA.translate("Tree", "显示转录内容")
             )
-        )
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.CheckBox_STT_Whisper_Verbose,
-            Section = 'Whisper Params',
-            Option = 'Verbose',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_STT_Whisper_Verbose,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_STT_Whisper_Verbose_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_Verbose)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_Verbose,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数"),
-            ChildItemText = QCA.translate("Tree", "显示转录内容")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_fp16,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "半精度计算\n主要使用半精度浮点数进行计算，若GPU不可用则忽略或禁用此项。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_fp16,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "半精度计算\n主要使用半精度浮点数进行计算，若GPU不可用则忽略或禁用此项。")
+                )
+            )
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.CheckBox_STT_Whisper_fp16,
+                Section = 'Whisper Params',
+                Option = 'fp16',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_STT_Whisper_fp16,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_STT_Whisper_fp16_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_fp16)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_fp16,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数"),
+                ChildItemText = QCA.translate("Tree", "半精度计算")
             )
-        )
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.CheckBox_STT_Whisper_fp16,
-            Section = 'Whisper Params',
-            Option = 'fp16',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_STT_Whisper_fp16,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_STT_Whisper_fp16_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_fp16)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_fp16,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数"),
-            ChildItemText = QCA.translate("Tree", "半精度计算")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_ConditionOnPreviousText,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "关联上下文\n在音频之间的内容具有关联性时启用该项可以获得更好的效果。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_ConditionOnPreviousText,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "关联上下文\n在音频之间的内容具有关联性时启用该项可以获得更好的效果。")
+                )
+            )
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
+                Section = 'Whisper Params',
+                Option = 'Condition_on_Previous_Text',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_STT_Whisper_ConditionOnPreviousText_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_ConditionOnPreviousText,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "语音转录参数"),
+                ChildItemText = QCA.translate("Tree", "关联上下文")
             )
-        )
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
-            Section = 'Whisper Params',
-            Option = 'Condition_on_Previous_Text',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_STT_Whisper_ConditionOnPreviousText_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_ConditionOnPreviousText,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "语音转录参数"),
-            ChildItemText = QCA.translate("Tree", "关联上下文")
-        )
 
-        self.ui.GroupBox_STT_Whisper_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_STT_Whisper_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            self.ui.GroupBox_STT_Whisper_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_STT_Whisper_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_STT_Whisper_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的字幕文件的目录的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_STT_Whisper_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的字幕文件的目录的名字。")
+                )
             )
-        )
-        STT_Whisper_OutputDirName_Default = str(date.today())
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.LineEdit_STT_Whisper_OutputDirName,
-            Section = 'Output Params',
-            Option = 'SRT_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = STT_Whisper_OutputDirName_Default
-        )
-        self.ui.Button_STT_Whisper_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_STT_Whisper_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
-
-        LineEdit_STT_Whisper_OutputDir = QLineEdit()
-        def SetText_LineEdit_STT_Whisper_OutputDir():
-            DirName = self.ui.LineEdit_STT_Whisper_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_STT_Whisper_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_STT_Whisper_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_STT_Whisper_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_STT_Whisper_OutputDirName.interacted.connect(SetText_LineEdit_STT_Whisper_OutputDir)
-        self.ui.LineEdit_STT_Whisper_OutputRoot.interacted.connect(SetText_LineEdit_STT_Whisper_OutputDir)
-        #SetText_LineEdit_STT_Whisper_OutputDir()
-
-        # ChildWindow
-        ChildWindow_STT = Window_ChildWindow_STT(self)
-
-        ChildWindow_STT.ui.Button_Close.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认放弃编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_STT.close()
-                    )
+            STT_Whisper_OutputDirName_Default = str(date.today())
+            ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.LineEdit_STT_Whisper_OutputDirName,
+                Section = 'Output Params',
+                Option = 'SRT_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = STT_Whisper_OutputDirName_Default
+            )
+            self.ui.Button_STT_Whisper_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_STT_Whisper.ResetParam(self.ui.LineEdit_STT_Whisper_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_STT_Whisper_OutputDirName.text())
                 }
             )
-        )
-        ChildWindow_STT.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_STT.showNormal() if ChildWindow_STT.isMaximized() else ChildWindow_STT.showMaximized())
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_STT_Whisper_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_STT_Whisper,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
+            )
+
+            LineEdit_STT_Whisper_OutputDir = QLineEdit()
+            def SetText_LineEdit_STT_Whisper_OutputDir():
+                DirName = self.ui.LineEdit_STT_Whisper_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_STT_Whisper_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_STT_Whisper_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_STT_Whisper_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_STT_Whisper_OutputDirName.interacted.connect(SetText_LineEdit_STT_Whisper_OutputDir)
+            self.ui.LineEdit_STT_Whisper_OutputRoot.interacted.connect(SetText_LineEdit_STT_Whisper_OutputDir)
+            #SetText_LineEdit_STT_Whisper_OutputDir()
+
+            # ChildWindow
+            ChildWindow_STT = Window_ChildWindow_STT(self)
+
+            ChildWindow_STT.ui.Button_Close.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认放弃编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_STT.close()
+                        )
+                    }
+                )
+            )
+            ChildWindow_STT.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_STT.showNormal() if ChildWindow_STT.isMaximized() else ChildWindow_STT.showMaximized())
 
-        QFunc.Function_SetText(
-            Widget = ChildWindow_STT.ui.Label_Title,
-            Text = QFunc.SetRichText(
-                Title = QCA.translate("Label", "语音转录结果")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_STT.ui.Label_Title,
+                Text = QFunc.SetRichText(
+                    Title = QCA.translate("Label", "语音转录结果")
+                )
             )
-        )
-        QFunc.Function_SetText(
-            Widget = ChildWindow_STT.ui.Label_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的字幕文本（包含了时间戳）\n你可以对这些文本进行更改，若启用了语种标注则小心不要误删")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_STT.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的字幕文本（包含了时间戳）\n你可以对这些文本进行更改，若启用了语种标注则小心不要误删")
+                )
             )
-        )
 
-        ChildWindow_STT.ui.Table.setHorizontalHeaderLabels(['音频路径', '音频内容', '播放'])
+            ChildWindow_STT.ui.Table.setHorizontalHeaderLabels(['音频路径', '音频内容', '播放'])
 
-        ChildWindow_STT.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
-        ChildWindow_STT.ui.Button_Cancel.clicked.connect(ChildWindow_STT.ui.Button_Close.click)
-        ChildWindow_STT.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
-        ChildWindow_STT.ui.Button_Confirm.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认应用编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        STTResult_Save(
-                            ChildWindow_STT.ui.Table.GetValue(),
-                            LineEdit_STT_Whisper_OutputDir.text()
-                        ),
-                        ChildWindow_STT.close()
-                    )
-                }
+            ChildWindow_STT.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
+            ChildWindow_STT.ui.Button_Cancel.clicked.connect(ChildWindow_STT.ui.Button_Close.click)
+            ChildWindow_STT.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
+            ChildWindow_STT.ui.Button_Confirm.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认应用编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            STTResult_Save(
+                                ChildWindow_STT.ui.Table.GetValue(),
+                                LineEdit_STT_Whisper_OutputDir.text()
+                            ),
+                            ChildWindow_STT.close()
+                        )
+                    }
+                )
             )
-        )
 
-        # Right
-        MonitorFile_Config_VoiceTranscriber = QTasks.MonitorFile(Path_Config_STT_Whisper)
-        MonitorFile_Config_VoiceTranscriber.start()
-        MonitorFile_Config_VoiceTranscriber.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_STT_Whisper.setText(
-                FileContent
+            # Right
+            MonitorFile_Config_VoiceTranscriber = QTasks.MonitorFile(Path_Config_STT_Whisper)
+            MonitorFile_Config_VoiceTranscriber.start()
+            MonitorFile_Config_VoiceTranscriber.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_STT_Whisper.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_STT_Whisper.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_STT_Whisper.clicked.connect(
-            lambda: ParamsManager_STT_Whisper.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_STT_Whisper.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_STT_Whisper.clicked.connect(
+                lambda: ParamsManager_STT_Whisper.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_STT_Whisper.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_STT_Whisper.clicked.connect(
-            lambda: ParamsManager_STT_Whisper.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_STT_Whisper.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_STT_Whisper.clicked.connect(
+                lambda: ParamsManager_STT_Whisper.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_STT_Whisper.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_STT_Whisper.clicked.connect(
-            lambda: ParamsManager_STT_Whisper.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_STT_Whisper.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_STT_Whisper.clicked.connect(
+                lambda: ParamsManager_STT_Whisper.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
-
-        self.ui.Button_CheckOutput_STT_Whisper.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_STT_Whisper,
-            URL = self.ui.LineEdit_STT_Whisper_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
 
-        # Bottom
-        self.ui.Button_STT_Whisper_Execute.setToolTip("执行语音转录")
-        self.ui.Button_STT_Whisper_Terminate.setToolTip("终止语音转录")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_STT_Whisper_Execute,
-            TerminateButton = self.ui.Button_STT_Whisper_Terminate,
-            ProgressBar = self.ui.ProgressBar_STT_Whisper,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Transcribing_Whisper.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_STT_Whisper_ModelPath,
-                self.ui.LineEdit_STT_Whisper_AudioDir,
-                self.ui.CheckBox_STT_Whisper_Verbose,
-                self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
-                self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
-                self.ui.CheckBox_STT_Whisper_fp16,
-                self.ui.LineEdit_STT_Whisper_OutputRoot,
-                self.ui.LineEdit_STT_Whisper_OutputDirName
-            ],
-            SuccessEvents = [
-                lambda: self.ShowMask(True, "正在加载表单"),
-                lambda: ChildWindow_STT.ui.Table.SetValue(
-                    STTResult_Get(LineEdit_STT_Whisper_OutputDir.text(), self.ui.LineEdit_STT_Whisper_AudioDir.text())
-                ),
-                ChildWindow_STT.exec,
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
+            self.ui.Button_CheckOutput_STT_Whisper.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_STT_Whisper,
+                URL = self.ui.LineEdit_STT_Whisper_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # Bottom
+            self.ui.Button_STT_Whisper_Execute.setToolTip("执行语音转录")
+            self.ui.Button_STT_Whisper_Terminate.setToolTip("终止语音转录")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_STT_Whisper_Execute,
+                TerminateButton = self.ui.Button_STT_Whisper_Terminate,
+                ProgressBar = self.ui.ProgressBar_STT_Whisper,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Transcribing_Whisper.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_STT_Whisper_ModelPath,
+                    self.ui.LineEdit_STT_Whisper_AudioDir,
+                    self.ui.CheckBox_STT_Whisper_Verbose,
+                    self.ui.CheckBox_STT_Whisper_AddLanguageInfo,
+                    self.ui.CheckBox_STT_Whisper_ConditionOnPreviousText,
+                    self.ui.CheckBox_STT_Whisper_fp16,
+                    self.ui.LineEdit_STT_Whisper_OutputRoot,
+                    self.ui.LineEdit_STT_Whisper_OutputDirName
+                ],
+                SuccessEvents = [
+                    lambda: self.ShowMask(True, "正在加载表单"),
+                    lambda: ChildWindow_STT.ui.Table.SetValue(
+                        STTResult_Get(LineEdit_STT_Whisper_OutputDir.text(), self.ui.LineEdit_STT_Whisper_AudioDir.text())
+                    ),
+                    ChildWindow_STT.exec,
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_STT, SetupPage_STT)
 
         #############################################################
         ###################### Content: Dataset #####################
@@ -3233,959 +3201,969 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_Dataset', 'False')) is False else None
         )
 
-        # GPT-SoVITS - ParamsManager
-        Path_Config_DAT_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_DAT_GPT-SoVITS.ini'))
-        ParamsManager_DAT_GPTSoVITS = ParamsManager(Path_Config_DAT_GPTSoVITS)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_Dataset():
+            nonlocal ParamsManager_DAT_GPTSoVITS, ParamsManager_DAT_VITS, LineEdit_DAT_GPTSoVITS_FileListPath, LineEdit_DAT_VITS_FileListPathTraining, LineEdit_DAT_VITS_FileListPathValidation
 
-        # GPT-SoVITS - Top
-        self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
-        self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setCheckable(True)
-        self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setChecked(True)
-        self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setAutoExclusive(True)
-        self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Dataset,
-                Target = 0
+            # GPT-SoVITS - ParamsManager
+            Path_Config_DAT_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_DAT_GPT-SoVITS.ini'))
+            ParamsManager_DAT_GPTSoVITS = ParamsManager(Path_Config_DAT_GPTSoVITS)
+
+            # GPT-SoVITS - Top
+            self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
+            self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setCheckable(True)
+            self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setChecked(True)
+            self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.setAutoExclusive(True)
+            self.ui.ToolButton_DatasetCreator_Title_GPTSoVITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Dataset,
+                    Target = 0
+                )
             )
-        )
 
-        # GPT-SoVITS - Left
-        self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS.clear()
-        self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS.setHeaderHidden(True)
+            # GPT-SoVITS - Left
+            self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS.clear()
+            self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS.setHeaderHidden(True)
 
-        # GPT-SoVITS - Middle
-        self.ui.GroupBox_DAT_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_GPTSoVITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # GPT-SoVITS - Middle
+            self.ui.GroupBox_DAT_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_GPTSoVITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_GPTSoVITS_AudioSpeakersDataPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音频文件目录/语音识别结果文本路径\n音频文件的所在目录，或者提供由语音识别得到的文本文件。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_GPTSoVITS_AudioSpeakersDataPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音频文件目录/语音识别结果文本路径\n音频文件的所在目录，或者提供由语音识别得到的文本文件。")
+                )
+            )
+            ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath,
+                Section = 'Input Params',
+                Option = 'WAV_Dir',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath.Button.clicked.connect(self.setAudioSpeakersDataPath)
+            self.ui.Button_DAT_GPTSoVITS_AudioSpeakersDataPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_GPTSoVITS_AudioSpeakersDataPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "音频文件目录")
             )
-        )
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath,
-            Section = 'Input Params',
-            Option = 'WAV_Dir',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath.Button.clicked.connect(self.setAudioSpeakersDataPath)
-        self.ui.Button_DAT_GPTSoVITS_AudioSpeakersDataPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_GPTSoVITS_AudioSpeakersDataPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "音频文件目录")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_GPTSoVITS_SRTDir,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "字幕输入目录\n字幕文件的所在目录，字幕文件须与对应音频文件同名且在文本中注明所属语言。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_GPTSoVITS_SRTDir,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "字幕输入目录\n字幕文件的所在目录，字幕文件须与对应音频文件同名且在文本中注明所属语言。")
+                )
+            )
+            ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_SRTDir,
+                Section = 'Input Params',
+                Option = 'SRT_Dir',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_DAT_GPTSoVITS_SRTDir.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = Path(CurrentDir).joinpath('语音转录结果', 'Whisper').as_posix()
+            )
+            self.ui.Button_DAT_GPTSoVITS_SRTDir_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_SRTDir),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_SRTDir.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_GPTSoVITS_SRTDir,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "字幕输入目录")
             )
-        )
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_SRTDir,
-            Section = 'Input Params',
-            Option = 'SRT_Dir',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_DAT_GPTSoVITS_SRTDir.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = Path(CurrentDir).joinpath('语音转录结果', 'Whisper').as_posix()
-        )
-        self.ui.Button_DAT_GPTSoVITS_SRTDir_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_SRTDir),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_SRTDir.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_GPTSoVITS_SRTDir,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "字幕输入目录")
-        )
 
-        self.ui.GroupBox_DAT_GPTSoVITS_GPTSoVITSParams.setTitle(QCA.translate("GroupBox", "数据集参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_GPTSoVITS_GPTSoVITSParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "数据集参数")
-        )
+            self.ui.GroupBox_DAT_GPTSoVITS_GPTSoVITSParams.setTitle(QCA.translate("GroupBox", "数据集参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_GPTSoVITS_GPTSoVITSParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "数据集参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_GPTSoVITS_DataFormat,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "数据文本格式\n数据集的文本格式，默认使用GPT-SoVITS的标准。")
-            )
-        )
-        DAT_GPTSoVITS_DataFormat_Default = '路径|人名|语言|文本'
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_DataFormat,
-            Section = 'GPT-SoVITS Params',
-            Option = 'DataFormat_Path',
-            DefaultValue = DAT_GPTSoVITS_DataFormat_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_GPTSoVITS_DataFormat_Default
-        )
-        self.ui.LineEdit_DAT_GPTSoVITS_DataFormat.textChanged.connect(
-            lambda Value: (
-                MessageBoxBase.pop(self,
-                    MessageType = QMessageBox.Warning,
-                    WindowTitle = "Warning",
-                    Text = "请保留关键词：'路径'，'人名'，'语言'，'文本'",
-                ),
-                ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat),
-            ) if not all(Keyword in Value for Keyword in ['路径', '人名', '语言', '文本']) else None
-        )
-        self.ui.Button_DAT_GPTSoVITS_DataFormat_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_GPTSoVITS_DataFormat,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "数据文本格式")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_GPTSoVITS_DataFormat,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "数据文本格式\n数据集的文本格式，默认使用GPT-SoVITS的标准。")
+                )
+            )
+            DAT_GPTSoVITS_DataFormat_Default = '路径|人名|语言|文本'
+            ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_DataFormat,
+                Section = 'GPT-SoVITS Params',
+                Option = 'DataFormat_Path',
+                DefaultValue = DAT_GPTSoVITS_DataFormat_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_GPTSoVITS_DataFormat_Default
+            )
+            self.ui.LineEdit_DAT_GPTSoVITS_DataFormat.textChanged.connect(
+                lambda Value: (
+                    MessageBoxBase.pop(self,
+                        MessageType = QMessageBox.Warning,
+                        WindowTitle = "Warning",
+                        Text = "请保留关键词：'路径'，'人名'，'语言'，'文本'",
+                    ),
+                    ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat),
+                ) if not all(Keyword in Value for Keyword in ['路径', '人名', '语言', '文本']) else None
+            )
+            self.ui.Button_DAT_GPTSoVITS_DataFormat_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_DataFormat.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_GPTSoVITS_DataFormat,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "数据文本格式")
+            )
 
-        self.ui.GroupBox_DAT_GPTSoVITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_GPTSoVITS_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            self.ui.GroupBox_DAT_GPTSoVITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_GPTSoVITS_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_GPTSoVITS_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的数据集文件的目录的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_GPTSoVITS_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的数据集文件的目录的名字。")
+                )
+            )
+            DAT_GPTSoVITS_OutputDirName_Default = str(date.today())
+            ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Output_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_GPTSoVITS_OutputDirName_Default
+            )
+            self.ui.Button_DAT_GPTSoVITS_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_GPTSoVITS_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
             )
-        )
-        DAT_GPTSoVITS_OutputDirName_Default = str(date.today())
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Output_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_GPTSoVITS_OutputDirName_Default
-        )
-        self.ui.Button_DAT_GPTSoVITS_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_GPTSoVITS_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
 
-        self.ui.ToolBox_DAT_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_DAT_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_DAT_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_DAT_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_GPTSoVITS_FileListName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "数据集文本名\n用于保存最后生成的数据集txt文件的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_GPTSoVITS_FileListName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "数据集文本名\n用于保存最后生成的数据集txt文件的名字。")
+                )
             )
-        )
-        DAT_GPTSoVITS_FileListName_Default = "Train_" + str(date.today())
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_FileListName,
-            Section = 'Output Params',
-            Option = 'FileList_Name',
-            DefaultValue = DAT_GPTSoVITS_FileListName_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_GPTSoVITS_FileListName_Default
-        )
-        self.ui.Button_DAT_GPTSoVITS_FileListName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_FileListName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_FileListName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_GPTSoVITS_FileListName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "数据集文本名")
-        )
-
-        LineEdit_DAT_GPTSoVITS_OutputDir = QLineEdit()
-        def SetText_LineEdit_DAT_GPTSoVITS_OutputDir():
-            DirName = self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_DAT_GPTSoVITS_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_OutputDir)
-        self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_OutputDir)
-        #SetText_LineEdit_DAT_GPTSoVITS_OutputDir()
-
-        LineEdit_DAT_GPTSoVITS_FileListPath = QLineEdit()
-        def SetText_LineEdit_DAT_GPTSoVITS_FileListPath():
-            FileName = self.ui.LineEdit_DAT_GPTSoVITS_FileListName.text()
-            if len(FileName.strip()) == 0:
-                Alert = False
-            else:
-                PathText = Path(LineEdit_DAT_GPTSoVITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
-                LineEdit_DAT_GPTSoVITS_FileListPath.setText(PathText)
-                Alert = Path(PathText).exists()
-            self.ui.LineEdit_DAT_GPTSoVITS_FileListName.Alert(True if Alert else False, "注意：路径已存在")
-        self.ui.LineEdit_DAT_GPTSoVITS_FileListName.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_FileListPath)
-        LineEdit_DAT_GPTSoVITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_GPTSoVITS_FileListPath)
-        #SetText_LineEdit_DAT_GPTSoVITS_FileListPath()
-
-        # ChildWindow
-        ChildWindow_DAT_GPTSoVITS = Window_ChildWindow_DAT_GPTSoVITS(self)
-
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Close.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认放弃编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_DAT_GPTSoVITS.close()
-                    )
+            DAT_GPTSoVITS_FileListName_Default = "Train_" + str(date.today())
+            ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_FileListName,
+                Section = 'Output Params',
+                Option = 'FileList_Name',
+                DefaultValue = DAT_GPTSoVITS_FileListName_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_GPTSoVITS_FileListName_Default
+            )
+            self.ui.Button_DAT_GPTSoVITS_FileListName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_GPTSoVITS.ResetParam(self.ui.LineEdit_DAT_GPTSoVITS_FileListName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_GPTSoVITS_FileListName.text())
                 }
             )
-        )
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_DAT_GPTSoVITS.showNormal() if ChildWindow_DAT_GPTSoVITS.isMaximized() else ChildWindow_DAT_GPTSoVITS.showMaximized())
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_GPTSoVITS_FileListName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "数据集文本名")
+            )
+
+            LineEdit_DAT_GPTSoVITS_OutputDir = QLineEdit()
+            def SetText_LineEdit_DAT_GPTSoVITS_OutputDir():
+                DirName = self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_DAT_GPTSoVITS_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_OutputDir)
+            self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_OutputDir)
+            #SetText_LineEdit_DAT_GPTSoVITS_OutputDir()
+
+            LineEdit_DAT_GPTSoVITS_FileListPath = QLineEdit()
+            def SetText_LineEdit_DAT_GPTSoVITS_FileListPath():
+                FileName = self.ui.LineEdit_DAT_GPTSoVITS_FileListName.text()
+                if len(FileName.strip()) == 0:
+                    Alert = False
+                else:
+                    PathText = Path(LineEdit_DAT_GPTSoVITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
+                    LineEdit_DAT_GPTSoVITS_FileListPath.setText(PathText)
+                    Alert = Path(PathText).exists()
+                self.ui.LineEdit_DAT_GPTSoVITS_FileListName.Alert(True if Alert else False, "注意：路径已存在")
+            self.ui.LineEdit_DAT_GPTSoVITS_FileListName.interacted.connect(SetText_LineEdit_DAT_GPTSoVITS_FileListPath)
+            LineEdit_DAT_GPTSoVITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_GPTSoVITS_FileListPath)
+            #SetText_LineEdit_DAT_GPTSoVITS_FileListPath()
+
+            # ChildWindow
+            ChildWindow_DAT_GPTSoVITS = Window_ChildWindow_DAT_GPTSoVITS(self)
+
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Close.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认放弃编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_DAT_GPTSoVITS.close()
+                        )
+                    }
+                )
+            )
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_DAT_GPTSoVITS.showNormal() if ChildWindow_DAT_GPTSoVITS.isMaximized() else ChildWindow_DAT_GPTSoVITS.showMaximized())
 
-        QFunc.Function_SetText(
-            Widget = ChildWindow_DAT_GPTSoVITS.ui.Label_Title,
-            Text = QFunc.SetRichText(
-                Title = QCA.translate("Label", "数据集制作结果")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_DAT_GPTSoVITS.ui.Label_Title,
+                Text = QFunc.SetRichText(
+                    Title = QCA.translate("Label", "数据集制作结果")
+                )
             )
-        )
-        QFunc.Function_SetText(
-            Widget = ChildWindow_DAT_GPTSoVITS.ui.Label_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的数据文本\n你可以对这些文本进行更改")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_DAT_GPTSoVITS.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的数据文本\n你可以对这些文本进行更改")
+                )
             )
-        )
 
-        ChildWindow_DAT_GPTSoVITS.ui.Table.setHorizontalHeaderLabels(['数据文本', '播放'])
+            ChildWindow_DAT_GPTSoVITS.ui.Table.setHorizontalHeaderLabels(['数据文本', '播放'])
 
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Cancel.clicked.connect(ChildWindow_DAT_GPTSoVITS.ui.Button_Close.click)
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
-        ChildWindow_DAT_GPTSoVITS.ui.Button_Confirm.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认应用编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        DATResult_Save(
-                            ChildWindow_DAT_GPTSoVITS.ui.Table.GetValue(),
-                            LineEdit_DAT_GPTSoVITS_FileListPath.text()
-                        ),
-                        ChildWindow_DAT_GPTSoVITS.close()
-                    )
-                }
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Cancel.clicked.connect(ChildWindow_DAT_GPTSoVITS.ui.Button_Close.click)
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
+            ChildWindow_DAT_GPTSoVITS.ui.Button_Confirm.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认应用编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            DATResult_Save(
+                                ChildWindow_DAT_GPTSoVITS.ui.Table.GetValue(),
+                                LineEdit_DAT_GPTSoVITS_FileListPath.text()
+                            ),
+                            ChildWindow_DAT_GPTSoVITS.close()
+                        )
+                    }
+                )
             )
-        )
 
-        # GPT-SoVITS - Right
-        MonitorFile_Config_DatasetCreator_GPTSoVITS = QTasks.MonitorFile(Path_Config_DAT_GPTSoVITS)
-        MonitorFile_Config_DatasetCreator_GPTSoVITS.start()
-        MonitorFile_Config_DatasetCreator_GPTSoVITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_DAT_GPTSoVITS.setText(
-                FileContent
+            # GPT-SoVITS - Right
+            MonitorFile_Config_DatasetCreator_GPTSoVITS = QTasks.MonitorFile(Path_Config_DAT_GPTSoVITS)
+            MonitorFile_Config_DatasetCreator_GPTSoVITS.start()
+            MonitorFile_Config_DatasetCreator_GPTSoVITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_DAT_GPTSoVITS.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_DAT_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_DAT_GPTSoVITS.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_DAT_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_DAT_GPTSoVITS.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_DAT_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_DAT_GPTSoVITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_DAT_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_DAT_GPTSoVITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_DAT_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_DAT_GPTSoVITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_DAT_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_DAT_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_DAT_GPTSoVITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_CheckOutput_DAT_GPTSoVITS.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_DAT_GPTSoVITS,
-            URL = self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
+            self.ui.Button_CheckOutput_DAT_GPTSoVITS.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_DAT_GPTSoVITS,
+                URL = self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # GPT-SoVITS - Bottom
+            self.ui.Button_DAT_GPTSoVITS_Execute.setToolTip("执行数据集制作")
+            self.ui.Button_DAT_GPTSoVITS_Terminate.setToolTip("终止数据集制作")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_DAT_GPTSoVITS_Execute,
+                TerminateButton = self.ui.Button_DAT_GPTSoVITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_DAT_GPTSoVITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Dataset_Creating_GPTSoVITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_DAT_GPTSoVITS_SRTDir,
+                    self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath,
+                    self.ui.LineEdit_DAT_GPTSoVITS_DataFormat,
+                    self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
+                    self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName,
+                    self.ui.LineEdit_DAT_GPTSoVITS_FileListName
+                ],
+                EmptyAllowed = [
+                ],
+                SuccessEvents = [
+                    lambda: self.ShowMask(True, "正在加载表单"),
+                    ChildWindow_DAT_GPTSoVITS.ui.Table.Release, # The DAT run may have rewritten the filelist that the shown result still maps
+                    lambda: ChildWindow_DAT_GPTSoVITS.ui.Table.SetValue(
+                        DATResult_Get(LineEdit_DAT_GPTSoVITS_FileListPath.text())
+                    ),
+                    ChildWindow_DAT_GPTSoVITS.exec,
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
 
-        # GPT-SoVITS - Bottom
-        self.ui.Button_DAT_GPTSoVITS_Execute.setToolTip("执行数据集制作")
-        self.ui.Button_DAT_GPTSoVITS_Terminate.setToolTip("终止数据集制作")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_DAT_GPTSoVITS_Execute,
-            TerminateButton = self.ui.Button_DAT_GPTSoVITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_DAT_GPTSoVITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Dataset_Creating_GPTSoVITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_DAT_GPTSoVITS_SRTDir,
-                self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath,
-                self.ui.LineEdit_DAT_GPTSoVITS_DataFormat,
-                self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
-                self.ui.LineEdit_DAT_GPTSoVITS_OutputDirName,
-                self.ui.LineEdit_DAT_GPTSoVITS_FileListName
-            ],
-            EmptyAllowed = [
-            ],
-            SuccessEvents = [
-                lambda: self.ShowMask(True, "正在加载表单"),
-                lambda: ChildWindow_DAT_GPTSoVITS.ui.Table.SetValue(
-                    DATResult_Get(LineEdit_DAT_GPTSoVITS_FileListPath.text())
-                ),
-                ChildWindow_DAT_GPTSoVITS.exec,
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
+            # VITS - ParamsManager
+            Path_Config_DAT_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_DAT_VITS.ini'))
+            ParamsManager_DAT_VITS = ParamsManager(Path_Config_DAT_VITS)
+
+            # VITS - Top
+            self.ui.ToolButton_DatasetCreator_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
+            self.ui.ToolButton_DatasetCreator_Title_VITS.setCheckable(True)
+            self.ui.ToolButton_DatasetCreator_Title_VITS.setChecked(False)
+            self.ui.ToolButton_DatasetCreator_Title_VITS.setAutoExclusive(True)
+            self.ui.ToolButton_DatasetCreator_Title_VITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Dataset,
+                    Target = 1
                 )
-            ]
-        )
+            )
 
-        # VITS - ParamsManager
-        Path_Config_DAT_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_DAT_VITS.ini'))
-        ParamsManager_DAT_VITS = ParamsManager(Path_Config_DAT_VITS)
+            # VITS - Left
+            self.ui.TreeWidget_Catalogue_DAT_VITS.clear()
+            self.ui.TreeWidget_Catalogue_DAT_VITS.setHeaderHidden(True)
 
-        # VITS - Top
-        self.ui.ToolButton_DatasetCreator_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
-        self.ui.ToolButton_DatasetCreator_Title_VITS.setCheckable(True)
-        self.ui.ToolButton_DatasetCreator_Title_VITS.setChecked(False)
-        self.ui.ToolButton_DatasetCreator_Title_VITS.setAutoExclusive(True)
-        self.ui.ToolButton_DatasetCreator_Title_VITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Dataset,
-                Target = 1
+            # VITS - Middle
+            self.ui.GroupBox_DAT_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_VITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
             )
-        )
 
-        # VITS - Left
-        self.ui.TreeWidget_Catalogue_DAT_VITS.clear()
-        self.ui.TreeWidget_Catalogue_DAT_VITS.setHeaderHidden(True)
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_AudioSpeakersDataPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音频文件目录/语音识别结果文本路径\n音频文件的所在目录（要求按说话人分类），或者提供由语音识别得到的文本文件。")
+                )
+            )
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath,
+                Section = 'Input Params',
+                Option = 'WAV_Dir',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath.Button.clicked.connect(self.setAudioSpeakersDataPath)
+            self.ui.Button_DAT_VITS_AudioSpeakersDataPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_AudioSpeakersDataPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "音频文件目录")
+            )
 
-        # VITS - Middle
-        self.ui.GroupBox_DAT_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_VITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_SRTDir,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "字幕输入目录\n字幕文件的所在目录，字幕文件须与对应音频文件同名且在文本中注明所属语言。")
+                )
+            )
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_SRTDir,
+                Section = 'Input Params',
+                Option = 'SRT_Dir',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_DAT_VITS_SRTDir.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = Path(CurrentDir).joinpath('语音转录结果', 'Whisper').as_posix()
+            )
+            self.ui.Button_DAT_VITS_SRTDir_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_SRTDir),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_SRTDir.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_SRTDir,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "字幕输入目录")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_AudioSpeakersDataPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音频文件目录/语音识别结果文本路径\n音频文件的所在目录（要求按说话人分类），或者提供由语音识别得到的文本文件。")
+            self.ui.GroupBox_DAT_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "数据集参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_VITS_VITSParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数")
             )
-        )
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath,
-            Section = 'Input Params',
-            Option = 'WAV_Dir',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath.Button.clicked.connect(self.setAudioSpeakersDataPath)
-        self.ui.Button_DAT_VITS_AudioSpeakersDataPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_AudioSpeakersDataPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "音频文件目录")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_SRTDir,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "字幕输入目录\n字幕文件的所在目录，字幕文件须与对应音频文件同名且在文本中注明所属语言。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_DataFormat,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "数据文本格式\n数据集的文本格式，默认使用VITS的标准。")
+                )
+            )
+            DAT_VITS_DataFormat_Default = '路径|人名|[语言]文本[语言]'
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_DataFormat,
+                Section = 'VITS Params',
+                Option = 'DataFormat_Path',
+                DefaultValue = DAT_VITS_DataFormat_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_DataFormat_Default
+            )
+            self.ui.LineEdit_DAT_VITS_DataFormat.textChanged.connect(
+                lambda Value: (
+                    MessageBoxBase.pop(self,
+                        MessageType = QMessageBox.Warning,
+                        WindowTitle = "Warning",
+                        Text = "请保留关键词：'路径'，'人名'，'语言'，'文本'",
+                    ),
+                    ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_DataFormat),
+                ) if not all(Keyword in Value for Keyword in ['路径', '人名', '语言', '文本']) else None
+            )
+            self.ui.Button_DAT_VITS_DataFormat_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_DataFormat),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_DataFormat.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_DataFormat,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "数据文本格式")
             )
-        )
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_SRTDir,
-            Section = 'Input Params',
-            Option = 'SRT_Dir',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_DAT_VITS_SRTDir.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = Path(CurrentDir).joinpath('语音转录结果', 'Whisper').as_posix()
-        )
-        self.ui.Button_DAT_VITS_SRTDir_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_SRTDir),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_SRTDir.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_SRTDir,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "字幕输入目录")
-        )
 
-        self.ui.GroupBox_DAT_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "数据集参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_VITS_VITSParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_DataFormat,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "数据文本格式\n数据集的文本格式，默认使用VITS的标准。")
-            )
-        )
-        DAT_VITS_DataFormat_Default = '路径|人名|[语言]文本[语言]'
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_DataFormat,
-            Section = 'VITS Params',
-            Option = 'DataFormat_Path',
-            DefaultValue = DAT_VITS_DataFormat_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_DataFormat_Default
-        )
-        self.ui.LineEdit_DAT_VITS_DataFormat.textChanged.connect(
-            lambda Value: (
-                MessageBoxBase.pop(self,
-                    MessageType = QMessageBox.Warning,
-                    WindowTitle = "Warning",
-                    Text = "请保留关键词：'路径'，'人名'，'语言'，'文本'",
-                ),
-                ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_DataFormat),
-            ) if not all(Keyword in Value for Keyword in ['路径', '人名', '语言', '文本']) else None
-        )
-        self.ui.Button_DAT_VITS_DataFormat_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_DataFormat),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_DataFormat.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_DataFormat,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "数据文本格式")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_AddAuxiliaryData,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "添加辅助数据\n添加用以辅助训练的数据集，若当前语音数据的质量/数量较低则建议启用。")
-            )
-        )
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
-            Section = 'VITS Params',
-            Option = 'Add_AuxiliaryData',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
-            CheckedText = "已启用",
-            CheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_DAT_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_DAT_VITS_AuxiliaryDataPath
-                    ],
-                    True
-                )
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_DAT_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_DAT_VITS_AuxiliaryDataPath
-                    ],
-                    False
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_AddAuxiliaryData,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "添加辅助数据\n添加用以辅助训练的数据集，若当前语音数据的质量/数量较低则建议启用。")
                 )
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_DAT_VITS_AddAuxiliaryData_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.CheckBox_DAT_VITS_AddAuxiliaryData)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_AddAuxiliaryData,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "添加辅助数据")
-        )
+            )
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
+                Section = 'VITS Params',
+                Option = 'Add_AuxiliaryData',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_DAT_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_DAT_VITS_AuxiliaryDataPath
+                        ],
+                        True
+                    )
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_DAT_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_DAT_VITS_AuxiliaryDataPath
+                        ],
+                        False
+                    )
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_DAT_VITS_AddAuxiliaryData_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.CheckBox_DAT_VITS_AddAuxiliaryData)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_AddAuxiliaryData,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "添加辅助数据")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_AuxiliaryDataPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "辅助数据文本路径\n辅助数据集的文本的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_AuxiliaryDataPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "辅助数据文本路径\n辅助数据集的文本的路径。")
+                )
+            )
+            DAT_VITS_AuxiliaryDataPath_Default = Path(CurrentDir).joinpath('AuxiliaryData', 'VITS', 'AuxiliaryData.txt').as_posix()
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath,
+                Section = 'VITS Params',
+                Option = 'AuxiliaryData_Path',
+                DefaultValue = DAT_VITS_AuxiliaryDataPath_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_AuxiliaryDataPath_Default
+            )
+            self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "文本类型 (*.csv *.txt)",
+                Directory = QFunc.NormPath(Path(CurrentDir).joinpath('AuxiliaryData', 'VITS'))
+            )
+            self.ui.Button_DAT_VITS_AuxiliaryDataPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_AuxiliaryDataPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "辅助数据文本路径")
             )
-        )
-        DAT_VITS_AuxiliaryDataPath_Default = Path(CurrentDir).joinpath('AuxiliaryData', 'VITS', 'AuxiliaryData.txt').as_posix()
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath,
-            Section = 'VITS Params',
-            Option = 'AuxiliaryData_Path',
-            DefaultValue = DAT_VITS_AuxiliaryDataPath_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_AuxiliaryDataPath_Default
-        )
-        self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "文本类型 (*.csv *.txt)",
-            Directory = QFunc.NormPath(Path(CurrentDir).joinpath('AuxiliaryData', 'VITS'))
-        )
-        self.ui.Button_DAT_VITS_AuxiliaryDataPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_AuxiliaryDataPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "辅助数据文本路径")
-        )
 
-        self.ui.ToolBox_DAT_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_DAT_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_DAT_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_DAT_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_TrainRatio,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "训练集占比\n划分给训练集的数据在数据集中所占的比例。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_TrainRatio,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "训练集占比\n划分给训练集的数据在数据集中所占的比例。")
+                )
+            )
+            self.ui.DoubleSpinBox_DAT_VITS_TrainRatio.setRange(0.5, 0.9)
+            self.ui.DoubleSpinBox_DAT_VITS_TrainRatio.setSingleStep(0.1)
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.DoubleSpinBox_DAT_VITS_TrainRatio,
+                Section = 'VITS Params',
+                Option = 'TrainRatio',
+                DefaultValue = 0.7
+            )
+            self.ui.Button_DAT_VITS_TrainRatio_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.DoubleSpinBox_DAT_VITS_TrainRatio)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_TrainRatio,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "训练集占比")
             )
-        )
-        self.ui.DoubleSpinBox_DAT_VITS_TrainRatio.setRange(0.5, 0.9)
-        self.ui.DoubleSpinBox_DAT_VITS_TrainRatio.setSingleStep(0.1)
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.DoubleSpinBox_DAT_VITS_TrainRatio,
-            Section = 'VITS Params',
-            Option = 'TrainRatio',
-            DefaultValue = 0.7
-        )
-        self.ui.Button_DAT_VITS_TrainRatio_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.DoubleSpinBox_DAT_VITS_TrainRatio)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_TrainRatio,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "训练集占比")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_SampleRate,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "采样率 (HZ)\n数据集所要求的音频采样率，若维持不变则保持'None'即可。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_SampleRate,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "采样率 (HZ)\n数据集所要求的音频采样率，若维持不变则保持'None'即可。")
+                )
+            )
+            self.ui.ComboBox_DAT_VITS_SampleRate.addItems(['22050', '44100', '48000', '96000', '192000', 'None'])
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.ComboBox_DAT_VITS_SampleRate,
+                Section = 'VITS Params',
+                Option = 'SampleRate',
+                DefaultValue = 22050
+            )
+            self.ui.Button_DAT_VITS_SampleRate_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.ComboBox_DAT_VITS_SampleRate)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_SampleRate,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "采样率")
             )
-        )
-        self.ui.ComboBox_DAT_VITS_SampleRate.addItems(['22050', '44100', '48000', '96000', '192000', 'None'])
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.ComboBox_DAT_VITS_SampleRate,
-            Section = 'VITS Params',
-            Option = 'SampleRate',
-            DefaultValue = 22050
-        )
-        self.ui.Button_DAT_VITS_SampleRate_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.ComboBox_DAT_VITS_SampleRate)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_SampleRate,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "采样率")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_SampleWidth,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "采样位数\n数据集所要求的音频采样位数，若维持不变则保持'None'即可。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_SampleWidth,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "采样位数\n数据集所要求的音频采样位数，若维持不变则保持'None'即可。")
+                )
+            )
+            self.ui.ComboBox_DAT_VITS_SampleWidth.addItems(['8', '16', '24', '32', '32 (Float)', 'None'])
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.ComboBox_DAT_VITS_SampleWidth,
+                Section = 'VITS Params',
+                Option = 'SampleWidth',
+                DefaultValue = 16
+            )
+            self.ui.Button_DAT_VITS_SampleWidth_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.ComboBox_DAT_VITS_SampleWidth)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_SampleWidth,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "采样位数")
             )
-        )
-        self.ui.ComboBox_DAT_VITS_SampleWidth.addItems(['8', '16', '24', '32', '32 (Float)', 'None'])
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.ComboBox_DAT_VITS_SampleWidth,
-            Section = 'VITS Params',
-            Option = 'SampleWidth',
-            DefaultValue = 16
-        )
-        self.ui.Button_DAT_VITS_SampleWidth_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.ComboBox_DAT_VITS_SampleWidth)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_SampleWidth,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "采样位数")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_ToMono,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "合并声道\n将数据集音频的声道合并为单声道。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_ToMono,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "合并声道\n将数据集音频的声道合并为单声道。")
+                )
+            )
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.CheckBox_DAT_VITS_ToMono,
+                Section = 'VITS Params',
+                Option = 'ToMono',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_DAT_VITS_ToMono,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_DAT_VITS_ToMono_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.CheckBox_DAT_VITS_ToMono)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_ToMono,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "数据集参数"),
+                ChildItemText = QCA.translate("Tree", "合并声道")
             )
-        )
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.CheckBox_DAT_VITS_ToMono,
-            Section = 'VITS Params',
-            Option = 'ToMono',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_DAT_VITS_ToMono,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_DAT_VITS_ToMono_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.CheckBox_DAT_VITS_ToMono)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_ToMono,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "数据集参数"),
-            ChildItemText = QCA.translate("Tree", "合并声道")
-        )
 
-        self.ui.GroupBox_DAT_VITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_DAT_VITS_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            self.ui.GroupBox_DAT_VITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_DAT_VITS_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的数据集文件的目录的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n用于保存最后生成的数据集文件的目录的名字。")
+                )
+            )
+            DAT_VITS_OutputDirName_Default = str(date.today())
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Output_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_OutputDirName_Default
+            )
+            self.ui.Button_DAT_VITS_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_OutputDirName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
             )
-        )
-        DAT_VITS_OutputDirName_Default = str(date.today())
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Output_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_OutputDirName_Default
-        )
-        self.ui.Button_DAT_VITS_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
 
-        self.ui.ToolBox_DAT_VITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_DAT_VITS_OutputParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_DAT_VITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_DAT_VITS_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_FileListNameTraining,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "训练集文本名\n用于保存最后生成的训练集txt文件的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_FileListNameTraining,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "训练集文本名\n用于保存最后生成的训练集txt文件的名字。")
+                )
+            )
+            DAT_VITS_FileListNameTraining_Default = "Train_" + str(date.today())
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_FileListNameTraining,
+                Section = 'Output Params',
+                Option = 'FileList_Name_Training',
+                DefaultValue = DAT_VITS_FileListNameTraining_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_FileListNameTraining_Default
+            )
+            self.ui.Button_DAT_VITS_FileListNameTraining_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_FileListNameTraining),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_FileListNameTraining.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_FileListNameTraining,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "训练集文本名")
             )
-        )
-        DAT_VITS_FileListNameTraining_Default = "Train_" + str(date.today())
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_FileListNameTraining,
-            Section = 'Output Params',
-            Option = 'FileList_Name_Training',
-            DefaultValue = DAT_VITS_FileListNameTraining_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_FileListNameTraining_Default
-        )
-        self.ui.Button_DAT_VITS_FileListNameTraining_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_FileListNameTraining),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_FileListNameTraining.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_FileListNameTraining,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "训练集文本名")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_DAT_VITS_FileListNameValidation,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "验证集文本名\n用于保存最后生成的验证集txt文件的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_DAT_VITS_FileListNameValidation,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "验证集文本名\n用于保存最后生成的验证集txt文件的名字。")
+                )
             )
-        )
-        DAT_VITS_FileListNameValidation_Default = "Val_" + str(date.today())
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_FileListNameValidation,
-            Section = 'Output Params',
-            Option = 'FileList_Name_Validation',
-            DefaultValue = DAT_VITS_FileListNameValidation_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_FileListNameValidation_Default
-        )
-        self.ui.Button_DAT_VITS_FileListNameValidation_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_FileListNameValidation),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_FileListNameValidation.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_DAT_VITS_FileListNameValidation,
-            TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "验证集文本名")
-        )
-
-        LineEdit_DAT_VITS_OutputDir = QLineEdit()
-        def SetText_LineEdit_DAT_VITS_OutputDir():
-            DirName = self.ui.LineEdit_DAT_VITS_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_DAT_VITS_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_DAT_VITS_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_DAT_VITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_DAT_VITS_OutputDirName.interacted.connect(SetText_LineEdit_DAT_VITS_OutputDir)
-        self.ui.LineEdit_DAT_VITS_OutputRoot.interacted.connect(SetText_LineEdit_DAT_VITS_OutputDir)
-        #SetText_LineEdit_DAT_VITS_OutputDir()
-
-        LineEdit_DAT_VITS_FileListPathTraining = QLineEdit()
-        def SetText_LineEdit_DAT_VITS_FileListPathTraining():
-            FileName = self.ui.LineEdit_DAT_VITS_FileListNameTraining.text()
-            if len(FileName.strip()) == 0:
-                Alert = False
-            else:
-                PathText = Path(LineEdit_DAT_VITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
-                LineEdit_DAT_VITS_FileListPathTraining.setText(PathText)
-                Alert = Path(PathText).exists()
-            self.ui.LineEdit_DAT_VITS_FileListNameTraining.Alert(True if Alert else False, "注意：路径已存在")
-        self.ui.LineEdit_DAT_VITS_FileListNameTraining.interacted.connect(SetText_LineEdit_DAT_VITS_FileListPathTraining)
-        LineEdit_DAT_VITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_VITS_FileListPathTraining)
-        #SetText_LineEdit_DAT_VITS_FileListPathTraining()
-
-        LineEdit_DAT_VITS_FileListPathValidation = QLineEdit()
-        def SetText_LineEdit_DAT_VITS_FileListPathValidation():
-            FileName = self.ui.LineEdit_DAT_VITS_FileListNameValidation.text()
-            if len(FileName.strip()) == 0:
-                Alert = False
-            else:
-                PathText = Path(LineEdit_DAT_VITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
-                LineEdit_DAT_VITS_FileListPathValidation.setText(PathText)
-                Alert = Path(PathText).exists()
-            self.ui.LineEdit_DAT_VITS_FileListNameValidation.Alert(True if Alert else False, "注意：路径已存在")
-        self.ui.LineEdit_DAT_VITS_FileListNameValidation.interacted.connect(SetText_LineEdit_DAT_VITS_FileListPathValidation)
-        LineEdit_DAT_VITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_VITS_FileListPathValidation)
-        #SetText_LineEdit_DAT_VITS_FileListPathValidation()
-
-        # ChildWindow
-        ChildWindow_DAT_VITS = Window_ChildWindow_DAT_VITS(self)
-
-        ChildWindow_DAT_VITS.ui.Button_Close.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认放弃编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_DAT_VITS.close()
-                    )
+            DAT_VITS_FileListNameValidation_Default = "Val_" + str(date.today())
+            ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_FileListNameValidation,
+                Section = 'Output Params',
+                Option = 'FileList_Name_Validation',
+                DefaultValue = DAT_VITS_FileListNameValidation_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_FileListNameValidation_Default
+            )
+            self.ui.Button_DAT_VITS_FileListNameValidation_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_DAT_VITS.ResetParam(self.ui.LineEdit_DAT_VITS_FileListNameValidation),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_DAT_VITS_FileListNameValidation.text())
                 }
             )
-        )
-        ChildWindow_DAT_VITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_DAT_VITS.showNormal() if ChildWindow_DAT_VITS.isMaximized() else ChildWindow_DAT_VITS.showMaximized())
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_DAT_VITS_FileListNameValidation,
+                TreeWidget = self.ui.TreeWidget_Catalogue_DAT_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "验证集文本名")
+            )
+
+            LineEdit_DAT_VITS_OutputDir = QLineEdit()
+            def SetText_LineEdit_DAT_VITS_OutputDir():
+                DirName = self.ui.LineEdit_DAT_VITS_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_DAT_VITS_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_DAT_VITS_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_DAT_VITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_DAT_VITS_OutputDirName.interacted.connect(SetText_LineEdit_DAT_VITS_OutputDir)
+            self.ui.LineEdit_DAT_VITS_OutputRoot.interacted.connect(SetText_LineEdit_DAT_VITS_OutputDir)
+            #SetText_LineEdit_DAT_VITS_OutputDir()
+
+            LineEdit_DAT_VITS_FileListPathTraining = QLineEdit()
+            def SetText_LineEdit_DAT_VITS_FileListPathTraining():
+                FileName = self.ui.LineEdit_DAT_VITS_FileListNameTraining.text()
+                if len(FileName.strip()) == 0:
+                    Alert = False
+                else:
+                    PathText = Path(LineEdit_DAT_VITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
+                    LineEdit_DAT_VITS_FileListPathTraining.setText(PathText)
+                    Alert = Path(PathText).exists()
+                self.ui.LineEdit_DAT_VITS_FileListNameTraining.Alert(True if Alert else False, "注意：路径已存在")
+            self.ui.LineEdit_DAT_VITS_FileListNameTraining.interacted.connect(SetText_LineEdit_DAT_VITS_FileListPathTraining)
+            LineEdit_DAT_VITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_VITS_FileListPathTraining)
+            #SetText_LineEdit_DAT_VITS_FileListPathTraining()
+
+            LineEdit_DAT_VITS_FileListPathValidation = QLineEdit()
+            def SetText_LineEdit_DAT_VITS_FileListPathValidation():
+                FileName = self.ui.LineEdit_DAT_VITS_FileListNameValidation.text()
+                if len(FileName.strip()) == 0:
+                    Alert = False
+                else:
+                    PathText = Path(LineEdit_DAT_VITS_OutputDir.text()).joinpath(FileName).as_posix() + ".txt"
+                    LineEdit_DAT_VITS_FileListPathValidation.setText(PathText)
+                    Alert = Path(PathText).exists()
+                self.ui.LineEdit_DAT_VITS_FileListNameValidation.Alert(True if Alert else False, "注意：路径已存在")
+            self.ui.LineEdit_DAT_VITS_FileListNameValidation.interacted.connect(SetText_LineEdit_DAT_VITS_FileListPathValidation)
+            LineEdit_DAT_VITS_OutputDir.textChanged.connect(SetText_LineEdit_DAT_VITS_FileListPathValidation)
+            #SetText_LineEdit_DAT_VITS_FileListPathValidation()
+
+            # ChildWindow
+            ChildWindow_DAT_VITS = Window_ChildWindow_DAT_VITS(self)
+
+            ChildWindow_DAT_VITS.ui.Button_Close.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认放弃编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_DAT_VITS.close()
+                        )
+                    }
+                )
+            )
+            ChildWindow_DAT_VITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_DAT_VITS.showNormal() if ChildWindow_DAT_VITS.isMaximized() else ChildWindow_DAT_VITS.showMaximized())
 
-        QFunc.Function_SetText(
-            Widget = ChildWindow_DAT_VITS.ui.Label_Title,
-            Text = QFunc.SetRichText(
-                Title = QCA.translate("Label", "数据集制作结果")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_DAT_VITS.ui.Label_Title,
+                Text = QFunc.SetRichText(
+                    Title = QCA.translate("Label", "数据集制作结果")
+                )
             )
-        )
-        QFunc.Function_SetText(
-            Widget = ChildWindow_DAT_VITS.ui.Label_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的数据文本\n你可以对这些文本进行更改")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_DAT_VITS.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "这里记录了每个语音文件与其对应的数据文本\n你可以对这些文本进行更改")
+                )
             )
-        )
 
-        ChildWindow_DAT_VITS.ui.Table_Train.setHorizontalHeaderLabels(['数据文本', '播放'])
-        ChildWindow_DAT_VITS.ui.Table_Val.setHorizontalHeaderLabels(['数据文本', '播放'])
+            ChildWindow_DAT_VITS.ui.Table_Train.setHorizontalHeaderLabels(['数据文本', '播放'])
+            ChildWindow_DAT_VITS.ui.Table_Val.setHorizontalHeaderLabels(['数据文本', '播放'])
 
-        ChildWindow_DAT_VITS.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
-        ChildWindow_DAT_VITS.ui.Button_Cancel.clicked.connect(ChildWindow_DAT_VITS.ui.Button_Close.click)
-        ChildWindow_DAT_VITS.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
-        ChildWindow_DAT_VITS.ui.Button_Confirm.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认应用编辑？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        DATResult_Save(
-                            ChildWindow_DAT_VITS.ui.Table_Train.GetValue(),
-                            LineEdit_DAT_VITS_FileListPathTraining.text()
-                        ),
-                        DATResult_Save(
-                            ChildWindow_DAT_VITS.ui.Table_Val.GetValue(),
-                            LineEdit_DAT_VITS_FileListPathValidation.text()
-                        ),
-                        ChildWindow_DAT_VITS.close()
-                    )
-                }
+            ChildWindow_DAT_VITS.ui.Button_Cancel.setText(QCA.translate("Button", "取消"))
+            ChildWindow_DAT_VITS.ui.Button_Cancel.clicked.connect(ChildWindow_DAT_VITS.ui.Button_Close.click)
+            ChildWindow_DAT_VITS.ui.Button_Confirm.setText(QCA.translate("Button", "确认"))
+            ChildWindow_DAT_VITS.ui.Button_Confirm.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认应用编辑？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            DATResult_Save(
+                                ChildWindow_DAT_VITS.ui.Table_Train.GetValue(),
+                                LineEdit_DAT_VITS_FileListPathTraining.text()
+                            ),
+                            DATResult_Save(
+                                ChildWindow_DAT_VITS.ui.Table_Val.GetValue(),
+                                LineEdit_DAT_VITS_FileListPathValidation.text()
+                            ),
+                            ChildWindow_DAT_VITS.close()
+                        )
+                    }
+                )
             )
-        )
 
-        # VITS - Right
-        MonitorFile_Config_DatasetCreator_VITS = QTasks.MonitorFile(Path_Config_DAT_VITS)
-        MonitorFile_Config_DatasetCreator_VITS.start()
-        MonitorFile_Config_DatasetCreator_VITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_DAT_VITS.setText(
-                FileContent
+            # VITS - Right
+            MonitorFile_Config_DatasetCreator_VITS = QTasks.MonitorFile(Path_Config_DAT_VITS)
+            MonitorFile_Config_DatasetCreator_VITS.start()
+            MonitorFile_Config_DatasetCreator_VITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_DAT_VITS.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_DAT_VITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_DAT_VITS.clicked.connect(
-            lambda: ParamsManager_DAT_VITS.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_DAT_VITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_DAT_VITS.clicked.connect(
+                lambda: ParamsManager_DAT_VITS.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_DAT_VITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_DAT_VITS.clicked.connect(
-            lambda: ParamsManager_DAT_VITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_DAT_VITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_DAT_VITS.clicked.connect(
+                lambda: ParamsManager_DAT_VITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_DAT_VITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_DAT_VITS.clicked.connect(
-            lambda: ParamsManager_DAT_VITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_DAT_VITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_DAT_VITS.clicked.connect(
+                lambda: ParamsManager_DAT_VITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
-
-        self.ui.Button_CheckOutput_DAT_VITS.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_DAT_VITS,
-            URL = self.ui.LineEdit_DAT_VITS_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
 
-        # VITS - Bottom
-        self.ui.Button_DAT_VITS_Execute.setToolTip("执行数据集制作")
-        self.ui.Button_DAT_VITS_Terminate.setToolTip("终止数据集制作")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_DAT_VITS_Execute,
-            TerminateButton = self.ui.Button_DAT_VITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_DAT_VITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Dataset_Creating_VITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_DAT_VITS_SRTDir,
-                self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath,
-                self.ui.ComboBox_DAT_VITS_SampleRate,
-                self.ui.ComboBox_DAT_VITS_SampleWidth,
-                self.ui.CheckBox_DAT_VITS_ToMono,
-                self.ui.LineEdit_DAT_VITS_DataFormat,
-                self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
-                self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath,
-                self.ui.DoubleSpinBox_DAT_VITS_TrainRatio,
-                self.ui.LineEdit_DAT_VITS_OutputRoot,
-                self.ui.LineEdit_DAT_VITS_OutputDirName,
-                self.ui.LineEdit_DAT_VITS_FileListNameTraining,
-                self.ui.LineEdit_DAT_VITS_FileListNameValidation
-            ],
-            EmptyAllowed = [
-                self.ui.ComboBox_DAT_VITS_SampleRate,
-                self.ui.ComboBox_DAT_VITS_SampleWidth,
-                self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath
-            ],
-            SuccessEvents = [
-                lambda: self.ShowMask(True, "正在加载表单"),
-                lambda: ChildWindow_DAT_VITS.ui.Table_Train.SetValue(
-                    DATResult_Get(LineEdit_DAT_VITS_FileListPathTraining.text())
-                ),
-                lambda: ChildWindow_DAT_VITS.ui.Table_Val.SetValue(
-                    DATResult_Get(LineEdit_DAT_VITS_FileListPathValidation.text())
-                ),
-                ChildWindow_DAT_VITS.exec,
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
+            self.ui.Button_CheckOutput_DAT_VITS.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_DAT_VITS,
+                URL = self.ui.LineEdit_DAT_VITS_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # VITS - Bottom
+            self.ui.Button_DAT_VITS_Execute.setToolTip("执行数据集制作")
+            self.ui.Button_DAT_VITS_Terminate.setToolTip("终止数据集制作")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_DAT_VITS_Execute,
+                TerminateButton = self.ui.Button_DAT_VITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_DAT_VITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Dataset_Creating_VITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_DAT_VITS_SRTDir,
+                    self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath,
+                    self.ui.ComboBox_DAT_VITS_SampleRate,
+                    self.ui.ComboBox_DAT_VITS_SampleWidth,
+                    self.ui.CheckBox_DAT_VITS_ToMono,
+                    self.ui.LineEdit_DAT_VITS_DataFormat,
+                    self.ui.CheckBox_DAT_VITS_AddAuxiliaryData,
+                    self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath,
+                    self.ui.DoubleSpinBox_DAT_VITS_TrainRatio,
+                    self.ui.LineEdit_DAT_VITS_OutputRoot,
+                    self.ui.LineEdit_DAT_VITS_OutputDirName,
+                    self.ui.LineEdit_DAT_VITS_FileListNameTraining,
+                    self.ui.LineEdit_DAT_VITS_FileListNameValidation
+                ],
+                EmptyAllowed = [
+                    self.ui.ComboBox_DAT_VITS_SampleRate,
+                    self.ui.ComboBox_DAT_VITS_SampleWidth,
+                    self.ui.LineEdit_DAT_VITS_AuxiliaryDataPath
+                ],
+                SuccessEvents = [
+                    lambda: self.ShowMask(True, "正在加载表单"),
+                    ChildWindow_DAT_VITS.ui.Table_Train.Release, # The DAT run may have rewritten the filelist that the shown result still maps
+                    lambda: ChildWindow_DAT_VITS.ui.Table_Train.SetValue(
+                        DATResult_Get(LineEdit_DAT_VITS_FileListPathTraining.text())
+                    ),
+                    ChildWindow_DAT_VITS.ui.Table_Val.Release, # The DAT run may have rewritten the filelist that the shown result still maps
+                    lambda: ChildWindow_DAT_VITS.ui.Table_Val.SetValue(
+                        DATResult_Get(LineEdit_DAT_VITS_FileListPathValidation.text())
+                    ),
+                    ChildWindow_DAT_VITS.exec,
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_Dataset, SetupPage_Dataset)
 
         #############################################################
         ####################### Content: Train ######################
@@ -4213,1165 +4191,1174 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_Train', 'False')) is False else None
         )
 
-        # GPT-SoVITS - ParamsManager
-        Path_Config_Train_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Train_GPT-SoVITS.ini'))
-        ParamsManager_Train_GPTSoVITS = ParamsManager(Path_Config_Train_GPTSoVITS)
-
-        # GPT-SoVITS - Top
-        self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
-        self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setCheckable(True)
-        self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setChecked(True)
-        self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Train,
-                Target = 0
-            )
+        # Ask for tensorboard whenever a training starts (even one submitted before the page is set up)
+        FunctionSignals.Signal_TaskStatus.connect(
+            lambda Task, Status: MessageBoxBase.pop(self,
+                MessageType = QMessageBox.Question,
+                WindowTitle = "Ask",
+                Text = "是否稍后启用tensorboard？",
+                Buttons = QMessageBox.Yes|QMessageBox.No,
+                ButtonEvents = {QMessageBox.Yes: lambda: (PageSetups.Setup(self.ui.Page_Train), self.ui.Button_RunTensorboard_Train_GPTSoVITS.click())}
+            ) if Task == 'Execute_Voice_Training_GPTSoVITS.Execute' and Status == 'Started' else None
+        )
+        FunctionSignals.Signal_TaskStatus.connect(
+            lambda Task, Status: MessageBoxBase.pop(self,
+                MessageType = QMessageBox.Question,
+                WindowTitle = "Ask",
+                Text = "是否稍后启用tensorboard？",
+                Buttons = QMessageBox.Yes|QMessageBox.No,
+                ButtonEvents = {QMessageBox.Yes: lambda: (PageSetups.Setup(self.ui.Page_Train), self.ui.Button_RunTensorboard_Train_VITS.click())}
+            ) if Task == 'Execute_Voice_Training_VITS.Execute' and Status == 'Started' else None
         )
 
-        # GPT-SoVITS - Left
-        self.ui.TreeWidget_Catalogue_Train_GPTSoVITS.clear()
-        self.ui.TreeWidget_Catalogue_Train_GPTSoVITS.setHeaderHidden(True)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_Train():
+            nonlocal ParamsManager_Train_GPTSoVITS, ParamsManager_Train_VITS
 
-        # GPT-SoVITS - Midlle
-        self.ui.GroupBox_Train_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_GPTSoVITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # GPT-SoVITS - ParamsManager
+            Path_Config_Train_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Train_GPT-SoVITS.ini'))
+            ParamsManager_Train_GPTSoVITS = ParamsManager(Path_Config_Train_GPTSoVITS)
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_FileListPath,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "训练集文本路径\n用于提供训练集音频路径及其语音内容的训练集txt文件的路径。")
+            # GPT-SoVITS - Top
+            self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
+            self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setCheckable(True)
+            self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setChecked(True)
+            self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceTrainer_Title_GPTSoVITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Train,
+                    Target = 0
+                )
             )
-        )
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_FileListPath,
-            Section = 'Input Params',
-            Option = 'FileList_Path',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_FileListPath.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "txt类型 (*.txt)",
-            Directory = Path(CurrentDir).joinpath('数据集制作结果', 'GPT-SoVITS').as_posix()
-        )
-        self.ui.Button_Train_GPTSoVITS_FileListPath_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_FileListPath),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_FileListPath.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_FileListPath,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "训练集文本路径")
-        )
 
-        self.ui.GroupBox_Train_GPTSoVITS_GPTSoVITSParams.setTitle(QCA.translate("GroupBox", "训练参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_GPTSoVITS_GPTSoVITSParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数")
-        )
+            # GPT-SoVITS - Left
+            self.ui.TreeWidget_Catalogue_Train_GPTSoVITS.clear()
+            self.ui.TreeWidget_Catalogue_Train_GPTSoVITS.setHeaderHidden(True)
 
-        '''
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_Epochs,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "s1迭代轮数\n将全部样本完整迭代一轮的次数。")
+            # GPT-SoVITS - Midlle
+            self.ui.GroupBox_Train_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_GPTSoVITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
             )
-        )
-        self.ui.SpinBox_Train_GPTSoVITS_S1Epochs.setRange(1, 100)
-        self.ui.SpinBox_Train_GPTSoVITS_S1Epochs.setSingleStep(1)
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.SpinBox_Train_GPTSoVITS_S1Epochs,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Epochs',
-            DefaultValue = 8
-        )
-        self.ui.Button_Train_GPTSoVITS_S1Epochs_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.SpinBox_Train_GPTSoVITS_S1Epochs)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_Epochs,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "s1迭代轮数")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_S2Epochs,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "s2迭代轮数\n将全部样本完整迭代一轮的次数。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_FileListPath,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "训练集文本路径\n用于提供训练集音频路径及其语音内容的训练集txt文件的路径。")
+                )
             )
-        )
-        self.ui.SpinBox_Train_GPTSoVITS_S2Epochs.setRange(1, 100)
-        self.ui.SpinBox_Train_GPTSoVITS_S2Epochs.setSingleStep(1)
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.SpinBox_Train_GPTSoVITS_S2Epochs,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Epochs',
-            DefaultValue = 15
-        )
-        self.ui.Button_Train_GPTSoVITS_S2Epochs_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.SpinBox_Train_GPTSoVITS_S2Epochs)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_S2Epochs,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "s2迭代轮数")
-        )
-        '''
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS1,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练s1模型路径\n预训练s1模型的路径。")
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_FileListPath,
+                Section = 'Input Params',
+                Option = 'FileList_Path',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_FileListPath.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "txt类型 (*.txt)",
+                Directory = Path(CurrentDir).joinpath('数据集制作结果', 'GPT-SoVITS').as_posix()
+            )
+            self.ui.Button_Train_GPTSoVITS_FileListPath_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_FileListPath),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_FileListPath.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_FileListPath,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "训练集文本路径")
             )
-        )
-        Train_GPTSoVITS_ModelPathPretrainedS1_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's1bert25hz-5kh-longer-epoch=12-step=369668.ckpt').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Model_Path_Pretrained_s1',
-            DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS1_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS1_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "ckpt类型 (*.ckpt)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
-        )
-        self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS1_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS1,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练s1模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2G,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练s2G模型路径\n预训练s2G模型的路径。")
+            self.ui.GroupBox_Train_GPTSoVITS_GPTSoVITSParams.setTitle(QCA.translate("GroupBox", "训练参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_GPTSoVITS_GPTSoVITSParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数")
             )
-        )
-        Train_GPTSoVITS_ModelPathPretrainedS2G_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2G2333k.pth').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Model_Path_Pretrained_s2G',
-            DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS2G_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS2G_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
-        )
-        self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS2G_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2G,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练s2G模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2D,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练s2D模型路径\n预训练s2D模型的路径。")
+            '''
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_Epochs,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "s1迭代轮数\n将全部样本完整迭代一轮的次数。")
+                )
+            )
+            self.ui.SpinBox_Train_GPTSoVITS_S1Epochs.setRange(1, 100)
+            self.ui.SpinBox_Train_GPTSoVITS_S1Epochs.setSingleStep(1)
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.SpinBox_Train_GPTSoVITS_S1Epochs,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Epochs',
+                DefaultValue = 8
+            )
+            self.ui.Button_Train_GPTSoVITS_S1Epochs_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.SpinBox_Train_GPTSoVITS_S1Epochs)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_Epochs,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "s1迭代轮数")
             )
-        )
-        Train_GPTSoVITS_ModelPathPretrainedS2D_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2D2333k.pth').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Model_Path_Pretrained_s2D',
-            DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS2D_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS2D_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
-        )
-        self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS2D_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2D,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练s2D模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedBert,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练bert模型路径\n预训练bert模型（文件夹）的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_S2Epochs,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "s2迭代轮数\n将全部样本完整迭代一轮的次数。")
+                )
             )
-        )
-        Train_GPTSoVITS_ModelDirPretrainedBert_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-roberta-wwm-ext-large').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Model_Dir_Pretrained_bert',
-            DefaultValue = Train_GPTSoVITS_ModelDirPretrainedBert_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_ModelDirPretrainedBert_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
-        )
-        self.ui.Button_Train_GPTSoVITS_ModelDirPretrainedBert_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedBert,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练bert模型路径")
-        )
+            self.ui.SpinBox_Train_GPTSoVITS_S2Epochs.setRange(1, 100)
+            self.ui.SpinBox_Train_GPTSoVITS_S2Epochs.setSingleStep(1)
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.SpinBox_Train_GPTSoVITS_S2Epochs,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Epochs',
+                DefaultValue = 15
+            )
+            self.ui.Button_Train_GPTSoVITS_S2Epochs_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.SpinBox_Train_GPTSoVITS_S2Epochs)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_S2Epochs,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "s2迭代轮数")
+            )
+            '''
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedSSL,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练ssl模型路径\n预训练ssl模型（文件夹）的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS1,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练s1模型路径\n预训练s1模型的路径。")
+                )
+            )
+            Train_GPTSoVITS_ModelPathPretrainedS1_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's1bert25hz-5kh-longer-epoch=12-step=369668.ckpt').as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Model_Path_Pretrained_s1',
+                DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS1_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS1_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "ckpt类型 (*.ckpt)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
+            )
+            self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS1_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS1,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练s1模型路径")
             )
-        )
-        Train_GPTSoVITS_ModelDirPretrainedSSL_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-hubert-base').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL,
-            Section = 'GPT-SoVITS Params',
-            Option = 'Model_Dir_Pretrained_ssl',
-            DefaultValue = Train_GPTSoVITS_ModelDirPretrainedSSL_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_ModelDirPretrainedSSL_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
-        )
-        self.ui.Button_Train_GPTSoVITS_ModelDirPretrainedSSL_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedSSL,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练ssl模型路径")
-        )
 
-        self.ui.ToolBox_Train_GPTSoVITS_GPTSoVITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Train_GPTSoVITS_GPTSoVITSParams_AdvanceSettings.widget(0).collapse()
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2G,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练s2G模型路径\n预训练s2G模型的路径。")
+                )
+            )
+            Train_GPTSoVITS_ModelPathPretrainedS2G_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2G2333k.pth').as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Model_Path_Pretrained_s2G',
+                DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS2G_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS2G_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
+            )
+            self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS2G_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2G,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练s2G模型路径")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_FP16Run,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "半精度训练\n通过混合了float16精度的训练方式减小显存占用。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2D,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练s2D模型路径\n预训练s2D模型的路径。")
+                )
+            )
+            Train_GPTSoVITS_ModelPathPretrainedS2D_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2D2333k.pth').as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Model_Path_Pretrained_s2D',
+                DefaultValue = Train_GPTSoVITS_ModelPathPretrainedS2D_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_ModelPathPretrainedS2D_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2'))
+            )
+            self.ui.Button_Train_GPTSoVITS_ModelPathPretrainedS2D_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelPathPretrainedS2D,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练s2D模型路径")
             )
-        )
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
-            Section = 'GPT-SoVITS Params',
-            Option = 'FP16_Run',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Train_GPTSoVITS_FP16Run_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.CheckBox_Train_GPTSoVITS_FP16Run)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_FP16Run,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "半精度训练")
-        )
 
-        self.ui.GroupBox_Train_GPTSoVITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_GPTSoVITS_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedBert,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练bert模型路径\n预训练bert模型（文件夹）的路径。")
+                )
+            )
+            Train_GPTSoVITS_ModelDirPretrainedBert_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-roberta-wwm-ext-large').as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Model_Dir_Pretrained_bert',
+                DefaultValue = Train_GPTSoVITS_ModelDirPretrainedBert_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_ModelDirPretrainedBert_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
+            )
+            self.ui.Button_Train_GPTSoVITS_ModelDirPretrainedBert_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedBert,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练bert模型路径")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n存放训练所得模型的目录的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedSSL,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练ssl模型路径\n预训练ssl模型（文件夹）的路径。")
+                )
+            )
+            Train_GPTSoVITS_ModelDirPretrainedSSL_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-hubert-base').as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL,
+                Section = 'GPT-SoVITS Params',
+                Option = 'Model_Dir_Pretrained_ssl',
+                DefaultValue = Train_GPTSoVITS_ModelDirPretrainedSSL_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_ModelDirPretrainedSSL_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
+            )
+            self.ui.Button_Train_GPTSoVITS_ModelDirPretrainedSSL_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_ModelDirPretrainedSSL,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练ssl模型路径")
             )
-        )
-        Train_GPTSoVITS_OutputDirName_Default = str(date.today())
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Output_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_OutputDirName_Default
-        )
-        self.ui.Button_Train_GPTSoVITS_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
 
-        self.ui.ToolBox_Train_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Train_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_Train_GPTSoVITS_GPTSoVITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Train_GPTSoVITS_GPTSoVITSParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_GPTSoVITS_LogDir,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "日志输出目录\n训练时生成的日志的存放目录。")
-            )
-        )
-        Train_GPTSoVITS_LogDir_Default = Path(Path(CurrentDir).root).joinpath('EVT_TrainLog', 'GPT-SoVITS', str(date.today())).as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_LogDir,
-            Section = 'Output Params',
-            Option = 'Output_LogDir',
-            DefaultValue = Train_GPTSoVITS_LogDir_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_LogDir_Default
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_LogDir.textChanged.connect(
-            lambda Value: (
-                MessageBoxBase.pop(self,
-                    MessageType = QMessageBox.Warning,
-                    WindowTitle = "Warning",
-                    Text = "保存路径不支持非ASCII字符，请使用英文路径以避免训练报错",
-                ),
-                self.ui.LineEdit_Train_GPTSoVITS_LogDir.clear()
-            ) if not all(Char.isascii() for Char in Value) else None
-        )
-        self.ui.LineEdit_Train_GPTSoVITS_LogDir.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(Train_GPTSoVITS_LogDir_Default).parent)
-        )
-        self.ui.Button_Train_GPTSoVITS_LogDir_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_LogDir),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_LogDir.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_GPTSoVITS_LogDir,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "日志输出目录")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_FP16Run,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "半精度训练\n通过混合了float16精度的训练方式减小显存占用。")
+                )
+            )
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
+                Section = 'GPT-SoVITS Params',
+                Option = 'FP16_Run',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Train_GPTSoVITS_FP16Run_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.CheckBox_Train_GPTSoVITS_FP16Run)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_FP16Run,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "半精度训练")
+            )
 
-        LineEdit_Train_GPTSoVITS_OutputDir = QLineEdit()
-        def SetText_LineEdit_Train_GPTSoVITS_OutputDir():
-            DirName = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_Train_GPTSoVITS_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_Train_GPTSoVITS_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.interacted.connect(SetText_LineEdit_Train_GPTSoVITS_OutputDir)
-        self.ui.LineEdit_Train_GPTSoVITS_OutputRoot.interacted.connect(SetText_LineEdit_Train_GPTSoVITS_OutputDir)
-        #SetText_LineEdit_Train_GPTSoVITS_OutputDir()
+            self.ui.GroupBox_Train_GPTSoVITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_GPTSoVITS_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        # GPT-SoVITS - Right
-        MonitorFile_Config_VoiceTrainer_GPTSoVITS = QTasks.MonitorFile(Path_Config_Train_GPTSoVITS)
-        MonitorFile_Config_VoiceTrainer_GPTSoVITS.start()
-        MonitorFile_Config_VoiceTrainer_GPTSoVITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_Train_GPTSoVITS.setText(
-                FileContent
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n存放训练所得模型的目录的名字。")
+                )
+            )
+            Train_GPTSoVITS_OutputDirName_Default = str(date.today())
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Output_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_OutputDirName_Default
+            )
+            self.ui.Button_Train_GPTSoVITS_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
             )
-        )
 
-        self.ui.Button_ResetSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_Train_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_Train_GPTSoVITS.ResetSettings()
-        )
+            self.ui.ToolBox_Train_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Train_GPTSoVITS_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        self.ui.Button_ImportSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_Train_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_Train_GPTSoVITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_GPTSoVITS_LogDir,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "日志输出目录\n训练时生成的日志的存放目录。")
                 )
             )
-        )
-
-        self.ui.Button_ExportSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_Train_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_Train_GPTSoVITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            Train_GPTSoVITS_LogDir_Default = Path(Path(CurrentDir).root).joinpath('EVT_TrainLog', 'GPT-SoVITS', str(date.today())).as_posix()
+            ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_LogDir,
+                Section = 'Output Params',
+                Option = 'Output_LogDir',
+                DefaultValue = Train_GPTSoVITS_LogDir_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_LogDir_Default
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_LogDir.textChanged.connect(
+                lambda Value: (
+                    MessageBoxBase.pop(self,
+                        MessageType = QMessageBox.Warning,
+                        WindowTitle = "Warning",
+                        Text = "保存路径不支持非ASCII字符，请使用英文路径以避免训练报错",
+                    ),
+                    self.ui.LineEdit_Train_GPTSoVITS_LogDir.clear()
+                ) if not all(Char.isascii() for Char in Value) else None
+            )
+            self.ui.LineEdit_Train_GPTSoVITS_LogDir.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(Train_GPTSoVITS_LogDir_Default).parent)
+            )
+            self.ui.Button_Train_GPTSoVITS_LogDir_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_GPTSoVITS.ResetParam(self.ui.LineEdit_Train_GPTSoVITS_LogDir),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_GPTSoVITS_LogDir.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_GPTSoVITS_LogDir,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "日志输出目录")
+            )
+
+            LineEdit_Train_GPTSoVITS_OutputDir = QLineEdit()
+            def SetText_LineEdit_Train_GPTSoVITS_OutputDir():
+                DirName = self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_Train_GPTSoVITS_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_Train_GPTSoVITS_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_Train_GPTSoVITS_OutputDirName.interacted.connect(SetText_LineEdit_Train_GPTSoVITS_OutputDir)
+            self.ui.LineEdit_Train_GPTSoVITS_OutputRoot.interacted.connect(SetText_LineEdit_Train_GPTSoVITS_OutputDir)
+            #SetText_LineEdit_Train_GPTSoVITS_OutputDir()
+
+            # GPT-SoVITS - Right
+            MonitorFile_Config_VoiceTrainer_GPTSoVITS = QTasks.MonitorFile(Path_Config_Train_GPTSoVITS)
+            MonitorFile_Config_VoiceTrainer_GPTSoVITS.start()
+            MonitorFile_Config_VoiceTrainer_GPTSoVITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_Train_GPTSoVITS.setText(
+                    FileContent
                 )
             )
-        )
-
-        self.ui.Button_RunTensorboard_Train_GPTSoVITS.setText(QCA.translate("Button", "启动Tensorboard"))
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_RunTensorboard_Train_GPTSoVITS,
-            Method = Tensorboard_Runner.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_Train_GPTSoVITS_LogDir
-            ]
-        )
 
-        self.ui.Button_CheckOutput_Train_GPTSoVITS.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_Train_GPTSoVITS,
-            URL = self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
+            self.ui.Button_ResetSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_Train_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_Train_GPTSoVITS.ResetSettings()
+            )
 
-        # GPT-SoVITS - Bottom
-        self.ui.Button_Train_GPTSoVITS_Execute.setToolTip("执行模型训练")
-        self.ui.Button_Train_GPTSoVITS_Terminate.setToolTip("终止模型训练")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_Train_GPTSoVITS_Execute,
-            TerminateButton = self.ui.Button_Train_GPTSoVITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_Train_GPTSoVITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Training_GPTSoVITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_Train_GPTSoVITS_FileListPath,
-                #self.ui.SpinBox_Train_GPTSoVITS_S1Epochs,
-                #self.ui.SpinBox_Train_GPTSoVITS_S1SaveInterval,
-                #self.ui.SpinBox_Train_GPTSoVITS_S2Epochs,
-                #self.ui.SpinBox_Train_GPTSoVITS_S2SaveInterval,
-                #self.ui.SpinBox_Train_GPTSoVITS_BatchSize,
-                self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
-                self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert,
-                self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL,
-                self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1,
-                self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G,
-                self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D,
-                self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
-                self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
-                self.ui.LineEdit_Train_GPTSoVITS_LogDir
-            ],
-            SuccessEvents = [
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
+            self.ui.Button_ImportSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_Train_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_Train_GPTSoVITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
-            ]
-        )
-        FunctionSignals.Signal_TaskStatus.connect(
-            lambda Task, Status: MessageBoxBase.pop(self,
-                MessageType = QMessageBox.Question,
-                WindowTitle = "Ask",
-                Text = "是否稍后启用tensorboard？",
-                Buttons = QMessageBox.Yes|QMessageBox.No,
-                ButtonEvents = {QMessageBox.Yes: lambda: self.ui.Button_RunTensorboard_Train_GPTSoVITS.click()}
-            ) if Task == 'Execute_Voice_Training_GPTSoVITS.Execute' and Status == 'Started' else None
-        )
+            )
 
-        # VITS - ParamsManager
-        Path_Config_Train_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Train_VITS.ini'))
-        ParamsManager_Train_VITS = ParamsManager(Path_Config_Train_VITS)
+            self.ui.Button_ExportSettings_Train_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_Train_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_Train_GPTSoVITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
+                )
+            )
 
-        # VITS - Top
-        self.ui.ToolButton_VoiceTrainer_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
-        self.ui.ToolButton_VoiceTrainer_Title_VITS.setCheckable(True)
-        self.ui.ToolButton_VoiceTrainer_Title_VITS.setChecked(False)
-        self.ui.ToolButton_VoiceTrainer_Title_VITS.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceTrainer_Title_VITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_Train,
-                Target = 1
+            self.ui.Button_RunTensorboard_Train_GPTSoVITS.setText(QCA.translate("Button", "启动Tensorboard"))
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_RunTensorboard_Train_GPTSoVITS,
+                Method = Tensorboard_Runner.Execute,
+                ParamsFrom = [
+                    self.ui.LineEdit_Train_GPTSoVITS_LogDir
+                ]
             )
-        )
 
-        # VITS - Left
-        self.ui.TreeWidget_Catalogue_Train_VITS.clear()
-        self.ui.TreeWidget_Catalogue_Train_VITS.setHeaderHidden(True)
+            self.ui.Button_CheckOutput_Train_GPTSoVITS.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_Train_GPTSoVITS,
+                URL = self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # GPT-SoVITS - Bottom
+            self.ui.Button_Train_GPTSoVITS_Execute.setToolTip("执行模型训练")
+            self.ui.Button_Train_GPTSoVITS_Terminate.setToolTip("终止模型训练")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_Train_GPTSoVITS_Execute,
+                TerminateButton = self.ui.Button_Train_GPTSoVITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_Train_GPTSoVITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Training_GPTSoVITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_Train_GPTSoVITS_FileListPath,
+                    #self.ui.SpinBox_Train_GPTSoVITS_S1Epochs,
+                    #self.ui.SpinBox_Train_GPTSoVITS_S1SaveInterval,
+                    #self.ui.SpinBox_Train_GPTSoVITS_S2Epochs,
+                    #self.ui.SpinBox_Train_GPTSoVITS_S2SaveInterval,
+                    #self.ui.SpinBox_Train_GPTSoVITS_BatchSize,
+                    self.ui.CheckBox_Train_GPTSoVITS_FP16Run,
+                    self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedBert,
+                    self.ui.LineEdit_Train_GPTSoVITS_ModelDirPretrainedSSL,
+                    self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS1,
+                    self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2G,
+                    self.ui.LineEdit_Train_GPTSoVITS_ModelPathPretrainedS2D,
+                    self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
+                    self.ui.LineEdit_Train_GPTSoVITS_OutputDirName,
+                    self.ui.LineEdit_Train_GPTSoVITS_LogDir
+                ],
+                SuccessEvents = [
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
 
-        # VITS - Midlle
-        self.ui.GroupBox_Train_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_VITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # VITS - ParamsManager
+            Path_Config_Train_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_Train_VITS.ini'))
+            ParamsManager_Train_VITS = ParamsManager(Path_Config_Train_VITS)
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_FileListPathTraining,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "训练集文本路径\n用于提供训练集音频路径及其语音内容的训练集txt文件的路径。")
+            # VITS - Top
+            self.ui.ToolButton_VoiceTrainer_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
+            self.ui.ToolButton_VoiceTrainer_Title_VITS.setCheckable(True)
+            self.ui.ToolButton_VoiceTrainer_Title_VITS.setChecked(False)
+            self.ui.ToolButton_VoiceTrainer_Title_VITS.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceTrainer_Title_VITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_Train,
+                    Target = 1
+                )
             )
-        )
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_FileListPathTraining,
-            Section = 'Input Params',
-            Option = 'FileList_Path_Training',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_Train_VITS_FileListPathTraining.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "txt类型 (*.txt)",
-            Directory = Path(CurrentDir).joinpath('数据集制作结果', 'VITS').as_posix()
-        )
-        self.ui.Button_Train_VITS_FileListPathTraining_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_FileListPathTraining),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_FileListPathTraining.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_FileListPathTraining,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "训练集文本路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_FileListPathValidation,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "验证集文本路径\n用于提供验证集音频路径及其语音内容的验证集txt文件的路径。")
-            )
-        )
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_FileListPathValidation,
-            Section = 'Input Params',
-            Option = 'FileList_Path_Validation',
-            DefaultValue = '',
-            SetPlaceholderText = True
-        )
-        self.ui.LineEdit_Train_VITS_FileListPathValidation.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "txt类型 (*.txt)",
-            Directory = Path(CurrentDir).joinpath('数据集制作结果', 'VITS').as_posix()
-        )
-        self.ui.Button_Train_VITS_FileListPathValidation_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_FileListPathValidation),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_FileListPathValidation.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_FileListPathValidation,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "验证集文本路径")
-        )
+            # VITS - Left
+            self.ui.TreeWidget_Catalogue_Train_VITS.clear()
+            self.ui.TreeWidget_Catalogue_Train_VITS.setHeaderHidden(True)
 
-        self.ui.GroupBox_Train_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "训练参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_VITS_VITSParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数")
-        )
+            # VITS - Midlle
+            self.ui.GroupBox_Train_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_VITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_Epochs,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "迭代轮数\n将全部样本完整迭代一轮的次数。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_FileListPathTraining,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "训练集文本路径\n用于提供训练集音频路径及其语音内容的训练集txt文件的路径。")
+                )
+            )
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_FileListPathTraining,
+                Section = 'Input Params',
+                Option = 'FileList_Path_Training',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_Train_VITS_FileListPathTraining.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "txt类型 (*.txt)",
+                Directory = Path(CurrentDir).joinpath('数据集制作结果', 'VITS').as_posix()
+            )
+            self.ui.Button_Train_VITS_FileListPathTraining_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_FileListPathTraining),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_FileListPathTraining.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_FileListPathTraining,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "训练集文本路径")
             )
-        )
-        self.ui.SpinBox_Train_VITS_Epochs.setRange(10, 100000)
-        self.ui.SpinBox_Train_VITS_Epochs.setSingleStep(1)
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.SpinBox_Train_VITS_Epochs,
-            Section = 'VITS Params',
-            Option = 'Epochs',
-            DefaultValue = 1000
-        )
-        self.ui.Button_Train_VITS_Epochs_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_Epochs)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_Epochs,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "迭代轮数")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_BatchSize,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "批处理量\n每轮迭代中单位批次的样本数量，需根据GPU的性能调节该值。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_FileListPathValidation,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "验证集文本路径\n用于提供验证集音频路径及其语音内容的验证集txt文件的路径。")
+                )
+            )
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_FileListPathValidation,
+                Section = 'Input Params',
+                Option = 'FileList_Path_Validation',
+                DefaultValue = '',
+                SetPlaceholderText = True
+            )
+            self.ui.LineEdit_Train_VITS_FileListPathValidation.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "txt类型 (*.txt)",
+                Directory = Path(CurrentDir).joinpath('数据集制作结果', 'VITS').as_posix()
+            )
+            self.ui.Button_Train_VITS_FileListPathValidation_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_FileListPathValidation),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_FileListPathValidation.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_FileListPathValidation,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "验证集文本路径")
             )
-        )
-        self.ui.SpinBox_Train_VITS_BatchSize.setRange(2, 128)
-        self.ui.SpinBox_Train_VITS_BatchSize.setSingleStep(1)
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.SpinBox_Train_VITS_BatchSize,
-            Section = 'VITS Params',
-            Option = 'Batch_Size',
-            DefaultValue = 4
-        )
-        self.ui.SpinBox_Train_VITS_BatchSize.setToolTip("建议：2~4G: 2\n6~8G: 4\n10~12G: 8\n14~16G: 16")
-        self.ui.Button_Train_VITS_BatchSize_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_BatchSize)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_BatchSize,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "批处理量")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_UsePretrainedModels,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "使用预训练模型\n使用预训练模型（底模），其载入优先级高于检查点。")
+            self.ui.GroupBox_Train_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "训练参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_VITS_VITSParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数")
             )
-        )
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.CheckBox_Train_VITS_UsePretrainedModels,
-            Section = 'VITS Params',
-            Option = 'Use_PretrainedModels',
-            DefaultValue = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Train_VITS_UsePretrainedModels,
-            CheckedText = "已启用",
-            CheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_Train_VITS_ModelPathPretrainedG,
-                        self.ui.Frame_Train_VITS_ModelPathPretrainedD,
-                        self.ui.Frame_Train_VITS_KeepOriginalSpeakers,
-                        self.ui.Frame_Train_VITS_ConfigPathLoad if self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers.isChecked() else None
-                    ],
-                    True
-                )
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_Train_VITS_ModelPathPretrainedG,
-                        self.ui.Frame_Train_VITS_ModelPathPretrainedD,
-                        self.ui.Frame_Train_VITS_KeepOriginalSpeakers,
-                        self.ui.Frame_Train_VITS_ConfigPathLoad
-                    ],
-                    False
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_Epochs,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "迭代轮数\n将全部样本完整迭代一轮的次数。")
                 )
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Train_VITS_UsePretrainedModels_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_UsePretrainedModels)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_UsePretrainedModels,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "使用预训练模型")
-        )
+            )
+            self.ui.SpinBox_Train_VITS_Epochs.setRange(10, 100000)
+            self.ui.SpinBox_Train_VITS_Epochs.setSingleStep(1)
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.SpinBox_Train_VITS_Epochs,
+                Section = 'VITS Params',
+                Option = 'Epochs',
+                DefaultValue = 1000
+            )
+            self.ui.Button_Train_VITS_Epochs_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_Epochs)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_Epochs,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "迭代轮数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_ModelPathPretrainedG,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练G模型路径\n预训练生成器（Generator）模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_BatchSize,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "批处理量\n每轮迭代中单位批次的样本数量，需根据GPU的性能调节该值。")
+                )
+            )
+            self.ui.SpinBox_Train_VITS_BatchSize.setRange(2, 128)
+            self.ui.SpinBox_Train_VITS_BatchSize.setSingleStep(1)
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.SpinBox_Train_VITS_BatchSize,
+                Section = 'VITS Params',
+                Option = 'Batch_Size',
+                DefaultValue = 4
+            )
+            self.ui.SpinBox_Train_VITS_BatchSize.setToolTip("建议：2~4G: 2\n6~8G: 4\n10~12G: 8\n14~16G: 16")
+            self.ui.Button_Train_VITS_BatchSize_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_BatchSize)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_BatchSize,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "批处理量")
             )
-        )
-        Train_VITS_ModelPathPretrainedG_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_G.pth').as_posix()
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
-            Section = 'VITS Params',
-            Option = 'Model_Path_Pretrained_G',
-            DefaultValue = Train_VITS_ModelPathPretrainedG_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_ModelPathPretrainedG_Default
-        )
-        self.ui.LineEdit_Train_VITS_ModelPathPretrainedG.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
-        )
-        self.ui.Button_Train_VITS_ModelPathPretrainedG_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ModelPathPretrainedG),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ModelPathPretrainedG.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_ModelPathPretrainedG,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练G模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_ModelPathPretrainedD,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练D模型路径\n预训练判别器（Discriminator）模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_UsePretrainedModels,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "使用预训练模型\n使用预训练模型（底模），其载入优先级高于检查点。")
+                )
+            )
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.CheckBox_Train_VITS_UsePretrainedModels,
+                Section = 'VITS Params',
+                Option = 'Use_PretrainedModels',
+                DefaultValue = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Train_VITS_UsePretrainedModels,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_Train_VITS_ModelPathPretrainedG,
+                            self.ui.Frame_Train_VITS_ModelPathPretrainedD,
+                            self.ui.Frame_Train_VITS_KeepOriginalSpeakers,
+                            self.ui.Frame_Train_VITS_ConfigPathLoad if self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers.isChecked() else None
+                        ],
+                        True
+                    )
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_Train_VITS_ModelPathPretrainedG,
+                            self.ui.Frame_Train_VITS_ModelPathPretrainedD,
+                            self.ui.Frame_Train_VITS_KeepOriginalSpeakers,
+                            self.ui.Frame_Train_VITS_ConfigPathLoad
+                        ],
+                        False
+                    )
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Train_VITS_UsePretrainedModels_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_UsePretrainedModels)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_UsePretrainedModels,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "使用预训练模型")
             )
-        )
-        Train_VITS_ModelPathPretrainedD_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_D.pth').as_posix()
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_ModelPathPretrainedD,
-            Section = 'VITS Params',
-            Option = 'Model_Path_Pretrained_D',
-            DefaultValue = Train_VITS_ModelPathPretrainedD_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_ModelPathPretrainedD_Default
-        )
-        self.ui.LineEdit_Train_VITS_ModelPathPretrainedD.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
-        )
-        self.ui.Button_Train_VITS_ModelPathPretrainedD_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ModelPathPretrainedD),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ModelPathPretrainedD.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_ModelPathPretrainedD,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "预训练D模型路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_KeepOriginalSpeakers,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "保留原说话人（实验性）\n保留预训练模型中原有的说话人。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_ModelPathPretrainedG,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练G模型路径\n预训练生成器（Generator）模型的路径。")
+                )
             )
-        )
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
-            Section = 'VITS Params',
-            Option = 'Keep_Original_Speakers',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
-            CheckedText = "已启用",
-            CheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_Train_VITS_ConfigPathLoad
-                    ],
-                    True
+            Train_VITS_ModelPathPretrainedG_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_G.pth').as_posix()
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
+                Section = 'VITS Params',
+                Option = 'Model_Path_Pretrained_G',
+                DefaultValue = Train_VITS_ModelPathPretrainedG_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_ModelPathPretrainedG_Default
+            )
+            self.ui.LineEdit_Train_VITS_ModelPathPretrainedG.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
+            )
+            self.ui.Button_Train_VITS_ModelPathPretrainedG_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ModelPathPretrainedG),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ModelPathPretrainedG.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_ModelPathPretrainedG,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练G模型路径")
+            )
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_ModelPathPretrainedD,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练D模型路径\n预训练判别器（Discriminator）模型的路径。")
                 )
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-                lambda: Function_SetChildWidgetsVisibility(
-                    self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
-                    [
-                        self.ui.Frame_Train_VITS_ConfigPathLoad
-                    ],
-                    False
+            )
+            Train_VITS_ModelPathPretrainedD_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_D.pth').as_posix()
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_ModelPathPretrainedD,
+                Section = 'VITS Params',
+                Option = 'Model_Path_Pretrained_D',
+                DefaultValue = Train_VITS_ModelPathPretrainedD_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_ModelPathPretrainedD_Default
+            )
+            self.ui.LineEdit_Train_VITS_ModelPathPretrainedD.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
+            )
+            self.ui.Button_Train_VITS_ModelPathPretrainedD_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ModelPathPretrainedD),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ModelPathPretrainedD.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_ModelPathPretrainedD,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "预训练D模型路径")
+            )
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_KeepOriginalSpeakers,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "保留原说话人（实验性）\n保留预训练模型中原有的说话人。")
                 )
-            ],
-            TakeEffect = True
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
-            CheckedEvents = [
-                lambda: MessageBoxBase.pop(self,
-                    MessageType = QMessageBox.Question,
-                    WindowTitle = "Tip",
-                    Text = """
+            )
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
+                Section = 'VITS Params',
+                Option = 'Keep_Original_Speakers',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_Train_VITS_ConfigPathLoad
+                        ],
+                        True
+                    )
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                    lambda: Function_SetChildWidgetsVisibility(
+                        self.ui.Frame_Train_VITS_VITSParams_BasicSettings,
+                        [
+                            self.ui.Frame_Train_VITS_ConfigPathLoad
+                        ],
+                        False
+                    )
+                ],
+                TakeEffect = True
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
+                CheckedEvents = [
+                    lambda: MessageBoxBase.pop(self,
+                        MessageType = QMessageBox.Question,
+                        WindowTitle = "Tip",
+                        Text = """
                         开启该实验性功能需要注意以下几点：
                         1. 为防止老角色的音色在训练过程中被逐渐遗忘，请保证每个原角色至少有一两条音频参与训练。\n
                         2. 为防止老角色的顺序被重组（导致音色混乱），请在下方设置包含了底模角色信息的配置文件路径。
                     """,
-                    Buttons = QMessageBox.Yes|QMessageBox.No,
-                    ButtonEvents = {QMessageBox.No: lambda: self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers.setChecked(False)}
-                )
-            ],
-            TakeEffect = False
-        )
-        self.ui.Button_Train_VITS_KeepOriginalSpeakers_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_KeepOriginalSpeakers,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "保留原说话人")
-        )
+                        Buttons = QMessageBox.Yes|QMessageBox.No,
+                        ButtonEvents = {QMessageBox.No: lambda: self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers.setChecked(False)}
+                    )
+                ],
+                TakeEffect = False
+            )
+            self.ui.Button_Train_VITS_KeepOriginalSpeakers_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_KeepOriginalSpeakers,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "保留原说话人")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_ConfigPathLoad,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "配置加载路径\n用于加载底模人物信息的配置文件的路径")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_ConfigPathLoad,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "配置加载路径\n用于加载底模人物信息的配置文件的路径")
+                )
+            )
+            Train_VITS_ConfigPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_Config.json').as_posix()
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_ConfigPathLoad,
+                Section = 'VITS Params',
+                Option = 'Config_Path_Load',
+                DefaultValue = Train_VITS_ConfigPathLoad_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_ConfigPathLoad_Default
+            )
+            self.ui.LineEdit_Train_VITS_ConfigPathLoad.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "json类型 (*.json)",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
+            )
+            self.ui.Button_Train_VITS_ConfigPathLoad_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ConfigPathLoad),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ConfigPathLoad.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_ConfigPathLoad,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "配置加载路径")
             )
-        )
-        Train_VITS_ConfigPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_Config.json').as_posix()
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_ConfigPathLoad,
-            Section = 'VITS Params',
-            Option = 'Config_Path_Load',
-            DefaultValue = Train_VITS_ConfigPathLoad_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_ConfigPathLoad_Default
-        )
-        self.ui.LineEdit_Train_VITS_ConfigPathLoad.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "json类型 (*.json)",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded'))
-        )
-        self.ui.Button_Train_VITS_ConfigPathLoad_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_ConfigPathLoad),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_ConfigPathLoad.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_ConfigPathLoad,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "配置加载路径")
-        )
 
-        self.ui.ToolBox_Train_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Train_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_Train_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Train_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_NumWorkers,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "进程数量\n进行数据加载时可并行的进程数量，需根据CPU的性能调节该值。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_NumWorkers,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "进程数量\n进行数据加载时可并行的进程数量，需根据CPU的性能调节该值。")
+                )
+            )
+            self.ui.SpinBox_Train_VITS_NumWorkers.setRange(2, 128)
+            self.ui.SpinBox_Train_VITS_NumWorkers.setSingleStep(2)
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.SpinBox_Train_VITS_NumWorkers,
+                Section = 'VITS Params',
+                Option = 'Num_Workers',
+                DefaultValue = 4
+            )
+            self.ui.Button_Train_VITS_NumWorkers_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_NumWorkers)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_NumWorkers,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "进程数量")
             )
-        )
-        self.ui.SpinBox_Train_VITS_NumWorkers.setRange(2, 128)
-        self.ui.SpinBox_Train_VITS_NumWorkers.setSingleStep(2)
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.SpinBox_Train_VITS_NumWorkers,
-            Section = 'VITS Params',
-            Option = 'Num_Workers',
-            DefaultValue = 4
-        )
-        self.ui.Button_Train_VITS_NumWorkers_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_NumWorkers)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_NumWorkers,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "进程数量")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_FP16Run,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "半精度训练\n通过混合了float16精度的训练方式减小显存占用以支持更大的批处理量。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_FP16Run,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "半精度训练\n通过混合了float16精度的训练方式减小显存占用以支持更大的批处理量。")
+                )
+            )
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.CheckBox_Train_VITS_FP16Run,
+                Section = 'VITS Params',
+                Option = 'FP16_Run',
+                DefaultValue = False
+            )
+            Function_ConfigureCheckBox(
+                CheckBox = self.ui.CheckBox_Train_VITS_FP16Run,
+                CheckedText = "已启用",
+                CheckedEvents = [
+                ],
+                UncheckedText = "未启用",
+                UncheckedEvents = [
+                ],
+                TakeEffect = True
+            )
+            self.ui.Button_Train_VITS_FP16Run_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_FP16Run)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_FP16Run,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "训练参数"),
+                ChildItemText = QCA.translate("Tree", "半精度训练")
             )
-        )
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.CheckBox_Train_VITS_FP16Run,
-            Section = 'VITS Params',
-            Option = 'FP16_Run',
-            DefaultValue = False
-        )
-        Function_ConfigureCheckBox(
-            CheckBox = self.ui.CheckBox_Train_VITS_FP16Run,
-            CheckedText = "已启用",
-            CheckedEvents = [
-            ],
-            UncheckedText = "未启用",
-            UncheckedEvents = [
-            ],
-            TakeEffect = True
-        )
-        self.ui.Button_Train_VITS_FP16Run_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.CheckBox_Train_VITS_FP16Run)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_FP16Run,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "训练参数"),
-            ChildItemText = QCA.translate("Tree", "半精度训练")
-        )
 
-        self.ui.GroupBox_Train_VITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_Train_VITS_OutputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数")
-        )
+            self.ui.GroupBox_Train_VITS_OutputParams.setTitle(QCA.translate("GroupBox", "输出参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_Train_VITS_OutputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_EvalInterval,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "保存间隔\n每次保存模型所间隔的步数。PS: 步数 ≈ 迭代轮次 * 训练样本数 / 批处理量")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_EvalInterval,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "保存间隔\n每次保存模型所间隔的步数。PS: 步数 ≈ 迭代轮次 * 训练样本数 / 批处理量")
+                )
+            )
+            self.ui.SpinBox_Train_VITS_EvalInterval.setRange(10, 100000)
+            self.ui.SpinBox_Train_VITS_EvalInterval.setSingleStep(1)
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.SpinBox_Train_VITS_EvalInterval,
+                Section = 'Output Params',
+                Option = 'Eval_Interval',
+                DefaultValue = 1000
+            )
+            self.ui.SpinBox_Train_VITS_EvalInterval.setToolTip("提示：设置过小可能导致磁盘占用激增哦")
+            self.ui.Button_Train_VITS_EvalInterval_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_EvalInterval)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_EvalInterval,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "保存间隔")
             )
-        )
-        self.ui.SpinBox_Train_VITS_EvalInterval.setRange(10, 100000)
-        self.ui.SpinBox_Train_VITS_EvalInterval.setSingleStep(1)
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.SpinBox_Train_VITS_EvalInterval,
-            Section = 'Output Params',
-            Option = 'Eval_Interval',
-            DefaultValue = 1000
-        )
-        self.ui.SpinBox_Train_VITS_EvalInterval.setToolTip("提示：设置过小可能导致磁盘占用激增哦")
-        self.ui.Button_Train_VITS_EvalInterval_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.SpinBox_Train_VITS_EvalInterval)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_EvalInterval,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "保存间隔")
-        )
 
-        self.ui.ToolBox_Train_VITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_Train_VITS_OutputParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_Train_VITS_OutputParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_Train_VITS_OutputParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_OutputDirName,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输出目录名\n存放训练所得模型的目录的名字，若目录中已存在模型则会将其视为检查点。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_OutputDirName,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输出目录名\n存放训练所得模型的目录的名字，若目录中已存在模型则会将其视为检查点。")
+                )
+            )
+            Train_VITS_OutputDirName_Default = str(date.today())
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_OutputDirName,
+                Section = 'Output Params',
+                Option = 'Output_Dir_Name',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_OutputDirName_Default
+            )
+            self.ui.Button_Train_VITS_OutputDirName_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_OutputDirName),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_OutputDirName.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_OutputDirName,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "输出目录名")
+            )
+
+            LineEdit_Train_VITS_OutputDir = QLineEdit()
+            def SetText_LineEdit_Train_VITS_OutputDir():
+                DirName = self.ui.LineEdit_Train_VITS_OutputDirName.text()
+                if len(DirName.strip()) == 0:
+                    Alert = False
+                else:
+                    DirText = Path(self.ui.LineEdit_Train_VITS_OutputRoot.text()).joinpath(DirName).as_posix()
+                    LineEdit_Train_VITS_OutputDir.setText(DirText)
+                    Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
+                self.ui.LineEdit_Train_VITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
+            self.ui.LineEdit_Train_VITS_OutputDirName.interacted.connect(SetText_LineEdit_Train_VITS_OutputDir)
+            self.ui.LineEdit_Train_VITS_OutputRoot.interacted.connect(SetText_LineEdit_Train_VITS_OutputDir)
+            #SetText_LineEdit_Train_VITS_OutputDir()
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_Train_VITS_LogDir,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "日志输出目录\n训练时生成的日志的存放目录。")
+                )
+            )
+            Train_VITS_LogDir_Default = Path(Path(CurrentDir).root).joinpath('EVT_TrainLog', 'VITS', str(date.today())).as_posix()
+            ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_LogDir,
+                Section = 'Output Params',
+                Option = 'Output_LogDir',
+                DefaultValue = Train_VITS_LogDir_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_LogDir_Default
+            )
+            self.ui.LineEdit_Train_VITS_LogDir.textChanged.connect(
+                lambda Value: (
+                    MessageBoxBase.pop(self,
+                        MessageType = QMessageBox.Warning,
+                        WindowTitle = "Warning",
+                        Text = "保存路径不支持非ASCII字符，请使用英文路径以避免训练报错",
+                    ),
+                    self.ui.LineEdit_Train_VITS_LogDir.clear()
+                ) if not all(Char.isascii() for Char in Value) else None
+            )
+            self.ui.LineEdit_Train_VITS_LogDir.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(Train_VITS_LogDir_Default).parent)
+            )
+            self.ui.Button_Train_VITS_LogDir_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_LogDir),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_LogDir.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_Train_VITS_LogDir,
+                TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
+                RootItemText = QCA.translate("Tree", "输出参数"),
+                ChildItemText = QCA.translate("Tree", "日志输出目录")
             )
-        )
-        Train_VITS_OutputDirName_Default = str(date.today())
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_OutputDirName,
-            Section = 'Output Params',
-            Option = 'Output_Dir_Name',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_OutputDirName_Default
-        )
-        self.ui.Button_Train_VITS_OutputDirName_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_OutputDirName),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_OutputDirName.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_OutputDirName,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "输出目录名")
-        )
-
-        LineEdit_Train_VITS_OutputDir = QLineEdit()
-        def SetText_LineEdit_Train_VITS_OutputDir():
-            DirName = self.ui.LineEdit_Train_VITS_OutputDirName.text()
-            if len(DirName.strip()) == 0:
-                Alert = False
-            else:
-                DirText = Path(self.ui.LineEdit_Train_VITS_OutputRoot.text()).joinpath(DirName).as_posix()
-                LineEdit_Train_VITS_OutputDir.setText(DirText)
-                Alert = Path(DirText).exists() and list(Path(DirText).iterdir()) != []
-            self.ui.LineEdit_Train_VITS_OutputDirName.Alert(True if Alert else False, "注意：目录已包含文件")
-        self.ui.LineEdit_Train_VITS_OutputDirName.interacted.connect(SetText_LineEdit_Train_VITS_OutputDir)
-        self.ui.LineEdit_Train_VITS_OutputRoot.interacted.connect(SetText_LineEdit_Train_VITS_OutputDir)
-        #SetText_LineEdit_Train_VITS_OutputDir()
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_Train_VITS_LogDir,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "日志输出目录\n训练时生成的日志的存放目录。")
-            )
-        )
-        Train_VITS_LogDir_Default = Path(Path(CurrentDir).root).joinpath('EVT_TrainLog', 'VITS', str(date.today())).as_posix()
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_LogDir,
-            Section = 'Output Params',
-            Option = 'Output_LogDir',
-            DefaultValue = Train_VITS_LogDir_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_LogDir_Default
-        )
-        self.ui.LineEdit_Train_VITS_LogDir.textChanged.connect(
-            lambda Value: (
-                MessageBoxBase.pop(self,
-                    MessageType = QMessageBox.Warning,
-                    WindowTitle = "Warning",
-                    Text = "保存路径不支持非ASCII字符，请使用英文路径以避免训练报错",
-                ),
-                self.ui.LineEdit_Train_VITS_LogDir.clear()
-            ) if not all(Char.isascii() for Char in Value) else None
-        )
-        self.ui.LineEdit_Train_VITS_LogDir.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(Train_VITS_LogDir_Default).parent)
-        )
-        self.ui.Button_Train_VITS_LogDir_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_Train_VITS.ResetParam(self.ui.LineEdit_Train_VITS_LogDir),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_Train_VITS_LogDir.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_Train_VITS_LogDir,
-            TreeWidget = self.ui.TreeWidget_Catalogue_Train_VITS,
-            RootItemText = QCA.translate("Tree", "输出参数"),
-            ChildItemText = QCA.translate("Tree", "日志输出目录")
-        )
 
-        # VITS - Right
-        MonitorFile_Config_VoiceTrainer_VITS = QTasks.MonitorFile(Path_Config_Train_VITS)
-        MonitorFile_Config_VoiceTrainer_VITS.start()
-        MonitorFile_Config_VoiceTrainer_VITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_Train_VITS.setText(
-                FileContent
+            # VITS - Right
+            MonitorFile_Config_VoiceTrainer_VITS = QTasks.MonitorFile(Path_Config_Train_VITS)
+            MonitorFile_Config_VoiceTrainer_VITS.start()
+            MonitorFile_Config_VoiceTrainer_VITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_Train_VITS.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_Train_VITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_Train_VITS.clicked.connect(
-            lambda: ParamsManager_Train_VITS.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_Train_VITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_Train_VITS.clicked.connect(
+                lambda: ParamsManager_Train_VITS.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_Train_VITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_Train_VITS.clicked.connect(
-            lambda: ParamsManager_Train_VITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_Train_VITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_Train_VITS.clicked.connect(
+                lambda: ParamsManager_Train_VITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_Train_VITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_Train_VITS.clicked.connect(
-            lambda: ParamsManager_Train_VITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_Train_VITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_Train_VITS.clicked.connect(
+                lambda: ParamsManager_Train_VITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
-
-        self.ui.Button_RunTensorboard_Train_VITS.setText(QCA.translate("Button", "启动Tensorboard"))
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_RunTensorboard_Train_VITS,
-            Method = Tensorboard_Runner.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_Train_VITS_LogDir
-            ]
-        )
 
-        self.ui.Button_CheckOutput_Train_VITS.setText(QCA.translate("Button", "打开输出目录"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_Train_VITS,
-            URL = self.ui.LineEdit_Train_VITS_OutputRoot,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
+            self.ui.Button_RunTensorboard_Train_VITS.setText(QCA.translate("Button", "启动Tensorboard"))
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_RunTensorboard_Train_VITS,
+                Method = Tensorboard_Runner.Execute,
+                ParamsFrom = [
+                    self.ui.LineEdit_Train_VITS_LogDir
+                ]
+            )
 
-        # VITS - Bottom
-        self.ui.Button_Train_VITS_Execute.setToolTip("执行模型训练")
-        self.ui.Button_Train_VITS_Terminate.setToolTip("终止模型训练")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_Train_VITS_Execute,
-            TerminateButton = self.ui.Button_Train_VITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_Train_VITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Training_VITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_Train_VITS_FileListPathTraining,
-                self.ui.LineEdit_Train_VITS_FileListPathValidation,
-                self.ui.SpinBox_Train_VITS_Epochs,
-                self.ui.SpinBox_Train_VITS_EvalInterval,
-                self.ui.SpinBox_Train_VITS_BatchSize,
-                self.ui.CheckBox_Train_VITS_FP16Run,
-                self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
-                self.ui.LineEdit_Train_VITS_ConfigPathLoad,
-                self.ui.SpinBox_Train_VITS_NumWorkers,
-                self.ui.CheckBox_Train_VITS_UsePretrainedModels,
-                self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
-                self.ui.LineEdit_Train_VITS_ModelPathPretrainedD,
-                self.ui.LineEdit_Train_VITS_OutputRoot,
-                self.ui.LineEdit_Train_VITS_OutputDirName,
-                'Config.json',
-                self.ui.LineEdit_Train_VITS_LogDir
-            ],
-            EmptyAllowed = [
-                self.ui.LineEdit_Train_VITS_ConfigPathLoad,
-                self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
-                self.ui.LineEdit_Train_VITS_ModelPathPretrainedD
-            ],
-            SuccessEvents = [
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
-        FunctionSignals.Signal_TaskStatus.connect(
-            lambda Task, Status: MessageBoxBase.pop(self,
-                MessageType = QMessageBox.Question,
-                WindowTitle = "Ask",
-                Text = "是否稍后启用tensorboard？",
-                Buttons = QMessageBox.Yes|QMessageBox.No,
-                ButtonEvents = {QMessageBox.Yes: lambda: self.ui.Button_RunTensorboard_Train_VITS.click()}
-            ) if Task == 'Execute_Voice_Training_VITS.Execute' and Status == 'Started' else None
-        )
+            self.ui.Button_CheckOutput_Train_VITS.setText(QCA.translate("Button", "打开输出目录"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_Train_VITS,
+                URL = self.ui.LineEdit_Train_VITS_OutputRoot,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # VITS - Bottom
+            self.ui.Button_Train_VITS_Execute.setToolTip("执行模型训练")
+            self.ui.Button_Train_VITS_Terminate.setToolTip("终止模型训练")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_Train_VITS_Execute,
+                TerminateButton = self.ui.Button_Train_VITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_Train_VITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Training_VITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_Train_VITS_FileListPathTraining,
+                    self.ui.LineEdit_Train_VITS_FileListPathValidation,
+                    self.ui.SpinBox_Train_VITS_Epochs,
+                    self.ui.SpinBox_Train_VITS_EvalInterval,
+                    self.ui.SpinBox_Train_VITS_BatchSize,
+                    self.ui.CheckBox_Train_VITS_FP16Run,
+                    self.ui.CheckBox_Train_VITS_KeepOriginalSpeakers,
+                    self.ui.LineEdit_Train_VITS_ConfigPathLoad,
+                    self.ui.SpinBox_Train_VITS_NumWorkers,
+                    self.ui.CheckBox_Train_VITS_UsePretrainedModels,
+                    self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
+                    self.ui.LineEdit_Train_VITS_ModelPathPretrainedD,
+                    self.ui.LineEdit_Train_VITS_OutputRoot,
+                    self.ui.LineEdit_Train_VITS_OutputDirName,
+                    'Config.json',
+                    self.ui.LineEdit_Train_VITS_LogDir
+                ],
+                EmptyAllowed = [
+                    self.ui.LineEdit_Train_VITS_ConfigPathLoad,
+                    self.ui.LineEdit_Train_VITS_ModelPathPretrainedG,
+                    self.ui.LineEdit_Train_VITS_ModelPathPretrainedD
+                ],
+                SuccessEvents = [
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_Train, SetupPage_Train)
 
         #############################################################
         ######################## Content: TTS #######################
@@ -5399,702 +5386,709 @@ class MainWindow(Window_MainWindow):
             ) if eval(Config.GetValue('Dialog', 'GuidanceShown_TTS', 'False')) is False else None
         )
 
-        # GPT-SoVITS - ParamsManager
-        Path_Config_TTS_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_TTS_GPT-SoVITS.ini'))
-        ParamsManager_TTS_GPTSoVITS = ParamsManager(Path_Config_TTS_GPTSoVITS)
+        # Set up the rest of the page the first time it is shown
+        def SetupPage_TTS():
+            nonlocal ParamsManager_TTS_GPTSoVITS, ParamsManager_TTS_VITS
 
-        # GPT-SoVITS - Top
-        self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
-        self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setCheckable(True)
-        self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setChecked(True)
-        self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_TTS,
-                Target = 0
+            # GPT-SoVITS - ParamsManager
+            Path_Config_TTS_GPTSoVITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_TTS_GPT-SoVITS.ini'))
+            ParamsManager_TTS_GPTSoVITS = ParamsManager(Path_Config_TTS_GPTSoVITS)
+
+            # GPT-SoVITS - Top
+            self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setText(QCA.translate("ToolButton", "GPT-SoVITS"))
+            self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setCheckable(True)
+            self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setChecked(True)
+            self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceConverter_Title_GPTSoVITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_TTS,
+                    Target = 0
+                )
             )
-        )
 
-        # GPT-SoVITS - Left
-        self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS.clear()
-        self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS.setHeaderHidden(True)
+            # GPT-SoVITS - Left
+            self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS.clear()
+            self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS.setHeaderHidden(True)
 
-        # GPT-SoVTIS - Middle
-        self.ui.GroupBox_TTS_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_TTS_GPTSoVITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # GPT-SoVTIS - Middle
+            self.ui.GroupBox_TTS_GPTSoVITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_TTS_GPTSoVITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS1,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "s1模型加载路径\ns1模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS1,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "s1模型加载路径\ns1模型的路径。")
+                )
+            )
+            TTS_GPTSoVITS_ModelPathLoadS1_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's1bert25hz-5kh-longer-epoch=12-step=369668.ckpt').as_posix()
+            ParamsManager_TTS_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1,
+                Section = 'Input Params',
+                Option = 'Model_Path_Load_s1',
+                DefaultValue = TTS_GPTSoVITS_ModelPathLoadS1_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_GPTSoVITS_ModelPathLoadS1_Default
+            )
+            self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "ckpt类型 (*.ckpt)",
+                Directory = Path(CurrentDir).joinpath('模型训练结果', 'GPT-SoVITS').as_posix()
+            )
+            self.ui.Button_TTS_GPTSoVITS_ModelPathLoadS1_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS1,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "s1模型加载路径")
             )
-        )
-        TTS_GPTSoVITS_ModelPathLoadS1_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's1bert25hz-5kh-longer-epoch=12-step=369668.ckpt').as_posix()
-        ParamsManager_TTS_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1,
-            Section = 'Input Params',
-            Option = 'Model_Path_Load_s1',
-            DefaultValue = TTS_GPTSoVITS_ModelPathLoadS1_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_GPTSoVITS_ModelPathLoadS1_Default
-        )
-        self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "ckpt类型 (*.ckpt)",
-            Directory = Path(CurrentDir).joinpath('模型训练结果', 'GPT-SoVITS').as_posix()
-        )
-        self.ui.Button_TTS_GPTSoVITS_ModelPathLoadS1_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS1,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "s1模型加载路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS2G,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "s2G模型加载路径\ns2G模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS2G,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "s2G模型加载路径\ns2G模型的路径。")
+                )
+            )
+            TTS_GPTSoVITS_ModelPathLoadS2G_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2G2333k.pth').as_posix()
+            ParamsManager_TTS_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G,
+                Section = 'Input Params',
+                Option = 'Model_Path_Load_s2G',
+                DefaultValue = TTS_GPTSoVITS_ModelPathLoadS2G_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_GPTSoVITS_ModelPathLoadS2G_Default
+            )
+            self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = Path(CurrentDir).joinpath('模型训练结果', 'GPT-SoVITS').as_posix()
+            )
+            self.ui.Button_TTS_GPTSoVITS_ModelPathLoadS2G_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS2G,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "s2G模型加载路径")
             )
-        )
-        TTS_GPTSoVITS_ModelPathLoadS2G_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 's1&s2', 's2G2333k.pth').as_posix()
-        ParamsManager_TTS_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G,
-            Section = 'Input Params',
-            Option = 'Model_Path_Load_s2G',
-            DefaultValue = TTS_GPTSoVITS_ModelPathLoadS2G_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_GPTSoVITS_ModelPathLoadS2G_Default
-        )
-        self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = Path(CurrentDir).joinpath('模型训练结果', 'GPT-SoVITS').as_posix()
-        )
-        self.ui.Button_TTS_GPTSoVITS_ModelPathLoadS2G_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelPathLoadS2G,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "s2G模型加载路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadBert,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练bert模型加载路径\n预训练bert模型（文件夹）的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadBert,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练bert模型加载路径\n预训练bert模型（文件夹）的路径。")
+                )
+            )
+            TTS_GPTSoVITS_ModelDirLoadBert_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-roberta-wwm-ext-large').as_posix()
+            ParamsManager_TTS_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert,
+                Section = 'Input Params',
+                Option = 'Model_Dir_Load_bert',
+                DefaultValue = TTS_GPTSoVITS_ModelDirLoadBert_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_GPTSoVITS_ModelDirLoadBert_Default
+            )
+            self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
+            )
+            self.ui.Button_TTS_GPTSoVITS_ModelDirLoadBert_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadBert,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "预训练bert模型加载路径")
             )
-        )
-        TTS_GPTSoVITS_ModelDirLoadBert_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-roberta-wwm-ext-large').as_posix()
-        ParamsManager_TTS_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert,
-            Section = 'Input Params',
-            Option = 'Model_Dir_Load_bert',
-            DefaultValue = TTS_GPTSoVITS_ModelDirLoadBert_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_GPTSoVITS_ModelDirLoadBert_Default
-        )
-        self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
-        )
-        self.ui.Button_TTS_GPTSoVITS_ModelDirLoadBert_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadBert,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "预训练bert模型加载路径")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadSSL,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "预训练ssl模型加载路径\n预训练ssl模型的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadSSL,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "预训练ssl模型加载路径\n预训练ssl模型的路径。")
+                )
+            )
+            TTS_GPTSoVITS_ModelDirLoadSSL_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-hubert-base').as_posix()
+            ParamsManager_TTS_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL,
+                Section = 'Input Params',
+                Option = 'Model_Dir_Load_ssl',
+                DefaultValue = TTS_GPTSoVITS_ModelDirLoadSSL_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_GPTSoVITS_ModelDirLoadSSL_Default
+            )
+            self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL.SetFileDialog(
+                Mode = "SelectFolder",
+                Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
+            )
+            self.ui.Button_TTS_GPTSoVITS_ModelDirLoadSSL_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadSSL,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "预训练ssl模型加载路径")
             )
-        )
-        TTS_GPTSoVITS_ModelDirLoadSSL_Default = Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded', 'chinese-hubert-base').as_posix()
-        ParamsManager_TTS_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL,
-            Section = 'Input Params',
-            Option = 'Model_Dir_Load_ssl',
-            DefaultValue = TTS_GPTSoVITS_ModelDirLoadSSL_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_GPTSoVITS_ModelDirLoadSSL_Default
-        )
-        self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL.SetFileDialog(
-            Mode = "SelectFolder",
-            Directory = QFunc.NormPath(Path(ModelDir).joinpath('TTS', 'GPT-SoVITS', 'Downloaded'))
-        )
-        self.ui.Button_TTS_GPTSoVITS_ModelDirLoadSSL_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_GPTSoVITS.ResetParam(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_GPTSoVITS_ModelDirLoadSSL,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_GPTSoVITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "预训练ssl模型加载路径")
-        )
 
-        # GPT-SoVITS - Right
-        MonitorFile_Config_VoiceConverter_GPTSoVITS = QTasks.MonitorFile(Path_Config_TTS_GPTSoVITS)
-        MonitorFile_Config_VoiceConverter_GPTSoVITS.start()
-        MonitorFile_Config_VoiceConverter_GPTSoVITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_TTS_GPTSoVITS.setText(
-                FileContent
+            # GPT-SoVITS - Right
+            MonitorFile_Config_VoiceConverter_GPTSoVITS = QTasks.MonitorFile(Path_Config_TTS_GPTSoVITS)
+            MonitorFile_Config_VoiceConverter_GPTSoVITS.start()
+            MonitorFile_Config_VoiceConverter_GPTSoVITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_TTS_GPTSoVITS.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_TTS_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_TTS_GPTSoVITS.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_TTS_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_TTS_GPTSoVITS.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_TTS_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_TTS_GPTSoVITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_TTS_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_TTS_GPTSoVITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_TTS_GPTSoVITS.clicked.connect(
-            lambda: ParamsManager_TTS_GPTSoVITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_TTS_GPTSoVITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_TTS_GPTSoVITS.clicked.connect(
+                lambda: ParamsManager_TTS_GPTSoVITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        # GPT-SoVITS - Bottom
-        self.ui.Button_TTS_GPTSoVITS_Execute.setToolTip("执行语音合成")
-        self.ui.Button_TTS_GPTSoVITS_Terminate.setToolTip("终止语音合成")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_TTS_GPTSoVITS_Execute,
-            TerminateButton = self.ui.Button_TTS_GPTSoVITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_TTS_GPTSoVITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Converting_GPTSoVITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1,
-                self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G,
-                self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert,
-                self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL,
-            ],
-            EmptyAllowed = [
-            ],
-            SuccessEvents = [
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
+            # GPT-SoVITS - Bottom
+            self.ui.Button_TTS_GPTSoVITS_Execute.setToolTip("执行语音合成")
+            self.ui.Button_TTS_GPTSoVITS_Terminate.setToolTip("终止语音合成")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_TTS_GPTSoVITS_Execute,
+                TerminateButton = self.ui.Button_TTS_GPTSoVITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_TTS_GPTSoVITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Converting_GPTSoVITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS1,
+                    self.ui.LineEdit_TTS_GPTSoVITS_ModelPathLoadS2G,
+                    self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadBert,
+                    self.ui.LineEdit_TTS_GPTSoVITS_ModelDirLoadSSL,
+                ],
+                EmptyAllowed = [
+                ],
+                SuccessEvents = [
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
 
-        # VITS - ParamsManager
-        Path_Config_TTS_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_TTS_VITS.ini'))
-        ParamsManager_TTS_VITS = ParamsManager(Path_Config_TTS_VITS)
+            # VITS - ParamsManager
+            Path_Config_TTS_VITS = QFunc.NormPath(Path(ConfigDir).joinpath('Config_TTS_VITS.ini'))
+            ParamsManager_TTS_VITS = ParamsManager(Path_Config_TTS_VITS)
 
-        # VITS - Top
-        self.ui.ToolButton_VoiceConverter_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
-        self.ui.ToolButton_VoiceConverter_Title_VITS.setCheckable(True)
-        self.ui.ToolButton_VoiceConverter_Title_VITS.setChecked(False)
-        self.ui.ToolButton_VoiceConverter_Title_VITS.setAutoExclusive(True)
-        self.ui.ToolButton_VoiceConverter_Title_VITS.clicked.connect(
-            lambda: Function_AnimateStackedWidget(
-                StackedWidget = self.ui.StackedWidget_Pages_TTS,
-                Target = 1
+            # VITS - Top
+            self.ui.ToolButton_VoiceConverter_Title_VITS.setText(QCA.translate("ToolButton", "VITS2"))
+            self.ui.ToolButton_VoiceConverter_Title_VITS.setCheckable(True)
+            self.ui.ToolButton_VoiceConverter_Title_VITS.setChecked(False)
+            self.ui.ToolButton_VoiceConverter_Title_VITS.setAutoExclusive(True)
+            self.ui.ToolButton_VoiceConverter_Title_VITS.clicked.connect(
+                lambda: Function_AnimateStackedWidget(
+                    StackedWidget = self.ui.StackedWidget_Pages_TTS,
+                    Target = 1
+                )
             )
-        )
 
-        # VITS - Left
-        self.ui.TreeWidget_Catalogue_TTS_VITS.clear()
-        self.ui.TreeWidget_Catalogue_TTS_VITS.setHeaderHidden(True)
+            # VITS - Left
+            self.ui.TreeWidget_Catalogue_TTS_VITS.clear()
+            self.ui.TreeWidget_Catalogue_TTS_VITS.setHeaderHidden(True)
 
-        # VTIS - Middle
-        self.ui.GroupBox_TTS_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_TTS_VITS_InputParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数")
-        )
+            # VTIS - Middle
+            self.ui.GroupBox_TTS_VITS_InputParams.setTitle(QCA.translate("GroupBox", "输入参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_TTS_VITS_InputParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_ConfigPathLoad,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "配置加载路径\n用于推理的配置文件的路径。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_ConfigPathLoad,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "配置加载路径\n用于推理的配置文件的路径。")
+                )
             )
-        )
-        TTS_VITS_ConfigPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_Config.json').as_posix()
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_VITS_ConfigPathLoad,
-            Section = 'Input Params',
-            Option = 'Config_Path_Load',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_VITS_ConfigPathLoad_Default
-        )
-        self.ui.LineEdit_TTS_VITS_ConfigPathLoad.textChanged.connect(
-            lambda Path: (
-                self.ui.ComboBox_TTS_VITS_Speaker.clear(),
-                self.ui.ComboBox_TTS_VITS_Speaker.addItems(Get_Speakers(Path))
+            TTS_VITS_ConfigPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_Config.json').as_posix()
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_VITS_ConfigPathLoad,
+                Section = 'Input Params',
+                Option = 'Config_Path_Load',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_VITS_ConfigPathLoad_Default
+            )
+            self.ui.LineEdit_TTS_VITS_ConfigPathLoad.textChanged.connect(
+                lambda Path: (
+                    self.ui.ComboBox_TTS_VITS_Speaker.clear(),
+                    self.ui.ComboBox_TTS_VITS_Speaker.addItems(Get_Speakers(Path))
+                )
             )
-        )
-        self.ui.LineEdit_TTS_VITS_ConfigPathLoad.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "json类型 (*.json)",
-            Directory = Path(CurrentDir).joinpath('模型训练结果', 'VITS').as_posix()
-        )
-        self.ui.Button_TTS_VITS_ConfigPathLoad_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.LineEdit_TTS_VITS_ConfigPathLoad),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_VITS_ConfigPathLoad.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_ConfigPathLoad,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "配置加载路径")
-        )
-
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_ModelPathLoad,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "G模型加载路径\n用于推理的生成器（Generator）模型的路径。")
+            self.ui.LineEdit_TTS_VITS_ConfigPathLoad.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "json类型 (*.json)",
+                Directory = Path(CurrentDir).joinpath('模型训练结果', 'VITS').as_posix()
+            )
+            self.ui.Button_TTS_VITS_ConfigPathLoad_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.LineEdit_TTS_VITS_ConfigPathLoad),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_VITS_ConfigPathLoad.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_ConfigPathLoad,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "配置加载路径")
             )
-        )
-        TTS_VITS_ModelPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_G.pth').as_posix()
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.LineEdit_TTS_VITS_ModelPathLoad,
-            Section = 'Input Params',
-            Option = 'Model_Path_Load',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = TTS_VITS_ModelPathLoad_Default
-        )
-        self.ui.LineEdit_TTS_VITS_ModelPathLoad.SetFileDialog(
-            Mode = "SelectFile",
-            FileType = "pth类型 (*.pth)",
-            Directory = Path(CurrentDir).joinpath('模型训练结果', 'VITS').as_posix()
-        )
-        self.ui.Button_TTS_VITS_ModelPathLoad_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.LineEdit_TTS_VITS_ModelPathLoad),
-                "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_VITS_ModelPathLoad.text())
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_ModelPathLoad,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "输入参数"),
-            ChildItemText = QCA.translate("Tree", "G模型加载路径")
-        )
 
-        self.ui.GroupBox_TTS_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "语音合成参数"))
-        Function_AddToTreeWidget(
-            Widget = self.ui.GroupBox_TTS_VITS_VITSParams,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_ModelPathLoad,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "G模型加载路径\n用于推理的生成器（Generator）模型的路径。")
+                )
+            )
+            TTS_VITS_ModelPathLoad_Default = Path(ModelDir).joinpath('TTS', 'VITS', 'Downloaded', 'standard_G.pth').as_posix()
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.LineEdit_TTS_VITS_ModelPathLoad,
+                Section = 'Input Params',
+                Option = 'Model_Path_Load',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = TTS_VITS_ModelPathLoad_Default
+            )
+            self.ui.LineEdit_TTS_VITS_ModelPathLoad.SetFileDialog(
+                Mode = "SelectFile",
+                FileType = "pth类型 (*.pth)",
+                Directory = Path(CurrentDir).joinpath('模型训练结果', 'VITS').as_posix()
+            )
+            self.ui.Button_TTS_VITS_ModelPathLoad_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.LineEdit_TTS_VITS_ModelPathLoad),
+                    "复制": lambda: self.Clipboard.setText(self.ui.LineEdit_TTS_VITS_ModelPathLoad.text())
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_ModelPathLoad,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "输入参数"),
+                ChildItemText = QCA.translate("Tree", "G模型加载路径")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "输入文字\n输入的文字会作为说话人的语音内容。")
+            self.ui.GroupBox_TTS_VITS_VITSParams.setTitle(QCA.translate("GroupBox", "语音合成参数"))
+            Function_AddToTreeWidget(
+                Widget = self.ui.GroupBox_TTS_VITS_VITSParams,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数")
             )
-        )
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.PlainTextEdit_TTS_VITS_Text,
-            Section = 'VITS Params',
-            Option = 'Text',
-            DefaultValue = '',
-            SetPlaceholderText = True,
-            PlaceholderText = '请输入语句'
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_Text,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "输入文字")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_Language,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "所属语言\n文字所属的语言，若使用自动检测则保持'None'即可（有概率报错）。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "输入文字\n输入的文字会作为说话人的语音内容。")
+                )
+            )
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.PlainTextEdit_TTS_VITS_Text,
+                Section = 'VITS Params',
+                Option = 'Text',
+                DefaultValue = '',
+                SetPlaceholderText = True,
+                PlaceholderText = '请输入语句'
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_Text,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "输入文字")
+            )
+
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_Language,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "所属语言\n文字所属的语言，若使用自动检测则保持'None'即可（有概率报错）。")
+                )
+            )
+            self.ui.ComboBox_TTS_VITS_Language.addItems(['None', QCA.translate("ComboBox", '中'), QCA.translate("ComboBox", '英'), QCA.translate("ComboBox", '日')])
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.ComboBox_TTS_VITS_Language,
+                Section = 'VITS Params',
+                Option = 'Language',
+                DefaultValue = None
+            )
+            self.ui.Button_TTS_VITS_Language_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.ComboBox_TTS_VITS_Language)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_Language,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "所属语言")
             )
-        )
-        self.ui.ComboBox_TTS_VITS_Language.addItems(['None', QCA.translate("ComboBox", '中'), QCA.translate("ComboBox", '英'), QCA.translate("ComboBox", '日')])
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.ComboBox_TTS_VITS_Language,
-            Section = 'VITS Params',
-            Option = 'Language',
-            DefaultValue = None
-        )
-        self.ui.Button_TTS_VITS_Language_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.ComboBox_TTS_VITS_Language)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_Language,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "所属语言")
-        )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_Speaker,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "人物名字\n说话人物的名字。")
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_Speaker,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "人物名字\n说话人物的名字。")
+                )
+            )
+            self.ui.ComboBox_TTS_VITS_Speaker.addItems(
+                Get_Speakers(self.ui.LineEdit_TTS_VITS_ConfigPathLoad.text())
+            )
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.ComboBox_TTS_VITS_Speaker,
+                Section = 'VITS Params',
+                Option = 'Speaker',
+                DefaultValue = ''
+            )
+            self.ui.ComboBox_TTS_VITS_Speaker.setCurrentIndex(0)
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_Speaker,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "人物名字")
             )
-        )
-        self.ui.ComboBox_TTS_VITS_Speaker.addItems(
-            Get_Speakers(self.ui.LineEdit_TTS_VITS_ConfigPathLoad.text())
-        )
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.ComboBox_TTS_VITS_Speaker,
-            Section = 'VITS Params',
-            Option = 'Speaker',
-            DefaultValue = ''
-        )
-        self.ui.ComboBox_TTS_VITS_Speaker.setCurrentIndex(0)
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_Speaker,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "人物名字")
-        )
 
-        self.ui.ToolBox_TTS_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
-        self.ui.ToolBox_TTS_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
+            self.ui.ToolBox_TTS_VITS_VITSParams_AdvanceSettings.widget(0).setText(QCA.translate("ToolBox", "高级设置"))
+            self.ui.ToolBox_TTS_VITS_VITSParams_AdvanceSettings.widget(0).collapse()
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_EmotionStrength,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "情感强度\n情感的变化程度。")
-            )
-        )
-        self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setMinimum(0)
-        self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setMaximum(100)
-        self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setTickInterval(1)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.HorizontalSlider_TTS_VITS_EmotionStrength,
-            Section = 'VITS Params',
-            Option = 'EmotionStrength',
-            DefaultValue = 0.67,
-            Times = 100
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.HorizontalSlider_TTS_VITS_EmotionStrength,
-            FromTo = {
-                self.ui.HorizontalSlider_TTS_VITS_EmotionStrength: self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength
-            },
-            Times = 0.01
-        )
-        self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength.setRange(0, 1)
-        self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength.setSingleStep(0.01)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
-            Section = 'VITS Params',
-            Option = 'EmotionStrength',
-            DefaultValue = 0.67
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
-            FromTo = {
-                self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength: self.ui.HorizontalSlider_TTS_VITS_EmotionStrength
-            },
-            Times = 100
-        )
-        self.ui.Button_TTS_VITS_EmotionStrength_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_EmotionStrength,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "情感强度")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_EmotionStrength,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "情感强度\n情感的变化程度。")
+                )
+            )
+            self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setMinimum(0)
+            self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setMaximum(100)
+            self.ui.HorizontalSlider_TTS_VITS_EmotionStrength.setTickInterval(1)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.HorizontalSlider_TTS_VITS_EmotionStrength,
+                Section = 'VITS Params',
+                Option = 'EmotionStrength',
+                DefaultValue = 0.67,
+                Times = 100
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.HorizontalSlider_TTS_VITS_EmotionStrength,
+                FromTo = {
+                    self.ui.HorizontalSlider_TTS_VITS_EmotionStrength: self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength
+                },
+                Times = 0.01
+            )
+            self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength.setRange(0, 1)
+            self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength.setSingleStep(0.01)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
+                Section = 'VITS Params',
+                Option = 'EmotionStrength',
+                DefaultValue = 0.67
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
+                FromTo = {
+                    self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength: self.ui.HorizontalSlider_TTS_VITS_EmotionStrength
+                },
+                Times = 100
+            )
+            self.ui.Button_TTS_VITS_EmotionStrength_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_EmotionStrength,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "情感强度")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_PhonemeDuration,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "音素音长\n音素的发音长度。")
-            )
-        )
-        self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setMinimum(0)
-        self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setMaximum(10)
-        self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setTickInterval(1)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration,
-            Section = 'VITS Params',
-            Option = 'PhonemeDuration',
-            DefaultValue = 0.8,
-            Times = 10
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration,
-            FromTo = {
-                self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration: self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration
-            },
-            Times = 0.1
-        )
-        self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration.setRange(0, 1)
-        self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration.setSingleStep(0.1)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
-            Section = 'VITS Params',
-            Option = 'PhonemeDuration',
-            DefaultValue = 0.8
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
-            FromTo = {
-                self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration: self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration
-            },
-            Times = 10
-        )
-        self.ui.Button_TTS_VITS_PhonemeDuration_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_PhonemeDuration,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "音素音长")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_PhonemeDuration,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "音素音长\n音素的发音长度。")
+                )
+            )
+            self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setMinimum(0)
+            self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setMaximum(10)
+            self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration.setTickInterval(1)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration,
+                Section = 'VITS Params',
+                Option = 'PhonemeDuration',
+                DefaultValue = 0.8,
+                Times = 10
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration,
+                FromTo = {
+                    self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration: self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration
+                },
+                Times = 0.1
+            )
+            self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration.setRange(0, 1)
+            self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration.setSingleStep(0.1)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
+                Section = 'VITS Params',
+                Option = 'PhonemeDuration',
+                DefaultValue = 0.8
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
+                FromTo = {
+                    self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration: self.ui.HorizontalSlider_TTS_VITS_PhonemeDuration
+                },
+                Times = 10
+            )
+            self.ui.Button_TTS_VITS_PhonemeDuration_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_PhonemeDuration,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "音素音长")
+            )
 
-        QFunc.Function_SetText(
-            Widget = self.ui.Label_TTS_VITS_SpeechRate,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "整体语速\n整体的说话速度。")
-            )
-        )
-        self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setMinimum(0)
-        self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setMaximum(20)
-        self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setTickInterval(1)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.HorizontalSlider_TTS_VITS_SpeechRate,
-            Section = 'VITS Params',
-            Option = 'SpeechRate',
-            DefaultValue = 1.,
-            Times = 10
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.HorizontalSlider_TTS_VITS_SpeechRate,
-            FromTo = {
-                self.ui.HorizontalSlider_TTS_VITS_SpeechRate: self.ui.DoubleSpinBox_TTS_VITS_SpeechRate
-            },
-            Times = 0.1
-        )
-        self.ui.DoubleSpinBox_TTS_VITS_SpeechRate.setRange(0, 2)
-        self.ui.DoubleSpinBox_TTS_VITS_SpeechRate.setSingleStep(0.1)
-        ParamsManager_TTS_VITS.SetParam(
-            Widget = self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
-            Section = 'VITS Params',
-            Option = 'SpeechRate',
-            DefaultValue = 1.
-        )
-        Function_ParamsSynchronizer(
-            Trigger = self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
-            FromTo = {
-                self.ui.DoubleSpinBox_TTS_VITS_SpeechRate: self.ui.HorizontalSlider_TTS_VITS_SpeechRate
-            },
-            Times = 10
-        )
-        self.ui.Button_TTS_VITS_SpeechRate_MoreActions.SetMenu(
-            ActionEvents = {
-                "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_SpeechRate)
-            }
-        )
-        Function_AddToTreeWidget(
-            Widget = self.ui.Label_TTS_VITS_SpeechRate,
-            TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
-            RootItemText = QCA.translate("Tree", "语音合成参数"),
-            ChildItemText = QCA.translate("Tree", "整体语速")
-        )
+            QFunc.Function_SetText(
+                Widget = self.ui.Label_TTS_VITS_SpeechRate,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "整体语速\n整体的说话速度。")
+                )
+            )
+            self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setMinimum(0)
+            self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setMaximum(20)
+            self.ui.HorizontalSlider_TTS_VITS_SpeechRate.setTickInterval(1)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.HorizontalSlider_TTS_VITS_SpeechRate,
+                Section = 'VITS Params',
+                Option = 'SpeechRate',
+                DefaultValue = 1.,
+                Times = 10
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.HorizontalSlider_TTS_VITS_SpeechRate,
+                FromTo = {
+                    self.ui.HorizontalSlider_TTS_VITS_SpeechRate: self.ui.DoubleSpinBox_TTS_VITS_SpeechRate
+                },
+                Times = 0.1
+            )
+            self.ui.DoubleSpinBox_TTS_VITS_SpeechRate.setRange(0, 2)
+            self.ui.DoubleSpinBox_TTS_VITS_SpeechRate.setSingleStep(0.1)
+            ParamsManager_TTS_VITS.SetParam(
+                Widget = self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
+                Section = 'VITS Params',
+                Option = 'SpeechRate',
+                DefaultValue = 1.
+            )
+            Function_ParamsSynchronizer(
+                Trigger = self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
+                FromTo = {
+                    self.ui.DoubleSpinBox_TTS_VITS_SpeechRate: self.ui.HorizontalSlider_TTS_VITS_SpeechRate
+                },
+                Times = 10
+            )
+            self.ui.Button_TTS_VITS_SpeechRate_MoreActions.SetMenu(
+                ActionEvents = {
+                    "重置": lambda: ParamsManager_TTS_VITS.ResetParam(self.ui.DoubleSpinBox_TTS_VITS_SpeechRate)
+                }
+            )
+            Function_AddToTreeWidget(
+                Widget = self.ui.Label_TTS_VITS_SpeechRate,
+                TreeWidget = self.ui.TreeWidget_Catalogue_TTS_VITS,
+                RootItemText = QCA.translate("Tree", "语音合成参数"),
+                ChildItemText = QCA.translate("Tree", "整体语速")
+            )
 
-        TTS_VITS_AudioDirSave = Path(CurrentDir).joinpath('语音合成结果', 'VITS').as_posix()
-        TTS_VITS_AudioPathSave = Path(TTS_VITS_AudioDirSave).joinpath("temp.wav").as_posix()
-        os.makedirs(TTS_VITS_AudioDirSave) if not Path(TTS_VITS_AudioDirSave).exists() else None
+            TTS_VITS_AudioDirSave = Path(CurrentDir).joinpath('语音合成结果', 'VITS').as_posix()
+            TTS_VITS_AudioPathSave = Path(TTS_VITS_AudioDirSave).joinpath("temp.wav").as_posix()
+            os.makedirs(TTS_VITS_AudioDirSave) if not Path(TTS_VITS_AudioDirSave).exists() else None
 
-        # ChildWindow
-        ChildWindow_TTS_VITS = Window_ChildWindow_TTS_VITS(self)
+            # ChildWindow
+            ChildWindow_TTS_VITS = Window_ChildWindow_TTS_VITS(self)
 
-        ChildWindow_TTS_VITS.ui.Button_Close.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认退出试听？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
-                        ChildWindow_TTS_VITS.close()
-                    )
-                } 
+            ChildWindow_TTS_VITS.ui.Button_Close.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认退出试听？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
+                            ChildWindow_TTS_VITS.close()
+                        )
+                    } 
+                )
             )
-        )
-        ChildWindow_TTS_VITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_TTS_VITS.showNormal() if ChildWindow_TTS_VITS.isMaximized() else ChildWindow_TTS_VITS.showMaximized())
+            ChildWindow_TTS_VITS.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_TTS_VITS.showNormal() if ChildWindow_TTS_VITS.isMaximized() else ChildWindow_TTS_VITS.showMaximized())
 
-        QFunc.Function_SetText(
-            Widget = ChildWindow_TTS_VITS.ui.Label_Title,
-            Text = QFunc.SetRichText(
-                Title = QCA.translate("Label", "语音合成结果")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_TTS_VITS.ui.Label_Title,
+                Text = QFunc.SetRichText(
+                    Title = QCA.translate("Label", "语音合成结果")
+                )
             )
-        )
-        QFunc.Function_SetText(
-            Widget = ChildWindow_TTS_VITS.ui.Label_Text,
-            Text = QFunc.SetRichText(
-                Body = QCA.translate("Label", "点击播放按钮以试听合成语音")
+            QFunc.Function_SetText(
+                Widget = ChildWindow_TTS_VITS.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = QCA.translate("Label", "点击播放按钮以试听合成语音")
+                )
             )
-        )
 
-        ChildWindow_TTS_VITS.ui.Button_Cancel.setText(QCA.translate("Button", "丢弃"))
-        ChildWindow_TTS_VITS.ui.Button_Cancel.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认丢弃音频？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
-                        os.remove(TTS_VITS_AudioPathSave),
-                        ChildWindow_TTS_VITS.close()
-                    )
-                }
+            ChildWindow_TTS_VITS.ui.Button_Cancel.setText(QCA.translate("Button", "丢弃"))
+            ChildWindow_TTS_VITS.ui.Button_Cancel.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认丢弃音频？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
+                            os.remove(TTS_VITS_AudioPathSave),
+                            ChildWindow_TTS_VITS.close()
+                        )
+                    }
+                )
             )
-        )
-        ChildWindow_TTS_VITS.ui.Button_Confirm.setText(QCA.translate("Button", "保留"))
-        ChildWindow_TTS_VITS.ui.Button_Confirm.clicked.connect(
-            lambda: MessageBoxBase.pop(self,
-                QMessageBox.Question, "Ask",
-                "确认保留音频？",
-                QMessageBox.Yes|QMessageBox.No,
-                {
-                    QMessageBox.Yes: lambda: (
-                        ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
-                        shutil.move(
-                            TTS_VITS_AudioPathSave,
-                            QFunc.Function_GetFileDialog(
-                                Mode = "SaveFile",
-                                FileType = "wav类型 (*.wav)"
-                            )
-                        ),
-                        ChildWindow_TTS_VITS.close()
-                    )
-                }
+            ChildWindow_TTS_VITS.ui.Button_Confirm.setText(QCA.translate("Button", "保留"))
+            ChildWindow_TTS_VITS.ui.Button_Confirm.clicked.connect(
+                lambda: MessageBoxBase.pop(self,
+                    QMessageBox.Question, "Ask",
+                    "确认保留音频？",
+                    QMessageBox.Yes|QMessageBox.No,
+                    {
+                        QMessageBox.Yes: lambda: (
+                            ChildWindow_TTS_VITS.ui.Widget.ReleaseMediaPlayer(),
+                            shutil.move(
+                                TTS_VITS_AudioPathSave,
+                                QFunc.Function_GetFileDialog(
+                                    Mode = "SaveFile",
+                                    FileType = "wav类型 (*.wav)"
+                                )
+                            ),
+                            ChildWindow_TTS_VITS.close()
+                        )
+                    }
+                )
             )
-        )
 
-        # VITS - Right
-        MonitorFile_Config_VoiceConverter_VITS = QTasks.MonitorFile(Path_Config_TTS_VITS)
-        MonitorFile_Config_VoiceConverter_VITS.start()
-        MonitorFile_Config_VoiceConverter_VITS.Signal_FileContent.connect(
-            lambda FileContent: self.ui.TextBrowser_Params_TTS_VITS.setText(
-                FileContent
+            # VITS - Right
+            MonitorFile_Config_VoiceConverter_VITS = QTasks.MonitorFile(Path_Config_TTS_VITS)
+            MonitorFile_Config_VoiceConverter_VITS.start()
+            MonitorFile_Config_VoiceConverter_VITS.Signal_FileContent.connect(
+                lambda FileContent: self.ui.TextBrowser_Params_TTS_VITS.setText(
+                    FileContent
+                )
             )
-        )
 
-        self.ui.Button_ResetSettings_TTS_VITS.setText(QCA.translate("Button", "全部重置"))
-        self.ui.Button_ResetSettings_TTS_VITS.clicked.connect(
-            lambda: ParamsManager_TTS_VITS.ResetSettings()
-        )
+            self.ui.Button_ResetSettings_TTS_VITS.setText(QCA.translate("Button", "全部重置"))
+            self.ui.Button_ResetSettings_TTS_VITS.clicked.connect(
+                lambda: ParamsManager_TTS_VITS.ResetSettings()
+            )
 
-        self.ui.Button_ImportSettings_TTS_VITS.setText(QCA.translate("Button", "导入配置"))
-        self.ui.Button_ImportSettings_TTS_VITS.clicked.connect(
-            lambda: ParamsManager_TTS_VITS.ImportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SelectFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ImportSettings_TTS_VITS.setText(QCA.translate("Button", "导入配置"))
+            self.ui.Button_ImportSettings_TTS_VITS.clicked.connect(
+                lambda: ParamsManager_TTS_VITS.ImportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SelectFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
 
-        self.ui.Button_ExportSettings_TTS_VITS.setText(QCA.translate("Button", "导出配置"))
-        self.ui.Button_ExportSettings_TTS_VITS.clicked.connect(
-            lambda: ParamsManager_TTS_VITS.ExportSettings(
-                QFunc.Function_GetFileDialog(
-                    Mode = "SaveFile",
-                    FileType = "ini类型 (*.ini)"
+            self.ui.Button_ExportSettings_TTS_VITS.setText(QCA.translate("Button", "导出配置"))
+            self.ui.Button_ExportSettings_TTS_VITS.clicked.connect(
+                lambda: ParamsManager_TTS_VITS.ExportSettings(
+                    QFunc.Function_GetFileDialog(
+                        Mode = "SaveFile",
+                        FileType = "ini类型 (*.ini)"
+                    )
                 )
             )
-        )
-
-        self.ui.Button_CheckOutput_TTS_VITS.setText(QCA.translate("Button", "查看输出文件"))
-        Function_SetURL(
-            Button = self.ui.Button_CheckOutput_TTS_VITS,
-            URL = TTS_VITS_AudioDirSave,
-            ButtonTooltip = "Click to open",
-            CreateIfNotExist = True
-        )
 
-        # VITS - Bottom
-        self.ui.Button_TTS_VITS_Execute.setToolTip("执行语音合成")
-        self.ui.Button_TTS_VITS_Terminate.setToolTip("终止语音合成")
-        Function_SetMethodExecutor(self,
-            ExecuteButton = self.ui.Button_TTS_VITS_Execute,
-            TerminateButton = self.ui.Button_TTS_VITS_Terminate,
-            ProgressBar = self.ui.ProgressBar_TTS_VITS,
-            ConsoleWidget = self.ui.Frame_Console,
-            Method = Execute_Voice_Converting_VITS.Execute,
-            ParamsFrom = [
-                self.ui.LineEdit_TTS_VITS_ConfigPathLoad,
-                self.ui.LineEdit_TTS_VITS_ModelPathLoad,
-                self.ui.PlainTextEdit_TTS_VITS_Text,
-                self.ui.ComboBox_TTS_VITS_Language,
-                self.ui.ComboBox_TTS_VITS_Speaker,
-                self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
-                self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
-                self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
-                TTS_VITS_AudioPathSave
-            ],
-            EmptyAllowed = [
-                self.ui.ComboBox_TTS_VITS_Language,
-                self.ui.ComboBox_TTS_VITS_Speaker
-            ],
-            SuccessEvents = [
-                lambda: self.ShowMask(True, "正在加载播放器"),
-                lambda: ChildWindow_TTS_VITS.ui.Widget.SetMediaPlayer(
+            self.ui.Button_CheckOutput_TTS_VITS.setText(QCA.translate("Button", "查看输出文件"))
+            Function_SetURL(
+                Button = self.ui.Button_CheckOutput_TTS_VITS,
+                URL = TTS_VITS_AudioDirSave,
+                ButtonTooltip = "Click to open",
+                CreateIfNotExist = True
+            )
+
+            # VITS - Bottom
+            self.ui.Button_TTS_VITS_Execute.setToolTip("执行语音合成")
+            self.ui.Button_TTS_VITS_Terminate.setToolTip("终止语音合成")
+            Function_SetMethodExecutor(self,
+                ExecuteButton = self.ui.Button_TTS_VITS_Execute,
+                TerminateButton = self.ui.Button_TTS_VITS_Terminate,
+                ProgressBar = self.ui.ProgressBar_TTS_VITS,
+                ConsoleWidget = self.ui.Frame_Console,
+                Method = Execute_Voice_Converting_VITS.Execute,
+                JobScheduler = JobScheduler,
+                ParamsFrom = [
+                    self.ui.LineEdit_TTS_VITS_ConfigPathLoad,
+                    self.ui.LineEdit_TTS_VITS_ModelPathLoad,
+                    self.ui.PlainTextEdit_TTS_VITS_Text,
+                    self.ui.ComboBox_TTS_VITS_Language,
+                    self.ui.ComboBox_TTS_VITS_Speaker,
+                    self.ui.DoubleSpinBox_TTS_VITS_EmotionStrength,
+                    self.ui.DoubleSpinBox_TTS_VITS_PhonemeDuration,
+                    self.ui.DoubleSpinBox_TTS_VITS_SpeechRate,
                     TTS_VITS_AudioPathSave
-                ),
-                ChildWindow_TTS_VITS.exec,
-                lambda: MessageBoxBase.pop(self,
-                    QMessageBox.Information, "Tip",
-                    "当前任务已执行结束。"
-                )
-            ]
-        )
+                ],
+                EmptyAllowed = [
+                    self.ui.ComboBox_TTS_VITS_Language,
+                    self.ui.ComboBox_TTS_VITS_Speaker
+                ],
+                SuccessEvents = [
+                    lambda: self.ShowMask(True, "正在加载播放器"),
+                    lambda: ChildWindow_TTS_VITS.ui.Widget.SetMediaPlayer(
+                        TTS_VITS_AudioPathSave
+                    ),
+                    ChildWindow_TTS_VITS.exec,
+                    lambda: MessageBoxBase.pop(self,
+                        QMessageBox.Information, "Tip",
+                        "当前任务已执行结束。"
+                    )
+                ]
+            )
+        PageSetups.Register(self.ui.Page_TTS, SetupPage_TTS)
 
         #############################################################
         ##################### Content: Settings #####################
@@ -6229,15 +6223,15 @@ class MainWindow(Window_MainWindow):
                 lambda: Config.EditConfig('Tools', 'AutoReset', 'Enabled'),
                 lambda: MainWindowSignals.Signal_MainWindowShown.connect(
                     lambda: (
-                        ParamsManager_Process.ResetSettings(),
-                        ParamsManager_ASR_VPR.ResetSettings(),
-                        ParamsManager_STT_Whisper.ResetSettings(),
-                        ParamsManager_DAT_GPTSoVITS.ResetSettings(),
-                        ParamsManager_DAT_VITS.ResetSettings(),
-                        ParamsManager_Train_GPTSoVITS.ResetSettings(),
-                        ParamsManager_Train_VITS.ResetSettings(),
-                        ParamsManager_TTS_GPTSoVITS.ResetSettings(),
-                        ParamsManager_TTS_VITS.ResetSettings()
+                        PageSetups.Register(self.ui.Page_Process, lambda: ParamsManager_Process.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_ASR, lambda: ParamsManager_ASR_VPR.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_STT, lambda: ParamsManager_STT_Whisper.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_Dataset, lambda: ParamsManager_DAT_GPTSoVITS.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_Dataset, lambda: ParamsManager_DAT_VITS.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_Train, lambda: ParamsManager_Train_GPTSoVITS.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_Train, lambda: ParamsManager_Train_VITS.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_TTS, lambda: ParamsManager_TTS_GPTSoVITS.ResetSettings()),
+                        PageSetups.Register(self.ui.Page_TTS, lambda: ParamsManager_TTS_VITS.ResetSettings())
                     )
                 )
             ],
@@ -6249,6 +6243,11 @@ class MainWindow(Window_MainWindow):
         )
 
         self.ui.Label_Setting_Synchronizer.setText(QCA.translate("Label", "自动关联前后工具的部分参数设置"))
+        def SynchronizeParams(Trigger: Union[QLineEdit, list], FromTo: dict, Pages: list):
+            # Set up the pages of the synchronized params before they get synchronized (or they would be overwritten by their configs)
+            for LineEdit in QFunc.ToIterable(Trigger):
+                LineEdit.textChanged.connect(lambda: [PageSetups.Setup(Page) for Page in Pages])
+            Function_ParamsSynchronizer(Trigger, FromTo)
         self.ui.CheckBox_Setting_Synchronizer.setChecked(
             {
                 'Enabled': True,
@@ -6260,29 +6259,47 @@ class MainWindow(Window_MainWindow):
             CheckedText = "已启用",
             CheckedEvents = [
                 lambda: Config.EditConfig('Tools', 'Synchronizer', 'Enabled'),
-                lambda: Function_ParamsSynchronizer(
-                    LineEdit_Process_OutputDir,
-                    {LineEdit_Process_OutputDir: self.ui.LineEdit_ASR_VPR_AudioDirInput}
+                lambda: PageSetups.Register(self.ui.Page_Process,
+                    lambda: SynchronizeParams(
+                        LineEdit_Process_OutputDir,
+                        {LineEdit_Process_OutputDir: self.ui.LineEdit_ASR_VPR_AudioDirInput},
+                        [self.ui.Page_ASR]
+                    )
                 ),
-                lambda: Function_ParamsSynchronizer(
-                    LineEdit_ASR_VPR_AudioSpeakersDataPath,
-                    {LineEdit_ASR_VPR_AudioSpeakersDataPath: [self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath, self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath]}
+                lambda: PageSetups.Register(self.ui.Page_ASR,
+                    lambda: SynchronizeParams(
+                        LineEdit_ASR_VPR_AudioSpeakersDataPath,
+                        {LineEdit_ASR_VPR_AudioSpeakersDataPath: [self.ui.LineEdit_DAT_GPTSoVITS_AudioSpeakersDataPath, self.ui.LineEdit_DAT_VITS_AudioSpeakersDataPath]},
+                        [self.ui.Page_Dataset]
+                    )
                 ),
-                lambda: Function_ParamsSynchronizer(
-                    ChildWindow_ASR.ui.LineEdit,
-                    {ChildWindow_ASR.ui.LineEdit: self.ui.LineEdit_STT_Whisper_AudioDir}
+                lambda: PageSetups.Register(self.ui.Page_ASR,
+                    lambda: SynchronizeParams(
+                        ChildWindow_ASR.ui.LineEdit,
+                        {ChildWindow_ASR.ui.LineEdit: self.ui.LineEdit_STT_Whisper_AudioDir},
+                        [self.ui.Page_STT]
+                    )
                 ),
-                lambda: Function_ParamsSynchronizer(
-                    LineEdit_STT_Whisper_OutputDir,
-                    {LineEdit_STT_Whisper_OutputDir: [self.ui.LineEdit_DAT_GPTSoVITS_SRTDir, self.ui.LineEdit_DAT_VITS_SRTDir]}
+                lambda: PageSetups.Register(self.ui.Page_STT,
+                    lambda: SynchronizeParams(
+                        LineEdit_STT_Whisper_OutputDir,
+                        {LineEdit_STT_Whisper_OutputDir: [self.ui.LineEdit_DAT_GPTSoVITS_SRTDir, self.ui.LineEdit_DAT_VITS_SRTDir]},
+                        [self.ui.Page_Dataset]
+                    )
                 ),
-                lambda: Function_ParamsSynchronizer(
-                    LineEdit_DAT_GPTSoVITS_FileListPath,
-                    {LineEdit_DAT_GPTSoVITS_FileListPath: self.ui.LineEdit_Train_GPTSoVITS_FileListPath}
+                lambda: PageSetups.Register(self.ui.Page_Dataset,
+                    lambda: SynchronizeParams(
+                        LineEdit_DAT_GPTSoVITS_FileListPath,
+                        {LineEdit_DAT_GPTSoVITS_FileListPath: self.ui.LineEdit_Train_GPTSoVITS_FileListPath},
+                        [self.ui.Page_Train]
+                    )
                 ),
-                lambda: Function_ParamsSynchronizer(
-                    [LineEdit_DAT_VITS_FileListPathTraining, LineEdit_DAT_VITS_FileListPathValidation],
-                    {LineEdit_DAT_VITS_FileListPathTraining: self.ui.LineEdit_Train_VITS_FileListPathTraining, LineEdit_DAT_VITS_FileListPathValidation: self.ui.LineEdit_Train_VITS_FileListPathValidation}
+                lambda: PageSetups.Register(self.ui.Page_Dataset,
+                    lambda: SynchronizeParams(
+                        [LineEdit_DAT_VITS_FileListPathTraining, LineEdit_DAT_VITS_FileListPathValidation],
+                        {LineEdit_DAT_VITS_FileListPathTraining: self.ui.LineEdit_Train_VITS_FileListPathTraining, LineEdit_DAT_VITS_FileListPathValidation: self.ui.LineEdit_Train_VITS_FileListPathValidation},
+                        [self.ui.Page_Train]
+                    )
                 )
             ],
             UncheckedText = "未启用",
@@ -6302,17 +6319,65 @@ class MainWindow(Window_MainWindow):
             TakeEffect = False
         )
 
+        self.ui.Label_Setting_LinkMode.setText(QCA.translate("Label", "保存音频时的文件放置方式"))
+        self.ui.ComboBox_Setting_LinkMode.addItems([QCA.translate("ComboBox", '自动（引用链接或复制）'), QCA.translate("ComboBox", '硬链接'), QCA.translate("ComboBox", '符号链接'), QCA.translate("ComboBox", '复制')])
+        self.ui.ComboBox_Setting_LinkMode.setToolTip(QCA.translate("ToolTip", "无法链接时（如跨磁盘）均会改为复制\n硬链接与符号链接会与源文件共用数据，之后原地修改其中一个音频（如重采样）也会改动另一个"))
+        LinkModeDict = {
+            '自动（引用链接或复制）': 'Auto',
+            '硬链接': 'Hardlink',
+            '符号链接': 'Symlink',
+            '复制': 'Copy'
+        }
+        self.ui.ComboBox_Setting_LinkMode.setCurrentText(
+            QCA.translate("ComboBox", QFunc.FindKey(LinkModeDict, Config.GetValue('Tools', 'LinkMode', 'Auto')) or '自动（引用链接或复制）')
+        )
+        self.ui.ComboBox_Setting_LinkMode.currentIndexChanged.connect(
+            lambda: Config.EditConfig(
+                'Tools', 'LinkMode', LinkModeDict.get(self.ui.ComboBox_Setting_LinkMode.currentText())
+            )
+        )
+
+        self.ui.Label_Setting_PrewarmPages.setText(QCA.translate("Label", "启动后在后台预先加载各工具界面"))
+        self.ui.CheckBox_Setting_PrewarmPages.setChecked(
+            {
+                'Enabled': True,
+                'Disabled': False
+            }.get(Config.GetValue('Tools', 'PrewarmPages', 'Enabled'))
+        )
+        Function_ConfigureCheckBox(
+            CheckBox = self.ui.CheckBox_Setting_PrewarmPages,
+            CheckedText = "已启用",
+            CheckedEvents = [
+                lambda: Config.EditConfig('Tools', 'PrewarmPages', 'Enabled'),
+                lambda: MainWindowSignals.Signal_MainWindowShown.connect(
+                    lambda: PageSetups.Prewarm(1000)
+                )
+            ],
+            UncheckedText = "未启用",
+            UncheckedEvents = [
+                lambda: Config.EditConfig('Tools', 'PrewarmPages', 'Disabled'),
+            ],
+            TakeEffect = True
+        )
+
         self.ui.GroupBox_Settings_Tools_Path.setTitle(QCA.translate("GroupBox", "路径设置"))
 
+        # The output dirs are params of the tools, so their pages get set up along with this one
+        PageSetups.Register(self.ui.Page_Settings,
+            Requires = [self.ui.Page_Process, self.ui.Page_ASR, self.ui.Page_STT, self.ui.Page_Dataset, self.ui.Page_Train]
+        )
+
         self.ui.Label_Process_OutputRoot.setText(QCA.translate("Label", "音频处理输出目录"))
         Process_OutputRoot_Default = Path(OutputDir).joinpath('音频处理结果').as_posix()
-        ParamsManager_Process.SetParam(
-            Widget = self.ui.LineEdit_Process_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = Process_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Process_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_Process,
+            lambda: ParamsManager_Process.SetParam(
+                Widget = self.ui.LineEdit_Process_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = Process_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Process_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_Process_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6326,13 +6391,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_ASR_VPR_OutputRoot.setText(QCA.translate("Label", "声纹识别结果输出目录"))
         ASR_VPR_AudioSpeakersDataRoot_Default = Path(CurrentDir).joinpath('语音识别结果', 'VPR').as_posix()
-        ParamsManager_ASR_VPR.SetParam(
-            Widget = self.ui.LineEdit_ASR_VPR_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Audio_Root_Output',
-            DefaultValue = ASR_VPR_AudioSpeakersDataRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = ASR_VPR_AudioSpeakersDataRoot_Default
+        PageSetups.Register(self.ui.Page_ASR,
+            lambda: ParamsManager_ASR_VPR.SetParam(
+                Widget = self.ui.LineEdit_ASR_VPR_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Audio_Root_Output',
+                DefaultValue = ASR_VPR_AudioSpeakersDataRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = ASR_VPR_AudioSpeakersDataRoot_Default
+            )
         )
         self.ui.LineEdit_ASR_VPR_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6347,13 +6414,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_STT_Whisper_OutputRoot.setText(QCA.translate("Label", "Whisper转录输出目录"))
         STT_Whisper_OutputRoot_Default = Path(OutputDir).joinpath('语音转录结果', 'Whisper').as_posix()
-        ParamsManager_STT_Whisper.SetParam(
-            Widget = self.ui.LineEdit_STT_Whisper_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = STT_Whisper_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = STT_Whisper_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_STT,
+            lambda: ParamsManager_STT_Whisper.SetParam(
+                Widget = self.ui.LineEdit_STT_Whisper_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = STT_Whisper_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = STT_Whisper_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_STT_Whisper_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6368,13 +6437,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_DAT_GPTSoVITS_OutputRoot.setText( QCA.translate("Label", "GPTSoVITS数据集输出目录"))
         DAT_GPTSoVITS_OutputRoot_Default = Path(OutputDir).joinpath('数据集制作结果', 'GPT-SoVITS').as_posix()
-        ParamsManager_DAT_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = DAT_GPTSoVITS_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_GPTSoVITS_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_Dataset,
+            lambda: ParamsManager_DAT_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = DAT_GPTSoVITS_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_GPTSoVITS_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_DAT_GPTSoVITS_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6389,13 +6460,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_DAT_VITS_OutputRoot.setText(QCA.translate("Label", "VITS数据集输出目录"))
         DAT_VITS_OutputRoot_Default = Path(OutputDir).joinpath('数据集制作结果', 'VITS').as_posix()
-        ParamsManager_DAT_VITS.SetParam(
-            Widget = self.ui.LineEdit_DAT_VITS_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = DAT_VITS_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = DAT_VITS_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_Dataset,
+            lambda: ParamsManager_DAT_VITS.SetParam(
+                Widget = self.ui.LineEdit_DAT_VITS_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = DAT_VITS_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = DAT_VITS_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_DAT_VITS_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6410,13 +6483,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_Train_GPTSoVITS_OutputRoot.setText(QCA.translate("Label", "GPTSoVITS训练输出目录"))
         Train_GPTSoVITS_OutputRoot_Default = Path(OutputDir).joinpath('模型训练结果', 'GPT-SoVITS').as_posix()
-        ParamsManager_Train_GPTSoVITS.SetParam(
-            Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = Train_GPTSoVITS_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_GPTSoVITS_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_Train,
+            lambda: ParamsManager_Train_GPTSoVITS.SetParam(
+                Widget = self.ui.LineEdit_Train_GPTSoVITS_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = Train_GPTSoVITS_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_GPTSoVITS_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_Train_GPTSoVITS_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6431,13 +6506,15 @@ class MainWindow(Window_MainWindow):
 
         self.ui.Label_Train_VITS_OutputRoot.setText(QCA.translate("Label", "VITS训练输出目录"))
         Train_VITS_OutputRoot_Default = Path(OutputDir).joinpath('模型训练结果', 'VITS').as_posix()
-        ParamsManager_Train_VITS.SetParam(
-            Widget = self.ui.LineEdit_Train_VITS_OutputRoot,
-            Section = 'Output Params',
-            Option = 'Output_Root',
-            DefaultValue = Train_VITS_OutputRoot_Default,
-            SetPlaceholderText = True,
-            PlaceholderText = Train_VITS_OutputRoot_Default
+        PageSetups.Register(self.ui.Page_Train,
+            lambda: ParamsManager_Train_VITS.SetParam(
+                Widget = self.ui.LineEdit_Train_VITS_OutputRoot,
+                Section = 'Output Params',
+                Option = 'Output_Root',
+                DefaultValue = Train_VITS_OutputRoot_Default,
+                SetPlaceholderText = True,
+                PlaceholderText = Train_VITS_OutputRoot_Default
+            )
         )
         self.ui.LineEdit_Train_VITS_OutputRoot.SetFileDialog(
             Mode = "SelectFolder",
@@ -6542,6 +6619,106 @@ class MainWindow(Window_MainWindow):
             ] else None
         )
 
+        # Display JobQueue
+        ChildWindow_JobQueue = Window_ChildWindow_JobQueue(self)
+
+        ChildWindow_JobQueue.ui.Button_Close.clicked.connect(ChildWindow_JobQueue.close)
+        ChildWindow_JobQueue.ui.Button_Maximize.clicked.connect(lambda: ChildWindow_JobQueue.showNormal() if ChildWindow_JobQueue.isMaximized() else ChildWindow_JobQueue.showMaximized())
+
+        QFunc.Function_SetText(
+            Widget = ChildWindow_JobQueue.ui.Label_Title,
+            Text = QFunc.SetRichText(
+                Title = QCA.translate("Label", "任务队列")
+            )
+        )
+
+        ChildWindow_JobQueue.ui.Table.setHorizontalHeaderLabels(['任务', '状态', '进度', '操作'])
+        ChildWindow_JobQueue.ui.Table.Raise.connect(lambda ID: JobScheduler.ShiftPriority(ID, +1))
+        ChildWindow_JobQueue.ui.Table.Lower.connect(lambda ID: JobScheduler.ShiftPriority(ID, -1))
+        ChildWindow_JobQueue.ui.Table.Cancel.connect(JobScheduler.Cancel)
+        ChildWindow_JobQueue.ui.Table.Retry.connect(JobScheduler.Retry)
+        ChildWindow_JobQueue.ui.Table.Remove.connect(JobScheduler.Remove)
+
+        ChildWindow_JobQueue.ui.Button_ImportPipeline.setText(QCA.translate("Button", "导入流水线"))
+        ChildWindow_JobQueue.ui.Button_ImportPipeline.setToolTip("导入流水线定义文件，将音频处理、语音识别、语音转录、数据集制作与模型训练作为一组任务加入队列（未指定的参数使用各工具界面的当前设置）")
+        def ImportPipeline():
+            DefinitionPath = QFunc.Function_GetFileDialog(
+                Mode = "SelectFile",
+                FileType = "json类型 (*.json)"
+            )
+            if QFunc.NormPath(DefinitionPath) is None:
+                return
+            try:
+                Config_Buffer.FlushAll()
+                IDs = SubmitPipeline(JobScheduler, LoadPipeline(DefinitionPath), GetDirs(ModelDir, OutputDir, CurrentDir), ConfigDir)
+                MessageBoxBase.pop(self, QMessageBox.Information, "Tip", f"已将流水线的 {len(IDs)} 个任务加入队列。")
+            except Exception as e:
+                MessageBoxBase.pop(self, QMessageBox.Warning, 'Failure', f'发生异常：\n{e}')
+        ChildWindow_JobQueue.ui.Button_ImportPipeline.clicked.connect(ImportPipeline)
+        ChildWindow_JobQueue.ui.Button_ExportPipeline.setText(QCA.translate("Button", "导出流水线模板"))
+        ChildWindow_JobQueue.ui.Button_ExportPipeline.clicked.connect(
+            lambda: ExportTemplate(
+                QFunc.Function_GetFileDialog(
+                    Mode = "SaveFile",
+                    FileType = "json类型 (*.json)"
+                )
+            )
+        )
+        ChildWindow_JobQueue.ui.Button_ClearEnded.setText(QCA.translate("Button", "清除已结束任务"))
+        ChildWindow_JobQueue.ui.Button_ClearEnded.clicked.connect(JobScheduler.ClearEnded)
+        ChildWindow_JobQueue.ui.Button_Pause.clicked.connect(lambda: JobScheduler.SetPaused(not JobScheduler.Paused))
+        ChildWindow_JobQueue.ui.Button_Confirm.setText(QCA.translate("Button", "关闭"))
+        ChildWindow_JobQueue.ui.Button_Confirm.clicked.connect(ChildWindow_JobQueue.close)
+
+        Button_JobQueue = ButtonBase(self.ui.Frame_Bottom_Left)
+        Button_JobQueue.setBorderless(True)
+        Button_JobQueue.setTransparent(True)
+        Button_JobQueue.setToolTip("点击以查看任务队列（右键各工具的执行按钮可加入队列）")
+        Button_JobQueue.clicked.connect(FunctionSignals.Signal_ShowJobQueue.emit)
+        self.ui.Frame_Bottom_Left.layout().insertWidget(1, Button_JobQueue)
+
+        JobStatusTexts = {
+            'Pending': "等待中",
+            'Running': "运行中",
+            'Finished': "已完成",
+            'Failed': "失败",
+            'Cancelled': "已取消"
+        }
+        def RefreshJobQueue():
+            Counts = {Status: JobScheduler.Count(Status) for Status in ('Running', 'Pending')}
+            Button_JobQueue.setText(f"任务队列：{Counts['Running']} 运行 / {Counts['Pending']} 等待{'（已暂停）' if JobScheduler.Paused else ''}")
+            ChildWindow_JobQueue.ui.Button_Pause.setText(QCA.translate("Button", "继续队列" if JobScheduler.Paused else "暂停队列"))
+            if not ChildWindow_JobQueue.isVisible():
+                return
+            Limits = JobScheduler.Limits
+            QFunc.Function_SetText(
+                Widget = ChildWindow_JobQueue.ui.Label_Text,
+                Text = QFunc.SetRichText(
+                    Body = f"运行中 {Counts['Running']}，等待中 {Counts['Pending']}；资源上限：CPU {Limits['CPU']:g}，内存 {Limits['RAM']:g} GB，GPU {Limits['GPU']:g}（可在配置文件的 Scheduler 项中修改）"
+                )
+            )
+            Jobs = JobScheduler.Snapshot()
+            Titles = {Job['ID']: Job['Title'] for Job in Jobs}
+            ChildWindow_JobQueue.ui.Table.SetValue([
+                (
+                    Job['ID'],
+                    Job['Title'],
+                    Job['Status'],
+                    JobStatusTexts[Job['Status']] + (f"（优先级 {Job['Priority']:+d}）" if Job['Priority'] != 0 and Job['Status'] == 'Pending' else ''),
+                    Function_FormatProgress(Job['Progress'] or {}) if Job['Status'] == 'Running' else '',
+                    '\n'.join(
+                        [f"{Job['Task']['Module']}.{Job['Task']['Name']}"]
+                        + ([f"等待：{'、'.join(Titles.get(Dependency, Dependency) for Dependency in Job['Depends'])}"] if Job['Depends'] else [])
+                        + ([FormatCoreError(Job['Error'])] if Job['Error'] is not None else [])
+                    )
+                ) for Job in Jobs
+            ])
+        MainWindowSignals.Signal_JobsChanged.connect(RefreshJobQueue)
+        FunctionSignals.Signal_ShowJobQueue.connect(lambda: (ChildWindow_JobQueue.show(), RefreshJobQueue()))
+        JobScheduler.OnChanged = MainWindowSignals.Signal_JobsChanged.emit
+        JobScheduler.Start()
+        RefreshJobQueue()
+
         # Display Usage
         self.MonitorUsage.Signal_UsageInfo.connect(
             lambda Usage_CPU, Usage_GPU: (
@@ -6566,20 +6743,30 @@ class MainWindow(Window_MainWindow):
 ##############################################################################################################################
 
 if __name__ == "__main__":
-    App = QApplication(sys.argv)
+    with StartupProfiler.Span("Create QApplication"):
+        App = QApplication(sys.argv)
 
     # Create&Show SplashScreen
-    SC = QSplashScreen(QPixmap(QFunc.NormPath(Path(ResourceDir).joinpath('assets/images/others/SplashScreen.png'))))
-    #SC.showMessage('Loading...', alignment = Qt.AlignmentFlag.AlignCenter)
-    SC.show()
+    with StartupProfiler.Span("Show splash screen"):
+        SC = QSplashScreen(QPixmap(QFunc.NormPath(Path(ResourceDir).joinpath('assets/images/others/SplashScreen.png'))))
+        #SC.showMessage('Loading...', alignment = Qt.AlignmentFlag.AlignCenter)
+        SC.show()
 
     # Init&Show MainWindow
-    MW = MainWindow()
-    MW.Main()
+    with StartupProfiler.Span("Build main window"):
+        MW = MainWindow()
+    with StartupProfiler.Span("Set up main window"):
+        MW.Main()
 
     # Close SplashScreen
     SC.finish(MW) #SC.close()
 
+    # Write the startup trace once the event loop runs (and again on exit, with what ran in the background since)
+    if TracePath is not None:
+        SaveTrace = lambda: StartupProfiler.Save(TracePath, {'Version': str(CurrentVersion), 'Argv': sys.argv})
+        QTimer.singleShot(0, lambda: (StartupProfiler.Mark("Event loop running"), SaveTrace()))
+        App.aboutToQuit.connect(SaveTrace)
+
     sys.exit(App.exec())
 
 ##############################################################################################################################
\ No newline at end of file
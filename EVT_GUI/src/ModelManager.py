@@ -0,0 +1,237 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+##############################################################################################################################
+
+# Size of the chunks read while hashing
+HashChunkSize = 1024 ** 2
+
+##############################################################################################################################
+
+def GetFileSHA(FilePath: str):
+    '''
+    Compute the SHA-256 of a file chunk by chunk
+    '''
+    SHA = hashlib.sha256()
+    with open(FilePath, mode = 'rb') as f:
+        for Chunk in iter(lambda: f.read(HashChunkSize), b''):
+            SHA.update(Chunk)
+    return SHA.hexdigest()
+
+
+class Hash_Index:
+    '''
+    Remember the SHA-256 of model files by (path, size, mtime, inode) so that only new or changed files get hashed
+    (files that were moved keep their inode, size and mtime, so they are found again without rehashing)
+    '''
+    def __init__(self, IndexPath: Optional[str] = None):
+        self.IndexPath = IndexPath
+
+        self.Items = {}
+        self.Lock = threading.Lock()
+        self.Changed = False
+
+        self.Load()
+
+    def Load(self):
+        if self.IndexPath is None or not Path(self.IndexPath).exists():
+            return
+        try:
+            with open(self.IndexPath, mode = 'r', encoding = 'utf-8') as f:
+                self.Items = json.load(f)
+        except (OSError, ValueError):
+            self.Items = {}
+
+    def Save(self):
+        '''
+        Write the index if anything changed (dropping files that no longer exist)
+        '''
+        with self.Lock:
+            if self.IndexPath is None or not self.Changed:
+                return
+            Items = {FilePath: Item for FilePath, Item in self.Items.items() if Path(FilePath).exists()}
+            self.Changed = False
+        os.makedirs(Path(self.IndexPath).parent, exist_ok = True)
+        TempPath = f"{self.IndexPath}.tmp"
+        with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+            json.dump(Items, f, ensure_ascii = False)
+        os.replace(TempPath, self.IndexPath)
+
+    def GetSHA(self, FilePath: str):
+        FilePath = Path(FilePath).absolute().as_posix()
+        FileStat = os.stat(FilePath)
+        Key = [FileStat.st_size, FileStat.st_mtime_ns, FileStat.st_ino]
+        with self.Lock:
+            Item = self.Items.get(FilePath)
+            if Item is not None and Item[:3] == Key:
+                return Item[3]
+            Moved = [Item for Item in self.Items.values() if Item[:3] == Key and Key[2] != 0] if Item is None else []
+        SHA = Moved[0][3] if len(Moved) > 0 else GetFileSHA(FilePath)
+        with self.Lock:
+            self.Items[FilePath] = Key + [SHA]
+            self.Changed = True
+        return SHA
+
+
+class Manifest_Index:
+    '''
+    Parse the model manifest once and index its models by tags (parsed again only when the file's size or mtime changes)
+    '''
+    def __init__(self, ManifestPath: Optional[str] = None):
+        self.ManifestPath = ManifestPath
+
+        self.Key = None
+        self.Models = {}
+        self.Lock = threading.Lock()
+
+    def Refresh(self):
+        try:
+            FileStat = os.stat(self.ManifestPath)
+        except (OSError, TypeError):
+            self.Key, self.Models = None, {}
+            return
+        Key = (FileStat.st_size, FileStat.st_mtime_ns)
+        if Key == self.Key:
+            return
+        with open(self.ManifestPath, mode = 'r', encoding = 'utf-8') as f:
+            Param = json.load(f)
+        Models = {}
+        for ModelDict in Param["models"]:
+            Models.setdefault(tuple(ModelDict["tags"]), []).append(ModelDict)
+        self.Key, self.Models = Key, Models
+
+    def Get(self, Tags: list):
+        '''
+        Return the models with the given tags (the same list object until the manifest changes)
+        '''
+        with self.Lock:
+            self.Refresh()
+            return self.Models.get(tuple(Tags), [])
+
+##############################################################################################################################
+
+def ScanModels(ModelsDir: str, ModelsFormats: list):
+    '''
+    Stat the model files under a dir (without reading them), return them along with the dirs that were walked
+    '''
+    Files = {}
+    Dirs = []
+    for DirPath, FolderNames, FileNames in os.walk(ModelsDir):
+        Dirs.append(Path(DirPath).as_posix())
+        for FileName in FileNames:
+            if not FileName.endswith(tuple(ModelsFormats)):
+                continue
+            FilePath = Path(DirPath).joinpath(FileName).absolute().as_posix()
+            try:
+                FileStat = os.stat(FilePath)
+            except OSError:
+                continue
+            Files[FilePath] = (FileStat.st_size, FileStat.st_mtime_ns)
+    return Files, Dirs
+
+
+class Model_Catalogue:
+    '''
+    Keep the rows listed for a model dir and report what changed since the last update
+    (files are compared by size and mtime, so only new or changed ones get looked at again)
+    '''
+    # Files modified within this many seconds may still be being written
+    SettleTime = 3
+
+    def __init__(self, ModelsDir: str, ModelsFormats: list, Hashes: Optional[Hash_Index] = None):
+        self.ModelsDir = ModelsDir
+        self.ModelsFormats = ModelsFormats
+        self.Hashes = Hashes or Hash_Index()
+
+        self.Files = {}
+        self.Locals = {}
+        self.Rows = {}
+        self.Dirs = []
+        self.Unsettled = False
+        self.Lock = threading.Lock()
+
+        self.ModelDicts_Cloud = None
+        self.Rows_Cloud = {}
+
+    def GetCloudRows(self, ModelDicts: list):
+        Rows = {}
+        for ModelDict in ModelDicts:
+            if isinstance(ModelDict["SHA"], dict):
+                Name = ModelDict["name"]
+                for Model, ModelSHA in ModelDict["SHA"].items():
+                    ModelName, ModelType = Model.rsplit('.', 1)
+                    ModelURL = ModelDict["downloadurl"][Model]
+                    ModelDir = Path(self.ModelsDir).joinpath("Downloaded", Name)
+                    DownloadParam = (ModelURL, ModelDir, ModelName, Path(ModelURL).suffix, ModelSHA)
+                    Rows[ModelSHA] = [str(f"[{Name}]{ModelName}"), str(ModelType), str(ModelDict["size"][Model]), str(ModelDict["date"][Model]), tuple(DownloadParam)]
+            else:
+                ModelName, ModelType = ModelDict["name"].rsplit('.', 1)
+                ModelSHA = ModelDict["SHA"]
+                ModelURL = ModelDict["downloadurl"]
+                ModelDir = Path(self.ModelsDir).joinpath("Downloaded")
+                DownloadParam = (ModelURL, ModelDir, ModelName, Path(ModelURL).suffix, ModelSHA)
+                Rows[ModelSHA] = [str(ModelName), str(ModelType), str(ModelDict["size"]), str(ModelDict["date"]), tuple(DownloadParam)]
+        return Rows
+
+    def GetLocalRow(self, ModelPath: str):
+        Name = Path(ModelPath).parts[-2] if Path(ModelPath).parent.as_posix() not in Path(self.ModelsDir).absolute().joinpath("Downloaded").as_posix() else None
+        ModelName, ModelType = Path(ModelPath).name.rsplit('.', 1)
+        ModelSize = round(Path(ModelPath).stat().st_size / (1024 ** 2), 1)
+        ModelDate = datetime.fromtimestamp(Path(ModelPath).stat().st_mtime)
+        ModelSHA = self.Hashes.GetSHA(ModelPath)
+        ModelDir = Path(ModelPath).parent
+        return ModelSHA, [str(f"[{Name}]{ModelName}" if Name is not None else ModelName), str(ModelType), str(ModelSize)+'MB', str(ModelDate), str(ModelDir)]
+
+    def Update(self, ModelDicts_Cloud: list = []):
+        '''
+        Rescan the dir and return the rows that were added, removed or changed as {'Added': {SHA: Row}, 'Removed': [SHA], 'Changed': {SHA: Row}}
+        '''
+        with self.Lock:
+            os.makedirs(self.ModelsDir, exist_ok = True)
+            Files, self.Dirs = ScanModels(self.ModelsDir, self.ModelsFormats)
+
+            for ModelPath in [ModelPath for ModelPath in self.Locals if ModelPath not in Files]:
+                del self.Locals[ModelPath]
+            ModelPaths_Update = [ModelPath for ModelPath, Key in Files.items() if self.Files.get(ModelPath) != Key]
+            def GetLocalRow(ModelPath):
+                try:
+                    return ModelPath, self.GetLocalRow(ModelPath)
+                except OSError:
+                    return ModelPath, None
+            with ThreadPoolExecutor(max_workers = os.cpu_count()) as Executor:
+                for ModelPath, Local in Executor.map(GetLocalRow, ModelPaths_Update):
+                    if Local is None:
+                        Files.pop(ModelPath)
+                        self.Locals.pop(ModelPath, None)
+                        continue
+                    self.Locals[ModelPath] = Local
+            self.Files = Files
+            self.Unsettled = any(time.time_ns() - MTimeNs < self.SettleTime * 10**9 for Size, MTimeNs in Files.values())
+
+            if ModelDicts_Cloud is not self.ModelDicts_Cloud:
+                self.ModelDicts_Cloud, self.Rows_Cloud = ModelDicts_Cloud, self.GetCloudRows(ModelDicts_Cloud)
+            Rows = dict(self.Rows_Cloud)
+            Rows.update({ModelSHA: Row for ModelSHA, Row in self.Locals.values()})
+            Delta = {
+                'Added': {ModelSHA: Row for ModelSHA, Row in Rows.items() if ModelSHA not in self.Rows},
+                'Removed': [ModelSHA for ModelSHA in self.Rows if ModelSHA not in Rows],
+                'Changed': {ModelSHA: Row for ModelSHA, Row in Rows.items() if ModelSHA in self.Rows and self.Rows[ModelSHA] != Row}
+            }
+            self.Rows = Rows
+        return Delta
+
+    def Reset(self):
+        with self.Lock:
+            self.Files = {}
+            self.Locals = {}
+            self.Rows = {}
+            self.ModelDicts_Cloud = None
+
+##############################################################################################################################
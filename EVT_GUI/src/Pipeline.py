@@ -0,0 +1,283 @@
+import os
+import json
+import shutil
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+from Tools import Tools
+from Results import ASR_Result, LinkFile, LinkFiles, LinkManifestName
+from Scheduler import Job_Scheduler
+
+##############################################################################################################################
+
+# Media formats picked up from the input dir
+MediaFormats = ('.flac', '.wav', '.mp3', '.aac', '.m4a', '.wma', '.aiff', '.au', '.ogg', '.mp4', '.mkv', '.avi', '.mov', '.flv', '.webm')
+
+# Stages a pipeline is made of (dataset & training stages come in a GPT-SoVITS and a VITS flavour)
+DATStages = ('dat-gptsovits', 'dat-vits')
+TrainStages = {'dat-gptsovits': 'train-gptsovits', 'dat-vits': 'train-vits'}
+
+# Task of the helper steps (run on a worker like the core tools, but imported from this dir)
+HelperTask = {
+    'Key': 'Pipeline',
+    'Module': 'Pipeline',
+    'KeepAlive': True,
+    'Resources': {'CPU': 1},
+    'Paths': [Path(__file__).parent.as_posix()]
+}
+
+##############################################################################################################################
+
+class Speaker_Filtering:
+    '''
+    Keep the clips that matched a speaker and sort them into a dir per speaker (the same as saving an ASR result with audio moved)
+    '''
+    def __init__(self,
+        AudioSpeakersDataPath: str,
+        AudioDirOutput: str,
+        AudioSpeakersDataPathOutput: str
+    ):
+        self.AudioSpeakersDataPath = AudioSpeakersDataPath
+        self.AudioDirOutput = AudioDirOutput
+        self.AudioSpeakersDataPathOutput = AudioSpeakersDataPathOutput
+
+    def Filter(self):
+        Pairs = []
+        Lines = []
+        for Audio, Speaker, Sim in ASR_Result(self.AudioSpeakersDataPath):
+            if Speaker == '':
+                continue
+            Audio_Dst = Path(self.AudioDirOutput).joinpath(Speaker, Path(Audio).name).as_posix()
+            Pairs.append((Audio, Audio_Dst))
+            Lines.append(f"{Audio_Dst}|{Speaker}\n")
+        LinkFiles(Pairs, ManifestPath = Path(self.AudioDirOutput).joinpath(LinkManifestName).as_posix())
+        os.makedirs(Path(self.AudioSpeakersDataPathOutput).parent, exist_ok = True)
+        with open(self.AudioSpeakersDataPathOutput, mode = 'w', encoding = 'utf-8') as AudioSpeakersData:
+            AudioSpeakersData.writelines(Lines)
+
+
+class Result_Merging:
+    '''
+    Merge the per-chunk ASR data and SRT files into the inputs of the dataset creator
+    '''
+    def __init__(self,
+        AudioSpeakersDataPaths: list,
+        SRTDirs: list,
+        AudioSpeakersDataPath: str,
+        SRTDir: str
+    ):
+        self.AudioSpeakersDataPaths = AudioSpeakersDataPaths
+        self.SRTDirs = SRTDirs
+        self.AudioSpeakersDataPath = AudioSpeakersDataPath
+        self.SRTDir = SRTDir
+
+    def Merge(self):
+        os.makedirs(Path(self.AudioSpeakersDataPath).parent, exist_ok = True)
+        with open(self.AudioSpeakersDataPath, mode = 'w', encoding = 'utf-8') as AudioSpeakersData:
+            for AudioSpeakersDataPath in self.AudioSpeakersDataPaths:
+                if not Path(AudioSpeakersDataPath).exists():
+                    continue
+                with open(AudioSpeakersDataPath, mode = 'r', encoding = 'utf-8') as AudioSpeakersData_Chunk:
+                    AudioSpeakersData.writelines(Line for Line in AudioSpeakersData_Chunk if Line.strip() != '')
+        os.makedirs(self.SRTDir, exist_ok = True)
+        for SRTDir in self.SRTDirs:
+            for SRTFile in Path(SRTDir).glob('*.srt'):
+                LinkFile(SRTFile.as_posix(), Path(self.SRTDir).joinpath(SRTFile.name).as_posix())
+
+
+class WorkDir_Cleaning:
+    '''
+    Remove the intermediate files of a pipeline
+    '''
+    def __init__(self,
+        WorkDir: str
+    ):
+        self.WorkDir = WorkDir
+
+    def Clean(self):
+        shutil.rmtree(self.WorkDir, ignore_errors = True)
+
+##############################################################################################################################
+
+def GetTemplate():
+    '''
+    Get an example pipeline definition
+    '''
+    return {
+        'Name': 'Pipeline',
+        'Input': '',
+        'WorkDir': '',
+        'ChunkSize': 20,
+        'KeepIntermediate': False,
+        'Priority': 0,
+        'Stages': {
+            'process': {'Config': ''},
+            'vpr': {'Config': '', 'StdAudioSpeaker': {'': ''}},
+            'whisper': {'Config': ''},
+            'dat-gptsovits': {'Config': ''},
+            'train-gptsovits': {'Config': ''}
+        }
+    }
+
+
+def ExportTemplate(SavePath: str):
+    if str(SavePath).strip() == '':
+        return
+    with open(SavePath, mode = 'w', encoding = 'utf-8') as f:
+        json.dump(GetTemplate(), f, ensure_ascii = False, indent = 4)
+
+
+def LoadPipeline(DefinitionPath: str):
+    '''
+    Load and check a pipeline definition
+    '''
+    with open(DefinitionPath, mode = 'r', encoding = 'utf-8') as f:
+        Definition = json.load(f)
+    Stages = Definition.get('Stages', {})
+    for Stage in Stages:
+        if Stage not in Tools or Stage.startswith('tts'):
+            raise ValueError(f"Unknown pipeline stage: {Stage}")
+    for Stage in ('process', 'vpr', 'whisper'):
+        if Stage not in Stages:
+            raise ValueError(f"Pipeline stage missing: {Stage}")
+    DATStage = [Stage for Stage in DATStages if Stage in Stages]
+    if len(DATStage) != 1:
+        raise ValueError(f"Pipeline should have exactly one of the stages: {', '.join(DATStages)}")
+    for Stage in TrainStages.values():
+        if Stage in Stages and Stage != TrainStages[DATStage[0]]:
+            raise ValueError(f"Stage {Stage} doesn't match {DATStage[0]}")
+    if not Path(str(Definition.get('Input', ''))).is_dir():
+        raise ValueError(f"Input dir not found: {Definition.get('Input')}")
+    return Definition
+
+
+def SplitInput(
+    InputDir: str,
+    ChunkRoot: str,
+    ChunkSize: int = 20
+):
+    '''
+    Link the media files into chunk dirs (renaming duplicated names so that every clip stays traceable to its SRT)
+    '''
+    MediaPaths = sorted(
+        [MediaPath for MediaPath in Path(InputDir).rglob('*') if MediaPath.is_file() and MediaPath.suffix.lower() in MediaFormats],
+        key = lambda MediaPath: MediaPath.as_posix()
+    )
+    ChunkSize = max(int(ChunkSize), 1)
+    ChunkDirs = []
+    Stems = set()
+    for Index, MediaPath in enumerate(MediaPaths):
+        if Index % ChunkSize == 0:
+            ChunkDirs.append(Path(ChunkRoot).joinpath(str(len(ChunkDirs))).as_posix())
+        Stem, Count = MediaPath.stem, 1
+        while Stem.lower() in Stems:
+            Stem, Count = f"{MediaPath.stem}_{Count}", Count + 1
+        Stems.add(Stem.lower())
+        LinkFile(MediaPath.as_posix(), Path(ChunkDirs[-1]).joinpath(f"{Stem}{MediaPath.suffix}").as_posix(), Mode = 'Hardlink') # Only read by the process stage
+    return ChunkDirs
+
+
+def GetStageValues(
+    Definition: dict,
+    Stage: str,
+    Dirs: dict,
+    ConfigDir: Optional[str] = None
+):
+    '''
+    Get the values of a stage: defaults < config file (the one given or the client's) < values given in the definition
+    '''
+    StageTool = Tools[Stage]
+    StageDefinition = dict(Definition['Stages'][Stage] or {})
+    ConfigPath = StageDefinition.pop('Config', '') or (Path(ConfigDir).joinpath(StageTool.ConfigName).as_posix() if ConfigDir is not None else '')
+    Values = StageTool.ReadConfig(ConfigPath, Dirs) if ConfigPath != '' and Path(ConfigPath).exists() else StageTool.GetDefaults(Dirs)
+    for Name, Value in StageDefinition.items():
+        StageTool.GetParam(Name)
+        Values[Name] = Value
+    return Values
+
+
+def SubmitPipeline(
+    Scheduler: Job_Scheduler,
+    Definition: dict,
+    Dirs: dict,
+    ConfigDir: Optional[str] = None
+):
+    '''
+    Split the input into chunks and queue the stages of every chunk as jobs depending on each other,
+    so that a chunk goes on to identifying and transcribing while the next one is still being processed.
+    Only the dataset (and the trained model) end up in the stages' output dirs, the rest stays in the work dir.
+    Return the IDs of the submitted jobs
+    '''
+    Name = Definition.get('Name') or 'Pipeline'
+    Priority = int(Definition.get('Priority', 0))
+    WorkDir = Path(Definition.get('WorkDir') or Path(Dirs['OutputDir']).joinpath('流水线缓存')).joinpath(f"{Name}_{datetime.now().strftime('%Y%m%d-%H%M%S')}").as_posix()
+    DATStage = [Stage for Stage in DATStages if Stage in Definition['Stages']][0]
+    TrainStage = TrainStages[DATStage] if TrainStages[DATStage] in Definition['Stages'] else None
+    StageValues = {Stage: GetStageValues(Definition, Stage, Dirs, ConfigDir) for Stage in Definition['Stages']}
+
+    # Plan all the jobs before submitting any of them, so that a bad param doesn't leave half a pipeline in the queue
+    Jobs = []
+    def AddJob(Task: dict, Title: str, Depends: list = [], Offset: int = 0):
+        Jobs.append((Task, f"{Name} {Title}", Depends, Priority + Offset))
+        return len(Jobs) - 1
+    def AddStage(Stage: str, Values: dict, Title: str, Depends: list = [], Offset: int = 0):
+        Params = Tools[Stage].ToParams({**StageValues[Stage], **Values}, Dirs)
+        return AddJob(Tools[Stage].Task(Params), Title, Depends, Offset), dict(zip([Param.Name for Param in Tools[Stage].Params], Params))
+    def AddHelper(Function: str, Call: str, Params: tuple, Title: str, Depends: list = [], Offset: int = 0):
+        return AddJob({**HelperTask, 'Name': Function, 'Params': Params, 'Calls': [Call]}, Title, Depends, Offset)
+
+    ChunkDirs = SplitInput(Definition['Input'], f"{WorkDir}/Chunks", Definition.get('ChunkSize', 20))
+    try:
+        if len(ChunkDirs) == 0:
+            raise ValueError(f"No media found in {Definition['Input']}")
+        WhisperJobs = []
+        for Index, ChunkDir in enumerate(ChunkDirs):
+            Chunk = f"[{Index + 1}/{len(ChunkDirs)}]"
+            ProcessJob, _ = AddStage('process',
+                {'MediaDirInput': ChunkDir, 'OutputRoot': f"{WorkDir}/Process", 'OutputDirName': str(Index)},
+                f"{Chunk} 音频处理"
+            )
+            VPRJob, _ = AddStage('vpr',
+                {'AudioDirInput': f"{WorkDir}/Process/{Index}", 'OutputRoot': f"{WorkDir}/VPR", 'OutputDirName': str(Index), 'AudioSpeakersDataName': 'AudioSpeakers'},
+                f"{Chunk} 语音识别", [ProcessJob], 1
+            )
+            FilterJob = AddHelper('Speaker_Filtering', 'Filter',
+                (f"{WorkDir}/VPR/{Index}/AudioSpeakers.txt", f"{WorkDir}/Speakers/{Index}", f"{WorkDir}/Speakers/{Index}.txt"),
+                f"{Chunk} 筛选匹配音频", [VPRJob], 2
+            )
+            WhisperJob, _ = AddStage('whisper',
+                {'AudioDir': f"{WorkDir}/Speakers/{Index}", 'OutputRoot': f"{WorkDir}/STT", 'OutputDirName': str(Index)},
+                f"{Chunk} 语音转录", [FilterJob], 3
+            )
+            WhisperJobs.append(WhisperJob)
+        MergeJob = AddHelper('Result_Merging', 'Merge',
+            ([f"{WorkDir}/Speakers/{Index}.txt" for Index in range(len(ChunkDirs))], [f"{WorkDir}/STT/{Index}" for Index in range(len(ChunkDirs))], f"{WorkDir}/AudioSpeakers.txt", f"{WorkDir}/SRT"),
+            "合并识别与转录结果", WhisperJobs, 4
+        )
+        DATJob, DATParams = AddStage(DATStage,
+            {'SRTDir': f"{WorkDir}/SRT", 'AudioSpeakersDataPath': f"{WorkDir}/AudioSpeakers.txt"},
+            "数据集制作", [MergeJob], 4
+        )
+        if TrainStage is not None:
+            DATOutputDir = Path(DATParams['OutputRoot']).joinpath(DATParams['OutputDirName']).as_posix()
+            AddStage(TrainStage,
+                {
+                    'FileListPath': f"{DATOutputDir}/{DATParams['FileListName']}.txt"
+                } if TrainStage == 'train-gptsovits' else {
+                    'FileListPathTraining': f"{DATOutputDir}/{DATParams['FileListNameTraining']}.txt",
+                    'FileListPathValidation': f"{DATOutputDir}/{DATParams['FileListNameValidation']}.txt"
+                },
+                "模型训练", [DATJob], 4
+            )
+        AddHelper('WorkDir_Cleaning', 'Clean', (WorkDir, ), "清理中间文件", [DATJob], 4) if not Definition.get('KeepIntermediate', False) else None
+    except Exception:
+        shutil.rmtree(WorkDir, ignore_errors = True)
+        raise
+
+    IDs = []
+    for Task, Title, Depends, JobPriority in Jobs:
+        IDs.append(Scheduler.Submit(Task, Title, JobPriority, [IDs[Depend] for Depend in Depends]))
+    return IDs
+
+##############################################################################################################################
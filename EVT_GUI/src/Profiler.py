@@ -0,0 +1,161 @@
+import os
+import sys
+import json
+import time
+import builtins
+import threading
+import importlib.util
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Optional, Callable
+
+##############################################################################################################################
+
+# Flag that turns the profiler on (checked before anything else gets imported)
+Flag = '--profile-startup'
+
+# Where the trace goes when the flag is given without a path
+DefaultTracePath = 'StartupProfile.json'
+
+##############################################################################################################################
+
+def IsRequested(Argv: list):
+    return any(Arg == Flag or Arg.startswith(f"{Flag}=") for Arg in Argv)
+
+
+class Startup_Profiler:
+    '''
+    Record spans of time as trace events (the Chrome trace format, which can be opened in Perfetto or speedscope
+    or turned into a flamegraph), nested spans of a thread show up as children of the span that encloses them
+    '''
+    def __init__(self, Enabled: bool = False):
+        self.Enabled = Enabled
+
+        self.Origin = time.perf_counter_ns()
+        self.Events = []
+        self.Threads = {}
+        self.Lock = threading.Lock()
+
+    def Now(self):
+        '''
+        Microseconds since the profiler was created
+        '''
+        return (time.perf_counter_ns() - self.Origin) / 1000
+
+    def AddEvent(self, Event: dict):
+        ThreadID = threading.get_ident()
+        Event.update(pid = os.getpid(), tid = ThreadID)
+        with self.Lock:
+            self.Threads.setdefault(ThreadID, threading.current_thread().name)
+            self.Events.append(Event)
+
+    def AddSpan(self, Name: str, Category: str, Start: float, End: float, Args: dict = {}):
+        self.AddEvent({'name': Name, 'cat': Category, 'ph': 'X', 'ts': Start, 'dur': End - Start, 'args': Args})
+
+    def Mark(self, Name: str, Category: str = 'startup'):
+        '''
+        Record a moment (e.g. the window becoming interactive)
+        '''
+        self.AddEvent({'name': Name, 'cat': Category, 'ph': 'i', 's': 'g', 'ts': self.Now()}) if self.Enabled else None
+
+    @contextmanager
+    def TimeSpan(self, Name: str, Category: str, Args: dict):
+        Start = self.Now()
+        try:
+            yield
+        finally:
+            self.AddSpan(Name, Category, Start, self.Now(), Args)
+
+    def Span(self, Name: str, Category: str = 'startup', **Args):
+        '''
+        Time the block under the given name
+        '''
+        return self.TimeSpan(Name, Category, Args) if self.Enabled else nullcontext()
+
+    def Trace(self, Name: Optional[str] = None, Category: str = 'startup'):
+        '''
+        Time every call of the decorated function (left as it is when the profiler is off)
+        '''
+        def Decorator(Function: Callable):
+            if not self.Enabled:
+                return Function
+            @wraps(Function)
+            def Wrapper(*Args, **Kwargs):
+                with self.TimeSpan(Name or Function.__qualname__, Category, {}):
+                    return Function(*Args, **Kwargs)
+            return Wrapper
+        return Decorator
+
+    @contextmanager
+    def Segments(self, Owner: type, MethodName: str, GetName: Callable, Category: str = 'startup'):
+        '''
+        Split the time spent in the block into spans that end at the calls of a method,
+        each named by GetName from the call's args (calls it names None don't end a span)
+        '''
+        if not self.Enabled:
+            yield
+            return
+        Method = getattr(Owner, MethodName)
+        Start = self.Now()
+        def Wrapper(*Args, **Kwargs):
+            nonlocal Start
+            Result = Method(*Args, **Kwargs)
+            Name = GetName(*Args, **Kwargs)
+            if Name is not None:
+                End = self.Now()
+                self.AddSpan(Name, Category, Start, End)
+                Start = End
+            return Result
+        setattr(Owner, MethodName, Wrapper)
+        try:
+            yield
+        finally:
+            setattr(Owner, MethodName, Method)
+
+    def TraceImports(self):
+        '''
+        Time the modules imported from now on (only the imports that load something, named after what they loaded)
+        '''
+        if not self.Enabled:
+            return
+        Import = builtins.__import__
+        def TimedImport(name, globals = None, locals = None, fromlist = (), level = 0): # Same signature as __import__ (called with keywords too)
+            try:
+                FullName = importlib.util.resolve_name('.' * level + name, (globals or {}).get('__package__') or '') if level > 0 else name
+            except (ImportError, ValueError):
+                FullName = name
+            SubNames = [f"{FullName}.{Item}" for Item in (fromlist or ()) if Item != '*']
+            if FullName in sys.modules and all(SubName in sys.modules for SubName in SubNames):
+                return Import(name, globals, locals, fromlist, level)
+            Loaded = set(sys.modules)
+            Start = self.Now()
+            try:
+                return Import(name, globals, locals, fromlist, level)
+            finally:
+                End = self.Now()
+                if len(sys.modules) > len(Loaded):
+                    Names = ([FullName] if FullName not in Loaded else []) + [SubName for SubName in SubNames if SubName in sys.modules and SubName not in Loaded] or [FullName]
+                    self.AddSpan(f"import {', '.join(Names)}", 'import', Start, End)
+        builtins.__import__ = TimedImport
+
+    def Save(self, TracePath: str, Info: dict = {}):
+        '''
+        Write what was recorded so far as a trace
+        '''
+        if not self.Enabled:
+            return
+        with self.Lock:
+            Events = list(self.Events)
+            Threads = dict(self.Threads)
+        Metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': ThreadID, 'args': {'name': ThreadName}} for ThreadID, ThreadName in Threads.items()]
+        os.makedirs(os.path.dirname(os.path.abspath(TracePath)), exist_ok = True)
+        TempPath = f"{TracePath}.tmp"
+        with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+            json.dump({'traceEvents': Metadata + Events, 'displayTimeUnit': 'ms', 'otherData': Info}, f, ensure_ascii = False)
+        os.replace(TempPath, TracePath)
+
+
+StartupProfiler = Startup_Profiler(IsRequested(sys.argv))
+StartupProfiler.TraceImports()
+
+##############################################################################################################################
@@ -0,0 +1,428 @@
+import os
+import json
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from FileList import LoadFileList, WriteTextFileList
+
+##############################################################################################################################
+
+# Request of the ioctl that clones a file on Linux filesystems with reflinks (FICLONE)
+FICLONE = 0x40049409
+
+# Number of files linked or copied at once
+MaxLinkWorkers = 8
+
+# Ways of putting files into place (see LinkFile)
+LinkModes = ('Auto', 'Hardlink', 'Symlink', 'Copy')
+
+# Name of the manifest that records how the files of a dir were put there
+LinkManifestName = 'LinkManifest.json'
+
+##############################################################################################################################
+
+def CloneFile(Src: str, Dst: str):
+    '''
+    Reflink the file (the copy shares the data until either is written), return whether it worked
+    '''
+    if fcntl is None:
+        return False
+    with open(Src, mode = 'rb') as SrcFile:
+        try:
+            DstFile = open(Dst, mode = 'xb')
+        except OSError:
+            return False
+        with DstFile:
+            try:
+                fcntl.ioctl(DstFile.fileno(), FICLONE, SrcFile.fileno())
+                Cloned = True
+            except OSError:
+                Cloned = False
+    shutil.copystat(Src, Dst) if Cloned else os.remove(Dst)
+    return Cloned
+
+
+def LinkFile(Src: str, Dst: str, Mode: str = 'Auto'):
+    '''
+    Put the file at the destination without copying its data where possible, return how it was done:
+    'Auto' reflinks it, 'Hardlink' reflinks or hardlinks it, 'Symlink' symlinks it, and all of them fall back to a copy (e.g. across drives)
+    (a hardlink or symlink shares the file with the source, so writing to either in place changes both)
+    '''
+    os.makedirs(Path(Dst).parent, exist_ok = True)
+    if Path(Dst).exists():
+        return 'Existing'
+    if Mode in ('Auto', 'Hardlink'):
+        if CloneFile(Src, Dst):
+            return 'Reflink'
+    if Mode == 'Hardlink':
+        try:
+            os.link(Src, Dst)
+            return 'Hardlink'
+        except OSError:
+            pass
+    if Mode == 'Symlink':
+        try:
+            os.symlink(Path(Src).absolute(), Dst)
+            return 'Symlink'
+        except OSError:
+            pass
+    shutil.copy2(Src, Dst)
+    return 'Copy'
+
+
+def VerifyFile(Src: str, Dst: str):
+    '''
+    Check that the destination resolves to a file of the same size as the source
+    '''
+    try:
+        return os.stat(Dst).st_size == os.stat(Src).st_size
+    except OSError:
+        return False
+
+
+def LinkFiles(Pairs: list, OnProgress: Optional[Callable] = None, Mode: str = 'Auto', ManifestPath: Optional[str] = None):
+    '''
+    Link the (Src, Dst) pairs in parallel (calling OnProgress(Done, Total) as they finish) and verify the ones put in place
+    (mismatched ones are put in place again), record how each was done in the manifest if given
+    '''
+    Methods = {}
+    def Link(Src, Dst):
+        Method = LinkFile(Src, Dst, Mode)
+        if Method != 'Existing' and not VerifyFile(Src, Dst):
+            os.remove(Dst)
+            Method = LinkFile(Src, Dst, Mode)
+            if not VerifyFile(Src, Dst):
+                raise OSError(f"Failed to verify {Dst}")
+        return Dst, Src, Method
+    with ThreadPoolExecutor(max_workers = MaxLinkWorkers) as Executor:
+        Futures = [Executor.submit(Link, Src, Dst) for Src, Dst in Pairs]
+        for Done, Future in enumerate(as_completed(Futures), start = 1):
+            Dst, Src, Method = Future.result()
+            Methods[Dst] = (Src, Method)
+            OnProgress(Done, len(Futures)) if OnProgress is not None else None
+    SaveLinkManifest(ManifestPath, Mode, Methods) if ManifestPath is not None and len(Methods) > 0 else None
+    return Methods
+
+
+def SaveLinkManifest(ManifestPath: str, Mode: str, Methods: dict):
+    '''
+    Merge the files into the manifest, which maps them (relative to its dir) to their source and how they were put there
+    '''
+    Manifest = {'Mode': Mode, 'Files': {}}
+    if Path(ManifestPath).exists():
+        try:
+            with open(ManifestPath, mode = 'r', encoding = 'utf-8') as f:
+                Manifest['Files'] = json.load(f).get('Files', {})
+        except (OSError, ValueError):
+            pass
+    for Dst, (Src, Method) in Methods.items():
+        Key = Path(os.path.relpath(Dst, Path(ManifestPath).parent)).as_posix()
+        Previous = Manifest['Files'].get(Key)
+        # Files that were already there keep the record of how they got there
+        Manifest['Files'][Key] = Previous if Method == 'Existing' and Previous is not None else {'Src': Path(Src).absolute().as_posix(), 'Method': Method}
+    os.makedirs(Path(ManifestPath).parent, exist_ok = True)
+    TempPath = f"{ManifestPath}.tmp"
+    with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+        json.dump(Manifest, f, ensure_ascii = False, indent = 1)
+    os.replace(TempPath, ManifestPath)
+
+##############################################################################################################################
+
+class Stem_Index:
+    '''
+    Map the stems of the files in a dir to their paths in a single walk,
+    cached until the mtime of any of the walked dirs changes (i.e. files were added, removed or renamed)
+    '''
+    def __init__(self):
+        self.Cache = {}
+        self.Lock = threading.Lock()
+
+    def Build(self, Dir: str, Recursive: bool, Suffixes: Optional[tuple]):
+        Index = {}
+        DirMTimes = {}
+        for DirPath, FolderNames, FileNames in os.walk(Dir):
+            FolderNames.sort()
+            DirMTimes[DirPath] = os.stat(DirPath).st_mtime_ns
+            for FileName in sorted(FileNames):
+                if FileName.startswith('.') or '.' not in FileName:
+                    continue
+                if Suffixes is not None and not FileName.lower().endswith(Suffixes):
+                    continue
+                Index.setdefault(Path(FileName).stem, os.path.join(DirPath, FileName))
+            if not Recursive:
+                break
+        return DirMTimes, Index
+
+    def IsValid(self, DirMTimes: dict):
+        try:
+            return all(os.stat(DirPath).st_mtime_ns == MTimeNs for DirPath, MTimeNs in DirMTimes.items())
+        except OSError:
+            return False
+
+    def Get(self, Dir: str, Recursive: bool = True, Suffixes: Optional[tuple] = None):
+        '''
+        Return {stem: path} for the files in the dir (the first one in sorted walk order wins for repeated stems)
+        '''
+        Key = (Path(Dir).absolute().as_posix(), Recursive, Suffixes)
+        with self.Lock:
+            Cached = self.Cache.get(Key)
+        if Cached is not None and self.IsValid(Cached[0]):
+            return Cached[1]
+        Cached = self.Build(Dir, Recursive, Suffixes)
+        with self.Lock:
+            self.Cache[Key] = Cached
+        return Cached[1]
+
+
+class STT_Result:
+    '''
+    Audio files paired with their subtitle files, whose text is only read when asked for
+    (a bounded number of texts is kept in memory) and only written back when edited
+    '''
+    # Number of unedited texts kept in memory
+    CacheSize = 1000
+
+    def __init__(self, SRTDir: str, AudioDir: str, Index: Optional[Stem_Index] = None):
+        Index = Index or Stem_Index()
+        AudioFiles = Index.Get(AudioDir, Recursive = True)
+        self.Items = [
+            (AudioFiles[Stem], SRTFile) for Stem, SRTFile in Index.Get(SRTDir, Recursive = False, Suffixes = ('.srt',)).items() if Stem in AudioFiles
+        ]
+        self.Texts = OrderedDict()
+        self.Edited = {}
+        self.Lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.Items)
+
+    def GetAudio(self, Row: int):
+        return self.Items[Row][0]
+
+    def GetText(self, Row: int):
+        with self.Lock:
+            if Row in self.Edited:
+                return self.Edited[Row]
+            if Row in self.Texts:
+                self.Texts.move_to_end(Row)
+                return self.Texts[Row]
+        with open(self.Items[Row][1], mode = 'r', encoding = 'utf-8') as SRT:
+            Text = SRT.read()
+        with self.Lock:
+            self.Texts[Row] = Text
+            self.Texts.popitem(last = False) if len(self.Texts) > self.CacheSize else None
+        return Text
+
+    def SetText(self, Row: int, Text: str):
+        if Row not in self.Edited and Text == self.GetText(Row):
+            return
+        with self.Lock:
+            self.Edited[Row] = Text
+            self.Texts.pop(Row, None)
+
+    def Save(self):
+        '''
+        Write back the edited texts only, return the number of files written
+        '''
+        with self.Lock:
+            Edited = dict(self.Edited)
+        for Row, Text in Edited.items():
+            SRTFile = self.Items[Row][1]
+            TempPath = f"{SRTFile}.tmp"
+            with open(TempPath, mode = 'w', encoding = 'utf-8') as SRT:
+                SRT.write(Text)
+            os.replace(TempPath, SRTFile)
+            with self.Lock:
+                self.Edited.pop(Row, None) if self.Edited.get(Row) == Text else None
+        return len(Edited)
+
+
+class DAT_Result:
+    '''
+    Lines of a filelist, read through its memory-mapped binary form (only the lines asked for get decoded)
+    and written back only if edited, the audio of a line is its first field (relative to the filelist's dir)
+    '''
+    def __init__(self, DATPath: str):
+        self.DATPath = DATPath
+        self.FileList = LoadFileList(DATPath)
+        self.Edited = {}
+        self.Lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.FileList)
+
+    def GetAudio(self, Row: int):
+        return Path(self.DATPath).parent.joinpath(self.FileList.GetField(Row, 0)).as_posix()
+
+    def GetText(self, Row: int):
+        with self.Lock:
+            if Row in self.Edited:
+                return self.Edited[Row]
+        return self.FileList.GetLine(Row).rstrip('\r')
+
+    def SetText(self, Row: int, Text: str):
+        with self.Lock:
+            if Text == self.FileList.GetLine(Row).rstrip('\r'):
+                self.Edited.pop(Row, None)
+            else:
+                self.Edited[Row] = Text
+
+    def Save(self):
+        '''
+        Write the filelist (and its binary form) if any line was edited, return the number of edited lines
+        '''
+        with self.Lock:
+            if len(self.Edited) == 0:
+                return 0
+            Lines = self.FileList.GetLines()
+            for Row, Text in self.Edited.items():
+                Lines[Row] = Text + '\r' if Lines[Row].endswith('\r') else Text
+            Edited, self.Edited = len(self.Edited), {}
+            TrailingNewline = self.FileList.TrailingNewline
+            self.FileList.Close()
+            WriteTextFileList(self.DATPath, Lines, TrailingNewline)
+            self.FileList = LoadFileList(self.DATPath)
+        return Edited
+
+    def Close(self):
+        with self.Lock:
+            self.FileList.Close()
+
+
+class ASR_Result:
+    '''
+    Audio files with the speakers they were matched to, read from a data file of "audio|speaker|similarity" lines,
+    edits are appended to a journal next to it as "audio|speaker" lines ("audio|" drops the audio)
+    and folded back into the data file (by replacing it) once the journal grows
+    '''
+    # Fold the journal in once it has this many lines per line of the data file
+    CompactRatio = 0.25
+
+    # First line of the journal, followed by the size and mtime of the data file it belongs to
+    JournalHeader = '#EVT-Journal'
+
+    def __init__(self, DataPath: str):
+        self.DataPath = DataPath
+        self.JournalPath = f"{DataPath}.journal"
+
+        self.Rows = []
+        self.Saved = {}
+        self.DataLines = 0
+        self.JournalLines = 0
+        self.Lock = threading.Lock()
+
+        self.Load()
+
+    def GetJournalHeader(self):
+        FileStat = os.stat(self.DataPath)
+        return f"{self.JournalHeader}|{FileStat.st_size}|{FileStat.st_mtime_ns}\n"
+
+    def Load(self):
+        Rows = {}
+        with open(self.DataPath, mode = 'r', encoding = 'utf-8') as Data:
+            for Line in Data:
+                Audio, _, Rest = Line.rstrip('\r\n').partition('|')
+                if Audio.strip() == '':
+                    continue
+                Speaker, _, Sim = Rest.partition('|')
+                Rows[Audio] = [Audio, Speaker.strip(), Sim]
+        self.DataLines = len(Rows)
+        self.JournalLines = 0
+        if Path(self.JournalPath).exists():
+            with open(self.JournalPath, mode = 'r', encoding = 'utf-8') as Journal:
+                Lines = Journal.readlines()
+            if len(Lines) > 0 and Lines[0] == self.GetJournalHeader():
+                for Line in Lines[1:]:
+                    if not Line.endswith('\n'):
+                        break
+                    Audio, _, Speaker = Line[:-1].rpartition('|')
+                    if Speaker == '':
+                        Rows.pop(Audio, None)
+                    else:
+                        Rows.setdefault(Audio, [Audio, Speaker, ''])[1] = Speaker
+                    self.JournalLines += 1
+            else:
+                # The data file was written anew since, so the journal no longer applies
+                os.remove(self.JournalPath)
+        self.Rows = list(Rows.values())
+        self.Saved = {Row[0]: Row[1] for Row in self.Rows}
+
+    def __iter__(self):
+        return iter(self.Rows)
+
+    def __len__(self):
+        return len(self.Rows)
+
+    def Save(self, MoveToDst: Optional[str] = None, OnProgress: Optional[Callable] = None, Compact: bool = False, LinkMode: str = 'Auto'):
+        '''
+        Append the changes since the last save to the journal (the audio of matched rows is linked to MoveToDst/speaker if given),
+        return the number of changes
+        '''
+        with self.Lock:
+            Links = []
+            for Row in self.Rows:
+                Row[1] = Row[1].strip()
+                if MoveToDst is not None and Row[1] != '':
+                    Audio_Dst = Path(MoveToDst).joinpath(Row[1], Path(Row[0]).name).as_posix()
+                    Links.append((Row, Audio_Dst)) if Audio_Dst != Row[0] else None
+            LinkFiles([(Row[0], Audio_Dst) for Row, Audio_Dst in Links], OnProgress, LinkMode,
+                Path(MoveToDst).joinpath(LinkManifestName).as_posix() if MoveToDst is not None else None
+            )
+            for Row, Audio_Dst in Links:
+                Row[0] = Audio_Dst
+
+            Current = {Row[0]: Row[1] for Row in self.Rows}
+            Changes = [(Audio, '') for Audio in self.Saved if Audio not in Current]
+            Changes += [(Audio, Speaker) for Audio, Speaker in Current.items() if self.Saved.get(Audio, '') != Speaker]
+            if len(Changes) > 0:
+                # A new journal is started if there is none (e.g. it was folded in by FoldJournal meanwhile)
+                Header = self.GetJournalHeader() if self.JournalLines == 0 or not Path(self.JournalPath).exists() else ''
+                with open(self.JournalPath, mode = 'w' if Header else 'a', encoding = 'utf-8') as Journal:
+                    Journal.write(Header + ''.join(f"{Audio}|{Speaker}\n" for Audio, Speaker in Changes))
+                    Journal.flush()
+                    os.fsync(Journal.fileno())
+                for Audio, Speaker in Changes:
+                    if Speaker == '':
+                        self.Saved.pop(Audio, None)
+                    else:
+                        self.Saved[Audio] = Speaker
+                self.JournalLines += len(Changes)
+        if Compact or self.JournalLines > self.CompactRatio * self.DataLines:
+            self.Compact()
+        return len(Changes)
+
+    def Compact(self):
+        '''
+        Fold the journal into the data file, which keeps the audio with speakers only (as "audio|speaker" lines)
+        '''
+        with self.Lock:
+            if self.JournalLines == 0:
+                return
+            Lines = [f"{Audio}|{Speaker}\n" for Audio, Speaker in self.Saved.items() if Speaker != '']
+            TempPath = f"{self.DataPath}.tmp"
+            with open(TempPath, mode = 'w', encoding = 'utf-8') as Data:
+                Data.writelines(Lines)
+                Data.flush()
+                os.fsync(Data.fileno())
+            os.replace(TempPath, self.DataPath)
+            os.remove(self.JournalPath) if Path(self.JournalPath).exists() else None
+            self.Saved = {Audio: Speaker for Audio, Speaker in self.Saved.items() if Speaker != ''}
+            self.DataLines = len(Lines)
+            self.JournalLines = 0
+
+
+def FoldJournal(DataPath: str):
+    '''
+    Fold the journal of an ASR result into its data file (if there is one), for tools that read the data file as plain text
+    '''
+    if Path(DataPath).is_file() and Path(f"{DataPath}.journal").exists():
+        ASR_Result(DataPath).Compact()
+
+##############################################################################################################################
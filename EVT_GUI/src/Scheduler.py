@@ -0,0 +1,360 @@
+import os
+import json
+import time
+import uuid
+import ctypes
+import platform
+import threading
+from pathlib import Path
+from typing import Optional, Callable
+
+from Worker import Worker_Pool
+
+##############################################################################################################################
+
+# Job states
+Pending = 'Pending'
+Running = 'Running'
+Finished = 'Finished'
+Failed = 'Failed'
+Cancelled = 'Cancelled'
+
+# Minimum seconds between two change notifications caused by progress only
+NotifyInterval = 1.
+
+##############################################################################################################################
+
+def GetTotalMemory():
+    '''
+    Get the size of physical memory in GB
+    '''
+    try:
+        if platform.system() == 'Windows':
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ('dwLength', ctypes.c_ulong),
+                    ('dwMemoryLoad', ctypes.c_ulong),
+                    ('ullTotalPhys', ctypes.c_ulonglong),
+                    ('ullAvailPhys', ctypes.c_ulonglong),
+                    ('ullTotalPageFile', ctypes.c_ulonglong),
+                    ('ullAvailPageFile', ctypes.c_ulonglong),
+                    ('ullTotalVirtual', ctypes.c_ulonglong),
+                    ('ullAvailVirtual', ctypes.c_ulonglong),
+                    ('sullAvailExtendedVirtual', ctypes.c_ulonglong)
+                ]
+            MemoryStatus = MEMORYSTATUSEX()
+            MemoryStatus.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(MemoryStatus))
+            return MemoryStatus.ullTotalPhys / 1024**3
+        else:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024**3
+    except (AttributeError, ValueError, OSError):
+        return 8.
+
+
+def GetDefaultLimits():
+    return {
+        'CPU': os.cpu_count() or 1,
+        'RAM': round(GetTotalMemory(), 1),
+        'GPU': 1
+    }
+
+##############################################################################################################################
+
+class Job_Scheduler:
+    '''
+    Run queued core tasks on warm workers, by priority, within resource limits and after the jobs they depend on
+
+    A job is a dict like:
+    {
+        'ID': ..., 'Title': ..., 'Priority': 0, 'Depends': [IDs],
+        'Task': {'Key': ..., 'Module': ..., 'Name': ..., 'Params': [...], 'Calls': [...], 'KeepAlive': True, 'Resources': {'CPU': 1, 'RAM': 2, 'GPU': 0}, 'Paths': [...]},
+        'Status': ..., 'Error': ..., 'Progress': ..., 'Created': ..., 'Started': ..., 'Ended': ...
+    }
+    The queue is saved to QueuePath on every change so that it survives restarts
+    '''
+    def __init__(self,
+        Pool: Worker_Pool,
+        QueuePath: Optional[str] = None,
+        Limits: Optional[dict] = None,
+        OnChanged: Optional[Callable[[], None]] = None
+    ):
+        self.Pool = Pool
+        self.QueuePath = QueuePath
+        self.Limits = {**GetDefaultLimits(), **(Limits or {})}
+        self.OnChanged = OnChanged
+
+        self.Jobs = {}
+        self.Workers = {}
+        self.Paused = False
+        self.LastSubmitted = None
+        self.LastNotified = 0.
+        self.Condition = threading.Condition(threading.RLock())
+        self.Thread = None
+        self.Stopped = False
+
+        self.Load()
+
+    def Load(self):
+        '''
+        Restore the saved queue (jobs that were running are queued again and the queue starts paused)
+        '''
+        if self.QueuePath is None or not Path(self.QueuePath).exists():
+            return
+        try:
+            with open(self.QueuePath, mode = 'r', encoding = 'utf-8') as f:
+                Saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for Job in Saved.get('Jobs', []):
+            Job['Status'] = Pending if Job['Status'] == Running else Job['Status']
+            self.Jobs[Job['ID']] = Job
+        self.Paused = any(Job['Status'] == Pending for Job in self.Jobs.values())
+
+    def Save(self):
+        if self.QueuePath is None:
+            return
+        os.makedirs(Path(self.QueuePath).parent, exist_ok = True)
+        TempPath = f"{self.QueuePath}.tmp"
+        with open(TempPath, mode = 'w', encoding = 'utf-8') as f:
+            json.dump({'Jobs': list(self.Jobs.values())}, f, ensure_ascii = False, indent = 2)
+        os.replace(TempPath, self.QueuePath)
+
+    def Changed(self, ProgressOnly: bool = False):
+        '''
+        Save the queue and notify (progress-only changes are throttled and not saved)
+        '''
+        Now = time.monotonic()
+        if ProgressOnly and Now - self.LastNotified < NotifyInterval:
+            return
+        self.LastNotified = Now
+        self.Save() if not ProgressOnly else None
+        self.OnChanged() if self.OnChanged is not None else None
+
+    def Start(self):
+        with self.Condition:
+            if self.Thread is not None and self.Thread.is_alive():
+                return
+            self.Stopped = False
+            self.Thread = threading.Thread(target = self.Schedule, daemon = True)
+            self.Thread.start()
+
+    def Shutdown(self):
+        '''
+        Stop scheduling and kill running jobs (they will be queued again on next start)
+        '''
+        with self.Condition:
+            self.Stopped = True
+            Workers = list(self.Workers.values())
+            self.Condition.notify_all()
+        for Worker in Workers:
+            self.Pool.Terminate(Worker)
+
+    def Submit(self,
+        Task: dict,
+        Title: str = '',
+        Priority: int = 0,
+        Depends: list = []
+    ):
+        '''
+        Add a task to the queue and return its job ID
+        '''
+        with self.Condition:
+            ID = uuid.uuid4().hex[:8]
+            self.Jobs[ID] = {
+                'ID': ID,
+                'Title': Title or Task['Name'],
+                'Priority': Priority,
+                'Depends': [Dependency for Dependency in Depends if Dependency in self.Jobs],
+                'Task': {**Task, 'Params': list(Task.get('Params', ()))},
+                'Status': Pending,
+                'Error': None,
+                'Progress': None,
+                'Created': time.time(),
+                'Started': None,
+                'Ended': None
+            }
+            self.LastSubmitted = ID
+            self.Changed()
+            self.Condition.notify_all()
+            return ID
+
+    def SetPriority(self, ID: str, Priority: int):
+        with self.Condition:
+            if ID in self.Jobs:
+                self.Jobs[ID]['Priority'] = Priority
+                self.Changed()
+                self.Condition.notify_all()
+
+    def ShiftPriority(self, ID: str, Delta: int = 1):
+        with self.Condition:
+            if ID in self.Jobs:
+                self.SetPriority(ID, self.Jobs[ID]['Priority'] + Delta)
+
+    def Cancel(self, ID: str):
+        '''
+        Cancel a job (killing it if running) and the jobs depending on it
+        '''
+        with self.Condition:
+            Job = self.Jobs.get(ID)
+            if Job is None:
+                return
+            if Job['Status'] == Pending:
+                self.SetEnded(Job, Cancelled)
+                self.CancelDependents(ID)
+                self.Changed()
+            if Job['Status'] != Running:
+                return
+            # Flagged even if the worker isn't registered yet, RunJob checks it once the worker is acquired
+            Job['Cancelling'] = True
+            Worker = self.Workers.get(ID)
+            if Worker is None:
+                return
+        self.Pool.Terminate(Worker)
+
+    def Retry(self, ID: str):
+        with self.Condition:
+            Job = self.Jobs.get(ID)
+            if Job is None or Job['Status'] not in (Failed, Cancelled):
+                return
+            self.Requeue(Job)
+            self.Changed()
+            self.Condition.notify_all()
+
+    def Remove(self, ID: str):
+        with self.Condition:
+            Job = self.Jobs.get(ID)
+            if Job is None or Job['Status'] == Running:
+                return
+            self.CancelDependents(ID) if Job['Status'] == Pending else None
+            del self.Jobs[ID]
+            self.Changed()
+
+    def ClearEnded(self):
+        with self.Condition:
+            for ID in [ID for ID, Job in self.Jobs.items() if Job['Status'] in (Finished, Failed, Cancelled)]:
+                del self.Jobs[ID]
+            self.Changed()
+
+    def SetPaused(self, Paused: bool):
+        with self.Condition:
+            self.Paused = Paused
+            self.Changed()
+            self.Condition.notify_all()
+
+    def Snapshot(self):
+        '''
+        Get a copy of the jobs (running first, then pending by priority, then ended)
+        '''
+        Order = {Running: 0, Pending: 1, Failed: 2, Cancelled: 2, Finished: 2}
+        with self.Condition:
+            Jobs = [dict(Job) for Job in self.Jobs.values()]
+        return sorted(Jobs, key = lambda Job: (Order[Job['Status']], -Job['Priority'] if Job['Status'] == Pending else 0, Job['Created']))
+
+    def Count(self, Status: str):
+        with self.Condition:
+            return sum(1 for Job in self.Jobs.values() if Job['Status'] == Status)
+
+    def SetEnded(self, Job: dict, Status: str, Error: Optional[dict] = None):
+        Job.update(Status = Status, Error = Error, Ended = time.time())
+        Job.pop('Cancelling', None)
+
+    def Requeue(self, Job: dict):
+        '''
+        Queue a job again along with the jobs that were cancelled because of it
+        '''
+        Job.update(Status = Pending, Error = None, Progress = None, Started = None, Ended = None)
+        for Dependent in self.Jobs.values():
+            if Job['ID'] in Dependent['Depends'] and Dependent['Status'] == Cancelled and (Dependent['Error'] or {}).get('Type') == 'DependencyError':
+                self.Requeue(Dependent)
+
+    def CancelDependents(self, ID: str):
+        for Job in self.Jobs.values():
+            if ID in Job['Depends'] and Job['Status'] == Pending:
+                self.SetEnded(Job, Cancelled, {'Type': 'DependencyError', 'Message': f"Job {ID} did not finish", 'Traceback': ''})
+                self.CancelDependents(Job['ID'])
+
+    def GetDemand(self, Job: dict):
+        '''
+        Get the resources a job asks for (capped by the limits so that a big job can still run on its own)
+        '''
+        Resources = Job['Task'].get('Resources', {})
+        return {Resource: min(float(Resources.get(Resource, 0)), float(Limit)) for Resource, Limit in self.Limits.items()}
+
+    def GetFreeResources(self):
+        Free = {Resource: float(Limit) for Resource, Limit in self.Limits.items()}
+        for Job in self.Jobs.values():
+            if Job['Status'] == Running:
+                for Resource, Amount in self.GetDemand(Job).items():
+                    Free[Resource] -= Amount
+        return Free
+
+    def PickJobs(self):
+        '''
+        Pick the pending jobs that can start now (by priority, then by submission order)
+        '''
+        Picked = []
+        Free = self.GetFreeResources()
+        for Job in sorted(
+            [Job for Job in self.Jobs.values() if Job['Status'] == Pending],
+            key = lambda Job: (-Job['Priority'], Job['Created'])
+        ):
+            States = [self.Jobs[Dependency]['Status'] if Dependency in self.Jobs else Finished for Dependency in Job['Depends']]
+            if any(State in (Failed, Cancelled) for State in States):
+                self.SetEnded(Job, Cancelled, {'Type': 'DependencyError', 'Message': "A job it depends on did not finish", 'Traceback': ''})
+                self.CancelDependents(Job['ID'])
+                self.Changed()
+                continue
+            if any(State != Finished for State in States):
+                continue
+            Demand = self.GetDemand(Job)
+            if all(Amount <= Free[Resource] + 1e-9 for Resource, Amount in Demand.items()):
+                for Resource, Amount in Demand.items():
+                    Free[Resource] -= Amount
+                Picked.append(Job)
+        return Picked
+
+    def Schedule(self):
+        with self.Condition:
+            while not self.Stopped:
+                for Job in [] if self.Paused else self.PickJobs():
+                    Job.update(Status = Running, Error = None, Started = time.time())
+                    self.Changed()
+                    threading.Thread(target = self.RunJob, args = (Job, ), daemon = True).start()
+                self.Condition.wait(timeout = 5)
+
+    def RunJob(self, Job: dict):
+        Task = Job['Task']
+        Worker = self.Pool.Acquire(Task['Key'])
+        with self.Condition:
+            self.Workers[Job['ID']] = Worker
+            CancelledEarly = Job.get('Cancelling', False)
+        def OnProgress(Event: dict):
+            with self.Condition:
+                Job['Progress'] = Event
+                self.Changed(ProgressOnly = True)
+        Error = Worker.Run(
+            Module = Task['Module'],
+            Name = Task['Name'],
+            Params = tuple(Task['Params']),
+            Calls = Task['Calls'],
+            OnProgress = OnProgress,
+            Paths = Task.get('Paths', [])
+        ) if not CancelledEarly else None
+        self.Pool.Release(Worker, Task.get('KeepAlive', True))
+        with self.Condition:
+            self.Workers.pop(Job['ID'], None)
+            if self.Stopped:
+                return
+            if Job.get('Cancelling'):
+                self.SetEnded(Job, Cancelled)
+                self.CancelDependents(Job['ID'])
+            elif Error is not None:
+                self.SetEnded(Job, Failed, Error)
+                self.CancelDependents(Job['ID'])
+            else:
+                self.SetEnded(Job, Finished)
+            self.Changed()
+            self.Condition.notify_all()
+
+##############################################################################################################################
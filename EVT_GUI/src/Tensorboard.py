@@ -0,0 +1,141 @@
+import os
+import time
+import socket
+import threading
+import subprocess
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+##############################################################################################################################
+
+# Name part of the files TensorBoard reads
+EventFilePattern = 'events.out.tfevents'
+
+# Port tried first, the ones after it are tried when it's taken
+DefaultPort = 6006
+MaxPortTries = 100
+
+# How long (in seconds) a server gets to answer after it's started, and how often it's asked
+StartTimeout = 60
+HealthInterval = 0.25
+
+##############################################################################################################################
+
+def FindEventFile(LogDir: str):
+    '''
+    Return the first event file under the log dir (None if there's none yet)
+    '''
+    for DirPath, _, FileNames in os.walk(LogDir):
+        for FileName in FileNames:
+            if EventFilePattern in FileName:
+                return Path(DirPath).joinpath(FileName).as_posix()
+
+
+def IsPortFree(Port: int, Host: str = '127.0.0.1'):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as Socket:
+        try:
+            Socket.bind((Host, Port))
+            return True
+        except OSError:
+            return False
+
+
+def IsServing(URL: str, Timeout: float = 1):
+    '''
+    Check whether a server answers at the URL (any HTTP status counts)
+    '''
+    try:
+        with urllib.request.urlopen(URL, timeout = Timeout):
+            return True
+    except urllib.error.HTTPError:
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+class Tensorboard_Manager:
+    '''
+    Keep one TensorBoard per log dir, reusing it while it's alive, each on a port of its own so that
+    several trainings can be watched at once (the servers are stopped with the client)
+    '''
+    def __init__(self, Interpreter: str = 'python', Host: str = '127.0.0.1'):
+        self.Interpreter = Interpreter
+        self.Host = Host
+
+        self.Servers = {}
+        self.Reserved = set()
+        self.Lock = threading.Lock()
+        self.LogDirLocks = {}
+
+    def GetURL(self, Port: int):
+        return f"http://{self.Host}:{Port}/"
+
+    def AllocatePort(self):
+        '''
+        Reserve a free port that isn't used or being started on by another server
+        '''
+        with self.Lock:
+            UsedPorts = self.Reserved.union(Port for _, Port in self.Servers.values())
+            for Port in range(DefaultPort, DefaultPort + MaxPortTries):
+                if Port not in UsedPorts and IsPortFree(Port, self.Host):
+                    self.Reserved.add(Port)
+                    return Port
+        raise OSError(f"No free port in {DefaultPort}-{DefaultPort + MaxPortTries - 1}")
+
+    def Start(self, LogDir: str):
+        '''
+        Start a server for the log dir and wait until it answers, trying the next free port if it can't take the one given
+        '''
+        while True:
+            Port = self.AllocatePort()
+            Process = subprocess.Popen(
+                [self.Interpreter, '-m', 'tensorboard.main', '--logdir', LogDir, '--host', self.Host, '--port', str(Port)],
+                env = os.environ,
+                stdout = subprocess.DEVNULL,
+                stderr = subprocess.DEVNULL
+            )
+            try:
+                Deadline = time.monotonic() + StartTimeout
+                while Process.poll() is None and not IsServing(self.GetURL(Port)):
+                    if time.monotonic() > Deadline:
+                        Process.kill()
+                        raise TimeoutError(f"TensorBoard didn't answer within {StartTimeout}s")
+                    time.sleep(HealthInterval)
+            finally:
+                with self.Lock:
+                    self.Reserved.discard(Port)
+            if Process.poll() is None:
+                return Process, Port
+            if IsPortFree(Port, self.Host): # It exited for another reason than the port being taken meanwhile
+                raise RuntimeError(f"TensorBoard exited with code {Process.returncode}")
+
+    def Launch(self, LogDir: str):
+        '''
+        Return the URL of the server for the log dir, starting one if there's none alive
+        '''
+        LogDir = Path(LogDir).absolute().as_posix()
+        with self.Lock:
+            LogDirLock = self.LogDirLocks.setdefault(LogDir, threading.Lock())
+        with LogDirLock: # Servers for other log dirs can be started meanwhile
+            with self.Lock:
+                Server = self.Servers.pop(LogDir, None)
+            if Server is not None:
+                Process, Port = Server
+                if Process.poll() is None and IsServing(self.GetURL(Port)):
+                    with self.Lock:
+                        self.Servers[LogDir] = Server
+                    return self.GetURL(Port)
+                Process.kill() if Process.poll() is None else None
+            Process, Port = self.Start(LogDir)
+            with self.Lock:
+                self.Servers[LogDir] = (Process, Port)
+            return self.GetURL(Port)
+
+    def Shutdown(self):
+        with self.Lock:
+            for Process, _ in self.Servers.values():
+                Process.terminate() if Process.poll() is None else None
+            self.Servers.clear()
+
+##############################################################################################################################
@@ -0,0 +1,394 @@
+import ast
+import configparser
+from pathlib import Path
+from datetime import date
+from typing import Optional
+
+from Results import FoldJournal
+
+##############################################################################################################################
+
+# Languages accepted by the core tools
+LANGUAGES_Whisper = {
+    "中":       "zh",
+    "Chinese":  "zh",
+    "英":       "en",
+    "English":  "en",
+    "日":       "ja",
+    "japanese": "ja"
+}
+LANGUAGES_VITS = {
+    "中":       "ZH",
+    "Chinese":  "ZH",
+    "英":       "EN",
+    "English":  "EN",
+    "日":       "JA",
+    "Japanese": "JA"
+}
+
+##############################################################################################################################
+
+def GetDirs(
+    ModelDir: str,
+    OutputDir: str,
+    CurrentDir: str
+):
+    '''
+    Get the values of the placeholders used by default params
+    '''
+    return {
+        'ModelDir': Path(ModelDir).as_posix(),
+        'OutputDir': Path(OutputDir).as_posix(),
+        'CurrentDir': Path(CurrentDir).as_posix(),
+        'Root': Path(CurrentDir).root.rstrip('\\/'),
+        'Today': str(date.today())
+    }
+
+
+def IsEmpty(Value):
+    '''
+    Check a param the same way as Function_ParamsChecker does
+    '''
+    if Value is None:
+        return True
+    if isinstance(Value, str):
+        return Value.strip() in ('', str(None))
+    if isinstance(Value, dict):
+        return any(str(Item).strip() in ('', str(None)) for Item in list(Value.keys()) + list(Value.values()))
+    return False
+
+
+class Tool_Param:
+    '''
+    A param of a core tool and where ParamsManager keeps it (Section is None if it isn't kept in config)
+    '''
+    def __init__(self,
+        Name: str,
+        Section: Optional[str],
+        Option: Optional[str],
+        Default = '',
+        Type: type = str,
+        EmptyAllowed: bool = False
+    ):
+        self.Name = Name
+        self.Section = Section
+        self.Option = Option
+        self.Default = Default
+        self.Type = Type
+        self.EmptyAllowed = EmptyAllowed
+
+    def GetDefault(self, Dirs: dict):
+        Default = self.Default
+        if isinstance(Default, str):
+            for Key, Value in Dirs.items():
+                Default = Default.replace('{%s}' % Key, Value)
+        return Default
+
+    def Convert(self, Value):
+        '''
+        Convert a value read from config or command line into the type the core tool takes
+        '''
+        if not isinstance(Value, str) or IsEmpty(Value):
+            return Value
+        if self.Type == bool:
+            return Value.strip().lower() in ('true', '1', 'yes', 'on')
+        if self.Type == int:
+            return int(float(Value))
+        if self.Type == float:
+            return float(Value)
+        if self.Type == dict:
+            return ast.literal_eval(Value)
+        return Value
+
+
+class Tool:
+    '''
+    Describe a core tool: the params it takes (in order), the config file they are kept in and how to run it
+    '''
+    def __init__(self,
+        Name: str,
+        ConfigName: str,
+        Key: str,
+        Module: str,
+        Function: str,
+        Calls: list,
+        KeepAlive: bool,
+        Resources: dict,
+        Params: list[Tool_Param],
+        Replacements: dict = {},
+        Journaled: list = []
+    ):
+        self.Name = Name
+        self.ConfigName = ConfigName
+        self.Key = Key
+        self.Module = Module
+        self.Function = Function
+        self.Calls = Calls
+        self.KeepAlive = KeepAlive
+        self.Resources = Resources
+        self.Params = Params
+        self.Replacements = Replacements
+        self.Journaled = Journaled
+
+    def GetParam(self, Name: str):
+        for Param in self.Params:
+            if Param.Name == Name:
+                return Param
+        raise KeyError(f"{self.Name} has no param named '{Name}'")
+
+    def GetDefaults(self, Dirs: dict):
+        return {Param.Name: Param.GetDefault(Dirs) for Param in self.Params}
+
+    def ReadConfig(self, ConfigPath: str, Dirs: dict):
+        '''
+        Read the values saved by ParamsManager (falling back to defaults)
+        '''
+        Parser = configparser.ConfigParser(interpolation = None)
+        Parser.read(ConfigPath, encoding = 'utf-8')
+        Values = self.GetDefaults(Dirs)
+        for Param in self.Params:
+            if Param.Section is not None and Parser.has_option(Param.Section, Param.Option):
+                Values[Param.Name] = Param.Convert(Parser.get(Param.Section, Param.Option))
+        return Values
+
+    def ToParams(self, Values: dict, Dirs: dict):
+        '''
+        Turn named values into the params tuple the core tool takes (empty values fall back to defaults)
+        '''
+        Params = []
+        for Param in self.Params:
+            Value = Param.Convert(Values.get(Param.Name))
+            Value = Param.GetDefault(Dirs) if IsEmpty(Value) else Value
+            if IsEmpty(Value):
+                if not Param.EmptyAllowed:
+                    raise ValueError(f"Empty param detected: {self.Name} {Param.Name}")
+                Value = None
+            Params.append(Value)
+        return tuple(Params)
+
+    def Task(self, Params: tuple):
+        '''
+        Get the task to run on a worker (the ASR results it reads get their journals folded in first, since it reads them as plain text)
+        '''
+        for Param, Value in zip(self.Params, Params):
+            FoldJournal(Value) if Param.Name in self.Journaled and isinstance(Value, str) else None
+        return {
+            'Key': self.Key,
+            'Module': self.Module,
+            'Name': self.Function,
+            'Params': tuple(self.Replacements.get(Param, Param) if isinstance(Param, str) else Param for Param in Params),
+            'Calls': list(self.Calls),
+            'KeepAlive': self.KeepAlive,
+            'Resources': dict(self.Resources)
+        }
+
+##############################################################################################################################
+
+Tools = {
+    'process': Tool(
+        Name = 'process',
+        ConfigName = 'Config_Process.ini',
+        Key = 'AudioProcessor',
+        Module = 'AudioProcessor.Process',
+        Function = 'Audio_Processing',
+        Calls = ['Process_Audio'],
+        KeepAlive = True,
+        Resources = {'CPU': 2, 'RAM': 2},
+        Params = [
+            Tool_Param('MediaDirInput', 'Input Params', 'Media_Dir_Input'),
+            Tool_Param('MediaFormatOutput', 'Output Params', 'Media_Format_Output', 'wav', EmptyAllowed = True),
+            Tool_Param('SampleRate', 'Output Params', 'SampleRate', None, EmptyAllowed = True),
+            Tool_Param('SampleWidth', 'Output Params', 'SampleWidth', None, EmptyAllowed = True),
+            Tool_Param('ToMono', 'Output Params', 'ToMono', False, bool),
+            Tool_Param('DenoiseAudio', 'Denoiser Params', 'Denoise_Audio', True, bool),
+            Tool_Param('DenoiseModelPath', 'Denoiser Params', 'Denoise_Model_Path', '{ModelDir}/Process/UVR/Downloaded/HP5_only_main_vocal.pth'),
+            Tool_Param('DenoiseTarget', 'Denoiser Params', 'Denoise_Target', '人声'),
+            Tool_Param('SliceAudio', 'Slicer Params', 'Slice_Audio', True, bool),
+            Tool_Param('RMSThreshold', 'Slicer Params', 'RMS_Threshold', -34., float),
+            Tool_Param('AudioLengthMin', 'Slicer Params', 'Audio_Length_Min', 4000, int),
+            Tool_Param('SilentIntervalMin', 'Slicer Params', 'Silent_Interval_Min', 300, int),
+            Tool_Param('HopSize', 'Slicer Params', 'Hop_Size', 10, int),
+            Tool_Param('SilenceKeptMax', 'Slicer Params', 'Silence_Kept_Max', 500, int),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/音频处理结果'),
+            Tool_Param('OutputDirName', 'Output Params', 'Output_Dir_Name', '{Today}')
+        ]
+    ),
+    'vpr': Tool(
+        Name = 'vpr',
+        ConfigName = 'Config_ASR_VPR.ini',
+        Key = 'VPR',
+        Module = 'VPR.Identify',
+        Function = 'Voice_Identifying',
+        Calls = ['GetModel', 'Inference'],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 4, 'GPU': 1},
+        Params = [
+            Tool_Param('StdAudioSpeaker', 'Input Params', 'StdAudioSpeaker', {"": ""}, dict),
+            Tool_Param('AudioDirInput', 'Input Params', 'Audio_Dir_Input'),
+            Tool_Param('ModelPath', 'VPR Params', 'Model_Path', '{ModelDir}/ASR/VPR/Downloaded/Ecapa-Tdnn_spectrogram.pth'),
+            Tool_Param('ModelType', 'VPR Params', 'Model_Type', 'Ecapa-Tdnn'),
+            Tool_Param('FeatureMethod', 'VPR Params', 'Feature_Method', 'spectrogram'),
+            Tool_Param('DecisionThreshold', 'VPR Params', 'DecisionThreshold', 0.75, float),
+            Tool_Param('DurationOfAudio', 'VPR Params', 'Duration_of_Audio', 3.00, float),
+            Tool_Param('OutputRoot', 'Output Params', 'Audio_Root_Output', '{CurrentDir}/语音识别结果/VPR'),
+            Tool_Param('OutputDirName', 'Output Params', 'Audio_Dir_Output', '{Today}'),
+            Tool_Param('AudioSpeakersDataName', 'Output Params', 'FileList_Name', 'Recgonition_{Today}')
+        ]
+    ),
+    'whisper': Tool(
+        Name = 'whisper',
+        ConfigName = 'Config_STT_Whisper.ini',
+        Key = 'Whisper',
+        Module = 'Whisper.Transcribe',
+        Function = 'Voice_Transcribing',
+        Calls = ['Transcriber'],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 6, 'GPU': 1},
+        Params = [
+            Tool_Param('ModelPath', 'Whisper Params', 'Model_Path', '{ModelDir}/STT/Whisper/Downloaded/small.pt'),
+            Tool_Param('AudioDir', 'Input Params', 'Audio_Dir'),
+            Tool_Param('Verbose', 'Whisper Params', 'Verbose', True, bool),
+            Tool_Param('AddLanguageInfo', 'Whisper Params', 'Add_LanguageInfo', True, bool),
+            Tool_Param('ConditionOnPreviousText', 'Whisper Params', 'Condition_on_Previous_Text', False, bool),
+            Tool_Param('fp16', 'Whisper Params', 'fp16', True, bool),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/语音转录结果/Whisper'),
+            Tool_Param('OutputDirName', 'Output Params', 'SRT_Dir_Name', '{Today}')
+        ],
+        Replacements = LANGUAGES_Whisper
+    ),
+    'dat-gptsovits': Tool(
+        Name = 'dat-gptsovits',
+        ConfigName = 'Config_DAT_GPT-SoVITS.ini',
+        Key = 'GPT_SoVITS',
+        Module = 'GPT_SoVITS.Create',
+        Function = 'Dataset_Creating',
+        Calls = ['CallingFunctions'],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 2},
+        Params = [
+            Tool_Param('SRTDir', 'Input Params', 'SRT_Dir'),
+            Tool_Param('AudioSpeakersDataPath', 'Input Params', 'WAV_Dir'),
+            Tool_Param('DataFormat', 'GPT-SoVITS Params', 'DataFormat_Path', '路径|人名|语言|文本'),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/数据集制作结果/GPT-SoVITS'),
+            Tool_Param('OutputDirName', 'Output Params', 'Output_Dir_Name', '{Today}'),
+            Tool_Param('FileListName', 'Output Params', 'FileList_Name', 'Train_{Today}')
+        ],
+        Journaled = ['AudioSpeakersDataPath']
+    ),
+    'dat-vits': Tool(
+        Name = 'dat-vits',
+        ConfigName = 'Config_DAT_VITS.ini',
+        Key = 'VITS',
+        Module = 'VITS.Create',
+        Function = 'Dataset_Creating',
+        Calls = ['CallingFunctions'],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 2},
+        Params = [
+            Tool_Param('SRTDir', 'Input Params', 'SRT_Dir'),
+            Tool_Param('AudioSpeakersDataPath', 'Input Params', 'WAV_Dir'),
+            Tool_Param('SampleRate', 'VITS Params', 'SampleRate', '22050', EmptyAllowed = True),
+            Tool_Param('SampleWidth', 'VITS Params', 'SampleWidth', '16', EmptyAllowed = True),
+            Tool_Param('ToMono', 'VITS Params', 'ToMono', True, bool),
+            Tool_Param('DataFormat', 'VITS Params', 'DataFormat_Path', '路径|人名|[语言]文本[语言]'),
+            Tool_Param('AddAuxiliaryData', 'VITS Params', 'Add_AuxiliaryData', False, bool),
+            Tool_Param('AuxiliaryDataPath', 'VITS Params', 'AuxiliaryData_Path', '{CurrentDir}/AuxiliaryData/VITS/AuxiliaryData.txt', EmptyAllowed = True),
+            Tool_Param('TrainRatio', 'VITS Params', 'TrainRatio', 0.7, float),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/数据集制作结果/VITS'),
+            Tool_Param('OutputDirName', 'Output Params', 'Output_Dir_Name', '{Today}'),
+            Tool_Param('FileListNameTraining', 'Output Params', 'FileList_Name_Training', 'Train_{Today}'),
+            Tool_Param('FileListNameValidation', 'Output Params', 'FileList_Name_Validation', 'Val_{Today}')
+        ],
+        Journaled = ['AudioSpeakersDataPath']
+    ),
+    'train-gptsovits': Tool(
+        Name = 'train-gptsovits',
+        ConfigName = 'Config_Train_GPT-SoVITS.ini',
+        Key = 'GPT_SoVITS',
+        Module = 'GPT_SoVITS.Train',
+        Function = 'Train',
+        Calls = [],
+        KeepAlive = False,
+        Resources = {'CPU': 4, 'RAM': 8, 'GPU': 1},
+        Params = [
+            Tool_Param('FileListPath', 'Input Params', 'FileList_Path'),
+            Tool_Param('FP16Run', 'GPT-SoVITS Params', 'FP16_Run', False, bool),
+            Tool_Param('ModelDirPretrainedBert', 'GPT-SoVITS Params', 'Model_Dir_Pretrained_bert', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/chinese-roberta-wwm-ext-large'),
+            Tool_Param('ModelDirPretrainedSSL', 'GPT-SoVITS Params', 'Model_Dir_Pretrained_ssl', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/chinese-hubert-base'),
+            Tool_Param('ModelPathPretrainedS1', 'GPT-SoVITS Params', 'Model_Path_Pretrained_s1', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/s1&s2/s1bert25hz-5kh-longer-epoch=12-step=369668.ckpt'),
+            Tool_Param('ModelPathPretrainedS2G', 'GPT-SoVITS Params', 'Model_Path_Pretrained_s2G', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/s1&s2/s2G2333k.pth'),
+            Tool_Param('ModelPathPretrainedS2D', 'GPT-SoVITS Params', 'Model_Path_Pretrained_s2D', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/s1&s2/s2D2333k.pth'),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/模型训练结果/GPT-SoVITS'),
+            Tool_Param('OutputDirName', 'Output Params', 'Output_Dir_Name', '{Today}'),
+            Tool_Param('LogDir', 'Output Params', 'Output_LogDir', '{Root}/EVT_TrainLog/GPT-SoVITS/{Today}')
+        ]
+    ),
+    'train-vits': Tool(
+        Name = 'train-vits',
+        ConfigName = 'Config_Train_VITS.ini',
+        Key = 'VITS',
+        Module = 'VITS.Train',
+        Function = 'Train',
+        Calls = [],
+        KeepAlive = False,
+        Resources = {'CPU': 4, 'RAM': 8, 'GPU': 1},
+        Params = [
+            Tool_Param('FileListPathTraining', 'Input Params', 'FileList_Path_Training'),
+            Tool_Param('FileListPathValidation', 'Input Params', 'FileList_Path_Validation'),
+            Tool_Param('Epochs', 'VITS Params', 'Epochs', 1000, int),
+            Tool_Param('EvalInterval', 'Output Params', 'Eval_Interval', 1000, int),
+            Tool_Param('BatchSize', 'VITS Params', 'Batch_Size', 4, int),
+            Tool_Param('FP16Run', 'VITS Params', 'FP16_Run', False, bool),
+            Tool_Param('KeepOriginalSpeakers', 'VITS Params', 'Keep_Original_Speakers', False, bool),
+            Tool_Param('ConfigPathLoad', 'VITS Params', 'Config_Path_Load', '{ModelDir}/TTS/VITS/Downloaded/standard_Config.json', EmptyAllowed = True),
+            Tool_Param('NumWorkers', 'VITS Params', 'Num_Workers', 4, int),
+            Tool_Param('UsePretrainedModels', 'VITS Params', 'Use_PretrainedModels', True, bool),
+            Tool_Param('ModelPathPretrainedG', 'VITS Params', 'Model_Path_Pretrained_G', '{ModelDir}/TTS/VITS/Downloaded/standard_G.pth', EmptyAllowed = True),
+            Tool_Param('ModelPathPretrainedD', 'VITS Params', 'Model_Path_Pretrained_D', '{ModelDir}/TTS/VITS/Downloaded/standard_D.pth', EmptyAllowed = True),
+            Tool_Param('OutputRoot', 'Output Params', 'Output_Root', '{OutputDir}/模型训练结果/VITS'),
+            Tool_Param('OutputDirName', 'Output Params', 'Output_Dir_Name', '{Today}'),
+            Tool_Param('ConfigName', None, None, 'Config.json'),
+            Tool_Param('LogDir', 'Output Params', 'Output_LogDir', '{Root}/EVT_TrainLog/VITS/{Today}')
+        ]
+    ),
+    'tts-gptsovits': Tool(
+        Name = 'tts-gptsovits',
+        ConfigName = 'Config_TTS_GPT-SoVITS.ini',
+        Key = 'GPT_SoVITS',
+        Module = 'GPT_SoVITS.Convert',
+        Function = 'Convert',
+        Calls = [],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 4, 'GPU': 1},
+        Params = [
+            Tool_Param('ModelPathLoadS1', 'Input Params', 'Model_Path_Load_s1', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/s1&s2/s1bert25hz-5kh-longer-epoch=12-step=369668.ckpt'),
+            Tool_Param('ModelPathLoadS2G', 'Input Params', 'Model_Path_Load_s2G', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/s1&s2/s2G2333k.pth'),
+            Tool_Param('ModelDirLoadBert', 'Input Params', 'Model_Dir_Load_bert', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/chinese-roberta-wwm-ext-large'),
+            Tool_Param('ModelDirLoadSSL', 'Input Params', 'Model_Dir_Load_ssl', '{ModelDir}/TTS/GPT-SoVITS/Downloaded/chinese-hubert-base')
+        ]
+    ),
+    'tts-vits': Tool(
+        Name = 'tts-vits',
+        ConfigName = 'Config_TTS_VITS.ini',
+        Key = 'VITS',
+        Module = 'VITS.Convert',
+        Function = 'Convert',
+        Calls = [],
+        KeepAlive = True,
+        Resources = {'CPU': 1, 'RAM': 4, 'GPU': 1},
+        Params = [
+            Tool_Param('ConfigPathLoad', 'Input Params', 'Config_Path_Load', '{ModelDir}/TTS/VITS/Downloaded/standard_Config.json'),
+            Tool_Param('ModelPathLoad', 'Input Params', 'Model_Path_Load', '{ModelDir}/TTS/VITS/Downloaded/standard_G.pth'),
+            Tool_Param('Text', 'VITS Params', 'Text'),
+            Tool_Param('Language', 'VITS Params', 'Language', None, EmptyAllowed = True),
+            Tool_Param('Speaker', 'VITS Params', 'Speaker', '', EmptyAllowed = True),
+            Tool_Param('EmotionStrength', 'VITS Params', 'EmotionStrength', 0.67, float),
+            Tool_Param('PhonemeDuration', 'VITS Params', 'PhonemeDuration', 0.8, float),
+            Tool_Param('SpeechRate', 'VITS Params', 'SpeechRate', 1., float),
+            Tool_Param('AudioPathSave', None, None, '{CurrentDir}/语音合成结果/VITS/temp.wav')
+        ],
+        Replacements = LANGUAGES_VITS
+    )
+}
+
+##############################################################################################################################
@@ -1,7 +1,6 @@
 import os
 import sys
 import platform
-import shutil
 from pathlib import Path
 from typing import Optional
 from PySide6.QtCore import Qt, QObject, QThread, Signal
@@ -11,6 +10,7 @@ from QEasyWidgets import QFunctions as QFunc
 from QEasyWidgets.Windows import MessageBoxBase
 
 from Functions import FunctionSignals, Function_SetMethodExecutor, Function_UpdateChecker
+from Downloader import DownloadFile
 from Config import *
 
 ##############################################################################################################################
@@ -85,27 +85,22 @@ def UpdateDownloader(
     #ExecuterPath: str = ...
 ):
     try:
-        # Download
-        FunctionSignals.Signal_UpdateMessage.emit("正在下载文件...\nDownloading files...")
-        FileInfo = QFunc.DownloadFile(
+        # Download (and unpack while downloading)
+        FunctionSignals.Signal_UpdateMessage.emit("正在下载并解压文件...\nDownloading and unpacking files...")
+        ExtractDir = QFunc.NormPath(Path(TargetDir).joinpath('Temp')) if ExtractDir == TargetDir else ExtractDir
+        FilePath = DownloadFile(
             DownloadURL = DownloadURL,
             DownloadDir = DownloadDir,
             FileName = Name,
             FileFormat = 'zip',
-            SHA_Expected = None
+            SHA_Expected = None,
+            ExtractDir = ExtractDir
         )
     except Exception as e:
         #FunctionSignals.Signal_UpdateMessage.emit("文件下载失败！\nFailed to download files!")
         FunctionSignals.Signal_IsUpdateSucceeded.emit(False, "文件下载失败！\nFailed to download files!")
     else:
-        # Unpack
-        FunctionSignals.Signal_UpdateMessage.emit("正在解压文件...\nUnpacking files...")
-        ExtractDir = QFunc.NormPath(Path(TargetDir).joinpath('Temp')) if ExtractDir == TargetDir else ExtractDir
-        shutil.unpack_archive(
-            filename = FileInfo[1],
-            extract_dir = ExtractDir
-        )
-        os.remove(FileInfo[1])
+        os.remove(FilePath)
         # Cover old files (About to finish)
         FunctionSignals.Signal_UpdateMessage.emit("即将重启客户端...\nRebooting client...")
         '''
@@ -0,0 +1,532 @@
+import os
+import sys
+import io
+import json
+import time
+import signal
+import shutil
+import secrets
+import platform
+import importlib
+import threading
+import traceback
+import subprocess
+from pathlib import Path
+from typing import Optional, Callable
+from collections import OrderedDict
+from multiprocessing.connection import Listener, Client
+
+##############################################################################################################################
+
+# Name of the env var that carries the authkey (so that it doesn't show up in the process list)
+AuthKeyVar = 'EVT_WORKER_AUTHKEY'
+
+# Loopback address that the worker listens on
+WorkerHost = '127.0.0.1'
+
+# Minimum seconds between two progress events of the same bar
+ProgressInterval = 0.5
+
+##############################################################################################################################
+
+class Checkpoint_Cache:
+    '''
+    Keep the bytes of the checkpoints torch.load reads (by path, size and mtime, up to MaxBytes in total) so that loading them again skips the disk,
+    every load still deserializes its own tensors onto the requested device so that tasks never share (and corrupt) them
+    '''
+    def __init__(self, MaxBytes: int = 1024**3):
+        self.MaxBytes = MaxBytes
+        self.Items = OrderedDict()
+        self.Size = 0
+        self.Lock = threading.Lock()
+        self.Patched = False
+
+    def GetKey(self, File):
+        if not isinstance(File, (str, os.PathLike)) or not Path(File).is_file():
+            return None
+        FileStat = os.stat(File)
+        return (os.path.abspath(File), FileStat.st_size, FileStat.st_mtime_ns)
+
+    def Get(self, Key: tuple):
+        '''
+        Get the bytes of the file (reading it into the cache if not there yet), dropping the least recently used ones beyond MaxBytes
+        '''
+        with self.Lock:
+            if Key in self.Items:
+                self.Items.move_to_end(Key)
+                return self.Items[Key]
+        Data = Path(Key[0]).read_bytes()
+        with self.Lock:
+            if Key not in self.Items:
+                self.Items[Key] = Data
+                self.Size += len(Data)
+            while self.Size > self.MaxBytes:
+                self.Size -= len(self.Items.popitem(last = False)[1])
+        return Data
+
+    def Patch(self):
+        '''
+        Wrap torch.load once torch has been imported by a task
+        '''
+        if self.Patched or 'torch' not in sys.modules or self.MaxBytes <= 0:
+            return
+        Torch = sys.modules['torch']
+        Load = Torch.load
+        def CachedLoad(File, *Args, **Kwargs):
+            Key = self.GetKey(File)
+            if Key is None or Key[1] > self.MaxBytes or Kwargs.get('mmap'):
+                return Load(File, *Args, **Kwargs)
+            return Load(io.BytesIO(self.Get(Key)), *Args, **Kwargs)
+        Torch.load = CachedLoad
+        self.Patched = True
+
+    def Clear(self):
+        with self.Lock:
+            self.Items.clear()
+            self.Size = 0
+
+
+class Progress_Reporter:
+    '''
+    Emit progress as flat JSON-serializable events, e.g.
+    {"Event": "Progress", "Stage": "Process_Audio", "Done": 3, "Total": 10, "Unit": "file", "Bytes": 1048576, "Rate": 0.5, "ETA": 14.0, "Time": ...}
+    Events: Started, Stage, Progress, Error, Finished
+    '''
+    def __init__(self, Sink: Callable[[dict], None]):
+        self.Sink = Sink
+        self.Stage = None
+        self.LastEmitted = {}
+        self.Lock = threading.Lock()
+
+    def Emit(self, Event: str, **Info):
+        with self.Lock:
+            try:
+                self.Sink({'Event': Event, 'Time': time.time(), **Info})
+            except (OSError, ValueError):
+                pass
+
+    def SetStage(self, Stage: str):
+        self.Stage = Stage
+        self.Emit('Stage', Stage = Stage)
+
+    def Update(self,
+        Done: int,
+        Total: Optional[int] = None,
+        Stage: Optional[str] = None,
+        Unit: str = 'it',
+        Bytes: Optional[int] = None,
+        Rate: Optional[float] = None,
+        ETA: Optional[float] = None,
+        Key: object = None,
+        Force: bool = False
+    ):
+        '''
+        Report a counter (throttled per key unless forced or completed)
+        '''
+        Now = time.monotonic()
+        if not Force and Done != Total and Now - self.LastEmitted.get(Key, 0) < ProgressInterval:
+            return False
+        self.LastEmitted[Key] = Now
+        self.Emit('Progress',
+            Stage = Stage or self.Stage,
+            Done = Done,
+            Total = Total,
+            Unit = Unit,
+            Bytes = Bytes,
+            Rate = Rate,
+            ETA = ETA
+        )
+        return True
+
+    def Error(self, Error: BaseException):
+        self.Emit('Error', **FormatError(Error))
+
+
+# Reporter of the task being run (the worker runs one task at a time)
+CurrentReporter: Optional[Progress_Reporter] = None
+
+
+def ReportBar(Bar):
+    '''
+    Turn the state of a tqdm bar into a progress event
+    '''
+    Reporter = CurrentReporter
+    if Reporter is None:
+        return
+    Done, Total = int(Bar.n), (int(Bar.total) if Bar.total else None)
+    if getattr(Bar, 'EVT_Reported', None) == Done:
+        return
+    Elapsed = time.time() - getattr(Bar, 'start_t', time.time())
+    Rate = Done / Elapsed if Elapsed > 0 and Done > 0 else None
+    ETA = (Total - Done) / Rate if Rate and Total else None
+    # Sum up the sizes of processed files when the bar iterates over paths
+    Bytes = None
+    Items = getattr(Bar, 'iterable', None)
+    if isinstance(Items, (list, tuple)) and 0 < len(Items) and isinstance(Items[0], (str, os.PathLike)):
+        Cursor, Bytes = getattr(Bar, 'EVT_Cursor', (0, 0))
+        for Item in Items[Cursor : min(Done, len(Items))]:
+            Bytes += os.path.getsize(Item) if isinstance(Item, (str, os.PathLike)) and os.path.isfile(Item) else 0
+        Bar.EVT_Cursor = (max(Cursor, min(Done, len(Items))), Bytes)
+    Bar.EVT_Reported = Done if Reporter.Update(
+        Done = Done,
+        Total = Total,
+        Stage = str(Bar.desc).strip().rstrip(':') or None,
+        Unit = 'file' if Bytes is not None else str(getattr(Bar, 'unit', 'it')),
+        Bytes = Bytes,
+        Rate = Rate,
+        ETA = ETA,
+        Key = id(Bar)
+    ) else None
+
+
+def HookTqdm():
+    '''
+    Forward the tqdm bars used by core modules to the current reporter
+    '''
+    try:
+        from tqdm import std
+    except ImportError:
+        return
+    if getattr(std.tqdm, 'EVT_Hooked', False):
+        return
+    Update, Close = std.tqdm.update, std.tqdm.close
+    def update(self, n = 1):
+        Result = Update(self, n)
+        ReportBar(self) if not self.disable else None
+        return Result
+    def close(self):
+        ReportBar(self) if not self.disable else None
+        return Close(self)
+    std.tqdm.update, std.tqdm.close = update, close
+    std.tqdm.EVT_Hooked = True
+
+
+def ExecuteTask(
+    Module: str,
+    Name: str,
+    Params: tuple = (),
+    Calls: list = [],
+    Reporter: Optional[Progress_Reporter] = None,
+    Paths: list = []
+):
+    '''
+    Import the core module and run the task (Name(*Params) followed by each of the calls)
+    Paths are searched for the module after the core dir (e.g. for client-side helper tasks)
+    '''
+    global CurrentReporter
+    CurrentReporter = Reporter
+    sys.path.extend([str(Dir) for Dir in Paths if str(Dir) not in sys.path])
+    HookTqdm() if Reporter is not None else None
+    try:
+        Reporter.Emit('Started', Module = Module, Name = Name) if Reporter is not None else None
+        Reporter.SetStage(Name) if Reporter is not None else None
+        Target = getattr(importlib.import_module(Module), Name)
+        Instance = Target(*Params)
+        for Index, Call in enumerate(Calls):
+            Reporter.SetStage(Call) if Reporter is not None else None
+            getattr(Instance, Call)()
+            Reporter.Emit('Progress', Stage = 'Steps', Done = Index + 1, Total = len(Calls), Unit = 'step') if Reporter is not None else None
+        Reporter.Emit('Finished') if Reporter is not None else None
+    except BaseException as e:
+        Reporter.Error(e) if Reporter is not None else None
+        raise
+    finally:
+        CurrentReporter = None
+
+
+def ToJSONLine(Event: dict):
+    '''
+    Serialize a progress event as one line of JSON
+    '''
+    return json.dumps(Event, ensure_ascii = False, default = str) + '\n'
+
+
+def FormatError(Error: BaseException):
+    '''
+    Turn an exception into a picklable dict
+    '''
+    return {
+        'Type': type(Error).__name__,
+        'Message': str(Error),
+        'Traceback': ''.join(traceback.format_exception(type(Error), Error, Error.__traceback__))
+    }
+
+
+def RunWorker(
+    CoreDir: str,
+    LogPath: Optional[str] = None,
+    CacheMB: int = 1024
+):
+    '''
+    Serve tasks sent by the client until it disconnects or asks to shut down
+    '''
+    # Mimic 'cd CoreDir && python -c ...' (the script's own dir must not shadow core modules)
+    os.chdir(CoreDir)
+    sys.path = [CoreDir] + [Dir for Dir in sys.path[1:] if Dir != CoreDir]
+
+    AuthKey = bytes.fromhex(os.environ.pop(AuthKeyVar))
+    WorkerListener = Listener((WorkerHost, 0), authkey = AuthKey)
+
+    # Tell the client where to connect, then send the rest of the output to the log
+    sys.stdout.write(f"{WorkerListener.address[1]}\n")
+    sys.stdout.flush()
+    if LogPath is not None:
+        os.makedirs(Path(LogPath).parent, exist_ok = True)
+        LogFile = open(LogPath, mode = 'a', encoding = 'utf-8', buffering = 1)
+        os.dup2(LogFile.fileno(), sys.stdout.fileno())
+        os.dup2(LogFile.fileno(), sys.stderr.fileno())
+        sys.stdout = sys.stderr = LogFile
+
+    CheckpointCache = Checkpoint_Cache(CacheMB * 1024**2)
+
+    Conn = WorkerListener.accept()
+    while True:
+        try:
+            Message = Conn.recv()
+        except (EOFError, OSError):
+            break
+        if Message['Type'] == 'Run':
+            try:
+                ExecuteTask(Message['Module'], Message['Name'], tuple(Message['Params']), Message['Calls'],
+                    Reporter = Progress_Reporter(lambda Event: Conn.send({'Type': 'Progress', 'Event': Event})),
+                    Paths = Message.get('Paths', [])
+                )
+                Error = None
+            except BaseException as e:
+                traceback.print_exc()
+                Error = FormatError(e)
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            CheckpointCache.Patch()
+            Conn.send({'Type': 'Finished', 'Error': Error})
+        if Message['Type'] == 'Import':
+            try:
+                for Module in Message['Modules']:
+                    importlib.import_module(Module)
+                Error = None
+            except BaseException as e:
+                traceback.print_exc()
+                Error = FormatError(e)
+            CheckpointCache.Patch()
+            Conn.send({'Type': 'Finished', 'Error': Error})
+        if Message['Type'] == 'ClearCache':
+            CheckpointCache.Clear()
+            Conn.send({'Type': 'Finished', 'Error': None})
+        if Message['Type'] == 'Shutdown':
+            break
+    Conn.close()
+    WorkerListener.close()
+
+##############################################################################################################################
+
+class Worker_Client:
+    '''
+    Start a long-lived worker process and talk to it over a local socket
+    (the worker keeps core modules imported and reuses loaded checkpoints between tasks)
+    '''
+    def __init__(self,
+        CoreDir: str,
+        LogPath: Optional[str] = None,
+        CacheMB: int = 1024,
+        Python: Optional[str] = None
+    ):
+        self.CoreDir = str(CoreDir)
+        self.LogPath = str(LogPath) if LogPath is not None else None
+        self.CacheMB = CacheMB
+        self.Python = Python
+
+        self.Process = None
+        self.Conn = None
+        self.Lock = threading.Lock()
+
+        self.LastKey = None
+
+    def IsAlive(self):
+        return self.Process is not None and self.Process.poll() is None and self.Conn is not None
+
+    def Start(self):
+        if self.IsAlive():
+            return
+        self.Kill()
+        AuthKey = secrets.token_bytes(16)
+        Env = dict(os.environ)
+        Env[AuthKeyVar] = AuthKey.hex()
+        Env['PYTHONUNBUFFERED'] = '1'
+        Args = [
+            self.Python or shutil.which('python') or sys.executable, str(Path(__file__).resolve()),
+            '--core', self.CoreDir,
+            '--cache-mb', str(self.CacheMB)
+        ] + (['--log', self.LogPath] if self.LogPath is not None else [])
+        self.Process = subprocess.Popen(
+            Args,
+            stdout = subprocess.PIPE,
+            env = Env,
+            creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0,
+            start_new_session = platform.system() != 'Windows'
+        )
+        Port = self.Process.stdout.readline().decode().strip()
+        if not Port.isdigit():
+            self.Kill()
+            raise RuntimeError("Failed to start the worker process")
+        self.Conn = Client((WorkerHost, int(Port)), authkey = AuthKey)
+
+    def Request(self, Message: dict, OnProgress: Optional[Callable[[dict], None]] = None):
+        '''
+        Send a message and wait for the worker to finish it (progress events are passed to OnProgress)
+        '''
+        with self.Lock:
+            try:
+                self.Start()
+                self.Conn.send(Message)
+                while True:
+                    Reply = self.Conn.recv()
+                    if Reply['Type'] == 'Progress':
+                        OnProgress(Reply['Event']) if OnProgress is not None else None
+                    if Reply['Type'] == 'Finished':
+                        return Reply['Error']
+            except (EOFError, OSError, RuntimeError) as e:
+                ReturnCode = self.Process.poll() if self.Process is not None else None
+                self.Kill()
+                return {
+                    'Type': 'WorkerError',
+                    'Message': f"Worker exited unexpectedly (return code: {ReturnCode})" if ReturnCode is not None else str(e),
+                    'Traceback': ''
+                }
+
+    def Run(self,
+        Module: str,
+        Name: str,
+        Params: tuple = (),
+        Calls: list = [],
+        OnProgress: Optional[Callable[[dict], None]] = None,
+        Paths: list = []
+    ):
+        '''
+        Run a core task, return None if succeeded or an error dict if failed
+        '''
+        return self.Request({'Type': 'Run', 'Module': Module, 'Name': Name, 'Params': tuple(Params), 'Calls': list(Calls), 'Paths': list(Paths)}, OnProgress)
+
+    def Preload(self, Modules: list):
+        return self.Request({'Type': 'Import', 'Modules': list(Modules)})
+
+    def Kill(self):
+        '''
+        Kill the worker (and whatever the running task spawned)
+        '''
+        if self.Conn is not None:
+            try:
+                self.Conn.close()
+            except OSError:
+                pass
+            self.Conn = None
+        Process, self.Process = self.Process, None
+        if Process is not None:
+            if Process.poll() is None:
+                if platform.system() == 'Windows':
+                    subprocess.run(['taskkill', '/F', '/T', '/PID', str(Process.pid)], capture_output = True)
+                else:
+                    try:
+                        os.killpg(Process.pid, signal.SIGKILL)
+                    except OSError:
+                        Process.kill()
+                Process.wait()
+            Process.stdout.close() if Process.stdout else None
+
+    def Shutdown(self):
+        if self.IsAlive():
+            try:
+                self.Conn.send({'Type': 'Shutdown'})
+                self.Process.wait(timeout = 3)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        self.Kill()
+
+
+class Worker_Pool:
+    '''
+    Hand out warm workers, preferring the one that last ran the same kind of task (so its models are reused)
+    '''
+    def __init__(self,
+        CoreDir: str,
+        LogPath: Optional[str] = None,
+        CacheMB: int = 1024,
+        MaxIdle: int = 2
+    ):
+        self.CoreDir = CoreDir
+        self.LogPath = LogPath
+        self.CacheMB = CacheMB
+        self.MaxIdle = MaxIdle
+
+        self.IdleWorkers = []
+        self.BusyWorkers = []
+        self.Lock = threading.Lock()
+
+    def Acquire(self, Key: Optional[str] = None):
+        with self.Lock:
+            Candidates = [Worker for Worker in self.IdleWorkers if Worker.LastKey == Key] or self.IdleWorkers
+            if len(Candidates) > 0:
+                Worker = Candidates[-1]
+                self.IdleWorkers.remove(Worker)
+            else:
+                Worker = Worker_Client(self.CoreDir, self.LogPath, self.CacheMB)
+            Worker.LastKey = Key
+            self.BusyWorkers.append(Worker)
+            return Worker
+
+    def Release(self, Worker: Worker_Client, KeepAlive: bool = True):
+        '''
+        Give the worker back to the pool (or shut it down if it holds resources worth freeing, e.g. after training)
+        '''
+        with self.Lock:
+            self.BusyWorkers.remove(Worker) if Worker in self.BusyWorkers else None
+            if not Worker.IsAlive():
+                return
+            if not KeepAlive:
+                Worker.Shutdown()
+                return
+            self.IdleWorkers.append(Worker)
+            while len(self.IdleWorkers) > self.MaxIdle:
+                self.IdleWorkers.pop(0).Shutdown()
+
+    def Terminate(self, Worker: Worker_Client):
+        Worker.Kill()
+        self.Release(Worker)
+
+    def Prewarm(self, Key: str, Modules: list):
+        '''
+        Start a worker in the background and import the given modules into it
+        '''
+        with self.Lock:
+            if any(Worker.LastKey == Key for Worker in self.IdleWorkers + self.BusyWorkers):
+                return
+        def Prewarm():
+            Worker = self.Acquire(Key)
+            Worker.Preload(Modules)
+            self.Release(Worker)
+        threading.Thread(target = Prewarm, daemon = True).start()
+
+    def Shutdown(self):
+        with self.Lock:
+            Workers = self.IdleWorkers + self.BusyWorkers
+            self.IdleWorkers, self.BusyWorkers = [], []
+        for Worker in Workers:
+            Worker.Shutdown()
+
+##############################################################################################################################
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--core",       help = "dir of core files",                 required = True)
+    parser.add_argument("--log",        help = "path to log file",                  default = None)
+    parser.add_argument("--cache-mb",   help = "megabytes of checkpoints to keep",  default = 1024, type = int)
+    args = parser.parse_args()
+
+    RunWorker(
+        CoreDir = args.core,
+        LogPath = args.log,
+        CacheMB = args.cache_mb
+    )
+
+##############################################################################################################################
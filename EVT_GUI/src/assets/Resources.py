@@ -0,0 +1,27 @@
+import threading
+from importlib import import_module
+
+##############################################################################################################################
+
+# Module compiled from the resource collection (registers its data with Qt when it's imported)
+SourcesModule = 'assets.Sources'
+
+Lock = threading.Lock()
+Registered = False
+
+##############################################################################################################################
+
+def RegisterResources():
+    '''
+    Register the compiled resources (icons and translations) with Qt the first time something needs them,
+    so that importing the components or running headless doesn't decode and register them all up front
+    '''
+    global Registered
+    if Registered:
+        return
+    with Lock:
+        if not Registered:
+            import_module(SourcesModule)
+            Registered = True
+
+##############################################################################################################################
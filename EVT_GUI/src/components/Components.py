@@ -1,13 +1,16 @@
-from typing import Optional
-from PySide6.QtCore import Qt, Signal
+import threading
+from typing import Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QUrl, QBuffer, QByteArray, QAbstractItemModel, QAbstractTableModel, QModelIndex, QPersistentModelIndex
+from PySide6.QtGui import QPainter
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtWidgets import *
 from QEasyWidgets import QFunctions as QFunc
 from QEasyWidgets import IconBase
 from QEasyWidgets.Components import *
 from QEasyWidgets.Windows import MessageBoxBase
 
-from assets.Sources import *
-
 ##############################################################################################################################
 
 class Table_ViewModels(TableBase):
@@ -25,12 +28,14 @@ class Table_ViewModels(TableBase):
 
         self.Clipboard = QApplication.clipboard()
 
+        self.RowKeys = []
+
     def setHorizontalHeaderLabels(self, Headers: list):
         self.HorizontalHeaderLabels = Headers
         self.ColumnCount = len(Headers)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-    def AddRow(self, Param: tuple):
+    def AddRow(self, Param: tuple, Key: Optional[str] = None):
         ModelName, ModelType, ModelSize, ModelDate, DownloadParam = Param
 
         RowHeight = 36
@@ -108,15 +113,43 @@ class Table_ViewModels(TableBase):
             [None, None, None, None, 2 * RowHeight],
             RowHeight
         )
+        self.RowKeys.append(Key)
+
+    def RemoveRow(self, Key: str):
+        if Key not in self.RowKeys:
+            return
+        Row = self.RowKeys.index(Key)
+        self.removeRow(Row)
+        self.RowKeys.pop(Row)
+
+    def UpdateRow(self, Key: str, Param: tuple):
+        self.RemoveRow(Key)
+        self.AddRow(Param, Key)
 
     def SetValue(self, Params: list = [['name', 'type', 'size', 'date', 'url'], ]):
         self.ClearRows()
+        self.RowKeys = []
         super().setColumnCount(self.columnCount())
         super().setHorizontalHeaderLabels(self.HorizontalHeaderLabels)
         for Param in Params:
             QApplication.processEvents()
             self.AddRow(Param)
 
+    def ApplyDelta(self, Delta: dict = {'Added': {}, 'Removed': [], 'Changed': {}}):
+        '''
+        Add, remove and update the rows (keyed by SHA) that changed instead of rebuilding the table
+        '''
+        if self.rowCount() == 0 and len(self.RowKeys) == 0:
+            super().setColumnCount(self.columnCount())
+            super().setHorizontalHeaderLabels(self.HorizontalHeaderLabels)
+        for Key in Delta.get('Removed', []):
+            self.RemoveRow(Key)
+        for Key, Param in Delta.get('Changed', {}).items():
+            self.UpdateRow(Key, Param)
+        for Key, Param in Delta.get('Added', {}).items():
+            QApplication.processEvents()
+            self.AddRow(Param, Key)
+
 
 class Table_EditAudioSpeaker(TableBase):
     '''
@@ -231,21 +264,245 @@ class Table_EditAudioSpeaker(TableBase):
         return ValueDict
 
 
-class Table_ASRResult(TableBase):
+class Audio_Player(QObject):
+    '''
+    One playback engine for all the rows of the result tables,
+    clips are kept in a small LRU cache and the ones that come next are read ahead in the background
+    '''
+    StateChanged = Signal(str, bool)
+
+    # Number of clips kept in memory
+    CacheSize = 8
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.MediaPlayer = None
+        self.Buffer = None
+        self.Current = None
+
+        self.Cache = OrderedDict()
+        self.Lock = threading.Lock()
+        self.Executor = ThreadPoolExecutor(max_workers = 1)
+
+    def GetMediaPlayer(self):
+        if self.MediaPlayer is None:
+            self.MediaPlayer = QMediaPlayer(self)
+            self.MediaPlayer.setAudioOutput(QAudioOutput(self))
+            self.MediaPlayer.mediaStatusChanged.connect(lambda Status: self.Stop() if Status in (QMediaPlayer.EndOfMedia, QMediaPlayer.InvalidMedia) else None)
+        return self.MediaPlayer
+
+    def Read(self, MediaPath: str):
+        with self.Lock:
+            if MediaPath in self.Cache:
+                self.Cache.move_to_end(MediaPath)
+                return self.Cache[MediaPath]
+        with open(MediaPath, mode = 'rb') as Media:
+            Data = Media.read()
+        with self.Lock:
+            self.Cache[MediaPath] = Data
+            self.Cache.popitem(last = False) if len(self.Cache) > self.CacheSize else None
+        return Data
+
+    def Prefetch(self, MediaPaths: list):
+        def Read(MediaPath):
+            try:
+                self.Read(MediaPath)
+            except OSError:
+                pass
+        for MediaPath in MediaPaths[:self.CacheSize - 1]:
+            self.Executor.submit(Read, MediaPath)
+
+    def IsPlaying(self, MediaPath: str):
+        return self.Current is not None and self.Current == MediaPath
+
+    def Play(self, MediaPath: str, NextPaths: list = []):
+        '''
+        Play a clip (stopping the one that is playing) and read the next ones ahead
+        '''
+        self.Stop()
+        try:
+            Data = self.Read(MediaPath)
+        except OSError:
+            return
+        self.Buffer = QBuffer(self)
+        self.Buffer.setData(QByteArray(Data))
+        self.Buffer.open(QBuffer.ReadOnly)
+        MediaPlayer = self.GetMediaPlayer()
+        MediaPlayer.setSourceDevice(self.Buffer, QUrl.fromLocalFile(MediaPath))
+        MediaPlayer.play()
+        self.Current = MediaPath
+        self.StateChanged.emit(MediaPath, True)
+        self.Prefetch(NextPaths)
+
+    def Stop(self):
+        if self.Current is None:
+            return
+        MediaPath, self.Current = self.Current, None
+        self.MediaPlayer.stop()
+        self.MediaPlayer.setSource(QUrl())
+        self.Buffer.deleteLater()
+        self.Buffer = None
+        self.StateChanged.emit(MediaPath, False)
+
+    def Toggle(self, MediaPath: str, NextPaths: list = []):
+        self.Stop() if self.IsPlaying(MediaPath) else self.Play(MediaPath, NextPaths)
+
+
+def GetAudioPlayer():
     '''
+    Return the audio player shared by the result tables
     '''
+    global SharedAudioPlayer
+    if SharedAudioPlayer is None:
+        SharedAudioPlayer = Audio_Player(QApplication.instance())
+    return SharedAudioPlayer
+
+SharedAudioPlayer = None
+
+
+class Result_Model(QAbstractTableModel):
+    '''
+    Model of result tables (column 0 holds the row index like TableBase does),
+    cells are read through the given functions and rows are fetched a page at a time
+    '''
+    PageSize = 100
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.Headers = []
+        self.Count = lambda: 0
+        self.Getter = lambda Row, Column: None
+        self.Setter = None
+        self.Remover = None
+        self.Loaded = 0
+
+    def SetSource(self, Count: Callable, Getter: Callable, Setter: Optional[Callable] = None, Remover: Optional[Callable] = None):
+        self.beginResetModel()
+        self.Count, self.Getter, self.Setter, self.Remover = Count, Getter, Setter, Remover
+        self.Loaded = min(self.PageSize, Count())
+        self.endResetModel()
+
+    def SetHeaders(self, Headers: list):
+        self.beginResetModel()
+        self.Headers = Headers
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()):
+        return 0 if parent.isValid() else self.Loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()):
+        return 0 if parent.isValid() else 1 + len(self.Headers)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()):
+        return not parent.isValid() and self.Loaded < self.Count()
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        Count = min(self.PageSize, self.Count() - self.Loaded)
+        if parent.isValid() or Count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.Loaded, self.Loaded + Count - 1)
+        self.Loaded += Count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            return None
+        if index.column() == 0:
+            return f"{index.row() + 1}" if role == Qt.DisplayRole else None
+        return self.Getter(index.row(), index.column() - 1)
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole):
+        if not index.isValid() or index.column() == 0 or role != Qt.EditRole or self.Setter is None:
+            return False
+        self.Setter(index.row(), index.column() - 1, value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return None
+        return 'Index' if section == 0 else (self.Headers[section - 1] if section - 1 < len(self.Headers) else None)
+
+    def RemoveRow(self, Row: int):
+        if self.Remover is None or not 0 <= Row < self.Loaded:
+            return
+        self.beginRemoveRows(QModelIndex(), Row, Row)
+        self.Remover(Row)
+        self.Loaded -= 1
+        self.endRemoveRows()
+        self.dataChanged.emit(self.index(Row, 0), self.index(self.Loaded - 1, 0)) if Row < self.Loaded else None
+
+
+class Widget_Delegate(QStyledItemDelegate):
+    '''
+    Show the cells of a column as widgets made by Factory(Parent, Index) (Updater(Widget, Index) syncs them with the model)
+    '''
+    def __init__(self, Factory: Callable, Updater: Optional[Callable] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.Factory = Factory
+        self.Updater = Updater
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex):
+        return self.Factory(parent, QPersistentModelIndex(index))
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        self.Updater(editor, index) if self.Updater is not None else None
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex):
+        pass
+
+    def updateEditorGeometry(self, editor: QWidget, option: QStyleOptionViewItem, index: QModelIndex):
+        editor.setGeometry(option.rect)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        pass
+
+
+class Table_ResultBase(TableBase):
+    '''
+    Result table on a model instead of a widget per cell,
+    the widgets of the widget columns are only created for the rows in view
+    '''
+    RowHeight = 30
+
+    ResizeModes = []
+    ColumnWidths = []
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
 
-        self.setRowCount(0)
-        self.setColumnCount(0)
+        self.StandardItemModel = Result_Model(self)
+        QTableView.setModel(self, self.StandardItemModel)
         self.SetIndexHeaderVisible(True)
         self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.RowHeight)
+
+        self.WidgetColumns = []
+        self.OpenRows = set()
+        self.PlayerColumn = None
+        self.Player = GetAudioPlayer()
+        self.Player.StateChanged.connect(self.UpdatePlayButtons)
+        self.EditorTimer = QTimer(self)
+        self.EditorTimer.setSingleShot(True)
+        self.EditorTimer.setInterval(0)
+        self.EditorTimer.timeout.connect(self.UpdateEditors)
+        self.verticalScrollBar().valueChanged.connect(self.EditorTimer.start)
+        self.model().rowsInserted.connect(self.EditorTimer.start)
+        self.model().rowsRemoved.connect(self.ResetEditors)
+        self.model().modelReset.connect(self.ResetEditors)
 
     def setHorizontalHeaderLabels(self, Headers: list):
         self.HorizontalHeaderLabels = Headers
         self.ColumnCount = len(Headers)
+        self.model().SetHeaders(Headers)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        for Column, (ResizeMode, ColumnWidth) in enumerate(zip(self.ResizeModes, self.ColumnWidths)):
+            self.SetSectionHorizontalResizeMode(Column, ResizeMode) if ResizeMode is not None else None
+            self.setColumnWidth(Column, int(ColumnWidth)) if ColumnWidth is not None else None
 
     def setStyleSheet(self, StyleSheet: str):
         super().setStyleSheet(StyleSheet + '''
@@ -253,54 +510,108 @@ class Table_ASRResult(TableBase):
         '''
         )
 
-    def AddRow(self, Param: tuple, ComboItems: list):
-        RowHeight = 30
-        LabelStyle = '''
-        QLabel {
-            background-color: transparent;
-            border: none;
-        }
+    def SetColumnWidget(self, Column: int, Factory: Callable, Updater: Optional[Callable] = None):
+        self.setItemDelegateForColumn(Column + 1, Widget_Delegate(Factory, Updater, self))
+        self.WidgetColumns.append(Column)
+
+    def SetWidgetStyle(self, Widget: QWidget):
+        Widget.setBorderless(True)
+        Widget.setTransparent(True)
+        return Widget
+
+    def CreateLineEdit(self, Parent: QWidget, Index: QPersistentModelIndex):
+        LineEdit = self.SetWidgetStyle(LineEditBase(Parent))
+        QFunc.Function_SetText(LineEdit, Index.data(), SetPlaceholderText = True)
+        LineEdit.textChanged.connect(lambda Text: self.model().setData(self.model().index(Index.row(), Index.column()), Text) if Index.isValid() else None)
+        return LineEdit
+
+    def UpdateLineEdit(self, LineEdit: QWidget, Index: QModelIndex):
+        LineEdit.setText(Index.data()) if LineEdit.text() != Index.data() else None
+
+    def CreatePlayButton(self, Parent: QWidget, Index: QPersistentModelIndex):
+        PlayButton = self.SetWidgetStyle(ButtonBase(Parent))
+        PlayButton.setIcon(IconBase.Pause if self.Player.IsPlaying(Index.data()) else IconBase.Play)
+        PlayButton.clicked.connect(lambda: self.Player.Toggle(Index.data(), self.GetNextPaths(Index)) if Index.isValid() else None)
+        return PlayButton
+
+    def UpdatePlayButton(self, PlayButton: QWidget, Index: QModelIndex):
+        PlayButton.setIcon(IconBase.Pause if self.Player.IsPlaying(Index.data()) else IconBase.Play)
+
+    def GetNextPaths(self, Index: QPersistentModelIndex):
         '''
-        def SetColumnLayout(ColumnLayout):
-            ColumnLayout.setContentsMargins(0, 0, 0, 0)
-            ColumnLayout.setSpacing(0)
+        Paths of the clips in the rows after the given one (the ones most likely to be played next)
+        '''
+        Rows = range(Index.row() + 1, min(Index.row() + self.Player.CacheSize, self.model().rowCount()))
+        return [self.model().index(Row, Index.column()).data() for Row in Rows]
 
-        Label0 = QLabel()
-        Label0.setStyleSheet(LabelStyle)
-        QFunc.Function_SetText(Label0, Param[0])
-        Column0Layout = QHBoxLayout()
-        SetColumnLayout(Column0Layout)
-        Column0Layout.addWidget(Label0)
+    def UpdatePlayButtons(self):
+        if self.PlayerColumn is not None and self.model().rowCount() > 0:
+            self.model().dataChanged.emit(self.model().index(0, self.PlayerColumn + 1), self.model().index(self.model().rowCount() - 1, self.PlayerColumn + 1))
 
-        ComboBox = ComboBoxBase()
-        ComboBox.setBorderless(True)
-        ComboBox.setTransparent(True)
-        ComboBox.addItems(ComboItems)
-        ComboBox.setCurrentText(Param[1])
-        Column1Layout = QHBoxLayout()
-        SetColumnLayout(Column1Layout)
-        Column1Layout.addWidget(ComboBox)
+    def SetPlayerColumn(self, Column: int):
+        self.SetColumnWidget(Column, self.CreatePlayButton, self.UpdatePlayButton)
+        self.PlayerColumn = Column
 
-        Label2 = QLabel()
-        Label2.setStyleSheet(LabelStyle)
-        QFunc.Function_SetText(Label2, Param[2])
-        Column2Layout = QHBoxLayout()
-        SetColumnLayout(Column2Layout)
-        Column2Layout.addWidget(Label2)
-
-        PlayerWidget = MediaPlayerBase()
-        PlayerWidget.setBorderless(True)
-        PlayerWidget.setTransparent(True)
-        PlayerWidget.SetMediaPlayer(Param[0])
-        PlayerWidget.layout().setContentsMargins(6, 6, 6, 6)
-        PlayerWidget.Slider.hide()
-        Column3Layout = QHBoxLayout()
-        SetColumnLayout(Column3Layout)
-        Column3Layout.addWidget(PlayerWidget)
+    def UpdateEditors(self):
+        '''
+        Open the widgets of the rows in view and close the ones that went out of it
+        '''
+        Rows = set()
+        RowCount = self.model().rowCount()
+        if RowCount > 0:
+            First = max(self.rowAt(0), 0)
+            Last = self.rowAt(self.viewport().height() - 1)
+            Rows = set(range(First, (Last if Last >= 0 else RowCount - 1) + 1))
+        for Row in self.OpenRows - Rows:
+            for Column in self.WidgetColumns:
+                self.closePersistentEditor(self.model().index(Row, Column + 1)) if Row < RowCount else None
+        for Row in Rows - self.OpenRows:
+            for Column in self.WidgetColumns:
+                self.openPersistentEditor(self.model().index(Row, Column + 1))
+        self.OpenRows = Rows
+
+    def ResetEditors(self):
+        RowCount = self.model().rowCount()
+        for Row in self.OpenRows:
+            for Column in self.WidgetColumns:
+                self.closePersistentEditor(self.model().index(Row, Column + 1)) if Row < RowCount else None
+        self.OpenRows = set()
+        self.EditorTimer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.EditorTimer.start()
+
+
+class Table_ASRResult(Table_ResultBase):
+    '''
+    '''
+    ResizeModes = [QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Fixed, QHeaderView.Fixed]
+    ColumnWidths = [None, None, None, Table_ResultBase.RowHeight, 1.5 * Table_ResultBase.RowHeight]
 
-        DelButton = ButtonBase()
-        DelButton.setBorderless(True)
-        DelButton.setTransparent(True)
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+
+        self.Result = None
+        self.Rows = []
+        self.ComboItems = []
+
+        self.SetColumnWidget(1, self.CreateComboBox, self.UpdateComboBox)
+        self.SetPlayerColumn(3)
+        self.SetColumnWidget(4, self.CreateDelButton)
+
+    def CreateComboBox(self, Parent: QWidget, Index: QPersistentModelIndex):
+        ComboBox = self.SetWidgetStyle(ComboBoxBase(Parent))
+        ComboBox.addItems(self.ComboItems)
+        ComboBox.setCurrentText(Index.data())
+        ComboBox.currentTextChanged.connect(lambda Text: self.model().setData(self.model().index(Index.row(), Index.column()), Text) if Index.isValid() else None)
+        return ComboBox
+
+    def UpdateComboBox(self, ComboBox: QWidget, Index: QModelIndex):
+        ComboBox.setCurrentText(Index.data()) if ComboBox.currentText() != Index.data() else None
+
+    def CreateDelButton(self, Parent: QWidget, Index: QPersistentModelIndex):
+        DelButton = self.SetWidgetStyle(ButtonBase(Parent))
         DelButton.setText("删除")
         DelButton.clicked.connect(
             lambda: MessageBoxBase.pop(None,
@@ -308,140 +619,113 @@ class Table_ASRResult(TableBase):
                 "确认删除该行？",
                 QMessageBox.Yes|QMessageBox.No,
                 {
-                    QMessageBox.Yes: lambda: (
-                        self.SelectOuterRow(DelButton),
-                        self.DelRow()
-                    )
+                    QMessageBox.Yes: lambda: self.model().RemoveRow(Index.row()) if Index.isValid() else None
                 }
             )
         )
-        Column4Layout = QHBoxLayout()
-        SetColumnLayout(Column4Layout)
-        Column4Layout.addWidget(DelButton)
+        return DelButton
 
-        super().AddRow(
-            [Column0Layout, Column1Layout, Column2Layout, Column3Layout, Column4Layout],
-            [QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Fixed, QHeaderView.Fixed],
-            [None, None, None, RowHeight, 1.5 * RowHeight],
-            RowHeight
-        )
-
-    def SetValue(self, Params: list = [['%Path%', '%Namex%', '%Sim%'], ], ComboItems: Optional[list] = ['%Name1%', ]):
-        self.ClearRows()
-        super().setColumnCount(self.columnCount())
-        super().setHorizontalHeaderLabels(self.HorizontalHeaderLabels)
+    def SetValue(self, Result: object = None, ComboItems: Optional[list] = None):
+        '''
+        Show a result whose Rows are [audio, speaker, similarity] lists (edited and removed in place)
+        '''
+        self.Result = Result
+        self.Rows = Result.Rows if Result is not None else []
         if ComboItems is None:
             ComboItems = []
-            for Param in Params:
-                ComboItem = Param[1]
+            for Row in self.Rows:
+                ComboItem = Row[1]
                 ComboItems.append(ComboItem) if ComboItem not in ComboItems else None
-        for Param in Params:
-            QApplication.processEvents()
-            self.AddRow(Param, ComboItems + [''])
+        self.ComboItems = ComboItems + ['']
+        def Getter(Row, Column):
+            return self.Rows[Row][Column] if Column < 3 else (self.Rows[Row][0] if Column == 3 else '')
+        def Setter(Row, Column, Value):
+            self.Rows[Row][Column] = Value
+        self.model().SetSource(lambda: len(self.Rows), Getter, Setter, self.Rows.pop)
 
     def GetValue(self):
-        ValueDict = {}
-        for RowCount in range(self.rowCount()):
-            try:
-                Key = QFunc.Function_GetText(self.cellWidget(RowCount, 0).findChild(QLabel))
-                Value = self.cellWidget(RowCount, 1).findChild(ComboBoxBase).currentText()
-                ValueDict[Key] = Value
-            except:
-                pass
-        return ValueDict
+        return self.Result
 
 
-class Table_STTResult(TableBase):
+class Table_STTResult(Table_ResultBase):
     '''
+    Texts are only read for the rows that are shown
     '''
+    ResizeModes = [QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Fixed]
+    ColumnWidths = [None, None, Table_ResultBase.RowHeight]
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
 
-        self.setRowCount(0)
-        self.setColumnCount(0)
-        self.SetIndexHeaderVisible(True)
-        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.Result = None
 
-    def setHorizontalHeaderLabels(self, Headers: list):
-        self.HorizontalHeaderLabels = Headers
-        self.ColumnCount = len(Headers)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.SetColumnWidget(1, self.CreateLineEdit, self.UpdateLineEdit)
+        self.SetPlayerColumn(2)
 
-    def setStyleSheet(self, StyleSheet: str):
-        super().setStyleSheet(StyleSheet + '''
-            QHeaderView::section, QTableView::item {padding: 0px;}
+    def SetValue(self, Result: object = None):
         '''
-        )
-
-    def AddRow(self, Param: tuple):
-        RowHeight = 30
-        LabelStyle = '''
-        QLabel {
-            background-color: transparent;
-            border: none;
-        }
+        Show a lazy result (with __len__, GetAudio, GetText and SetText)
         '''
-        def SetColumnLayout(ColumnLayout):
-            ColumnLayout.setContentsMargins(0, 0, 0, 0)
-            ColumnLayout.setSpacing(0)
+        self.Result = Result
+        def Getter(Row, Column):
+            return self.Result.GetText(Row) if Column == 1 else self.Result.GetAudio(Row)
+        def Setter(Row, Column, Value):
+            if Column == 1:
+                self.Result.SetText(Row, Value)
+        self.model().SetSource(lambda: len(self.Result) if self.Result is not None else 0, Getter, Setter)
 
-        Label0 = QLabel()
-        Label0.setStyleSheet(LabelStyle)
-        QFunc.Function_SetText(Label0, Param[0])
-        Column0Layout = QHBoxLayout()
-        SetColumnLayout(Column0Layout)
-        Column0Layout.addWidget(Label0)
+    def GetValue(self):
+        return self.Result
 
-        LineEdit = LineEditBase()
-        LineEdit.setBorderless(True)
-        LineEdit.setTransparent(True)
-        QFunc.Function_SetText(LineEdit, Param[1], SetPlaceholderText = True)
-        Column1Layout = QHBoxLayout()
-        SetColumnLayout(Column1Layout)
-        Column1Layout.addWidget(LineEdit)
-
-        PlayerWidget = MediaPlayerBase()
-        PlayerWidget.setBorderless(True)
-        PlayerWidget.setTransparent(True)
-        PlayerWidget.SetMediaPlayer(Param[0])
-        PlayerWidget.layout().setContentsMargins(6, 6, 6, 6)
-        PlayerWidget.Slider.hide()
-        Column2Layout = QHBoxLayout()
-        SetColumnLayout(Column2Layout)
-        Column2Layout.addWidget(PlayerWidget)
 
-        super().AddRow(
-            [Column0Layout, Column1Layout, Column2Layout],
-            [QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Fixed],
-            [None, None, RowHeight],
-            RowHeight
-        )
+class Table_DATResult(Table_ResultBase):
+    '''
+    Lines are only read for the rows that are shown
+    '''
+    ResizeModes = [QHeaderView.Stretch, QHeaderView.Fixed]
+    ColumnWidths = [None, Table_ResultBase.RowHeight]
 
-    def SetValue(self, Params: dict = {'%Path%': '%Transcription%'}):
-        self.ClearRows()
-        super().setColumnCount(self.columnCount())
-        super().setHorizontalHeaderLabels(self.HorizontalHeaderLabels)
-        ParamDict = QFunc.ToIterable(Params)
-        for Key, Value in ParamDict.items():
-            QApplication.processEvents()
-            Param = (Key, Value)
-            self.AddRow(Param)
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+
+        self.Result = None
+
+        self.SetColumnWidget(0, self.CreateLineEdit, self.UpdateLineEdit)
+        self.SetPlayerColumn(1)
+
+    def SetValue(self, Result: object = None):
+        '''
+        Show a lazy result (with __len__, GetAudio, GetText and SetText)
+        '''
+        self.Result = Result
+        def Getter(Row, Column):
+            return self.Result.GetText(Row) if Column == 0 else self.Result.GetAudio(Row)
+        def Setter(Row, Column, Value):
+            if Column == 0:
+                self.Result.SetText(Row, Value)
+        self.model().SetSource(lambda: len(self.Result) if self.Result is not None else 0, Getter, Setter)
 
     def GetValue(self):
-        ValueDict = {}
-        for RowCount in range(self.rowCount()):
-            try:
-                Key = QFunc.Function_GetText(self.cellWidget(RowCount, 0).findChild(QLabel))
-                Value = QFunc.Function_GetText(self.cellWidget(RowCount, 1).findChild(QLineEdit))
-                ValueDict[Key] = Value
-            except:
-                pass
-        return ValueDict
+        return self.Result
 
+    def Release(self):
+        '''
+        Close the shown result (unmapping its filelist so that it can be written again) and show nothing
+        '''
+        Result = self.Result
+        self.SetValue(None)
+        Result.Close() if Result is not None else None
 
-class Table_DATResult(TableBase):
+
+class Table_JobQueue(TableBase):
     '''
     '''
+    Raise = Signal(str)
+    Lower = Signal(str)
+    Cancel = Signal(str)
+    Retry = Signal(str)
+    Remove = Signal(str)
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
 
@@ -462,54 +746,72 @@ class Table_DATResult(TableBase):
         )
 
     def AddRow(self, Param: tuple):
+        JobID, Title, Status, StatusText, ProgressText, ToolTip = Param
+
         RowHeight = 30
+        LabelStyle = '''
+        QLabel {
+            background-color: transparent;
+            border: none;
+        }
+        '''
         def SetColumnLayout(ColumnLayout):
             ColumnLayout.setContentsMargins(0, 0, 0, 0)
             ColumnLayout.setSpacing(0)
 
-        LineEdit = LineEditBase()
-        LineEdit.setBorderless(True)
-        LineEdit.setTransparent(True)
-        QFunc.Function_SetText(LineEdit, Param[1], SetPlaceholderText = True)
-        Column0Layout = QHBoxLayout()
-        SetColumnLayout(Column0Layout)
-        Column0Layout.addWidget(LineEdit)
-
-        PlayerWidget = MediaPlayerBase()
-        PlayerWidget.setBorderless(True)
-        PlayerWidget.setTransparent(True)
-        PlayerWidget.SetMediaPlayer(Param[0])
-        PlayerWidget.layout().setContentsMargins(6, 6, 6, 6)
-        PlayerWidget.Slider.hide()
-        Column1Layout = QHBoxLayout()
-        SetColumnLayout(Column1Layout)
-        Column1Layout.addWidget(PlayerWidget)
+        Label_Title = QLabel()
+        Label_Title.setStyleSheet(LabelStyle)
+        Label_Title.setToolTip(ToolTip)
+        QFunc.Function_SetText(Label_Title, Title)
+        ColumnLayout_Title = QHBoxLayout()
+        SetColumnLayout(ColumnLayout_Title)
+        ColumnLayout_Title.addWidget(Label_Title)
+
+        Label_Status = QLabel()
+        Label_Status.setStyleSheet(LabelStyle)
+        Label_Status.setToolTip(ToolTip)
+        QFunc.Function_SetText(Label_Status, StatusText)
+        ColumnLayout_Status = QHBoxLayout()
+        SetColumnLayout(ColumnLayout_Status)
+        ColumnLayout_Status.addWidget(Label_Status)
+
+        Label_Progress = QLabel()
+        Label_Progress.setStyleSheet(LabelStyle)
+        Label_Progress.setToolTip(ProgressText)
+        QFunc.Function_SetText(Label_Progress, ProgressText)
+        ColumnLayout_Progress = QHBoxLayout()
+        SetColumnLayout(ColumnLayout_Progress)
+        ColumnLayout_Progress.addWidget(Label_Progress)
+
+        def AddButton(ColumnLayout, Text, Signal_Job, Visible):
+            Button = ButtonBase()
+            Button.setBorderless(True)
+            Button.setTransparent(True)
+            Button.setText(Text)
+            Button.clicked.connect(lambda: Signal_Job.emit(JobID))
+            QFunc.Function_SetRetainSizeWhenHidden(Button)
+            Button.setVisible(Visible)
+            ColumnLayout.addWidget(Button)
+        ColumnLayout_Management = QHBoxLayout()
+        SetColumnLayout(ColumnLayout_Management)
+        AddButton(ColumnLayout_Management, "提前", self.Raise, Status == 'Pending')
+        AddButton(ColumnLayout_Management, "推后", self.Lower, Status == 'Pending')
+        AddButton(ColumnLayout_Management, "取消", self.Cancel, Status in ('Pending', 'Running'))
+        AddButton(ColumnLayout_Management, "重试", self.Retry, Status in ('Failed', 'Cancelled'))
+        AddButton(ColumnLayout_Management, "移除", self.Remove, Status != 'Running')
 
         super().AddRow(
-            [Column0Layout, Column1Layout],
-            [QHeaderView.Stretch, QHeaderView.Fixed],
-            [None, RowHeight],
+            [ColumnLayout_Title, ColumnLayout_Status, ColumnLayout_Progress, ColumnLayout_Management],
+            [QHeaderView.Stretch, QHeaderView.Interactive, QHeaderView.Stretch, QHeaderView.Fixed],
+            [None, None, None, 7.5 * RowHeight],
             RowHeight
         )
 
-    def SetValue(self, Params: dict = {'%Path%': '%Data%'}):
+    def SetValue(self, Params: list = [['%ID%', '%Title%', '%Status%', '%StatusText%', '%Progress%', '%ToolTip%'], ]):
         self.ClearRows()
         super().setColumnCount(self.columnCount())
         super().setHorizontalHeaderLabels(self.HorizontalHeaderLabels)
-        ParamDict = QFunc.ToIterable(Params)
-        for Key, Value in ParamDict.items():
-            QApplication.processEvents()
-            Param = (Key, Value)
+        for Param in Params:
             self.AddRow(Param)
 
-    def GetValue(self):
-        ValueList = []
-        for RowCount in range(self.rowCount()):
-            try:
-                Value = QFunc.Function_GetText(self.cellWidget(RowCount, 0).findChild(QLineEdit))
-                ValueList.append(Value)
-            except:
-                pass
-        return ValueList
-
 ##############################################################################################################################
\ No newline at end of file
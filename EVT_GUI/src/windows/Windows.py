@@ -5,12 +5,15 @@ from QEasyWidgets import QFunctions as QFunc
 from QEasyWidgets.Windows import *
 from QEasyWidgets.Components import *
 
+from Profiler import StartupProfiler
+from assets.Resources import RegisterResources
 from windows.ui.UI_MainWindow import Ui_MainWindow
 from windows.ui.UI_ChildWindow_ASR_VPR import Ui_ChildWindow_ASR_VPR
 from windows.ui.UI_ChildWindow_STT_Whisper import Ui_ChildWindow_STT_Whisper
 from windows.ui.UI_ChildWindow_DAT_GPTSoVITS import Ui_ChildWindow_DAT_GPTSoVITS
 from windows.ui.UI_ChildWindow_DAT_VITS import Ui_ChildWindow_DAT_VITS
 from windows.ui.UI_ChildWindow_TTS_VITS import Ui_ChildWindow_TTS_VITS
+from windows.ui.UI_ChildWindow_JobQueue import Ui_ChildWindow_JobQueue
 
 ##############################################################################################################################
 
@@ -20,7 +23,13 @@ class Window_MainWindow(MainWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 1280, min_height = 720)
 
-        self.ui.setupUi(self)
+        RegisterResources()
+
+        # The pages are built one after another, so each is timed up to its adding to the stackedwidget
+        with StartupProfiler.Span("Build UI_MainWindow"), StartupProfiler.Segments(QStackedWidget, 'addWidget',
+            lambda StackedWidget, Widget: f"Build {Widget.objectName()}" if StackedWidget.objectName() == 'StackedWidget_Pages' else None
+        ):
+            self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
 
@@ -36,6 +45,7 @@ class Window_ChildWindow_ASR(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 960, min_height = 540)
 
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -47,6 +57,7 @@ class Window_ChildWindow_STT(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 960, min_height = 540)
 
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -58,6 +69,7 @@ class Window_ChildWindow_DAT_GPTSoVITS(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 960, min_height = 540)
 
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -69,6 +81,7 @@ class Window_ChildWindow_DAT_VITS(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 960, min_height = 540)
 
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -80,6 +93,7 @@ class Window_ChildWindow_TTS_GPTSoVITS(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 450, min_height = 300)
 
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -91,6 +105,19 @@ class Window_ChildWindow_TTS_VITS(ChildWindowBase):
     def __init__(self, parent = None):
         super().__init__(parent, min_width = 450, min_height = 300)
 
+        RegisterResources()
+        self.ui.setupUi(self)
+
+        self.setTitleBar(self.ui.TitleBar)
+
+
+class Window_ChildWindow_JobQueue(ChildWindowBase):
+    ui = Ui_ChildWindow_JobQueue()
+
+    def __init__(self, parent = None):
+        super().__init__(parent, min_width = 960, min_height = 540)
+
+        RegisterResources()
         self.ui.setupUi(self)
 
         self.setTitleBar(self.ui.TitleBar)
@@ -103,6 +130,8 @@ class MessageBox_Stacked(MessageBoxBase):
     def __init__(self, parent: QWidget = None):
         super().__init__(parent, min_width = 810, min_height = 480)
 
+        RegisterResources()
+
         self.layout().setContentsMargins(6, 12, 6, 12)
         self.layout().setSpacing(6)
 
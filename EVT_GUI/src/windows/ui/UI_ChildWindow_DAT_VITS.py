@@ -2,7 +2,6 @@ from PySide6.QtCore import (QCoreApplication, QMetaObject, QSize)
 from PySide6.QtWidgets import *
 
 from components.Components import Table_DATResult
-from assets import Sources
 
 
 class Ui_ChildWindow_DAT_VITS(object):
@@ -2,7 +2,6 @@ from PySide6.QtCore import (QCoreApplication, QMetaObject, QRect, QSize, Qt)
 from PySide6.QtWidgets import *
 
 from components.Components import WidgetBase, ButtonBase, HollowButton, MenuButton, LabelBase, LineEditBase, TextEditBase, TextBrowserBase, ComboBoxBase, SpinBoxBase, DoubleSpinBoxBase, ToolBoxBase, ScrollAreaBase, TreeWidgetBase, Table_ViewModels, Table_EditAudioSpeaker
-from assets import Sources
 
 
 class Ui_MainWindow(object):
@@ -12365,6 +12364,118 @@ class Ui_MainWindow(object):
 
         self.verticalLayout_76.addWidget(self.Frame_Setting_Synchronizer)
 
+        self.Frame_Setting_LinkMode = QFrame(self.GroupBox_Settings_Tools_Function)
+        self.Frame_Setting_LinkMode.setObjectName(u"Frame_Setting_LinkMode")
+        self.Frame_Setting_LinkMode.setMinimumSize(QSize(0, 90))
+        self.Frame_Setting_LinkMode.setStyleSheet(u"QFrame {\n"
+"	background-color: transparent;\n"
+"	border-width: 0px;\n"
+"	border-style: solid;\n"
+"}\n"
+"QFrame:hover {\n"
+"	background-color: rgba(36, 36, 36, 12);\n"
+"}")
+        self.horizontalLayout_80 = QHBoxLayout(self.Frame_Setting_LinkMode)
+        self.horizontalLayout_80.setSpacing(12)
+        self.horizontalLayout_80.setObjectName(u"horizontalLayout_80")
+        self.horizontalLayout_80.setContentsMargins(21, 12, 21, 12)
+        self.Label_Setting_LinkMode = QLabel(self.Frame_Setting_LinkMode)
+        self.Label_Setting_LinkMode.setObjectName(u"Label_Setting_LinkMode")
+        sizePolicy4.setHeightForWidth(self.Label_Setting_LinkMode.sizePolicy().hasHeightForWidth())
+        self.Label_Setting_LinkMode.setSizePolicy(sizePolicy4)
+        self.Label_Setting_LinkMode.setStyleSheet(u"QLabel {\n"
+"	font-size: 15px;\n"
+"	/*text-align: center;*/\n"
+"	background-color: transparent;\n"
+"	padding: 0px;\n"
+"	border-width: 0px;\n"
+"	border-radius: 0px;\n"
+"	border-style: solid;\n"
+"}")
+
+        self.horizontalLayout_80.addWidget(self.Label_Setting_LinkMode)
+
+        self.ComboBox_Setting_LinkMode = ComboBoxBase(self.Frame_Setting_LinkMode)
+        self.ComboBox_Setting_LinkMode.setObjectName(u"ComboBox_Setting_LinkMode")
+        self.ComboBox_Setting_LinkMode.setMinimumSize(QSize(123, 30))
+
+        self.horizontalLayout_80.addWidget(self.ComboBox_Setting_LinkMode)
+
+
+        self.verticalLayout_76.addWidget(self.Frame_Setting_LinkMode)
+
+        self.Frame_Setting_PrewarmPages = QFrame(self.GroupBox_Settings_Tools_Function)
+        self.Frame_Setting_PrewarmPages.setObjectName(u"Frame_Setting_PrewarmPages")
+        self.Frame_Setting_PrewarmPages.setMinimumSize(QSize(0, 90))
+        self.Frame_Setting_PrewarmPages.setStyleSheet(u"QFrame {\n"
+"	background-color: transparent;\n"
+"	border-width: 0px;\n"
+"	border-style: solid;\n"
+"}\n"
+"QFrame:hover {\n"
+"	background-color: rgba(36, 36, 36, 12);\n"
+"}")
+        self.horizontalLayout_81 = QHBoxLayout(self.Frame_Setting_PrewarmPages)
+        self.horizontalLayout_81.setSpacing(12)
+        self.horizontalLayout_81.setObjectName(u"horizontalLayout_81")
+        self.horizontalLayout_81.setContentsMargins(21, 12, 21, 12)
+        self.Label_Setting_PrewarmPages = QLabel(self.Frame_Setting_PrewarmPages)
+        self.Label_Setting_PrewarmPages.setObjectName(u"Label_Setting_PrewarmPages")
+        sizePolicy4.setHeightForWidth(self.Label_Setting_PrewarmPages.sizePolicy().hasHeightForWidth())
+        self.Label_Setting_PrewarmPages.setSizePolicy(sizePolicy4)
+        self.Label_Setting_PrewarmPages.setStyleSheet(u"QLabel {\n"
+"	font-size: 15px;\n"
+"	/*text-align: center;*/\n"
+"	background-color: transparent;\n"
+"	padding: 0px;\n"
+"	border-width: 0px;\n"
+"	border-radius: 0px;\n"
+"	border-style: solid;\n"
+"}")
+
+        self.horizontalLayout_81.addWidget(self.Label_Setting_PrewarmPages)
+
+        self.CheckBox_Setting_PrewarmPages = QCheckBox(self.Frame_Setting_PrewarmPages)
+        self.CheckBox_Setting_PrewarmPages.setObjectName(u"CheckBox_Setting_PrewarmPages")
+        sizePolicy5.setHeightForWidth(self.CheckBox_Setting_PrewarmPages.sizePolicy().hasHeightForWidth())
+        self.CheckBox_Setting_PrewarmPages.setSizePolicy(sizePolicy5)
+        self.CheckBox_Setting_PrewarmPages.setMinimumSize(QSize(0, 30))
+        self.CheckBox_Setting_PrewarmPages.setStyleSheet(u"QCheckBox {\n"
+"	font-size: 15px;\n"
+"	spacing: 12.3px;\n"
+"	background-color: transparent;\n"
+"	padding: 0px;\n"
+"	border-width: 0px;\n"
+"	border-radius: 6px;\n"
+"	border-style: solid;\n"
+"}\n"
+"QCheckBox:hover {\n"
+"}\n"
+"\n"
+"QCheckBox::indicator {\n"
+"	width: 30px;\n"
+"	height: 30px;\n"
+"    background-color: transparent;\n"
+"	padding: 0px;\n"
+"	border-width: 0px;\n"
+"	border-radius: 6px;\n"
+"	border-style: solid;\n"
+"}\n"
+"QCheckBox::indicator:hover {\n"
+"	background-color: rgba(255, 255, 255, 21);\n"
+"}\n"
+"QCheckBox::indicator:unchecked {\n"
+"	border-image: url(:/CheckBox_Icon/images/icons/ToggleOff.png);\n"
+"}\n"
+"QCheckBox::indicator:checked {\n"
+"	border-image: url(:/CheckBox_Icon/images/icons/ToggleOn.png);\n"
+"}")
+
+        self.horizontalLayout_81.addWidget(self.CheckBox_Setting_PrewarmPages)
+
+
+        self.verticalLayout_76.addWidget(self.Frame_Setting_PrewarmPages)
+
 
         self.verticalLayout_34.addWidget(self.GroupBox_Settings_Tools_Function)
 
@@ -13589,6 +13700,9 @@ class Ui_MainWindow(object):
         self.CheckBox_Setting_AutoReset.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
         self.Label_Setting_Synchronizer.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
         self.CheckBox_Setting_Synchronizer.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.Label_Setting_LinkMode.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.Label_Setting_PrewarmPages.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.CheckBox_Setting_PrewarmPages.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
         self.GroupBox_Settings_Tools_Path.setTitle(QCoreApplication.translate("MainWindow", u"GroupBox", None))
         self.Label_Process_OutputRoot.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
         self.Label_ASR_VPR_OutputRoot.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
@@ -0,0 +1,105 @@
+import os
+import sys
+import hashlib
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('src').as_posix())
+
+import Downloader
+
+##############################################################################################################################
+
+class Range_Handler(BaseHTTPRequestHandler):
+    '''
+    Serve the server's data with range support, cutting the first responses short if the server is told to
+    '''
+    def log_message(self, *Args):
+        pass
+
+    def do_GET(self):
+        Data = self.server.Data
+        Start, End = 0, len(Data) - 1
+        Range = self.headers.get('Range')
+        if Range is not None:
+            First, _, Last = Range.removeprefix('bytes=').partition('-')
+            Start, End = int(First), int(Last) if Last else len(Data) - 1
+        with self.server.Lock:
+            self.server.Ranges.append((Start, End) if Range is not None else None)
+            Drop = Range is not None and End > 0 and self.server.Drops > 0
+            self.server.Drops -= 1 if Drop else 0
+        self.send_response(206 if Range is not None else 200)
+        self.send_header('Content-Range', f"bytes {Start}-{End}/{len(Data)}") if Range is not None else None
+        self.send_header('Content-Length', str(End - Start + 1))
+        self.end_headers()
+        Body = Data[Start : End + 1]
+        # Send half of the body and hang up
+        self.wfile.write(Body[: len(Body) // 2] if Drop else Body)
+        self.close_connection = True
+
+
+class Test_DownloadFile(unittest.TestCase):
+    def setUp(self):
+        self.Data = os.urandom(1024 ** 2 + 12345)
+        self.Server = ThreadingHTTPServer(('127.0.0.1', 0), Range_Handler)
+        self.Server.Data = self.Data
+        self.Server.Ranges = []
+        self.Server.Drops = 0
+        self.Server.Lock = threading.Lock()
+        threading.Thread(target = self.Server.serve_forever, daemon = True).start()
+        self.URL = f"http://127.0.0.1:{self.Server.server_address[1]}/model.bin"
+        self.TempDir = tempfile.TemporaryDirectory()
+
+        self.Defaults = (Downloader.MinSegmentSize, Downloader.MaxRetries, Downloader.DownloadChunkSize)
+        Downloader.MinSegmentSize = 256 * 1024
+        Downloader.DownloadChunkSize = 16 * 1024
+
+    def tearDown(self):
+        Downloader.MinSegmentSize, Downloader.MaxRetries, Downloader.DownloadChunkSize = self.Defaults
+        self.Server.shutdown()
+        self.Server.server_close()
+        self.TempDir.cleanup()
+
+    def Download(self, SHA_Expected: str):
+        return Downloader.DownloadFile(self.URL, self.TempDir.name, 'model', 'bin', SHA_Expected, Segments = 4)
+
+    def test_SegmentsMerged(self):
+        FilePath = self.Download(hashlib.sha256(self.Data).hexdigest())
+        self.assertEqual(Path(FilePath).read_bytes(), self.Data)
+        Starts = sorted(Start for Start, End in self.Server.Ranges[1:])
+        self.assertEqual(len(Starts), 4)
+        self.assertEqual(Starts[0], 0)
+        self.assertFalse(Path(f"{FilePath}.part").exists())
+        self.assertFalse(Path(f"{FilePath}.part.json").exists())
+
+    def test_ResumedAfterInterruption(self):
+        Downloader.MaxRetries = 0
+        self.Server.Drops = 4
+        with self.assertRaises(Exception):
+            self.Download(hashlib.sha256(self.Data).hexdigest())
+        PartPath = Path(self.TempDir.name).joinpath('model.bin.part')
+        self.assertTrue(PartPath.exists())
+        self.assertTrue(Path(f"{PartPath}.json").exists())
+
+        self.Server.Ranges.clear()
+        FilePath = self.Download(hashlib.sha256(self.Data).hexdigest())
+        self.assertEqual(Path(FilePath).read_bytes(), self.Data)
+        # The segments went on from where they were cut off instead of from their starts
+        SegmentStarts = [Start for Start, End, Done in Downloader.SplitSegments(len(self.Data), 4)]
+        Resumed = [Start for Start, End in self.Server.Ranges[1:]]
+        self.assertTrue(len(Resumed) > 0)
+        self.assertTrue(all(Start not in SegmentStarts for Start in Resumed))
+
+    def test_SHAMismatchRejected(self):
+        with self.assertRaises(Exception) as Context:
+            self.Download(hashlib.sha256(b'something else').hexdigest())
+        self.assertIn('SHA mismatch', str(Context.exception))
+        self.assertEqual(os.listdir(self.TempDir.name), [])
+
+##############################################################################################################################
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+
+##############################################################################################################################
+
+# Get current directory
+CurrentDir = sys.path[0]
+
+# Import the command line tools from the frontend sources (without loading the GUI)
+sys.path.insert(1, Path(CurrentDir).joinpath('EVT_GUI', 'src').as_posix())
+from CLI import Run
+
+##############################################################################################################################
+
+if __name__ == "__main__":
+    sys.exit(
+        Run(
+            CoreDir = Path(CurrentDir).joinpath('EVT_Core').as_posix(),
+            ModelDir = Path(CurrentDir).joinpath('Models').as_posix(),
+            OutputDir = Path(CurrentDir).as_posix(),
+            CurrentDir = Path(CurrentDir).joinpath('EVT_GUI', 'src').as_posix()
+        )
+    )
+
+##############################################################################################################################